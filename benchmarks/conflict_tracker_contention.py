@@ -0,0 +1,159 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark: ConflictTracker acquire/release throughput under contention.
+
+Drives N concurrent transactions, each claiming ``--objects-per-txn`` object
+IDs drawn from a pool of ``--hot-objects`` shared IDs (modelling shared gas
+coins) plus one private ID, through the current ``ConflictTracker`` and
+through ``_LegacyConflictTracker``, a copy of the previous implementation
+(one ``asyncio.Event`` per object under a global lock, ``deque.remove`` on
+release). Each transaction holds its claim for one event loop turn.
+
+No network access or Sui node is required.
+
+Usage::
+    python -m benchmarks.conflict_tracker_contention
+    python -m benchmarks.conflict_tracker_contention --levels 1000,10000,50000 --hot-objects 4
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+from collections import defaultdict, deque
+from time import perf_counter
+
+from pysui.sui.sui_common.executors.conflict_tracker import ConflictTracker
+from pysui.sui.sui_common.instrumentation import active_collector
+
+from benchmarks.dict_collector import DictCollector
+
+
+class _LegacyReservation:
+    def __init__(self, tracker: "_LegacyConflictTracker", claimed: list) -> None:
+        self._tracker = tracker
+        self._claimed = claimed
+
+    async def release(self) -> None:
+        await self._tracker._release(self._claimed)
+
+
+class _LegacyConflictTracker:
+    """The previous ConflictTracker, kept here as the comparison baseline."""
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, deque[asyncio.Event]] = defaultdict(deque)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, conflict_ids: set[str]) -> _LegacyReservation:
+        claimed: list[tuple[str, asyncio.Event]] = []
+        async with self._lock:
+            for oid in sorted(conflict_ids):
+                ev = asyncio.Event()
+                q = self._waiters[oid]
+                if not q:
+                    ev.set()
+                q.append(ev)
+                claimed.append((oid, ev))
+        for _, ev in claimed:
+            await ev.wait()
+        return _LegacyReservation(self, claimed)
+
+    async def _release(self, claimed: list[tuple[str, asyncio.Event]]) -> None:
+        async with self._lock:
+            for oid, ev in claimed:
+                q = self._waiters[oid]
+                if q and q[0] is ev:
+                    q.popleft()
+                    if q:
+                        q[0].set()
+                    else:
+                        del self._waiters[oid]
+                else:
+                    try:
+                        q.remove(ev)
+                    except ValueError:
+                        pass
+
+
+def _workload(txns: int, hot_objects: int, objects_per_txn: int, seed: int) -> list[set[str]]:
+    """Conflict sets: objects_per_txn - 1 hot ids plus one private id each."""
+    rng = random.Random(seed)
+    hot = [f"0xhot{i}" for i in range(hot_objects)]
+    shared = max(0, min(objects_per_txn - 1, hot_objects))
+    return [set(rng.sample(hot, shared)) | {f"0xown{n}"} for n in range(txns)]
+
+
+async def _run(tracker, workload: list[set[str]]) -> float:
+    """Run every conflict set through tracker concurrently; return txns/sec."""
+
+    async def _txn(ids: set[str]) -> None:
+        reservation = await tracker.acquire(ids)
+        await asyncio.sleep(0)
+        await reservation.release()
+
+    start = perf_counter()
+    await asyncio.gather(*[_txn(ids) for ids in workload])
+    return len(workload) / (perf_counter() - start)
+
+
+async def main() -> None:
+    """."""
+    parser = argparse.ArgumentParser(
+        description="ConflictTracker acquire/release throughput, current vs. legacy"
+    )
+    parser.add_argument(
+        "--levels", type=str, default="1000,5000,10000,20000",
+        help="Comma separated transaction counts (default: 1000,5000,10000,20000)",
+    )
+    parser.add_argument("--hot-objects", type=int, default=8, help="Shared object pool size (default: 8)")
+    parser.add_argument(
+        "--objects-per-txn", type=int, default=3,
+        help="Object ids claimed per transaction, one private (default: 3)",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Workload random seed (default: 7)")
+    parser.add_argument(
+        "--output-dir", "-o", type=str, default="bench_results",
+        help="Directory for JSON output (default: bench_results/)",
+    )
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    results: dict[str, dict] = {"legacy": {}, "current": {}, "wait_seconds": {}}
+    print(
+        f"hot objects={args.hot_objects} objects/txn={args.objects_per_txn}"
+    )
+    print(f"{'txns':>8} {'legacy txn/s':>14} {'current txn/s':>14} {'speedup':>8}")
+    for level in levels:
+        workload = _workload(level, args.hot_objects, args.objects_per_txn, args.seed)
+        legacy = await _run(_LegacyConflictTracker(), workload)
+        current = await _run(ConflictTracker(), workload)
+        results["legacy"][level] = legacy
+        results["current"][level] = current
+        print(f"{level:>8} {legacy:>14.0f} {current:>14.0f} {current / legacy:>7.2f}x")
+
+    # Wait-time distribution of the current tracker at the largest level
+    collector = DictCollector()
+    async with active_collector(collector):
+        await _run(
+            ConflictTracker(),
+            _workload(levels[-1], args.hot_objects, args.objects_per_txn, args.seed),
+        )
+    bounds = [0.001, 0.01, 0.1, 1.0, 10.0]
+    results["wait_seconds"] = collector.histogram("executor.conflict.wait_seconds", bounds)
+    print(f"wait seconds at {levels[-1]} txns: {results['wait_seconds']}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "conflict_tracker_contention.json")
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -31,10 +31,14 @@ from pysui.sui.sui_common.instrumentation import InstrumentationCollector
 
 
 class DictCollector(InstrumentationCollector):
-    """Accumulates (label, elapsed_ns) events; supports summary and heat-map output."""
+    """Accumulates (label, elapsed_ns) events and recorded samples.
+
+    Supports summary, heat-map and sample histogram output.
+    """
 
     def __init__(self) -> None:
         self.events: list[tuple[str, int]] = []
+        self.samples: dict[str, list[float]] = {}
 
     @asynccontextmanager
     async def measure(self, label: str) -> AsyncIterator[None]:
@@ -42,6 +46,25 @@ class DictCollector(InstrumentationCollector):
         yield
         self.events.append((label, perf_counter_ns() - start))
 
+    def record(self, label: str, value: float) -> None:
+        self.samples.setdefault(label, []).append(value)
+
+    def histogram(self, label: str, bounds: list[float]) -> dict[str, int]:
+        """Bucket the samples recorded for label by ascending upper bounds.
+
+        Keys are ``"<=bound"`` for each bound plus ``">last"`` for the overflow.
+        """
+        counts = {f"<={b}": 0 for b in bounds}
+        counts[f">{bounds[-1]}"] = 0
+        for value in self.samples.get(label, []):
+            for b in bounds:
+                if value <= b:
+                    counts[f"<={b}"] += 1
+                    break
+            else:
+                counts[f">{bounds[-1]}"] += 1
+        return counts
+
     def summary(self) -> dict[str, int]:
         """Return total elapsed_ns per label (summed across repeated calls)."""
         result: dict[str, int] = {}
@@ -0,0 +1,126 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark: GqlSessionPool requests/sec vs. concurrency against a local stub server.
+
+Starts a minimal keep-alive HTTP GraphQL stub on localhost that answers every
+POST after a fixed simulated latency, then drives it through ``GqlSessionPool``
+at increasing caller concurrency. The ``serial`` row reproduces the former
+single-permit behaviour (one session, one request in flight).
+
+No network access or Sui node is required.
+
+Usage::
+    python -m benchmarks.gql_pool_concurrency
+    python -m benchmarks.gql_pool_concurrency --requests 2000 --latency-ms 20 --pool-size 2
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+from time import perf_counter
+
+from gql import gql
+
+from pysui.sui.sui_pgql.pgql_session_pool import GqlSessionPool
+
+_RESPONSE_BODY = json.dumps({"data": {"chainIdentifier": "4c78adac"}}).encode()
+_RESPONSE_HEAD = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_RESPONSE_BODY)).encode() + b"\r\n"
+    b"Connection: keep-alive\r\n\r\n"
+)
+
+
+async def _stub_handler(latency: float, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve keep-alive GraphQL POSTs with a fixed response after latency seconds."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            await asyncio.sleep(latency)
+            writer.write(_RESPONSE_HEAD + _RESPONSE_BODY)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run_level(url: str, requests: int, concurrency: int, pool_size: int, max_in_flight: int) -> float:
+    """Issue requests from concurrency callers and return requests/sec."""
+    pool = GqlSessionPool(url=url, pool_size=pool_size, max_in_flight=max_in_flight)
+    query = gql("query { chainIdentifier }")
+    remaining = requests
+
+    async def _caller() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await pool.execute(query, extra_args={"timeout": 30.0})
+
+    try:
+        await pool.execute(query)  # connect outside the timed window
+        start = perf_counter()
+        await asyncio.gather(*[_caller() for _ in range(concurrency)])
+        elapsed = perf_counter() - start
+    finally:
+        await pool.close()
+    return requests / elapsed
+
+
+async def main() -> None:
+    """."""
+    parser = argparse.ArgumentParser(
+        description="GqlSessionPool requests/sec vs. concurrency against a local stub server"
+    )
+    parser.add_argument("--requests", "-n", type=int, default=1000, help="Requests per level (default: 1000)")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Stub server latency (default: 10ms)")
+    parser.add_argument("--pool-size", type=int, default=1, help="Transports in the pool (default: 1)")
+    parser.add_argument(
+        "--levels", type=str, default="1,2,4,8,16,32,64",
+        help="Comma separated caller concurrency levels (default: 1,2,4,8,16,32,64)",
+    )
+    parser.add_argument(
+        "--output-dir", "-o", type=str, default="bench_results",
+        help="Directory for JSON output (default: bench_results/)",
+    )
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    server = await asyncio.start_server(
+        lambda r, w: _stub_handler(args.latency_ms / 1000.0, r, w), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/graphql"
+
+    results: dict[str, dict[int, float]] = {"serial": {}, "pooled": {}}
+    async with server:
+        print(f"Stub GraphQL server on {url} latency={args.latency_ms}ms")
+        print(f"{'concurrency':>12} {'serial req/s':>14} {'pooled req/s':>14}")
+        for level in levels:
+            serial = await _run_level(url, args.requests, level, 1, 1)
+            pooled = await _run_level(url, args.requests, level, args.pool_size, max(level, 1))
+            results["serial"][level] = serial
+            results["pooled"][level] = pooled
+            print(f"{level:>12} {serial:>14.1f} {pooled:>14.1f}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "gql_pool_concurrency.json")
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark: per request overhead of GrpcProtocolClient dispatch.
+
+Sends ``--requests`` GetObject and GetAddressCoinBalance requests through
+``GrpcProtocolClient._dispatch_grpc_request`` over an in-process channel that
+answers every call at once, so the time measured is the client's own work:
+pool lease, stub lookup, header handling, request conversion and the stub call.
+
+Modes:
+
+- ``floor``: the request's stub method called directly on a prebuilt stub
+- ``per_call``: dispatch building a new service stub for every request
+  (the previous behaviour)
+- ``cached``: dispatch reusing the stub cached on the pooled channel
+
+No network access or Sui node is required.
+
+Usage::
+    python -m benchmarks.grpc_dispatch_overhead
+    python -m benchmarks.grpc_dispatch_overhead --requests 200000 --repeat 5
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+from time import perf_counter_ns
+from unittest.mock import MagicMock
+
+import pysui.sui.sui_grpc.pgrpc_clients as pgrpc_clients
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.config.confgroup import Profile
+from pysui.sui.sui_grpc.pgrpc_requests import GetAddressCoinBalance, GetObject
+
+_RESPONSES = {
+    "/sui.rpc.v2.LedgerService/GetObject": sui_prot.GetObjectResponse(
+        object=sui_prot.Object(object_id="0x" + "ab" * 32, version=3)
+    ),
+    "/sui.rpc.v2.StateService/GetBalance": sui_prot.GetBalanceResponse(
+        balance=sui_prot.Balance(coin_type="0x2::sui::SUI", balance=10)
+    ),
+}
+
+
+class _Stream:
+    """Unary stream that replies immediately with a canned response."""
+
+    def __init__(self, route: str) -> None:
+        self._route = route
+
+    async def __aenter__(self) -> "_Stream":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def send_message(self, message, end: bool = False) -> None:
+        return None
+
+    async def recv_message(self):
+        return _RESPONSES[self._route]
+
+
+class _Channel:
+    """Stands in for grpclib.client.Channel."""
+
+    def __init__(self, host: str, port) -> None:
+        self.host = host
+        self.port = port
+
+    def request(self, route, cardinality, request_type, reply_type, **kwargs) -> _Stream:
+        return _Stream(route)
+
+    def close(self) -> None:
+        return None
+
+
+def _new_stub(member, service):
+    """Previous behaviour: a fresh stub per request."""
+    return pgrpc_clients._SERVICE_STUBS[service](member.channel)
+
+
+async def _run(mode: str, client, requests: list) -> int:
+    """Dispatch every request once; return elapsed nanoseconds."""
+    if mode == "floor":
+        stubs = {
+            service: stub_class(_Channel("floor", 443))
+            for service, stub_class in pgrpc_clients._SERVICE_STUBS.items()
+        }
+        start = perf_counter_ns()
+        for request in requests:
+            fn, req = request.to_request(stub=stubs[request.service])
+            await fn(req, metadata=client._default_header)
+        return perf_counter_ns() - start
+    start = perf_counter_ns()
+    for request in requests:
+        result = await client._dispatch_grpc_request(request)
+        assert result.is_ok(), result.result_string
+    return perf_counter_ns() - start
+
+
+async def main() -> None:
+    """."""
+    parser = argparse.ArgumentParser(description="gRPC client dispatch overhead per request")
+    parser.add_argument("--requests", type=int, default=50000, help="Requests per measurement (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Measurements per mode, best is kept (default: 3)")
+    parser.add_argument(
+        "--output-dir", "-o", type=str, default="bench_results",
+        help="Directory for JSON output (default: bench_results/)",
+    )
+    args = parser.parse_args()
+
+    config = MagicMock()
+    config.active_group.active_profile = Profile("bench", "https://bench.example:443")
+    client = pgrpc_clients.GrpcProtocolClient(
+        pysui_config=config,
+        default_header={"x-client": "pysui-bench"},
+        health_interval=0,
+        channel_factory=_Channel,
+    )
+    requests = [
+        GetObject(object_id="0x" + "ab" * 32)
+        if n % 2 == 0
+        else GetAddressCoinBalance(owner="0x" + "cd" * 32)
+        for n in range(args.requests)
+    ]
+
+    cached_stub = pgrpc_clients._service_stub
+    results: dict[str, dict] = {}
+    print(f"requests={args.requests} repeat={args.repeat}")
+    print(f"{'mode':>9} {'ns/request':>11} {'requests/s':>11}")
+    for mode in ("floor", "per_call", "cached"):
+        pgrpc_clients._service_stub = _new_stub if mode == "per_call" else cached_stub
+        try:
+            best = min([await _run(mode, client, requests) for _ in range(args.repeat)])
+        finally:
+            pgrpc_clients._service_stub = cached_stub
+        per_request = best / args.requests
+        results[mode] = {"ns_per_request": per_request, "requests_per_sec": 1e9 / per_request}
+        print(f"{mode:>9} {per_request:>11.0f} {1e9 / per_request:>11.0f}")
+
+    await client.close()
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "grpc_dispatch_overhead.json")
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,200 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark: InMemoryObjectRegistry memory per entry and ops/sec at scale.
+
+Fills a registry bounded at each level with that many objects, then measures
+traced memory per entry, single ``get`` and ``upsert`` rates, and batched
+``get_many`` / ``upsert_many`` rates. ``_LegacyObjectRegistry`` is a copy of
+the previous implementation (string versions, a timestamped dataclass per
+entry, an ``asyncio.Lock`` around every call) kept as the comparison baseline.
+
+No network access or Sui node is required.
+
+Usage::
+    python -m benchmarks.object_registry_scale
+    python -m benchmarks.object_registry_scale --levels 50000,1000000 --batch 200
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import gc
+import json
+import os
+import time
+import tracemalloc
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from pysui.sui.sui_common.executors.object_registry import (
+    InMemoryObjectRegistry,
+    ObjectVersionEntry,
+)
+
+
+@dataclass
+class _LegacyEntry:
+    object_id: str
+    version: str
+    digest: str
+    last_used_ns: int = field(default_factory=time.monotonic_ns)
+    is_tombstone: bool = False
+    tombstone_expires_ns: int = 0
+
+
+class _LegacyObjectRegistry:
+    """The previous InMemoryObjectRegistry, kept here as the comparison baseline."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._entries: OrderedDict[str, _LegacyEntry] = OrderedDict()
+        self._max = max_entries
+        self._lock = asyncio.Lock()
+
+    async def get(self, object_id: str):
+        async with self._lock:
+            return self._get_unlocked(object_id)
+
+    async def get_many(self, object_ids: list[str]):
+        async with self._lock:
+            result = {}
+            for oid in object_ids:
+                entry = self._get_unlocked(oid)
+                if entry is not None:
+                    result[oid] = entry
+            return result
+
+    async def upsert(self, entry) -> None:
+        async with self._lock:
+            self._upsert_unlocked(entry)
+
+    async def upsert_many(self, entries) -> None:
+        async with self._lock:
+            for entry in entries:
+                self._upsert_unlocked(entry)
+
+    def _get_unlocked(self, object_id: str):
+        entry = self._entries.get(object_id)
+        if entry is None:
+            return None
+        if entry.is_tombstone and time.monotonic_ns() > entry.tombstone_expires_ns:
+            del self._entries[object_id]
+            return None
+        self._entries.move_to_end(object_id)
+        entry.last_used_ns = time.monotonic_ns()
+        return entry
+
+    def _upsert_unlocked(self, entry) -> None:
+        existing = self._entries.get(entry.object_id)
+        if existing and not entry.is_tombstone and not existing.is_tombstone:
+            if existing.version >= entry.version:
+                return
+        self._entries[entry.object_id] = entry
+        self._entries.move_to_end(entry.object_id)
+        while len(self._entries) > self._max:
+            self._entries.popitem(last=False)
+
+
+_DIGEST = "4vJ9JU1bJJE96FWSJKvHsmmFADCg4gpZQff4P3bkLKi"
+
+
+def _oid(n: int) -> str:
+    return f"0x{n:064x}"
+
+
+async def _fill(registry, entry_cls, ids: list[str], version, batch: int) -> None:
+    for i in range(0, len(ids), batch):
+        await registry.upsert_many(
+            [entry_cls(object_id=oid, version=version, digest=_DIGEST) for oid in ids[i : i + batch]]
+        )
+
+
+async def _measure(registry_cls, entry_cls, version_of, size: int, ops: int, batch: int) -> dict:
+    """Fill a registry of size entries and time reads and writes against it."""
+    ids = [_oid(n) for n in range(size)]
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    registry = registry_cls(max_entries=size)
+    await _fill(registry, entry_cls, ids, version_of(1), batch)
+    per_entry = (tracemalloc.get_traced_memory()[0] - base) / size
+    tracemalloc.stop()
+
+    step = max(1, size // ops)
+    probe = ids[::step][:ops]
+
+    start = perf_counter()
+    for oid in probe:
+        await registry.get(oid)
+    get_rate = len(probe) / (perf_counter() - start)
+
+    start = perf_counter()
+    for i in range(0, len(probe), batch):
+        await registry.get_many(probe[i : i + batch])
+    get_many_rate = len(probe) / (perf_counter() - start)
+
+    start = perf_counter()
+    for oid in probe:
+        await registry.upsert(entry_cls(object_id=oid, version=version_of(2), digest=_DIGEST))
+    upsert_rate = len(probe) / (perf_counter() - start)
+
+    start = perf_counter()
+    await _fill(registry, entry_cls, probe, version_of(3), batch)
+    upsert_many_rate = len(probe) / (perf_counter() - start)
+
+    return {
+        "bytes_per_entry": per_entry,
+        "get_per_sec": get_rate,
+        "get_many_per_sec": get_many_rate,
+        "upsert_per_sec": upsert_rate,
+        "upsert_many_per_sec": upsert_many_rate,
+    }
+
+
+async def main() -> None:
+    """."""
+    parser = argparse.ArgumentParser(
+        description="InMemoryObjectRegistry memory per entry and ops/sec, current vs. legacy"
+    )
+    parser.add_argument(
+        "--levels", type=str, default="50000,250000,1000000",
+        help="Comma separated registry sizes (default: 50000,250000,1000000)",
+    )
+    parser.add_argument("--ops", type=int, default=50_000, help="Timed operations per measurement (default: 50000)")
+    parser.add_argument("--batch", type=int, default=100, help="get_many/upsert_many batch size (default: 100)")
+    parser.add_argument(
+        "--output-dir", "-o", type=str, default="bench_results",
+        help="Directory for JSON output (default: bench_results/)",
+    )
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    variants = {
+        "legacy": (_LegacyObjectRegistry, _LegacyEntry, str),
+        "current": (InMemoryObjectRegistry, ObjectVersionEntry, int),
+    }
+    results: dict[str, dict[int, dict]] = {name: {} for name in variants}
+    header = f"{'entries':>9} {'impl':>8} {'B/entry':>8} {'get/s':>10} {'get_many/s':>11} {'upsert/s':>10} {'upsert_many/s':>14}"
+    print(header)
+    for level in levels:
+        for name, (registry_cls, entry_cls, version_of) in variants.items():
+            row = await _measure(registry_cls, entry_cls, version_of, level, args.ops, args.batch)
+            results[name][level] = row
+            print(
+                f"{level:>9} {name:>8} {row['bytes_per_entry']:>8.0f} {row['get_per_sec']:>10.0f}"
+                f" {row['get_many_per_sec']:>11.0f} {row['upsert_per_sec']:>10.0f}"
+                f" {row['upsert_many_per_sec']:>14.0f}"
+            )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "object_registry_scale.json")
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark: transaction signatures/sec under concurrent load.
+
+Runs ``--txns`` simulated builds at each concurrency level. Every build yields
+to the loop once (standing in for its network round trips) and then signs a
+random transaction for a sender, either inline on the loop with
+``SignerBlock.get_signatures`` or through ``get_signatures_async`` with a
+thread or process backed ``SigningPool``. A ticker coroutine running alongside
+records the worst event loop stall, which is what inline signing costs the
+other in-flight transactions.
+
+No network access or Sui node is required.
+
+Usage::
+    python -m benchmarks.signing_throughput
+    python -m benchmarks.signing_throughput --levels 8,64,256 --workers 4
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from pysui.sui.sui_crypto import SuiKeyPair, create_new_keypair
+from pysui.sui.sui_common.txn_signing import SignerBlock, SigningPool
+
+
+class _Group:
+    """Just enough of a configuration group to resolve one sender's keypair."""
+
+    using_profile = "bench"
+
+    def __init__(self, keypair: SuiKeyPair, address: str) -> None:
+        self._keypair = keypair
+        self._address = address
+
+    def get_transient_keypair(self, *, profile_name: str, address: str):
+        return self._keypair if address == self._address else None
+
+
+class _Config:
+    def __init__(self, keypair: SuiKeyPair, address: str) -> None:
+        self.active_group = _Group(keypair, address)
+
+
+async def _run(mode: str, pool, block: SignerBlock, config, payloads: list[str], concurrency: int) -> dict:
+    """Sign every payload with at most concurrency builds in flight; return rate and loop stall."""
+    sem = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+    worst = 0.0
+
+    async def _ticker() -> None:
+        nonlocal worst
+        while not done.is_set():
+            start = perf_counter()
+            await asyncio.sleep(0)
+            worst = max(worst, perf_counter() - start)
+
+    async def _build(tx_bytes: str) -> None:
+        async with sem:
+            await asyncio.sleep(0)
+            if mode == "inline":
+                block.get_signatures(config=config, tx_bytes=tx_bytes)
+            else:
+                await block.get_signatures_async(config=config, tx_bytes=tx_bytes, pool=pool)
+
+    ticker = asyncio.create_task(_ticker())
+    start = perf_counter()
+    await asyncio.gather(*[_build(p) for p in payloads])
+    elapsed = perf_counter() - start
+    done.set()
+    await ticker
+    return {"sigs_per_sec": len(payloads) / elapsed, "max_loop_stall_ms": worst * 1000}
+
+
+async def main() -> None:
+    """."""
+    parser = argparse.ArgumentParser(description="Signatures/sec: inline vs. thread and process SigningPool")
+    parser.add_argument(
+        "--levels", type=str, default="1,8,64,256",
+        help="Comma separated concurrent build counts (default: 1,8,64,256)",
+    )
+    parser.add_argument("--txns", type=int, default=4000, help="Transactions signed per measurement (default: 4000)")
+    parser.add_argument("--tx-size", type=int, default=512, help="Transaction bytes (default: 512)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Pool workers (default: cpu count)")
+    parser.add_argument(
+        "--output-dir", "-o", type=str, default="bench_results",
+        help="Directory for JSON output (default: bench_results/)",
+    )
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    _, keypair = create_new_keypair()
+    address = "0x" + "ab" * 32
+    block = SignerBlock(sender=address)
+    config = _Config(keypair, address)
+    rng = random.Random(7)
+    payloads = [base64.b64encode(rng.randbytes(args.tx_size)).decode() for _ in range(args.txns)]
+
+    thread_pool = SigningPool(max_workers=args.workers)
+    process_executor = ProcessPoolExecutor(max_workers=args.workers)
+    process_pool = SigningPool(process_executor)
+    modes = {"inline": None, "thread": thread_pool, "process": process_pool}
+    # Start the process workers before timing
+    await block.get_signatures_async(config=config, tx_bytes=payloads[0], pool=process_pool)
+
+    results: dict[str, dict[int, dict]] = {name: {} for name in modes}
+    print(f"workers={args.workers} txns={args.txns}")
+    print(f"{'concurrency':>11} {'mode':>8} {'sigs/s':>10} {'max stall ms':>13}")
+    for level in levels:
+        for name, pool in modes.items():
+            row = await _run(name, pool, block, config, payloads, level)
+            results[name][level] = row
+            print(f"{level:>11} {name:>8} {row['sigs_per_sec']:>10.0f} {row['max_loop_stall_ms']:>13.2f}")
+
+    thread_pool.shutdown()
+    process_executor.shutdown()
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "signing_throughput.json")
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
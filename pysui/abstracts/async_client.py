@@ -5,9 +5,22 @@
 
 """Abstract base class for async clients."""
 
+import asyncio
+import contextlib
+import copy
 import functools
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, ClassVar, Optional
+
+if TYPE_CHECKING:
+    import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+    from pysui.sui.sui_common.package_cache import PackageCache
+    from pysui.sui.sui_common.retry_policy import FailureKind, RetryPolicy
+
+
+def _walk(obj: Any, path: tuple[str, ...]) -> Any:
+    """Follow the attribute path from obj."""
+    return functools.reduce(getattr, path, obj)
 
 
 class AsyncClientBase(ABC):
@@ -20,6 +33,13 @@ class AsyncClientBase(ABC):
     """
 
     _protocol: ClassVar[str] = ""
+    # Maximum concurrent requests when a chunked command is split
+    chunk_concurrency: int = 4
+    # Retry, hedging and deadline policy for execute, None sends each command once
+    retry_policy: Optional["RetryPolicy"] = None
+    # Maximum concurrent sub-collection fetches per compound command
+    compound_concurrency: int = 8
+    _package_cache: Optional["PackageCache"] = None
 
     @abstractmethod
     async def transaction(self, **kwargs) -> Any:
@@ -53,6 +73,43 @@ class AsyncClientBase(ABC):
         :return: SuiRpcResult wrapping the response or error
         """
 
+    @property
+    def package_cache(self) -> "PackageCache":
+        """Fetch the cache of Move package reads, created on first use."""
+        if self._package_cache is None:
+            from pysui.sui.sui_common.package_cache import PackageCache
+
+            self._package_cache = PackageCache()
+        return self._package_cache
+
+    @package_cache.setter
+    def package_cache(self, cache: "PackageCache") -> None:
+        """Set the package read cache, for example to share one between clients."""
+        self._package_cache = cache
+
+    def _classify_failure(self, result: "SuiRpcResult") -> "FailureKind":
+        """Classify a failed result for the retry policy; protocols override this."""
+        from pysui.sui.sui_common.retry_policy import FailureKind
+
+        return FailureKind.PERMANENT
+
+    async def _run_with_policy(
+        self,
+        command: "SuiCommand",
+        attempt: Callable[[float | None], Awaitable["SuiRpcResult"]],
+        timeout: float | None,
+    ) -> "SuiRpcResult":
+        """Send a command once through attempt(timeout), or under retry_policy when set."""
+        policy = self.retry_policy
+        if policy is None:
+            return await attempt(timeout)
+        return await policy.run(
+            attempt,
+            idempotent=command.idempotent,
+            classify=self._classify_failure,
+            timeout=timeout,
+        )
+
     async def execute_for_all(
         self,
         *,
@@ -63,19 +120,39 @@ class AsyncClientBase(ABC):
         """Execute a pageable SuiCommand and accumulate all pages into one result.
 
         For non-pageable commands delegates to execute() unchanged. For pageable
-        commands loops until next_page_token is None, extending the items list
-        in place on the first page's result, then returns that accumulated result
-        with next_page_token cleared.
+        commands reads every page through the same prefetching page iterator as
+        iterate_all(), extending the items list in place on the first page's
+        result, then returns that accumulated result with next_page_token cleared.
 
         The caller's command instance is not mutated — a shallow copy is used
-        internally to carry the page token between iterations.
+        internally to carry the page token for each following page.
+
+        Commands flagged ``immutable_package_read`` (GetPackage, GetModule...)
+        are answered from ``package_cache`` after their first success.
 
         :param command: A SuiCommand instance describing the operation (not mutated)
         :param timeout: Per-page timeout in seconds (applied per page, not total)
         :param headers: Optional headers/metadata passed to the transport
         :return: SuiRpcResult with fully accumulated result_data
         """
-        import copy
+        if getattr(command, "immutable_package_read", False):
+            cache = self.package_cache
+            key = cache.key_for(self._protocol, command)
+            if key is not None:
+                return await cache.get_or_fetch(
+                    key,
+                    lambda: self._execute_for_all(command, timeout=timeout, headers=headers),
+                )
+        return await self._execute_for_all(command, timeout=timeout, headers=headers)
+
+    async def _execute_for_all(
+        self,
+        command: "SuiCommand",
+        *,
+        timeout: float | None = None,
+        headers: dict | None = None,
+    ) -> "SuiRpcResult":
+        """Uncached execute_for_all."""
         from pysui import SuiRpcResult  # lazy — avoids circular import at module load
 
         is_pageable = getattr(command, f"is_pageable_{self._protocol}", False)
@@ -92,43 +169,217 @@ class AsyncClientBase(ABC):
                 f"paginated_field_path_{self._protocol} is not set on {type(command).__name__}",
                 None,
             )
-
-        command = copy.copy(command)
         parent_path, items_field = items_path[:-1], items_path[-1]
 
-        def _walk(obj, path):
-            return functools.reduce(getattr, path, obj)
-
         accumulator = None
-        while True:
-            result = await self.execute(command=command, timeout=timeout, headers=headers)
-            if not result.is_ok():
-                return result
-            page = result.result_data
-            try:
+        async with contextlib.aclosing(
+            self._iterate_pages(command, timeout=timeout, headers=headers)
+        ) as pages:
+            async for result, items in pages:
+                if not result.is_ok():
+                    return result
                 if accumulator is None:
-                    accumulator = page
+                    accumulator = result.result_data
+                    collected = items
                 else:
-                    getattr(_walk(accumulator, parent_path), items_field).extend(
-                        getattr(_walk(page, parent_path), items_field)
-                    )
-                parent_obj = _walk(page, parent_path)
-                token = getattr(parent_obj, "next_page_token", None)
-            except AttributeError as exc:
-                return SuiRpcResult(
-                    False,
-                    f"Paging path misconfigured for {type(command).__name__}: {exc}",
-                    None,
-                )
-            if token is None:
-                break
-            command.next_page_token = token
+                    collected.extend(items)
 
         _walk(accumulator, parent_path).next_page_token = None
         return await self._apply_compound(
             command, SuiRpcResult(True, "", accumulator), timeout=timeout, headers=headers
         )
 
+    async def iterate_all(
+        self,
+        *,
+        command: "SuiCommand",
+        timeout: float | None = None,
+        headers: dict | None = None,
+        max_items: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield the items of a pageable SuiCommand as its pages arrive.
+
+        The request for the following page is sent as soon as a page arrives,
+        so it overlaps with the caller handling the items of the current one.
+        Only the current page and the one being fetched are held in memory.
+        Stopping early (``max_items`` reached, ``break`` or ``aclose``) cancels
+        the outstanding page request.
+
+        :param command: A pageable SuiCommand instance (not mutated)
+        :param timeout: Per-page timeout in seconds
+        :param headers: Optional headers/metadata passed to the transport
+        :param max_items: Stop after this many items, defaults to None (all)
+        :raises ValueError: If command is not pageable for this protocol, or a page fails
+        :return: Async iterator of the items at paginated_field_path
+        """
+        if not getattr(command, f"is_pageable_{self._protocol}", False):
+            raise ValueError(f"{type(command).__name__} is not pageable for {self._protocol}")
+        if max_items is not None and max_items < 1:
+            return
+        count = 0
+        async with contextlib.aclosing(
+            self._iterate_pages(command, timeout=timeout, headers=headers)
+        ) as pages:
+            async for result, items in pages:
+                if not result.is_ok():
+                    raise ValueError(f"{type(command).__name__} page failed: {result.result_string}")
+                for item in items:
+                    yield item
+                    count += 1
+                    if count == max_items:
+                        return
+
+    async def _iterate_pages(
+        self,
+        command: "SuiCommand",
+        *,
+        timeout: float | None = None,
+        headers: dict | None = None,
+    ) -> AsyncIterator[tuple["SuiRpcResult", list]]:
+        """Yield (result, items) per page, fetching the next page before yielding.
+
+        A failed result is yielded with an empty items list and ends iteration.
+        """
+        from pysui import SuiRpcResult  # lazy — avoids circular import at module load
+
+        items_path: tuple[str, ...] = getattr(
+            command, f"paginated_field_path_{self._protocol}"
+        )
+        parent_path, items_field = items_path[:-1], items_path[-1]
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(
+            self.execute(command=command, timeout=timeout, headers=headers)
+        )
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if not result.is_ok():
+                    yield result, []
+                    return
+                try:
+                    parent_obj = _walk(result.result_data, parent_path)
+                    items = getattr(parent_obj, items_field)
+                    token = getattr(parent_obj, "next_page_token", None)
+                except AttributeError as exc:
+                    yield SuiRpcResult(
+                        False,
+                        f"Paging path misconfigured for {type(command).__name__}: {exc}",
+                        None,
+                    ), []
+                    return
+                if token is not None:
+                    following = copy.copy(command)
+                    following.next_page_token = token
+                    pending = asyncio.ensure_future(
+                        self.execute(command=following, timeout=timeout, headers=headers)
+                    )
+                yield result, items
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    def fetch_checkpoint_range(
+        self,
+        start: int,
+        end: int,
+        *,
+        concurrency: int = 8,
+        reorder_window: Optional[int] = None,
+        field_mask: Optional[list[str]] = None,
+        cursor_file: Optional[str] = None,
+        save_every: int = 100,
+        timeout: float | None = None,
+        headers: dict | None = None,
+    ) -> AsyncIterator[tuple[int, "sui_prot.Checkpoint"]]:
+        """Fetch checkpoints start..end-1 in parallel and yield them in order.
+
+        Async generator of (sequence_number, Checkpoint). At most ``concurrency``
+        fetches are in flight and at most ``reorder_window`` checkpoints are held
+        ahead of the consumer. With ``cursor_file`` set, progress is saved there
+        and a later call with the same file resumes where this one stopped.
+        See :py:func:`pysui.sui.sui_common.checkpoint_range.fetch_checkpoint_range`.
+
+        :param start: First sequence number of the range
+        :param end: Sequence number one past the last of the range
+        :param concurrency: Most fetches in flight, defaults to 8
+        :param reorder_window: Most checkpoints fetched ahead of the consumer, defaults to 4 * concurrency
+        :param field_mask: gRPC checkpoint read mask, defaults to every field (ignored by GraphQL)
+        :param cursor_file: Path of a resumable cursor file, defaults to None
+        :param save_every: Checkpoints consumed between cursor saves, defaults to 100
+        :param timeout: Per fetch timeout in seconds
+        :param headers: Optional headers/metadata passed to the transport
+        :return: Async iterator of (sequence_number, Checkpoint)
+        """
+        from pysui.sui.sui_common.checkpoint_range import fetch_checkpoint_range
+
+        return fetch_checkpoint_range(
+            self,
+            start,
+            end,
+            concurrency=concurrency,
+            reorder_window=reorder_window,
+            field_mask=field_mask,
+            cursor_file=cursor_file,
+            save_every=save_every,
+            timeout=timeout,
+            headers=headers,
+        )
+
+    async def _execute_chunked(
+        self,
+        command: "SuiCommand",
+        *,
+        timeout: float | None = None,
+        headers: dict | None = None,
+    ) -> "SuiRpcResult | None":
+        """Split a command whose chunked_field exceeds chunk_size and merge the results.
+
+        Chunks are executed with at most ``chunk_concurrency`` in flight. The
+        list at ``chunked_result_path`` of each chunk result is appended, in
+        chunk order, to the first chunk's result so input order is preserved.
+        The first failing chunk result is returned as is.
+
+        :param command: A SuiCommand instance (not mutated)
+        :param timeout: Per-chunk timeout in seconds
+        :param headers: Optional headers/metadata passed to the transport
+        :return: The merged result, or None if command does not need chunking
+        """
+        import dataclasses
+
+        field = getattr(command, "chunked_field", None)
+        if not field:
+            return None
+        values = getattr(command, field)
+        size = command.chunk_size
+        if len(values) <= size:
+            return None
+
+        *parent_path, items_field = command.chunked_result_path
+        limiter = asyncio.Semaphore(max(1, self.chunk_concurrency))
+
+        async def _run(chunk: list) -> "SuiRpcResult":
+            async with limiter:
+                return await self.execute(
+                    command=dataclasses.replace(command, **{field: chunk}),
+                    timeout=timeout,
+                    headers=headers,
+                )
+
+        results = await asyncio.gather(
+            *[_run(values[i : i + size]) for i in range(0, len(values), size)]
+        )
+        for result in results:
+            if not result.is_ok():
+                return result
+        merged = results[0]
+        items = getattr(functools.reduce(getattr, parent_path, merged.result_data), items_field)
+        for result in results[1:]:
+            items.extend(
+                getattr(functools.reduce(getattr, parent_path, result.result_data), items_field)
+            )
+        return merged
+
     async def _apply_compound(
         self,
         command: Any,
@@ -137,21 +388,37 @@ class AsyncClientBase(ABC):
         timeout: float | None = None,
         headers: dict | None = None,
     ) -> "SuiRpcResult":
-        """Drive sub-collection fetches declared in compound_sub_collections_{protocol}."""
+        """Drive sub-collection fetches declared in compound_sub_collections_{protocol}.
+
+        Sub-fetches run concurrently, at most ``compound_concurrency`` at a time,
+        and are stitched back into the result by field or item index.
+        """
         if not result.is_ok():
             return result
         data = result.result_data
-        specs = getattr(command, f"compound_sub_collections_{self._protocol}", None)
-        if specs:
-            for has_next_attr, sub_cmd_class, sub_src_field, parent_field in specs:
-                if not getattr(data, has_next_attr, False):
-                    continue
-                sub_cmd = sub_cmd_class(
-                    package=command.package, module_name=command.module_name
-                )
-                sub_result = await self.execute_for_all(
+        limiter = asyncio.Semaphore(max(1, self.compound_concurrency))
+
+        async def _fetch(sub_cmd: Any) -> "SuiRpcResult":
+            async with limiter:
+                return await self.execute_for_all(
                     command=sub_cmd, timeout=timeout, headers=headers
                 )
+
+        specs = getattr(command, f"compound_sub_collections_{self._protocol}", None)
+        if specs:
+            wanted = [
+                (sub_src_field, parent_field)
+                for has_next_attr, _, sub_src_field, parent_field in specs
+                if getattr(data, has_next_attr, False)
+            ]
+            sub_results = await asyncio.gather(
+                *[
+                    _fetch(sub_cmd_class(package=command.package, module_name=command.module_name))
+                    for has_next_attr, sub_cmd_class, _, _ in specs
+                    if getattr(data, has_next_attr, False)
+                ]
+            )
+            for (sub_src_field, parent_field), sub_result in zip(wanted, sub_results):
                 if not sub_result.is_ok():
                     return sub_result
                 setattr(data, parent_field, getattr(sub_result.result_data, sub_src_field))
@@ -161,16 +428,23 @@ class AsyncClientBase(ABC):
                 *parent_path, items_field = item_path
                 parent = functools.reduce(getattr, parent_path, data)
                 items = getattr(parent, items_field, [])
-                for i, item in enumerate(items):
-                    if not any(getattr(item, attr, False) for attr in trunc_attrs):
-                        continue
-                    key_val = getattr(item, item_key_attr)
-                    sub_cmd = item_cmd_class(
-                        package=command.package, **{cmd_kwarg: key_val}
-                    )
-                    sub_result = await self.execute_for_all(
-                        command=sub_cmd, timeout=timeout, headers=headers
-                    )
+                truncated = [
+                    i
+                    for i, item in enumerate(items)
+                    if any(getattr(item, attr, False) for attr in trunc_attrs)
+                ]
+                sub_results = await asyncio.gather(
+                    *[
+                        _fetch(
+                            item_cmd_class(
+                                package=command.package,
+                                **{cmd_kwarg: getattr(items[i], item_key_attr)},
+                            )
+                        )
+                        for i in truncated
+                    ]
+                )
+                for i, sub_result in zip(truncated, sub_results):
                     if sub_result.is_ok():
                         items[i] = sub_result.result_data
         return result
@@ -30,6 +30,7 @@ class SignatureScheme(IntEnum):
     MULTISIG = 3
     BLS12381 = 4
     ZKLOGINAUTHENTICATOR = 5
+    PASSKEY = 6
 
     def as_str(self) -> str:
         """Get scheme as string."""
@@ -45,6 +46,8 @@ class SignatureScheme(IntEnum):
             return "Bls12381"
         if self is SignatureScheme.ZKLOGINAUTHENTICATOR:
             return "ZkLoginAuthenticator"
+        if self is SignatureScheme.PASSKEY:
+            return "Passkey"
         raise TypeError(f"Unknown scheme {self.name}")
 
     @property
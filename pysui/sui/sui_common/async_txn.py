@@ -5,7 +5,6 @@
 
 """Unified async Sui Transaction builder — protocol-agnostic (GQL and gRPC)."""
 
-import asyncio
 import base64
 import hashlib
 import struct as _struct
@@ -18,12 +17,13 @@ from pysui.sui.sui_common.txn_base import (
     _SuiTransactionBase as txbase,
     FundsSource,
 )
-from pysui.sui.sui_common.txn_signing import SignerBlock, SigningMultiSig
+from pysui.sui.sui_common.txn_signing import SignerBlock, SigningMultiSig, SigningPool
 from pysui.sui.sui_bcs import bcs
 from pysui.sui.sui_common.txn_pure import PureInput
 import pysui.sui.sui_pgql.pgql_validators as tv
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 from pysui.sui.sui_common.txn_gas import (
+    GasBudgetEstimator,
     compute_gas_budget,
     async_get_gas_data as _async_get_gas_data,
 )
@@ -31,7 +31,12 @@ import pysui.sui.sui_common.sui_commands as cmd
 import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
 from pysui.sui.sui_common.txn_tx_argparse import TxnArgParse, TxnArgMode
 from pysui.sui.sui_common.executors.cache import AsyncObjectCache, ObjectSummary
-from pysui.sui.sui_common.async_funcs import AsyncLRU
+from pysui.sui.sui_common.chain_context import ChainContext, ChainContextCache
+from pysui.sui.sui_common.function_cache import (
+    MoveFunctionCache,
+    fetch_function_signature,
+    normalize_target,
+)
 from pysui.sui.sui_common.instrumentation import (
     instrumented,
     measure,
@@ -190,7 +195,10 @@ class AsyncSuiTransaction(txbase):
         """Inject an external object cache for use during deferred input resolution."""
         self._object_cache = cache
 
-    @AsyncLRU(maxsize=256)
+    @versionchanged(
+        version="1.2.0",
+        reason="Signatures are served from the client's MoveFunctionCache",
+    )
     @instrumented(
         "pysui.sui.sui_common.async_txn.AsyncSuiTransaction._function_meta_args"
     )
@@ -204,31 +212,18 @@ class AsyncSuiTransaction(txbase):
         :return: package address, module, function, return count, parameter types
         :rtype: tuple
         """
-        from pysui.sui.sui_common.txn_arg_encoder import grpc_to_raw_parameters
-
-        package, package_module, package_function = (
-            tv.TypeValidator.check_target_triplet(target)
-        )
-        try:
-            result = await self.client.execute(
-                command=cmd.GetFunction(
-                    package=package,
-                    module_name=package_module,
-                    function_name=package_function,
-                )
-            )
-            if result.is_ok():
-                mfunc: sui_prot.GetFunctionResponse = result.result_data
-                return (
-                    bcs.Address.from_str(package),
-                    package_module,
-                    package_function,
-                    len(mfunc.function.returns),
-                    grpc_to_raw_parameters(mfunc),
-                )
-        except ValueError as ve:
-            raise ValueError(f"{target} {ve.args}")
-        raise ValueError(f"Unresolvable target {target}")
+        fcache = getattr(self.client, "function_cache", None)
+        if isinstance(fcache, MoveFunctionCache):
+            return await fcache.get(self.client, target)
+        return await fetch_function_signature(self.client, normalize_target(target))
+
+    @instrumented("pysui.sui.sui_common.async_txn.AsyncSuiTransaction._chain_context")
+    async def _chain_context(self) -> ChainContext:
+        """Return the epoch scoped chain context from the client's cache."""
+        ctx_cache = getattr(self.client, "chain_context", None)
+        if not isinstance(ctx_cache, ChainContextCache):
+            ctx_cache = ChainContextCache(max_age_seconds=0)
+        return await ctx_cache.get(self.client)
 
     @instrumented(
         "pysui.sui.sui_common.async_txn.AsyncSuiTransaction.target_function_summary"
@@ -271,7 +266,9 @@ class AsyncSuiTransaction(txbase):
 
         if fetch_ids:
             result = await self.client.execute(
-                command=GetMultipleObjectSummary(object_ids=list(fetch_ids.values()))
+                command=GetMultipleObjectSummary(
+                    object_ids=list(dict.fromkeys(fetch_ids.values()))
+                )
             )
             if not result.is_ok():
                 raise ValueError(f"Object resolution failed: {result.result_string}")
@@ -324,39 +321,40 @@ class AsyncSuiTransaction(txbase):
         clone = self.builder.shallow_clone()
         await self._resolve_deferred_inputs(clone)
         tx_kind = clone.finish_for_inspect()
-        _epoch_res, _chain_res = await asyncio.gather(
-            self.client.execute(command=cmd.GetBasicCurrentEpochInfo(), timeout=30.0),
-            self.client.execute(command=cmd.GetChainIdentifier(), timeout=30.0),
-        )
-        if not _epoch_res.is_ok():
-            raise ValueError(_epoch_res.result_string)
-        if not _chain_res.is_ok():
-            raise ValueError("Error getting chain id")
-        _cei: sui_prot.Epoch = _epoch_res.result_data
-        chain_id = _chain_res.result_data
+        _cei: ChainContext = await self._chain_context()
+        chain_id = _cei.chain_id
         min_epoch = txn_expires_after or _cei.epoch
         pay_addy = self.signer_block.payer_address
         if gas_budget is None:
-            _res = await self.client.execute(
-                command=cmd.SimulateTransactionKind(
-                    tx_kind=tx_kind,
-                    tx_meta={"sender": pay_addy},
-                    gas_selection=True,
-                ),
-                timeout=60.0,
-            )
-            if _res.is_ok():
+
+            async def _simulate() -> int:
+                _res = await self.client.execute(
+                    command=cmd.SimulateTransactionKind(
+                        tx_kind=tx_kind,
+                        tx_meta={"sender": pay_addy},
+                        gas_selection=True,
+                    ),
+                    timeout=60.0,
+                )
+                if not _res.is_ok():
+                    raise ValueError(_res.result_string)
                 gas_used = (
                     _res.result_data.transaction.effects.gas_used
                     or sui_prot.GasCostSummary()
                 )
-                gas_budget = compute_gas_budget(
+                return compute_gas_budget(
                     gas_used.computation_cost or 0,
                     gas_used.storage_cost or 0,
                     _cei.reference_gas_price,
                 )
+
+            estimator = getattr(self.client, "budget_estimator", None)
+            if isinstance(estimator, GasBudgetEstimator):
+                gas_budget = await estimator.estimate(
+                    tx_kind, _cei.reference_gas_price, _simulate
+                )
             else:
-                raise ValueError(_res.result_string)
+                gas_budget = await _simulate()
         payment = (
             [
                 _build_coin_reservation_ref(
@@ -426,15 +424,11 @@ class AsyncSuiTransaction(txbase):
                 gas_budget, txn_expires_after, uses_gas_coin, gas_source_draw
             )
 
-        # Standard coin path — fetch gas price lazily at build time
+        # Standard coin path — resolve gas price lazily at build time
         if self._current_gas_price is None:
-            _epoch_res = await self.client.execute(
-                command=cmd.GetBasicCurrentEpochInfo(), timeout=30.0
-            )
-            if _epoch_res.is_ok():
-                self._current_gas_price = _epoch_res.result_data.reference_gas_price
-            else:
-                raise ValueError(_epoch_res.result_string)
+            self._current_gas_price = (
+                await self._chain_context()
+            ).reference_gas_price
 
         obj_in_use: set[str] = set(self.builder.objects_registry.keys())
         tx_kind = self.builder.finish_for_inspect()
@@ -585,6 +579,7 @@ class AsyncSuiTransaction(txbase):
 
     @instrumented("ptb.build_and_sign")
     @versionchanged(version="0.64.0", reason="Return dict instead of tuple")
+    @versionchanged(version="1.2.0", reason="Added signing_pool argument")
     async def build_and_sign(
         self,
         *,
@@ -593,6 +588,7 @@ class AsyncSuiTransaction(txbase):
         txn_expires_after: Optional[int] = None,
         use_account_for_gas: bool = False,
         auto_gas: bool = False,
+        signing_pool: Optional[SigningPool] = None,
     ) -> dict:
         """Serialize the BCS TransactionData to base64, sign, and return both.
 
@@ -606,6 +602,8 @@ class AsyncSuiTransaction(txbase):
         :type use_account_for_gas: bool, optional
         :param auto_gas: Let pysui decide gas source based on available balances, defaults to False
         :type auto_gas: bool, optional
+        :param signing_pool: Sign in this pool's executor instead of on the event loop, defaults to None
+        :type signing_pool: Optional[SigningPool], optional
         :return: Dict with ``tx_bytestr`` (base64 transaction bytes) and ``sig_array`` (list of base64 signature bytes)
         :rtype: dict[str, str]
         """
@@ -619,9 +617,14 @@ class AsyncSuiTransaction(txbase):
         async with measure("ptb.serialize"):
             tx_bytes = base64.b64encode(txn_kind.serialize()).decode()
         async with measure("ptb.sign"):
-            sigs = self.signer_block.get_signatures(
-                config=self.client.config, tx_bytes=tx_bytes
-            )
+            if signing_pool is None:
+                sigs = self.signer_block.get_signatures(
+                    config=self.client.config, tx_bytes=tx_bytes
+                )
+            else:
+                sigs = await self.signer_block.get_signatures_async(
+                    config=self.client.config, tx_bytes=tx_bytes, pool=signing_pool
+                )
         return {self._BUILD_BYTE_STR: tx_bytes, self._SIG_ARRAY: sigs}
 
     @instrumented("ptb.cmd.split_coin")
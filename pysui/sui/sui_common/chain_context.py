@@ -0,0 +1,241 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Client scoped, epoch aware cache of chain context used when building transactions."""
+
+import asyncio
+import datetime
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+# Execution failures that mean a transaction was built with a stale epoch or gas price
+_EPOCH_ERROR_RE = re.compile(
+    r"underrgp|reference gas price|expired|epoch",
+    re.IGNORECASE,
+)
+
+
+@sync_instrumented("pysui.sui.sui_common.chain_context.is_epoch_error")
+def is_epoch_error(message: Optional[str]) -> bool:
+    """Return True if an execution failure message points at stale epoch data."""
+    return bool(message) and _EPOCH_ERROR_RE.search(message) is not None
+
+
+@dataclass(frozen=True)
+class ChainContext:
+    """Chain values that only change at epoch boundaries (chain_id never)."""
+
+    epoch: int
+    reference_gas_price: int
+    chain_id: str
+    epoch_start: Optional[datetime.datetime] = None
+    # Actual end when reported, otherwise estimated from the learned epoch duration
+    epoch_end: Optional[datetime.datetime] = None
+    protocol: Any = None
+
+
+class ChainContextCache:
+    """Lazily refreshed ChainContext shared by every transaction built on a client.
+
+    The context is considered current while the wall clock is before the
+    (reported or estimated) end of the cached epoch. When the end of the epoch
+    is unknown or has passed, the context is refreshed at most once every
+    ``max_age_seconds``. Observers that see a newer epoch (transaction effects,
+    checkpoints) call ``note_epoch``/``note_checkpoint`` to force a refresh on
+    the next ``get``.
+    """
+
+    DEFAULT_MAX_AGE_SECONDS: float = 60.0
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.__init__")
+    def __init__(
+        self,
+        *,
+        max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+        epoch_duration_ms: Optional[int] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        :param max_age_seconds: Refresh interval used when the epoch end is unknown
+            or passed, None to refresh only on observed rollover, defaults to 60
+        :type max_age_seconds: Optional[float], optional
+        :param epoch_duration_ms: Epoch length used to estimate the epoch end, learned
+            from the first observed rollover if not provided, defaults to None
+        :type epoch_duration_ms: Optional[int], optional
+        """
+        self._context: Optional[ChainContext] = None
+        self._fetched_at: float = 0.0
+        self._stale: bool = False
+        self._max_age = max_age_seconds
+        self._epoch_duration_ms = epoch_duration_ms
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._refreshes = 0
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.current")
+    def current(self) -> Optional[ChainContext]:
+        """The cached context, if any, without checking freshness."""
+        return self._context
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.hits")
+    def hits(self) -> int:
+        """Lookups served without a round trip."""
+        return self._hits
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.refreshes")
+    def refreshes(self) -> int:
+        """Number of times the context was fetched from the node."""
+        return self._refreshes
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache._expired")
+    def _expired(self) -> bool:
+        """True when the cached context must be refetched."""
+        if self._stale or self._context is None:
+            return True
+        end = self._context.epoch_end
+        if end is not None and datetime.datetime.now(datetime.timezone.utc) < end:
+            return False
+        return (
+            self._max_age is not None
+            and time.monotonic() - self._fetched_at > self._max_age
+        )
+
+    @instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.get")
+    async def get(self, client: Any) -> ChainContext:
+        """Return the current chain context, refreshing it if required.
+
+        :param client: The protocol client (GQL or gRPC)
+        :raises ValueError: If the epoch or chain identifier can not be fetched
+        :return: The current chain context
+        :rtype: ChainContext
+        """
+        if not self._expired():
+            self._hits += 1
+            return self._context
+        async with self._lock:
+            if not self._expired():
+                self._hits += 1
+                return self._context
+            return await self._refresh(client)
+
+    @instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.refresh")
+    async def refresh(self, client: Any) -> ChainContext:
+        """Unconditionally refetch the chain context.
+
+        :param client: The protocol client (GQL or gRPC)
+        :raises ValueError: If the epoch or chain identifier can not be fetched
+        :return: The refreshed chain context
+        :rtype: ChainContext
+        """
+        async with self._lock:
+            return await self._refresh(client)
+
+    @instrumented("pysui.sui.sui_common.chain_context.ChainContextCache._refresh")
+    async def _refresh(self, client: Any) -> ChainContext:
+        """Fetch epoch info (and the chain id once) and replace the cached context."""
+        import pysui.sui.sui_common.sui_commands as cmd
+
+        previous = self._context
+        if previous is None:
+            epoch_res, chain_res = await asyncio.gather(
+                client.execute(command=cmd.GetBasicCurrentEpochInfo(), timeout=30.0),
+                client.execute(command=cmd.GetChainIdentifier(), timeout=30.0),
+            )
+            if not chain_res.is_ok():
+                raise ValueError("Error getting chain id")
+            chain_id = chain_res.result_data
+        else:
+            epoch_res = await client.execute(
+                command=cmd.GetBasicCurrentEpochInfo(), timeout=30.0
+            )
+            chain_id = previous.chain_id
+        if not epoch_res.is_ok():
+            raise ValueError(epoch_res.result_string)
+        cei = epoch_res.result_data
+
+        rolled_over = previous is not None and cei.epoch != previous.epoch
+        if rolled_over:
+            self._learn_duration(previous, cei)
+            # Protocol upgrades only take effect at epoch boundaries
+            init_protocol = getattr(client, "_init_protocol", None)
+            if init_protocol is not None:
+                await init_protocol()
+            logger.debug(
+                "chain context: epoch %s -> %s", previous.epoch, cei.epoch
+            )
+
+        end = cei.end
+        if end is None and cei.start is not None and self._epoch_duration_ms:
+            end = cei.start + datetime.timedelta(milliseconds=self._epoch_duration_ms)
+        self._context = ChainContext(
+            epoch=cei.epoch,
+            reference_gas_price=cei.reference_gas_price,
+            chain_id=chain_id,
+            epoch_start=cei.start,
+            epoch_end=end,
+            protocol=client.protocol(),
+        )
+        self._fetched_at = time.monotonic()
+        self._stale = False
+        self._refreshes += 1
+        return self._context
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache._learn_duration")
+    def _learn_duration(self, previous: ChainContext, cei: Any) -> None:
+        """Derive the epoch length from two consecutive epoch start times."""
+        if (
+            self._epoch_duration_ms is None
+            and cei.epoch == previous.epoch + 1
+            and previous.epoch_start is not None
+            and cei.start is not None
+        ):
+            delta = cei.start - previous.epoch_start
+            self._epoch_duration_ms = int(delta.total_seconds() * 1000)
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.note_epoch")
+    def note_epoch(self, epoch: Optional[int]) -> bool:
+        """Record an epoch observed elsewhere; a newer epoch forces a refresh.
+
+        :param epoch: The epoch reported by effects, checkpoints or the node
+        :type epoch: Optional[int]
+        :return: True if the cached context was marked stale
+        :rtype: bool
+        """
+        if epoch is None or self._context is None or epoch <= self._context.epoch:
+            return False
+        self._stale = True
+        return True
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.note_checkpoint")
+    def note_checkpoint(self, checkpoint: Any) -> bool:
+        """Record the epoch of a checkpoint received from a subscription.
+
+        A checkpoint carrying end of epoch data closes its epoch, so the next
+        epoch is noted.
+
+        :param checkpoint: A sui_prot.Checkpoint (summary required)
+        :return: True if the cached context was marked stale
+        :rtype: bool
+        """
+        summary = getattr(checkpoint, "summary", None)
+        if summary is None or summary.epoch is None:
+            return False
+        epoch = summary.epoch + (0 if summary.end_of_epoch_data is None else 1)
+        return self.note_epoch(epoch)
+
+    @sync_instrumented("pysui.sui.sui_common.chain_context.ChainContextCache.invalidate")
+    def invalidate(self) -> None:
+        """Force a refresh on the next lookup, keeping the known chain id."""
+        self._stale = True
@@ -0,0 +1,154 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Parallel, ordered retrieval of historical checkpoint ranges."""
+
+import asyncio
+import collections
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.instrumentation import record, sync_instrumented
+
+if TYPE_CHECKING:
+    from pysui.abstracts.async_client import AsyncClientBase
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointCursor:
+    """Resumable progress of a checkpoint range, kept in a small JSON file.
+
+    The file holds the range end and the next sequence number not yet handed to
+    the consumer. It is replaced atomically, so a crash leaves either the old
+    or the new position, never a partial file.
+    """
+
+    @sync_instrumented("pysui.sui.sui_common.checkpoint_range.CheckpointCursor.__init__")
+    def __init__(self, path: str):
+        """Initialize the cursor.
+
+        :param path: Location of the cursor file
+        :type path: str
+        """
+        self.path = path
+
+    @sync_instrumented("pysui.sui.sui_common.checkpoint_range.CheckpointCursor.load")
+    def load(self) -> Optional[int]:
+        """Return the stored next sequence number, None if there is no cursor file."""
+        try:
+            with open(self.path, encoding="utf8") as cursor_file:
+                return int(json.load(cursor_file)["next"])
+        except FileNotFoundError:
+            return None
+
+    @sync_instrumented("pysui.sui.sui_common.checkpoint_range.CheckpointCursor.save")
+    def save(self, next_sequence: int, end: int) -> None:
+        """Store next_sequence as the resume point of a range ending before end."""
+        staging = f"{self.path}.tmp"
+        with open(staging, "w", encoding="utf8") as cursor_file:
+            json.dump({"next": next_sequence, "end": end}, cursor_file)
+        os.replace(staging, self.path)
+
+
+async def fetch_checkpoint_range(
+    client: "AsyncClientBase",
+    start: int,
+    end: int,
+    *,
+    concurrency: int = 8,
+    reorder_window: Optional[int] = None,
+    field_mask: Optional[list[str]] = None,
+    cursor_file: Optional[str] = None,
+    save_every: int = 100,
+    timeout: Optional[float] = None,
+    headers: Optional[dict] = None,
+) -> AsyncIterator[tuple[int, sui_prot.Checkpoint]]:
+    """Yield (sequence_number, checkpoint) for start <= sequence_number < end in order.
+
+    At most ``concurrency`` checkpoints are fetched at once. Fetching runs at
+    most ``reorder_window`` checkpoints ahead of the consumer, which bounds the
+    results held while an earlier checkpoint is still outstanding. Each fetch
+    is a ``GetCheckpointBySequence`` command sent through ``client.execute``,
+    so the client's retry policy applies.
+
+    With ``cursor_file`` set, the range resumes from the position stored there
+    and that position is saved every ``save_every`` checkpoints and when the
+    generator finishes or is closed. A checkpoint counts as consumed once the
+    consumer asks for the one after it.
+
+    :param client: The client to fetch with
+    :type client: AsyncClientBase
+    :param start: First sequence number of the range
+    :type start: int
+    :param end: Sequence number one past the last of the range
+    :type end: int
+    :param concurrency: Most fetches in flight, defaults to 8
+    :type concurrency: int, optional
+    :param reorder_window: Most checkpoints fetched ahead of the consumer, defaults to None (4 * concurrency)
+    :type reorder_window: Optional[int], optional
+    :param field_mask: gRPC checkpoint read mask, defaults to None (every field);
+        GraphQL always returns its fixed selection
+    :type field_mask: Optional[list[str]], optional
+    :param cursor_file: Path of a resumable cursor file, defaults to None
+    :type cursor_file: Optional[str], optional
+    :param save_every: Checkpoints consumed between cursor saves, defaults to 100
+    :type save_every: int, optional
+    :param timeout: Per fetch timeout in seconds, defaults to None
+    :type timeout: Optional[float], optional
+    :param headers: Headers or metadata passed to the transport, defaults to None
+    :type headers: Optional[dict], optional
+    :raises ValueError: If an argument is out of range, or a checkpoint cannot be fetched
+    """
+    if concurrency < 1 or save_every < 1:
+        raise ValueError("concurrency and save_every must be >= 1")
+    window = reorder_window or 4 * concurrency
+    if window < concurrency:
+        raise ValueError(f"reorder_window must be >= concurrency, found {window}")
+    cursor = CheckpointCursor(cursor_file) if cursor_file else None
+    if cursor is not None:
+        stored = cursor.load()
+        if stored is not None and start <= stored <= end:
+            logger.info("Resuming checkpoint range at %d from %s", stored, cursor_file)
+            start = stored
+
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def _fetch(sequence: int) -> sui_prot.Checkpoint:
+        async with limiter:
+            result = await client.execute(
+                command=cmd.GetCheckpointBySequence(sequence_number=sequence, field_mask=field_mask),
+                timeout=timeout,
+                headers=headers,
+            )
+        if not result.is_ok() or result.result_data.checkpoint is None:
+            raise ValueError(f"Unable to fetch checkpoint {sequence}: {result.result_string}")
+        return result.result_data.checkpoint
+
+    pending: collections.deque[asyncio.Task] = collections.deque()
+    following = start
+    consumed = start
+    try:
+        while consumed < end:
+            while following < end and len(pending) < window:
+                pending.append(asyncio.ensure_future(_fetch(following)))
+                following += 1
+            checkpoint = await pending[0]
+            pending.popleft()
+            record("checkpoint.range.buffered", sum(1 for task in pending if task.done()))
+            yield consumed, checkpoint
+            consumed += 1
+            if cursor is not None and (consumed - start) % save_every == 0:
+                cursor.save(consumed, end)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if cursor is not None:
+            cursor.save(consumed, end)
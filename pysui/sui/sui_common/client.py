@@ -6,9 +6,19 @@
 """Pysui generic client abstraction."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from pysui import PysuiConfiguration
 from pysui.sui.sui_common.types import TransactionConstraints
+from pysui.sui.sui_common.function_cache import MoveFunctionCache
+from pysui.sui.sui_common.chain_context import ChainContextCache, is_epoch_error
+from pysui.sui.sui_common.gas_inventory import (
+    GasCoinInventory,
+    gas_payer,
+    is_stale_object_error,
+)
+
+if TYPE_CHECKING:
+    from pysui.sui.sui_common.txn_gas import GasBudgetEstimator
 
 
 class PysuiClient(ABC):
@@ -19,16 +29,89 @@ class PysuiClient(ABC):
         *,
         pysui_config: PysuiConfiguration,
         default_header: Optional[dict] = None,
+        function_cache: Optional[MoveFunctionCache] = None,
     ):
         """."""
         self._pysui_config: PysuiConfiguration = pysui_config
         self._default_header = default_header if default_header else {}
+        self._function_cache: MoveFunctionCache = (
+            function_cache if function_cache is not None else MoveFunctionCache()
+        )
+        self._chain_context: ChainContextCache = ChainContextCache()
+        self._budget_estimator: Optional["GasBudgetEstimator"] = None
+        self._gas_inventories: dict[str, GasCoinInventory] = {}
 
     @property
     def config(self) -> PysuiConfiguration:
         """Fetch the Pysui configuration."""
         return self._pysui_config
 
+    @property
+    def function_cache(self) -> MoveFunctionCache:
+        """Fetch the Move function signature cache used by this client's transactions."""
+        return self._function_cache
+
+    @property
+    def chain_context(self) -> ChainContextCache:
+        """Fetch the epoch scoped chain context cache (gas price, epoch, chain id)."""
+        return self._chain_context
+
+    @property
+    def budget_estimator(self) -> Optional["GasBudgetEstimator"]:
+        """Fetch the opt-in gas budget estimator, None when budgets are always simulated."""
+        return self._budget_estimator
+
+    @budget_estimator.setter
+    def budget_estimator(self, estimator: Optional["GasBudgetEstimator"]) -> None:
+        """Set (or clear with None) the gas budget estimator used by transaction builds."""
+        self._budget_estimator = estimator
+
+    def gas_inventory(self, owner: str) -> GasCoinInventory:
+        """Fetch the gas coin inventory for owner, creating it on first use."""
+        key = owner.lower()
+        inventory = self._gas_inventories.get(key)
+        if inventory is None:
+            inventory = self._gas_inventories[key] = GasCoinInventory(key)
+        return inventory
+
+    def _observe_result(self, command: Any, result: Any) -> None:
+        """Fold a transaction execution into client side state.
+
+        Effects of a successful execution note their epoch in the chain context
+        and update every gas inventory. A failure from a below reference gas
+        price, expiration or epoch mismatch invalidates the chain context. A
+        failure caused by a stale or missing input object invalidates the
+        payer's inventory (every inventory if the payer can not be decoded) so
+        the next build reseeds it.
+        """
+        from pysui.sui.sui_common.sui_commands import ExecuteTransaction
+
+        if not isinstance(command, ExecuteTransaction):
+            return
+        if result.is_ok():
+            effects = getattr(result.result_data, "effects", None)
+            if effects is not None:
+                self._chain_context.note_epoch(effects.epoch)
+        elif is_epoch_error(str(result.result_string or "")):
+            self._chain_context.invalidate()
+        if not self._gas_inventories:
+            return
+        if result.is_ok():
+            if result.result_data is not None:
+                for inventory in self._gas_inventories.values():
+                    inventory.apply_executed(result.result_data)
+            return
+        if not is_stale_object_error(str(result.result_string or "")):
+            return
+        payer = gas_payer(command.tx_bytestr)
+        if payer is None:
+            stale = list(self._gas_inventories.values())
+        else:
+            inventory = self._gas_inventories.get(payer.lower())
+            stale = [inventory] if inventory is not None else []
+        for inventory in stale:
+            inventory.invalidate()
+
     @property
     @abstractmethod
     def current_gas_price(self) -> int:
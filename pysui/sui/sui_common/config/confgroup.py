@@ -6,10 +6,12 @@
 """Sui Configuration Group."""
 
 import base64
+from collections import OrderedDict
 from enum import IntEnum
 import hashlib
 import dataclasses
-from typing import Optional, Union
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Optional, Union
 import dataclasses_json
 from pysui.abstracts.client_keypair import SignatureScheme, KeyPair
 import pysui.sui.sui_crypto as crypto
@@ -39,6 +41,11 @@ SUI_GQL_RPC_GROUP: str = "sui_gql_config"
 SUI_GRPC_GROUP: str = "sui_grpc_config"
 SUI_USER_GROUP: str = "user"
 
+_PROFILE_NAME = attrgetter("profile_name")
+_ALIAS_NAME = attrgetter("alias")
+_KEY_STRING = attrgetter("private_key_base64")
+_SELF: Callable[[Any], Any] = lambda item: item
+
 
 @dataclasses.dataclass
 class ProfileAlias(dataclasses_json.DataClassJsonMixin):
@@ -63,6 +70,14 @@ class Profile(dataclasses_json.DataClassJsonMixin):
     url: str
     faucet_url: Optional[str] = None
     faucet_status_url: Optional[str] = None
+    # gRPC only: further nodes of the same network to fail over to, and
+    # connections opened to each node. Left out of the JSON when unset.
+    failover_urls: Optional[list[str]] = dataclasses.field(
+        default=None, metadata=dataclasses_json.config(exclude=lambda v: v is None)
+    )
+    channels_per_endpoint: Optional[int] = dataclasses.field(
+        default=None, metadata=dataclasses_json.config(exclude=lambda v: v is None)
+    )
 
 
 @dataclasses.dataclass
@@ -77,6 +92,8 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     address_list: list[str] = dataclasses.field(default_factory=list)
     profiles: list[Profile] = dataclasses.field(default_factory=list)
     protocol: GroupProtocol = GroupProtocol.OTHER
+    # Most decoded keypairs kept by keypair_for_address
+    KEYPAIR_CACHE_SIZE: ClassVar[int] = 256
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.__post_init__")
     def __post_init__(self):
@@ -86,37 +103,71 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             elif self.group_name == SUI_GRPC_GROUP:
                 self.protocol = GroupProtocol.GRPC
         self._transient: dict[str, dict] = {}
+        # Lookup indexes: name -> (indexed list, its length, {key: position})
+        self._indexes: dict[str, tuple[list, int, dict]] = {}
+        # address -> (keystring, decoded keypair), least recently used first
+        self._keypairs: OrderedDict[str, tuple[str, crypto.SuiKeyPair]] = OrderedDict()
+
+    @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._invalidate")
+    def _invalidate(self) -> None:
+        """Drop lookup indexes and decoded keypairs after the group changes."""
+        self._indexes.clear()
+        self._keypairs.clear()
+
+    @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._position")
+    def _position(self, name: str, items: list, key: Callable, value: Any) -> Optional[int]:
+        """Position of the first item whose key is value, or None.
+
+        The index for a list is rebuilt when the list is replaced or changes
+        length, and when a hit no longer matches (an item edited in place).
+        """
+        for _ in range(2):
+            cached = self._indexes.get(name)
+            if cached is None or cached[0] is not items or cached[1] != len(items):
+                index: dict = {}
+                for pos, item in enumerate(items):
+                    index.setdefault(key(item), pos)
+                cached = (items, len(items), index)
+                self._indexes[name] = cached
+            pos = cached[2].get(value)
+            if pos is None or key(items[pos]) == value:
+                return pos
+            del self._indexes[name]
+        return None
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._profile_exists")
     def _profile_exists(self, *, profile_name: str) -> Optional[Profile]:
         """Check if a profile, by name, exists."""
-        return next(
-            (prf for prf in self.profiles if prf.profile_name == profile_name), None
-        )
+        pos = self._position("profile", self.profiles, _PROFILE_NAME, profile_name)
+        return None if pos is None else self.profiles[pos]
+
+    @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._alias_position")
+    def _alias_position(self, alias_name: str) -> Optional[int]:
+        """Position of an alias in alias_list, which is also its address and key position."""
+        return self._position("alias", self.alias_list, _ALIAS_NAME, alias_name)
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._alias_exists")
     def _alias_exists(self, *, alias_name: str) -> Optional[ProfileAlias]:
         """Check if an alias, by name, exists."""
-        return next(
-            (ally for ally in self.alias_list if ally.alias == alias_name), None
-        )
+        pos = self._alias_position(alias_name)
+        return None if pos is None else self.alias_list[pos]
+
+    @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._address_position")
+    def _address_position(self, address: str) -> Optional[int]:
+        """Position of an address in address_list, which is also its alias and key position."""
+        return self._position("address", self.address_list, _SELF, address)
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._address_exists")
     def _address_exists(self, *, address: str) -> Optional[str]:
         """Check if address is valid."""
-        return next((addy for addy in self.address_list if addy == address), None)
+        pos = self._address_position(address)
+        return None if pos is None else self.address_list[pos]
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._key_exists")
     def _key_exists(self, *, key_string: str) -> Optional[ProfileKey]:
         """Check if key string exists."""
-        return next(
-            (
-                pkey
-                for pkey in self.key_list
-                if pkey.private_key_base64 == key_string
-            ),
-            None,
-        )
+        pos = self._position("key", self.key_list, _KEY_STRING, key_string)
+        return None if pos is None else self.key_list[pos]
 
     @property
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.active_address")
@@ -128,23 +179,25 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.active_address")
     def active_address(self, change_to: str) -> None:
         """Set the using address to change_to."""
-        _ = self.address_list.index(change_to)
+        if self._address_position(change_to) is None:
+            raise ValueError(f"{change_to!r} is not in list")
         self.using_address = change_to
 
     @property
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.active_alias")
     def active_alias(self) -> str:
         """Return the alias associated to the using (active) address."""
-        adex = self.address_list.index(self.using_address)
+        adex = self._address_position(self.using_address)
+        if adex is None:
+            raise ValueError(f"{self.using_address!r} is not in list")
         return self.alias_list[adex].alias
 
     @active_alias.setter
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.active_alias")
     def active_alias(self, change_to: str) -> None:
         """Change the alias that is active."""
-        _res = self._alias_exists(alias_name=change_to)
-        if _res:
-            aliindx = self.alias_list.index(_res)
+        aliindx = self._alias_position(change_to)
+        if aliindx is not None:
             self.using_address = self.address_list[aliindx]
             return
         raise ValueError(f"Alias {change_to} not found in group")
@@ -164,39 +217,36 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.address_for_alias")
     def address_for_alias(self, *, alias: str) -> str:
         """Get address associated with alias."""
-        _res = self._alias_exists(alias_name=alias)
-        if _res:
-            aliindx = self.alias_list.index(_res)
+        aliindx = self._alias_position(alias)
+        if aliindx is not None:
             return self.address_list[aliindx]
         raise ValueError(f"Alias {alias} not found in group")
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.alias_for_address")
     def alias_for_address(self, *, address: str) -> ProfileAlias:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
-        if _res:
-            adindex = self.address_list.index(_res)
+        adindex = self._address_position(address)
+        if adindex is not None:
             return self.alias_list[adindex]
         raise ValueError(f"Address {address} not found in group")
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.alias_name_for_address")
     def alias_name_for_address(self, *, address: str) -> str:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
-        if _res:
-            adindex = self.address_list.index(_res)
+        adindex = self._address_position(address)
+        if adindex is not None:
             return self.alias_list[adindex].alias
         raise ValueError(f"Address {address} not found in group")
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.replace_alias_name")
     def replace_alias_name(self, *, from_alias: str, to_alias: str) -> str:
         """Replace alias name and return associated address."""
-        _res = self._alias_exists(alias_name=from_alias)
-        if _res:
+        aliindx = self._alias_position(from_alias)
+        if aliindx is not None:
             _rese = self._alias_exists(alias_name=to_alias)
             if not _rese:
-                aliindx = self.alias_list.index(_res)
-                _res.alias = to_alias
+                self.alias_list[aliindx].alias = to_alias
+                self._invalidate()
                 return self.address_list[aliindx]
             raise ValueError(f"Alias {to_alias} already exists")
         raise ValueError(f"Alias {from_alias} not found in group")
@@ -236,13 +286,23 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.keypair_for_address")
     def keypair_for_address(self, *, address: str) -> crypto.SuiKeyPair:
-        """Fetch an addresses KeyPair."""
-        _res = self._address_exists(address=address)
-        if _res:
-            return crypto.keypair_from_keystring(
-                self.key_list[self.address_list.index(_res)].private_key_base64
-            )
-        raise ValueError(f"Keypair for address: {address} does not exist.")
+        """Fetch an addresses KeyPair.
+
+        Decoded keypairs are cached, up to ``KEYPAIR_CACHE_SIZE`` addresses.
+        """
+        adindex = self._address_position(address)
+        if adindex is None:
+            raise ValueError(f"Keypair for address: {address} does not exist.")
+        keystring = self.key_list[adindex].private_key_base64
+        cached = self._keypairs.get(address)
+        if cached is not None and cached[0] == keystring:
+            self._keypairs.move_to_end(address)
+            return cached[1]
+        keypair = crypto.keypair_from_keystring(keystring)
+        self._keypairs[address] = (keystring, keypair)
+        if len(self._keypairs) > self.KEYPAIR_CACHE_SIZE:
+            self._keypairs.popitem(last=False)
+        return keypair
 
     @staticmethod
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup._alias_check_or_gen")
@@ -374,6 +434,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             self.address_list.append(new_address)
             self.key_list.append(new_key)
             self.alias_list.append(new_alias)
+            self._invalidate()
 
             if make_active:
                 self.using_address = new_address
@@ -426,6 +487,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         self.key_list.extend(_pfkey)
         self.address_list.extend(addies)
         self.alias_list.extend(_pfalias)
+        self._invalidate()
         return addies
 
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.add_profile")
@@ -435,6 +497,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         if _res:
             raise ValueError(f"Profile {new_prf.profile_name} already exists.")
         self.profiles.append(new_prf)
+        self._invalidate()
         if make_active:
             self.active_profile = new_prf.profile_name
 
@@ -445,6 +508,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         if profile_name in prf_names:
             was_active: bool = self.using_profile == profile_name
             self.profiles = [x for x in self.profiles if x.profile_name != profile_name]
+            self._invalidate()
             prf_names = self.profile_names
             if was_active:
                 self.using_profile = prf_names[0] if prf_names else ""
@@ -454,14 +518,14 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     @sync_instrumented("pysui.sui.sui_common.config.confgroup.ProfileGroup.remove_alias")
     def remove_alias(self, *, alias_name: str) -> str:
         """Remove the identity associated to alias."""
-        al_names = [x.alias for x in self.alias_list]
-        if alias_name in al_names:
-            al_ndx = al_names.index(alias_name)
+        al_ndx = self._alias_position(alias_name)
+        if al_ndx is not None:
             # Remove remnants
             al_addy = self.address_list[al_ndx]
             self.alias_list.pop(al_ndx)
             self.address_list.pop(al_ndx)
             self.key_list.pop(al_ndx)
+            self._invalidate()
             if self.using_address == al_addy:
                 self.using_address = self.address_list[0] if self.address_list else ""
             if self.using_address:
@@ -583,6 +583,7 @@ class PysuiConfiguration:
 
         return addies
 
+    @versionchanged(version="1.2.0", reason="Added failover_urls and channels_per_endpoint arguments")
     @sync_instrumented("pysui.sui.sui_common.config.pysui_config.PysuiConfiguration.new_profile")
     def new_profile(
         self,
@@ -591,6 +592,8 @@ class PysuiConfiguration:
         url: str,
         faucet_url: Optional[str] = None,
         faucet_status_url: Optional[str] = None,
+        failover_urls: Optional[list[str]] = None,
+        channels_per_endpoint: Optional[int] = None,
         make_active: Optional[bool] = False,
         in_group: Optional[str] = None,
         persist: Optional[bool] = True,
@@ -605,6 +608,10 @@ class PysuiConfiguration:
         :type faucet_url: Optional[str], optional
         :param faucet_status_url: The faucet status url reference for the profile, defaults to None
         :type faucet_status_url: Optional[str], optional
+        :param failover_urls: gRPC only, other nodes of the same network to fail over to, defaults to None
+        :type failover_urls: Optional[list[str]], optional
+        :param channels_per_endpoint: gRPC only, connections opened to each node, defaults to None (1)
+        :type channels_per_endpoint: Optional[int], optional
         :param make_active: Sets this as the groups active_profile, defaults to False
         :type make_active: Optional[bool], optional
         :param in_group: Group to add new profile, defaults to active_group or excepts if not exists
@@ -618,12 +625,20 @@ class PysuiConfiguration:
             else self.active_group
         )
         _group.add_profile(
-            new_prf=cfg_group.Profile(profile_name, url, faucet_url, faucet_status_url),
+            new_prf=cfg_group.Profile(
+                profile_name,
+                url,
+                faucet_url,
+                faucet_status_url,
+                failover_urls=failover_urls,
+                channels_per_endpoint=channels_per_endpoint,
+            ),
             make_active=bool(make_active),
         )
         if persist:
             self._write_model()
 
+    @versionchanged(version="1.2.0", reason="Added failover_urls and channels_per_endpoint arguments")
     @sync_instrumented("pysui.sui.sui_common.config.pysui_config.PysuiConfiguration.update_profile")
     def update_profile(
         self,
@@ -632,6 +647,8 @@ class PysuiConfiguration:
         url: Optional[str] = None,
         faucet_url: Optional[str] = None,
         faucet_status_url: Optional[str] = None,
+        failover_urls: Optional[list[str]] = None,
+        channels_per_endpoint: Optional[int] = None,
         in_group: Optional[str] = None,
         persist: Optional[bool] = True,
     ):
@@ -645,6 +662,10 @@ class PysuiConfiguration:
         :type faucet_url: Optional[str], optional
         :param faucet_status_url: The faucet status url reference for the profile, defaults to None
         :type faucet_status_url: Optional[str], optional
+        :param failover_urls: gRPC only, replaces the failover node urls, an empty list clears them, defaults to None
+        :type failover_urls: Optional[list[str]], optional
+        :param channels_per_endpoint: gRPC only, connections opened to each node, defaults to None
+        :type channels_per_endpoint: Optional[int], optional
         :param make_active: Sets this as the groups active_profile, defaults to False
         :type make_active: Optional[bool], optional
         :param in_group: Group to add new profile, defaults to active_group or excepts if not exists
@@ -658,6 +679,9 @@ class PysuiConfiguration:
             else self.active_group
         )
         _prf = _group.get_profile(profile_name)
+        if failover_urls is not None:
+            _prf.failover_urls = failover_urls or None
+        _prf.channels_per_endpoint = channels_per_endpoint or _prf.channels_per_endpoint
         _prf.url = url or _prf.url
         _prf.faucet_url = faucet_url or _prf.faucet_url
         _prf.faucet_status_url = faucet_status_url or _prf.faucet_status_url
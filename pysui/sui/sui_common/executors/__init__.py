@@ -19,6 +19,9 @@ from pysui.sui.sui_common.executors.cache import (
     AsyncObjectCache,
     ObjectSummary,
     MoveFunctionCacheEntry,
+    SharedObjectCache,
+    SharedObjectCacheStats,
+    TransactionObjectCache,
 )
 from pysui.sui.sui_common.executors.base_caching_executor import _BaseCachingExecutor
 from pysui.sui.sui_common.executors.object_registry import (
@@ -26,13 +29,17 @@ from pysui.sui.sui_common.executors.object_registry import (
     AbstractObjectRegistry,
     InMemoryObjectRegistry,
     get_object_registry,
+    set_object_registry,
     _set_object_registry_for_tests,
 )
+from pysui.sui.sui_common.executors.shared_object_registry import (
+    SharedMemoryObjectRegistry,
+)
 from pysui.sui.sui_common.executors.conflict_tracker import (
     ConflictTracker,
     ConflictReservation,
 )
-from pysui.sui.sui_common.executors.gas_pool import GasCoin, GasCoinPool
+from pysui.sui.sui_common.executors.gas_pool import GasCoin, GasCoinPool, GasCoinPoolStats
 from pysui.sui.sui_common.executors.object_id_extract import extract_object_id
 from pysui.sui.sui_common.executors.base_parallel_executor import _BaseParallelExecutor
 from pysui.sui.sui_common.executors.parallel_executor import ParallelExecutor
@@ -46,14 +53,20 @@ __all__ = [
     "AsyncObjectCache",
     "ObjectSummary",
     "MoveFunctionCacheEntry",
+    "SharedObjectCache",
+    "SharedObjectCacheStats",
+    "TransactionObjectCache",
     "ObjectVersionEntry",
     "AbstractObjectRegistry",
     "InMemoryObjectRegistry",
     "get_object_registry",
+    "set_object_registry",
+    "SharedMemoryObjectRegistry",
     "ConflictTracker",
     "ConflictReservation",
     "GasCoin",
     "GasCoinPool",
+    "GasCoinPoolStats",
     "extract_object_id",
     "ParallelExecutor",
     "GasMode",
@@ -21,3 +21,5 @@ class _QueueItem:
     txn: "AsyncSuiTransaction"
     future: "asyncio.Future[Any]"
     retry_count: int = 0
+    # Least balance of the gas coin checked out for the transaction (coins mode)
+    min_gas_balance: int = 0
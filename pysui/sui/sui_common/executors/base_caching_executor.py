@@ -7,10 +7,20 @@
 
 from __future__ import annotations
 
+import base64
 import logging
+import time
 from typing import TYPE_CHECKING, Optional
 
-from pysui.sui.sui_common.executors.cache import AsyncObjectCache, ObjectSummary
+from pysui.sui.sui_common.chain_context import ChainContextCache
+from pysui.sui.sui_common.executors.cache import (
+    AsyncObjectCache,
+    ObjectSummary,
+    SharedObjectCache,
+    TransactionObjectCache,
+)
+from pysui.sui.sui_common.txn_gas import GasBudgetEstimator
+from pysui.sui.sui_common.txn_signing import SigningPool, default_signing_pool
 from pysui.sui.sui_common.types import TransactionEffects
 import pysui.sui.sui_bcs.bcs as bcs
 from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
@@ -30,11 +40,17 @@ class _BaseCachingExecutor:
         client=None,
         gas_owner: Optional[str] = None,
         use_account_gas: bool = False,
+        signing_pool: Optional[SigningPool] = None,
+        shared_cache: Optional[SharedObjectCache] = None,
     ) -> None:
         self._client = client
         self._gas_owner = gas_owner
         self._use_account_gas = use_account_gas
-        self.cache: AsyncObjectCache = AsyncObjectCache()
+        self._signing_pool = signing_pool or default_signing_pool()
+        # With a shared cache only the gas coin selection is private to this executor
+        self.cache: AsyncObjectCache = (
+            AsyncObjectCache() if shared_cache is None else TransactionObjectCache(shared_cache)
+        )
 
     @instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.build_transaction")
     async def build_transaction(
@@ -43,7 +59,7 @@ class _BaseCachingExecutor:
         signer_block,
         gas_objects_override: Optional[list] = None,
     ) -> dict:
-        """Resolve deferred object inputs then build and sign, injecting gas from cache."""
+        """Resolve deferred object inputs then build, injecting gas from cache, and sign in the signing pool."""
         txn.inject_cache(self.cache)
         if gas_objects_override is not None:
             use_gas = gas_objects_override
@@ -53,12 +69,57 @@ class _BaseCachingExecutor:
         return await txn.build_and_sign(
             use_gas_objects=use_gas,
             use_account_for_gas=self._use_account_gas and not use_gas,
+            signing_pool=self._signing_pool,
         )
 
     @instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.apply_effects")
     async def apply_effects(self, effects: TransactionEffects) -> None:
-        """Apply transaction effects to the cache."""
+        """Apply transaction effects to the cache and note the epoch they executed in."""
         await self.cache.applyEffects(effects)
+        ctx_cache = getattr(self._client, "chain_context", None)
+        if isinstance(ctx_cache, ChainContextCache):
+            ctx_cache.note_epoch(getattr(effects, "epoch", None))
+
+    @sync_instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.note_insufficient_gas")
+    def note_insufficient_gas(self, signed_tx: dict) -> None:
+        """Drop the estimated budget for a transaction's shape after an insufficient gas failure."""
+        estimator = getattr(self._client, "budget_estimator", None)
+        if not isinstance(estimator, GasBudgetEstimator):
+            return
+        tx_data = bcs.TransactionData.deserialize(base64.b64decode(signed_tx["tx_bytestr"]))
+        estimator.note_insufficient_gas(tx_data.value.TransactionKind)
+
+    @instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.evict_owned_inputs")
+    async def evict_owned_inputs(
+        self, signed_tx: dict, registry: Optional["AbstractObjectRegistry"] = None
+    ) -> list[str]:
+        """Drop the owned object inputs of a transaction that failed to execute.
+
+        The failure may be a cached input version gone stale (spent elsewhere);
+        evicting the inputs from the cache and the registry makes the next
+        build re-read them from the node.
+
+        :param signed_tx: The built transaction, as returned by build_transaction
+        :type signed_tx: dict
+        :param registry: Object version registry to evict from as well, defaults to None
+        :type registry: Optional[AbstractObjectRegistry], optional
+        :return: The evicted object ids
+        :rtype: list[str]
+        """
+        tx_data = bcs.TransactionData.deserialize(base64.b64decode(signed_tx["tx_bytestr"]))
+        kind = tx_data.value.TransactionKind
+        if kind.enum_name != "ProgrammableTransaction":
+            return []
+        oids = [
+            arg.value.value.ObjectID.to_address_str()
+            for arg in kind.value.Inputs
+            if arg.enum_name == "Object" and arg.value.enum_name in ("ImmOrOwnedObject", "Receiving")
+        ]
+        await self.cache.delete_objects(oids)
+        if registry is not None:
+            for oid in oids:
+                await registry.evict(oid)
+        return oids
 
     @instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.reset")
     async def reset(self) -> None:
@@ -77,19 +138,37 @@ class _BaseCachingExecutor:
 
     @instrumented("pysui.sui.sui_common.executors.base_caching_executor._BaseCachingExecutor.sync_to_registry")
     async def sync_to_registry(self, registry: "AbstractObjectRegistry") -> None:
-        """Push known object versions from the per-executor cache into the shared registry.
+        """Push the object versions changed by applied effects into the shared registry.
 
-        Higher version always wins — stale writes are silently dropped by the registry.
+        Only objects written or deleted since the last sync are sent, in one
+        batch; deletions are sent as tombstones. Higher version always wins —
+        stale writes are silently dropped by the registry.
         Called by the parallel executor after each transaction's effects are applied.
         """
-        from pysui.sui.sui_common.executors.object_registry import ObjectVersionEntry
-
-        # Only owned objects change version after execution; shared objects use
-        # initialSharedVersion which is stable and doesn't need registry tracking.
-        owned = self.cache._cache.get("OwnedObject", {})
-        entries: list[ObjectVersionEntry] = [
-            ObjectVersionEntry(object_id=oid, version=cached.version, digest=cached.digest)
-            for oid, cached in owned.items()
-        ]
+        from pysui.sui.sui_common.executors.object_registry import (
+            InMemoryObjectRegistry,
+            ObjectVersionEntry,
+        )
+
+        dirty = self.cache.take_dirty()
+        if not dirty:
+            return
+        ttl_ns = int(InMemoryObjectRegistry.DEFAULT_TOMBSTONE_TTL_SECONDS * 1_000_000_000)
+        expires_ns = time.monotonic_ns() + ttl_ns
+        entries: list[ObjectVersionEntry] = []
+        for oid, cached in dirty.items():
+            if cached is None:
+                entries.append(
+                    ObjectVersionEntry(
+                        object_id=oid,
+                        version=0,
+                        digest="",
+                        is_tombstone=True,
+                        tombstone_expires_ns=expires_ns,
+                    )
+                )
+            elif cached.owner:
+                # Shared objects keep a stable initialSharedVersion; only owned versions are tracked
+                entries.append(ObjectVersionEntry(object_id=oid, version=cached.version, digest=cached.digest))
         if entries:
             await registry.upsert_many(entries)
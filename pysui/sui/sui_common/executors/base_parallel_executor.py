@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -22,6 +24,7 @@ from pysui.sui.sui_common.executors.exec_types import (
     ExecutorOptions,
 )
 from pysui.sui.sui_common.executors.base_caching_executor import _BaseCachingExecutor
+from pysui.sui.sui_common.executors.cache import SharedObjectCache
 from pysui.sui.sui_common.executors.conflict_tracker import ConflictTracker
 from pysui.sui.sui_common.executors.gas_pool import GasCoin, GasCoinPool
 from pysui.sui.sui_common.executors.object_registry import (
@@ -35,17 +38,33 @@ from pysui.sui.sui_common.executors.gas_utils import (
     update_tracked_balance,
     update_tracked_balance_from_accumulator,
     run_replenishment,
+    merge_gas_coins,
+    splay_gas_coin,
 )
 from pysui.sui.sui_common.executors._queue_types import _SENTINEL, _QueueItem
 from pysui.sui.sui_common.validators import valid_sui_address
 from pysui.sui.sui_common.txn_tx_argparse import TxnArgMode
 import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
 import pysui.sui.sui_common.sui_commands as cmd
-from pysui.sui.sui_common.instrumentation import instrumented, measure, sync_instrumented
+from pysui.sui.sui_common.instrumentation import (
+    instrumented,
+    measure,
+    record,
+    sync_instrumented,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ScheduledItem:
+    """A queued transaction held in the scheduler's reorder window."""
+
+    item: _QueueItem
+    conflict_ids: set[str]
+    sender: str
+
+
 class _BaseParallelExecutor:
     """Protocol-agnostic concrete parallel transaction executor.
 
@@ -60,6 +79,11 @@ class _BaseParallelExecutor:
 
     Conflict tracking serializes transactions sharing owned object inputs,
     preventing equivocation while allowing concurrent execution of non-conflicting txns.
+    The build worker looks ahead up to ``reorder_window`` queued transactions so
+    a transaction blocked on a busy object does not stall unrelated ones.
+    Sui has no multi-transaction execute RPC: every signed transaction is its
+    own ``ExecuteTransaction`` request, and ``max_concurrent`` bounds how many
+    are outstanding.
     """
 
     @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor.__init__")
@@ -71,16 +95,31 @@ class _BaseParallelExecutor:
         self._build_task: asyncio.Task[None] | None = None
         self._build_queue: asyncio.Queue[_QueueItem | object] = asyncio.Queue()
         self._in_flight: set[asyncio.Task[None]] = set()
+        self._window: deque[_ScheduledItem] = deque()
+        self._wakeup = asyncio.Event()
         self._semaphore = asyncio.Semaphore(options.max_concurrent)
         self._conflict_tracker = ConflictTracker()
         self._registry: AbstractObjectRegistry = get_object_registry()
+        self._object_cache = SharedObjectCache(self._registry)
         self._tracked_balance: int = 0
         self._signing_block = SignerBlock(sender=options.sender)
 
         if options.gas_mode == GasMode.COINS:
-            self._gas_pool: GasCoinPool | None = GasCoinPool()
+            # When splaying, top the pool up once half the configured coins are gone
+            self._gas_pool: GasCoinPool | None = (
+                GasCoinPool(low_water_mark=max(1, options.max_concurrent // 2))
+                if options.splay_coin_balance
+                else GasCoinPool()
+            )
         else:
             self._gas_pool = None
+        self._gas_maintenance: asyncio.Task[None] | None = None
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor.object_cache")
+    def object_cache(self) -> SharedObjectCache:
+        """Return the object cache shared by this executor's transactions."""
+        return self._object_cache
 
     @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._initialize")
     async def _initialize(self) -> None:
@@ -106,8 +145,12 @@ class _BaseParallelExecutor:
                 )
                 for o in selected
             ]
-            await self._gas_pool.replenish(gas_coins)
             self._tracked_balance = sum(c.balance for c in gas_coins)
+            if self._options.splay_coin_balance:
+                gas_coins.sort(key=lambda c: c.balance, reverse=True)
+                splayed = await self._splay(gas_coins[0], self._options.max_concurrent - len(gas_coins))
+                gas_coins = splayed + gas_coins[1:]
+            await self._gas_pool.replenish(gas_coins)
         else:
             bal_result = await self._client.execute(
                 command=cmd.GetAddressCoinBalance(owner=sender)
@@ -164,9 +207,85 @@ class _BaseParallelExecutor:
             ]
             await self._gas_pool.replenish(gas_coins)
             self._tracked_balance += sum(c.balance for c in gas_coins)
+            self._wakeup.set()
         else:
             await self._send_funds_to_account(candidates, self._tracked_balance)
 
+    @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._splay")
+    async def _splay(self, source: GasCoin, count: int) -> list[GasCoin]:
+        """Split count gas coins of splay_coin_balance off source; returns source and the new coins."""
+        if count <= 0:
+            return [source]
+        coins, effects = await splay_gas_coin(
+            client=self._client,
+            sender=self._signing_block.sender_str,
+            source=source,
+            count=count,
+            amount=self._options.splay_coin_balance,
+            new_transaction_fn=self._new_transaction,
+        )
+        if effects is not None:
+            self._update_tracked_balance(effects)
+            record("executor.gas.splay", len(coins) - 1)
+        return coins
+
+    @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._maybe_maintain_gas")
+    def _maybe_maintain_gas(self) -> None:
+        """Start background gas maintenance when splaying and the pool has run low."""
+        if not self._options.splay_coin_balance or self._gas_pool is None or self._dead:
+            return
+        if self._gas_maintenance is not None and not self._gas_maintenance.done():
+            return
+        if not self._gas_pool.is_low():
+            return
+        task = asyncio.create_task(self._maintain_gas())
+        self._gas_maintenance = task
+        # Tracked with the in-flight transactions so close() waits for it
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._maintain_gas")
+    async def _maintain_gas(self) -> None:
+        """Merge retired coins back and re-splay the pool up to max_concurrent coins."""
+        retired = self._gas_pool.take_retired()
+        source: GasCoin | None = None
+        from_pool = False
+        try:
+            if retired:
+                source, effects = await merge_gas_coins(
+                    client=self._client,
+                    sender=self._signing_block.sender_str,
+                    coin_ids=[c.object_id for c in retired],
+                    new_transaction_fn=self._new_transaction,
+                )
+                if effects is not None:
+                    self._update_tracked_balance(effects)
+                    record("executor.gas.merge", len(retired))
+            if source is None:
+                source = self._gas_pool.try_checkout(min_balance=self._gas_pool.max_balance())
+                from_pool = source is not None
+            if source is None:
+                return
+            # A coin taken from the pool is already counted as in circulation
+            wanted = self._options.max_concurrent - self._gas_pool.managed() - (0 if from_pool else 1)
+            coins = await self._splay(source, wanted)
+        except Exception as exc:
+            logger.warning("_BaseParallelExecutor: gas maintenance failed: %s", exc)
+            if from_pool:
+                # Its version is uncertain after a failed split; re-read when merged next cycle
+                await self._gas_pool.checkin(source, retire=True)
+            elif source is not None:
+                # The retired coins were merged into source; keep it for the next cycle
+                self._gas_pool.restore_retired([source])
+            else:
+                self._gas_pool.restore_retired(retired)
+            return
+        if from_pool:
+            await self._gas_pool.checkin(coins[0])
+            coins = coins[1:]
+        await self._gas_pool.replenish(coins)
+        self._wakeup.set()
+
     @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._send_funds_to_account")
     async def _send_funds_to_account(self, candidates: list, existing_balance: int = 0) -> None:
         executed_tx = await send_funds_to_account(
@@ -186,7 +305,7 @@ class _BaseParallelExecutor:
         return await self._client.transaction(**kwargs)
 
     @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._submit_one")
-    def _submit_one(self, txn) -> asyncio.Future:
+    def _submit_one(self, txn, min_gas_balance: int = 0) -> asyncio.Future:
         loop = asyncio.get_running_loop()
         future = loop.create_future()
         if self._dead:
@@ -194,64 +313,157 @@ class _BaseParallelExecutor:
                 ExecutionSkipped(transaction_index=-1, reason="Executor is dead")
             )
             return future
-        self._build_queue.put_nowait(_QueueItem(txn=txn, future=future))
+        self._build_queue.put_nowait(_QueueItem(txn=txn, future=future, min_gas_balance=min_gas_balance))
+        self._wakeup.set()
         return future
 
     @instrumented("executor.parallel._build_worker")
     async def _build_worker(self) -> None:
-        """Serial background coroutine: acquire conflict + gas, dispatch execute tasks."""
+        """Background scheduler: dispatch queued transactions as soon as they can run.
+
+        Up to ``reorder_window`` queued transactions are held in a window. Each
+        pass dispatches, in submit order, every window entry whose objects are
+        free and for which a concurrency slot (and a gas coin in COINS mode) is
+        available. An entry never overtakes an earlier blocked entry sharing an
+        object, or sharing its sender when ``preserve_sender_order`` is set.
+        When nothing can be dispatched the worker sleeps until an in-flight
+        transaction finishes, funds are added or a new transaction is submitted.
+        """
+        window_size = max(1, self._options.reorder_window)
+        stopping = False
         while True:
-            try:
-                item = await self._build_queue.get()
-            except asyncio.CancelledError:
-                break
-            if item is _SENTINEL:
+            while not stopping and len(self._window) < window_size:
+                try:
+                    item = self._build_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
                 self._build_queue.task_done()
-                break
+                if item is _SENTINEL:
+                    stopping = True
+                else:
+                    self._window.append(await self._schedule_entry(item))
 
             if self._dead:
-                item.future.set_result(
-                    ExecutionSkipped(transaction_index=-1, reason="Executor is dead")
-                )
+                self._skip_window("Executor is dead")
+            if not self._window:
+                if stopping:
+                    break
+                try:
+                    item = await self._build_queue.get()
+                except asyncio.CancelledError:
+                    break
                 self._build_queue.task_done()
+                if item is _SENTINEL:
+                    stopping = True
+                else:
+                    self._window.append(await self._schedule_entry(item))
                 continue
 
-            # Conflict acquisition — blocks until all object IDs are free
-            try:
-                async with measure("executor.parallel.object_resolve"):
-                    unresolved = item.txn.builder.get_unresolved_inputs()
-                    conflict_ids: set[str] = {
-                        u.ObjectStr for u in unresolved.values()
-                        if hasattr(u, "ObjectStr")
-                    }
-            except (AttributeError, TypeError):
-                conflict_ids = set()
-            reservation = await self._conflict_tracker.acquire(conflict_ids)
-
-            # Bound concurrency — block here if max_concurrent tasks are running
-            await self._semaphore.acquire()
+            self._wakeup.clear()
+            if not await self._dispatch_ready():
+                try:
+                    await self._wakeup.wait()
+                except asyncio.CancelledError:
+                    break
+
+    @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._schedule_entry")
+    async def _schedule_entry(self, item: _QueueItem) -> _ScheduledItem:
+        """Capture the conflict set and ordering key of a queued transaction."""
+        try:
+            async with measure("executor.parallel.object_resolve"):
+                unresolved = item.txn.builder.get_unresolved_inputs()
+                conflict_ids: set[str] = {
+                    u.ObjectStr for u in unresolved.values()
+                    if hasattr(u, "ObjectStr")
+                }
+        except (AttributeError, TypeError):
+            conflict_ids = set()
+        try:
+            sender = item.txn.signer_block.sender_str
+        except (AttributeError, TypeError, ValueError):
+            sender = None
+        return _ScheduledItem(
+            item=item,
+            conflict_ids=conflict_ids,
+            sender=sender or self._signing_block.sender_str,
+        )
+
+    @instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._dispatch_ready")
+    async def _dispatch_ready(self) -> bool:
+        """Dispatch every window entry that can run now; True if any was dispatched."""
+        coins_mode = self._options.gas_mode == GasMode.COINS
+        blocked_ids: set[str] = set()
+        blocked_senders: set[str] = set()
+        waiting: deque[_ScheduledItem] = deque()
+        dispatched = False
+        while self._window:
+            entry = self._window.popleft()
+            if self._semaphore.locked() or (coins_mode and self._gas_pool.size() == 0):
+                waiting.append(entry)
+                waiting.extend(self._window)
+                self._window.clear()
+                break
+            reservation = None
+            if not (entry.conflict_ids & blocked_ids) and not (
+                self._options.preserve_sender_order and entry.sender in blocked_senders
+            ) and self._gas_available(entry.item.min_gas_balance):
+                reservation = self._conflict_tracker.try_acquire(entry.conflict_ids)
+            if reservation is None:
+                blocked_ids |= entry.conflict_ids
+                blocked_senders.add(entry.sender)
+                waiting.append(entry)
+                continue
 
-            # Gas checkout — blocks if pool is empty (back-pressure in COINS mode)
-            gas_coin: GasCoin | None = None
-            if self._options.gas_mode == GasMode.COINS:
-                gas_coin = await self._gas_pool.checkout()
+            # Neither call suspends: a slot and a coin are known to be available
+            await self._semaphore.acquire()
+            gas_coin: GasCoin | None = (
+                self._checkout_gas_nowait(entry.item.min_gas_balance) if coins_mode else None
+            )
+            if waiting:
+                record("executor.parallel.reordered")
 
-            # Per-transaction caching executor (isolated; not shared across tasks)
+            # Per-transaction caching executor over the shared object cache
             caching_exec = _BaseCachingExecutor(
                 client=self._client,
                 gas_owner=self._signing_block.sender_str,
                 use_account_gas=(self._options.gas_mode == GasMode.ADDRESS_BALANCE),
+                signing_pool=self._options.signing_pool,
+                shared_cache=self._object_cache,
             )
-            if gas_coin is not None:
-                await caching_exec.update_gas_coins([gas_coin.object_id])
-
             task = asyncio.create_task(
-                self._execute_item(item, gas_coin, reservation, caching_exec)
+                self._execute_item(entry.item, gas_coin, reservation, caching_exec)
             )
             self._in_flight.add(task)
             task.add_done_callback(self._in_flight.discard)
+            dispatched = True
+        self._window = waiting
+        return dispatched
+
+    @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._gas_available")
+    def _gas_available(self, min_balance: int) -> bool:
+        """True unless a transaction should wait for a coin of min_balance to come back.
 
-            self._build_queue.task_done()
+        A coin that may satisfy it is out with an in-flight transaction while
+        none of the available coins does; with nothing out the richest available
+        coin is used rather than waiting forever.
+        """
+        pool = self._gas_pool
+        if pool is None or min_balance <= pool.max_balance():
+            return True
+        return pool.managed() == pool.size()
+
+    @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._checkout_gas_nowait")
+    def _checkout_gas_nowait(self, min_balance: int) -> GasCoin | None:
+        """Check out the smallest available coin holding min_balance, else the richest available."""
+        return self._gas_pool.try_checkout(min_balance=min(min_balance, self._gas_pool.max_balance()))
+
+    @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._skip_window")
+    def _skip_window(self, reason: str) -> None:
+        """Resolve every transaction held in the reorder window as skipped."""
+        while self._window:
+            future = self._window.popleft().item.future
+            if not future.done():
+                future.set_result(ExecutionSkipped(transaction_index=-1, reason=reason))
 
     @instrumented("executor.parallel._execute_item")
     async def _execute_item(
@@ -311,12 +523,20 @@ class _BaseParallelExecutor:
                             "insufficient gas" in error_str or
                             "insufficient_gas" in error_str
                         )
+                        if is_gas_error:
+                            caching_exec.note_insufficient_gas(signed_tx)
 
                         if is_gas_error and item.retry_count < self._options.max_retries:
                             if gas_coin is not None:
+                                # Retry with a richer coin than the one that ran short
+                                item.min_gas_balance = max(item.min_gas_balance, gas_coin.balance + 1)
                                 await self._gas_pool.checkin(gas_coin, retire=True)
                                 gas_coin = None
-                            if not await self._replenish():
+                            richer_pooled = (
+                                self._gas_pool is not None
+                                and self._gas_pool.max_balance() >= item.min_gas_balance
+                            )
+                            if not richer_pooled and not await self._replenish():
                                 item.future.set_result((ExecutorError.EXECUTING_ERROR, exc))
                                 await self._hard_stop("on_balance_low declined on gas retry")
                                 return
@@ -324,7 +544,11 @@ class _BaseParallelExecutor:
                             if self._options.gas_mode == GasMode.COINS:
                                 self._semaphore.release()
                                 semaphore_held = False
-                                gas_coin = await self._gas_pool.checkout()
+                                gas_coin = self._checkout_gas_nowait(item.min_gas_balance)
+                                if gas_coin is None:
+                                    gas_coin = await self._gas_pool.checkout(
+                                        min_balance=item.min_gas_balance, or_richest=True
+                                    )
                                 await self._semaphore.acquire()
                                 semaphore_held = True
                             continue
@@ -332,6 +556,11 @@ class _BaseParallelExecutor:
                         if gas_coin is not None:
                             await self._gas_pool.checkin(gas_coin, retire=True)
                             gas_coin = None
+                        try:
+                            # A stale cached input must not fail the next build too
+                            await caching_exec.evict_owned_inputs(signed_tx, self._registry)
+                        except Exception as evict_exc:
+                            logger.debug("_BaseParallelExecutor: input eviction failed: %s", evict_exc)
                         if not item.future.done():
                             item.future.set_result((ExecutorError.EXECUTING_ERROR, exc))
                         if is_gas_error:
@@ -367,6 +596,8 @@ class _BaseParallelExecutor:
                 await self._gas_pool.checkin(gas_coin, retire=True)
             if semaphore_held:
                 self._semaphore.release()
+            self._maybe_maintain_gas()
+            self._wakeup.set()
 
     @sync_instrumented("pysui.sui.sui_common.executors.base_parallel_executor._BaseParallelExecutor._update_gas_coin")
     def _update_gas_coin(
@@ -440,6 +671,7 @@ class _BaseParallelExecutor:
                 self._build_queue.task_done()
             except asyncio.QueueEmpty:
                 break
+        self._skip_window(reason)
         self._build_queue.put_nowait(_SENTINEL)
         if self._build_task is not None and not self._build_task.done():
             self._build_task.cancel()
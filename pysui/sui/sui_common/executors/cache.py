@@ -8,7 +8,7 @@
 from abc import ABC, abstractmethod
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from dataclasses import dataclass
 
 from pysui.sui.sui_common.shared_types import ObjectSummary
@@ -20,6 +20,7 @@ from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
 # as a consequence — runtime hint resolution (e.g. typing.get_type_hints) will not work.
 if TYPE_CHECKING:
     import pysui.sui.sui_pgql.pgql_types as ptypes
+    from pysui.sui.sui_common.executors.object_registry import AbstractObjectRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +238,8 @@ class AsyncObjectCache(AsyncInMemoryCache):
         """Initialize the async object cache."""
 
         super().__init__()
+        # Objects changed by applied effects and not yet taken; None marks a deletion
+        self._dirty: dict[str, Optional[ObjectSummary]] = {}
 
     @instrumented("pysui.sui.sui_common.executors.cache.AsyncObjectCache.clear")
     async def clear(self, cache_type: Union[str, None]):
@@ -321,3 +324,155 @@ class AsyncObjectCache(AsyncInMemoryCache):
             logger.debug("Effects results: Deleted %s Added %s", deleted, added)
             await self.delete_objects(deleted)
             await self.add_objects(added)
+            for oid in deleted:
+                self._dirty[oid] = None
+            for obj in added:
+                self._dirty[obj.objectId] = obj
+
+    @sync_instrumented("pysui.sui.sui_common.executors.cache.AsyncObjectCache.take_dirty")
+    def take_dirty(self) -> dict[str, Optional[ObjectSummary]]:
+        """Return and forget the objects changed by effects applied since the last call.
+
+        :return: Object id to its written summary, or None if the effects deleted it
+        :rtype: dict[str, Optional[ObjectSummary]]
+        """
+        dirty, self._dirty = self._dirty, {}
+        return dirty
+
+
+@dataclass(frozen=True)
+class SharedObjectCacheStats:
+    """Point in time counters for a SharedObjectCache."""
+
+    hits: int
+    registry_hits: int
+    misses: int
+    size: int
+
+
+class SharedObjectCache(AsyncObjectCache):
+    """Object cache shared by every transaction of a parallel executor.
+
+    Lookups consult the object version registry first, then the objects this
+    cache has learned from resolution and effects; a miss is fetched from the
+    network by the caller and added back. Owned object writes are version
+    monotonic: an add never replaces a newer version, so a summary fetched
+    before a sibling transaction executed can not undo that transaction's
+    effects. Shared and immutable objects are stable once known.
+
+    Transactions see it through a ``TransactionObjectCache`` overlay that keeps
+    their gas coin selection private.
+    """
+
+    @sync_instrumented("pysui.sui.sui_common.executors.cache.SharedObjectCache.__init__")
+    def __init__(self, registry: "AbstractObjectRegistry | None" = None):
+        """Initialize the shared cache.
+
+        :param registry: Object version registry consulted before local entries, defaults to None
+        :type registry: AbstractObjectRegistry | None
+        """
+        super().__init__()
+        self._registry = registry
+        self._hits = 0
+        self._registry_hits = 0
+        self._misses = 0
+
+    @sync_instrumented("pysui.sui.sui_common.executors.cache.SharedObjectCache.stats")
+    def stats(self) -> SharedObjectCacheStats:
+        """Return the current counters."""
+        return SharedObjectCacheStats(
+            hits=self._hits,
+            registry_hits=self._registry_hits,
+            misses=self._misses,
+            size=len(self._cache["OwnedObject"]) + len(self._cache["SharedOrImmutableObject"]),
+        )
+
+    @instrumented("pysui.sui.sui_common.executors.cache.SharedObjectCache.get_object")
+    async def get_object(self, id: str) -> Union[ObjectSummary, None]:
+        """Return the freshest known summary of an object, None if it must be fetched."""
+        shared = self._cache["SharedOrImmutableObject"].get(id)
+        if shared is not None:
+            self._hits += 1
+            return shared
+        local = self._cache["OwnedObject"].get(id)
+        entry = await self._registry.get(id) if self._registry is not None else None
+        if entry is not None:
+            if entry.is_tombstone:
+                self._misses += 1
+                return None
+            if local is None or int(local.version) < entry.version:
+                # Written by another executor; the registry tracks owned objects only
+                self._registry_hits += 1
+                return ObjectSummary(
+                    objectId=id,
+                    version=str(entry.version),
+                    digest=entry.digest,
+                    owner=local.owner if local is not None else None,
+                )
+        if local is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return local
+
+    @instrumented("pysui.sui.sui_common.executors.cache.SharedObjectCache.add_object")
+    async def add_object(self, obj: ObjectSummary) -> ObjectSummary:
+        """Add an object summary unless a newer version of it is already known."""
+        if obj.owner:
+            owned = self._cache["OwnedObject"]
+            known = owned.get(obj.objectId)
+            if known is not None and int(known.version) > int(obj.version):
+                return known
+            owned[obj.objectId] = obj
+            self._cache["SharedOrImmutableObject"].pop(obj.objectId, None)
+        else:
+            self._cache["SharedOrImmutableObject"][obj.objectId] = obj
+            self._cache["OwnedObject"].pop(obj.objectId, None)
+        return obj
+
+    @instrumented("pysui.sui.sui_common.executors.cache.SharedObjectCache._clear")
+    async def _clear(self, cache_type: Union[str, None]) -> None:
+        """Clear buckets in place so overlays keep seeing the same stores."""
+        for name, bucket in self._cache.items():
+            if cache_type is None or name == cache_type:
+                bucket.clear()
+
+
+class TransactionObjectCache(AsyncObjectCache):
+    """Per transaction view of a SharedObjectCache.
+
+    Object and Move function lookups, additions and applied effects go to the
+    shared cache. The ``Custom`` bucket, which holds the transaction's gas coin
+    selection, belongs to the overlay, and ``reset`` only clears the overlay.
+    """
+
+    @sync_instrumented("pysui.sui.sui_common.executors.cache.TransactionObjectCache.__init__")
+    def __init__(self, shared: SharedObjectCache):
+        """Initialize the overlay.
+
+        :param shared: The executor's shared object cache
+        :type shared: SharedObjectCache
+        """
+        super().__init__()
+        self.shared = shared
+        # Alias the shared stores so inherited bucket access reads through
+        for name in ("OwnedObject", "SharedOrImmutableObject", "MoveFunction"):
+            self._cache[name] = shared._cache[name]
+
+    @instrumented("pysui.sui.sui_common.executors.cache.TransactionObjectCache.get_object")
+    async def get_object(self, id: str) -> Union[ObjectSummary, None]:
+        """Return the object summary from the shared cache."""
+        return await self.shared.get_object(id)
+
+    @instrumented("pysui.sui.sui_common.executors.cache.TransactionObjectCache.add_object")
+    async def add_object(self, obj: ObjectSummary) -> ObjectSummary:
+        """Add an object summary to the shared cache."""
+        return await self.shared.add_object(obj)
+
+    @instrumented("pysui.sui.sui_common.executors.cache.TransactionObjectCache._clear")
+    async def _clear(self, cache_type: Union[str, None]) -> None:
+        """Clear the overlay's Custom bucket, or the named shared bucket."""
+        if cache_type is None or cache_type == "Custom":
+            self._cache["Custom"] = {}
+        else:
+            await self.shared._clear(cache_type)
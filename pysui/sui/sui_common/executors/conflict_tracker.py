@@ -7,24 +7,45 @@
 
 import asyncio
 import logging
-from collections import defaultdict, deque
-from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+import time
+from collections import deque
+from typing import Optional
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
 
 logger = logging.getLogger(__name__)
 
 
+class _Waiter:
+    """One transaction's claim on a set of object IDs.
+
+    ``remaining`` counts the object queues in which the waiter is not yet at
+    the head; the claim is granted when it reaches zero.
+    """
+
+    __slots__ = ("ids", "remaining", "future", "enqueued_at", "released")
+
+    def __init__(self, ids: tuple[str, ...]) -> None:
+        self.ids = ids
+        self.remaining = 0
+        self.future: Optional[asyncio.Future] = None
+        self.enqueued_at = 0.0
+        self.released = False
+
+
 class ConflictReservation:
     """Holds an active conflict claim; release via async context manager or release()."""
 
+    __slots__ = ("_tracker", "_waiter")
+
     @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictReservation.__init__")
-    def __init__(self, tracker: "ConflictTracker", claimed: list[tuple[str, asyncio.Event]]) -> None:
+    def __init__(self, tracker: "ConflictTracker", waiter: _Waiter) -> None:
         self._tracker = tracker
-        self._claimed = claimed
+        self._waiter = waiter
 
     @instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictReservation.release")
     async def release(self) -> None:
         """Release the claimed conflict reservations."""
-        await self._tracker._release(self._claimed)
+        self._tracker._release(self._waiter)
 
     @instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictReservation.__aenter__")
     async def __aenter__(self) -> "ConflictReservation":
@@ -38,58 +59,122 @@ class ConflictReservation:
 class ConflictTracker:
     """Tracks in-flight object IDs and serializes transactions that share owned objects.
 
-    Transactions are queued FIFO per object ID. IDs are always claimed in sorted
-    order to prevent deadlock when a transaction needs multiple objects.
+    Each object ID has a FIFO queue of waiters; the head of every queue holds
+    the object. A transaction enqueues a single waiter in all of its queues at
+    once and runs when it reaches the head of each. Because a waiter is
+    enqueued atomically, every pair of transactions is ordered the same way in
+    all the queues they share, so overlapping sets can not deadlock.
+
+    All bookkeeping is synchronous, which makes it atomic on the event loop
+    without a lock. Release pops one queue head per object and wakes a
+    successor only when its last object is handed over.
+
+    Samples reported through ``instrumentation.record``:
+
+    - ``executor.conflict.queue_depth``: for each object a transaction has to
+      wait for, the number of transactions ahead of it at enqueue time
+    - ``executor.conflict.wait_seconds``: time from enqueue to grant for a
+      transaction that had to wait
     """
 
     @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker.__init__")
     def __init__(self) -> None:
-        self._waiters: dict[str, deque[asyncio.Event]] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        self._queues: dict[str, deque[_Waiter]] = {}
+
+    @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker._enqueue")
+    def _enqueue(self, conflict_ids: set[str]) -> _Waiter:
+        """Append a waiter to the queue of every object ID, creating queues as needed."""
+        waiter = _Waiter(tuple(conflict_ids))
+        queues = self._queues
+        for oid in waiter.ids:
+            q = queues.get(oid)
+            if q is None:
+                queues[oid] = deque((waiter,))
+            else:
+                q.append(waiter)
+                waiter.remaining += 1
+                record("executor.conflict.queue_depth", len(q) - 1)
+        return waiter
 
     @instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker.acquire")
     async def acquire(self, conflict_ids: set[str]) -> ConflictReservation:
         """Block until all object IDs are free, then mark them in-use.
 
-        Sorted acquisition order prevents deadlock when transactions
-        claim overlapping sets of object IDs.
+        Transactions claiming the same object are granted it in call order.
+        """
+        waiter = self._enqueue(conflict_ids)
+        if waiter.remaining:
+            waiter.enqueued_at = time.monotonic()
+            waiter.future = asyncio.get_running_loop().create_future()
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+            record("executor.conflict.wait_seconds", time.monotonic() - waiter.enqueued_at)
+        return ConflictReservation(self, waiter)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker.try_acquire")
+    def try_acquire(self, conflict_ids: set[str]) -> ConflictReservation | None:
+        """Claim all object IDs only if every one is free now; never blocks.
+
+        :return: A reservation, or None (nothing claimed) if any ID is in use
         """
-        claimed: list[tuple[str, asyncio.Event]] = []
-        async with self._lock:
-            for oid in sorted(conflict_ids):
-                ev = asyncio.Event()
-                q = self._waiters[oid]
-                if not q:
-                    ev.set()
-                q.append(ev)
-                claimed.append((oid, ev))
-
-        for oid, ev in claimed:
-            await ev.wait()
-            logger.debug("conflict_tracker: acquired %s", oid)
-
-        return ConflictReservation(self, claimed)
-
-    @instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker._release")
-    async def _release(self, claimed: list[tuple[str, asyncio.Event]]) -> None:
-        async with self._lock:
-            for oid, ev in claimed:
-                q = self._waiters[oid]
-                if q and q[0] is ev:
-                    q.popleft()
-                    if q:
-                        q[0].set()
-                        logger.debug("conflict_tracker: released %s, waking next waiter", oid)
-                    else:
-                        del self._waiters[oid]
-                        logger.debug("conflict_tracker: released %s, queue empty", oid)
+        queues = self._queues
+        for oid in conflict_ids:
+            if oid in queues:
+                return None
+        return ConflictReservation(self, self._enqueue(conflict_ids))
+
+    @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker._release")
+    def _release(self, waiter: _Waiter) -> None:
+        """Hand each object held by waiter to the next waiter in its queue."""
+        if waiter.released:
+            return
+        waiter.released = True
+        queues = self._queues
+        for oid in waiter.ids:
+            q = queues[oid]
+            q.popleft()
+            if q:
+                nxt = q[0]
+                nxt.remaining -= 1
+                if nxt.remaining == 0 and not nxt.future.done():
+                    nxt.future.set_result(None)
+                logger.debug("conflict_tracker: released %s, next waiter advanced", oid)
+            else:
+                del queues[oid]
+                logger.debug("conflict_tracker: released %s, queue empty", oid)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker._abandon")
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Withdraw a cancelled waiter, releasing any objects it already holds."""
+        if waiter.remaining == 0:
+            # Granted before the cancellation was delivered
+            self._release(waiter)
+            return
+        waiter.released = True
+        queues = self._queues
+        for oid in waiter.ids:
+            q = queues[oid]
+            if q[0] is waiter:
+                q.popleft()
+                if q:
+                    nxt = q[0]
+                    nxt.remaining -= 1
+                    if nxt.remaining == 0 and not nxt.future.done():
+                        nxt.future.set_result(None)
                 else:
-                    try:
-                        q.remove(ev)
-                    except ValueError:
-                        pass
+                    del queues[oid]
+            else:
+                q.remove(waiter)
 
     @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker.in_flight_ids")
     def in_flight_ids(self) -> set[str]:
         """Return the set of object IDs currently claimed by at least one transaction."""
-        return set(self._waiters.keys())
+        return set(self._queues.keys())
+
+    @sync_instrumented("pysui.sui.sui_common.executors.conflict_tracker.ConflictTracker.queue_depths")
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of transactions waiting behind the holder of each object ID."""
+        return {oid: len(q) - 1 for oid, q in self._queues.items()}
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from enum import Enum, IntEnum
 from typing import Any, Awaitable, Callable, Literal
 from pysui.sui.sui_common.shared_types import ObjectSummary
-from pysui.sui.sui_common.txn_signing import SigningMultiSig
+from pysui.sui.sui_common.txn_signing import SigningMultiSig, SigningPool
 
 
 class GasMode(Enum):
@@ -51,6 +51,17 @@ class ExecutorOptions:
     max_retries: int = 1
     on_failure: Literal["continue", "exit"] = "continue"
     max_concurrent: int = 10
+    # Parallel executor scheduling: how many queued transactions are examined
+    # for dispatch, and whether a sender's transactions dispatch in submit order
+    reorder_window: int = 16
+    preserve_sender_order: bool = False
+    # Executor used to sign transactions off the event loop; None uses the
+    # shared thread backed default_signing_pool()
+    signing_pool: SigningPool | None = None
+    # Parallel executor coins mode: split the funding coin into max_concurrent
+    # gas coins of this many MIST at startup, re-split when the pool runs low
+    # and merge retired coins back; None uses the selected coins as they are
+    splay_coin_balance: int | None = None
 
 
 @dataclass
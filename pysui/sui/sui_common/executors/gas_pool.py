@@ -6,10 +6,14 @@
 """Gas coin pool for parallel executor coins gas mode."""
 
 import asyncio
+import bisect
+import itertools
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
-from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +28,32 @@ class GasCoin:
     balance: int
 
 
+@dataclass(frozen=True)
+class GasCoinPoolStats:
+    """Point in time counters for a GasCoinPool."""
+
+    checkouts: int
+    waits: int
+    wait_seconds: float
+    retired: int
+    available: int
+    managed: int
+
+
 class GasCoinPool:
-    """Bounded async queue of gas coins for parallel transaction execution.
+    """Balance ordered pool of gas coins for parallel transaction execution.
 
     In coins gas mode, each in-flight transaction checks out one coin
     exclusively and returns it (at its new version) after effects are applied.
-    checkout() blocks if the pool is empty, providing natural back-pressure.
+    checkout(min_balance=...) returns the smallest available coin holding at
+    least min_balance, so cheap transactions leave the rich coins for
+    expensive ones; among equal balances the longest idle coin goes first.
+    When no available coin is adequate the caller waits, providing natural
+    back-pressure, and is handed the first adequate coin checked in.
+    Coins dropped at checkin are kept aside until taken with take_retired().
+
+    Waits are reported as ``executor.gas.wait_seconds`` and retirements as
+    ``executor.gas.retired``.
     """
 
     @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.__init__")
@@ -39,14 +63,79 @@ class GasCoinPool:
         low_water_mark: int = 5,
         min_balance_per_coin: Optional[int] = None,
     ) -> None:
-        self._queue: asyncio.Queue[GasCoin] = asyncio.Queue()
+        # (balance, arrival, coin) kept sorted; arrival breaks balance ties
+        self._coins: list[tuple[int, int, GasCoin]] = []
+        self._arrivals = itertools.count()
+        # (min_balance, future, or_richest) per waiting checkout
+        self._waiters: deque[tuple[int, asyncio.Future, bool]] = deque()
         self._low_water_mark = low_water_mark
         self._min_balance_per_coin = min_balance_per_coin
+        self._checked_out = 0
+        self._retired: list[GasCoin] = []
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._retire_count = 0
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.stats")
+    def stats(self) -> GasCoinPoolStats:
+        """Return the current counters."""
+        return GasCoinPoolStats(
+            checkouts=self._checkouts,
+            waits=self._waits,
+            wait_seconds=self._wait_seconds,
+            retired=self._retire_count,
+            available=len(self._coins),
+            managed=self.managed(),
+        )
 
     @instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.checkout")
-    async def checkout(self) -> GasCoin:
-        """Remove and return a coin from the pool, blocking if empty."""
-        coin = await self._queue.get()
+    async def checkout(self, *, min_balance: int = 0, or_richest: bool = False) -> GasCoin:
+        """Remove and return the smallest coin holding at least min_balance, waiting for one if needed.
+
+        :param min_balance: Least balance the coin must hold, defaults to 0
+        :type min_balance: int, optional
+        :param or_richest: Settle for the richest coin when none is checked out,
+            so no adequate coin can come back from a transaction, defaults to False
+        :type or_richest: bool, optional
+        :raises RuntimeError: If the pool is reset while waiting
+        """
+        coin = self._take(min_balance)
+        if coin is None and or_richest and self._checked_out == 0 and self._coins:
+            coin = self._coins.pop()[2]
+        if coin is None:
+            waiter = (min_balance, asyncio.get_running_loop().create_future(), or_richest)
+            self._waiters.append(waiter)
+            started = time.monotonic()
+            try:
+                coin = await waiter[1]
+            except asyncio.CancelledError:
+                if waiter[1].cancelled():
+                    try:
+                        self._waiters.remove(waiter)
+                    except ValueError:
+                        pass
+                else:
+                    # Handed a coin in the same turn the wait was cancelled
+                    self._put(waiter[1].result())
+                raise
+            waited = time.monotonic() - started
+            self._waits += 1
+            self._wait_seconds += waited
+            record("executor.gas.wait_seconds", waited)
+        self._checked_out += 1
+        self._checkouts += 1
+        logger.debug("gas_pool: checked out %s (balance=%d)", coin.object_id, coin.balance)
+        return coin
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.try_checkout")
+    def try_checkout(self, *, min_balance: int = 0) -> Optional[GasCoin]:
+        """Remove and return the smallest coin holding at least min_balance, or None if there is none."""
+        coin = self._take(min_balance)
+        if coin is None:
+            return None
+        self._checked_out += 1
+        self._checkouts += 1
         logger.debug("gas_pool: checked out %s (balance=%d)", coin.object_id, coin.balance)
         return coin
 
@@ -55,40 +144,107 @@ class GasCoinPool:
         """Return a coin to the pool after use.
 
         If retire=True or the coin's balance is below min_balance_per_coin,
-        the coin is not returned — the caller should add it to source_coins
-        for the next refill cycle.
+        the coin is not returned to the pool but kept for take_retired(), so
+        its remaining balance can be merged back on the next refill cycle.
         """
+        self._checked_out = max(0, self._checked_out - 1)
         if retire:
             logger.debug("gas_pool: retiring %s (explicit)", coin.object_id)
+            self._retire(coin)
             return
         if self._min_balance_per_coin is not None and coin.balance < self._min_balance_per_coin:
             logger.debug("gas_pool: retiring %s (balance %d below threshold)", coin.object_id, coin.balance)
+            self._retire(coin)
             return
-        await self._queue.put(coin)
+        self._put(coin)
         logger.debug("gas_pool: checked in %s", coin.object_id)
 
     @instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.replenish")
     async def replenish(self, coins: list[GasCoin]) -> None:
         """Add a batch of freshly-minted coins to the pool."""
         for coin in coins:
-            await self._queue.put(coin)
-        logger.debug("gas_pool: replenished with %d coins (total=%d)", len(coins), self._queue.qsize())
+            self._put(coin)
+        logger.debug("gas_pool: replenished with %d coins (total=%d)", len(coins), len(self._coins))
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool._take")
+    def _take(self, min_balance: int) -> Optional[GasCoin]:
+        """Remove the smallest available coin holding at least min_balance."""
+        index = bisect.bisect_left(self._coins, (min_balance, -1))
+        if index == len(self._coins):
+            return None
+        return self._coins.pop(index)[2]
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool._put")
+    def _put(self, coin: GasCoin) -> None:
+        """Hand coin to the longest waiting caller it satisfies, else make it available."""
+        for waiter in self._waiters:
+            min_balance, future, _ = waiter
+            if not future.done() and coin.balance >= min_balance:
+                self._waiters.remove(waiter)
+                future.set_result(coin)
+                return
+        bisect.insort(self._coins, (coin.balance, next(self._arrivals), coin))
+        if self._checked_out == 0:
+            # No adequate coin can come back from a transaction now
+            for waiter in self._waiters:
+                _, future, or_richest = waiter
+                if or_richest and not future.done():
+                    self._waiters.remove(waiter)
+                    future.set_result(self._coins.pop()[2])
+                    return
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool._retire")
+    def _retire(self, coin: GasCoin) -> None:
+        self._retired.append(coin)
+        self._retire_count += 1
+        record("executor.gas.retired")
 
     @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.size")
     def size(self) -> int:
         """Current number of available coins."""
-        return self._queue.qsize()
+        return len(self._coins)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.max_balance")
+    def max_balance(self) -> int:
+        """Balance of the richest available coin, 0 when none is available."""
+        return self._coins[-1][0] if self._coins else 0
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.managed")
+    def managed(self) -> int:
+        """Number of coins in circulation: available plus checked out."""
+        return len(self._coins) + self._checked_out
 
     @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.is_low")
     def is_low(self) -> bool:
-        """True when available coins are at or below the low-water mark."""
-        return self._queue.qsize() <= self._low_water_mark
+        """True when the coins in circulation are at or below the low-water mark.
+
+        Coins checked out to in-flight transactions count, so a busy pool is
+        not low; retired coins do not.
+        """
+        return self.managed() <= self._low_water_mark
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.take_retired")
+    def take_retired(self) -> list[GasCoin]:
+        """Return and forget the coins retired since the last call."""
+        retired, self._retired = self._retired, []
+        return retired
+
+    @sync_instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.restore_retired")
+    def restore_retired(self, coins: list[GasCoin]) -> None:
+        """Put coins taken with take_retired() back, e.g. after a failed merge."""
+        self._retired[:0] = coins
 
     @instrumented("pysui.sui.sui_common.executors.gas_pool.GasCoinPool.reset")
     async def reset(self) -> None:
-        """Drain the pool, discarding all coins."""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        """Drain the pool, discarding all coins and failing waiting checkouts.
+
+        Coins checked out before the reset are no longer counted by managed();
+        one checked in afterwards rejoins the pool.
+        """
+        self._coins.clear()
+        self._retired.clear()
+        self._checked_out = 0
+        waiters, self._waiters = self._waiters, deque()
+        for _, future, _ in waiters:
+            if not future.done():
+                future.set_exception(RuntimeError("GasCoinPool was reset"))
@@ -8,6 +8,7 @@
 import logging
 
 from pysui.sui.sui_common.executors.exec_types import ExecutorContext
+from pysui.sui.sui_common.executors.gas_pool import GasCoin
 from pysui.sui.sui_common.validators import valid_sui_address
 import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
 import pysui.sui.sui_common.sui_commands as cmd
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 _SUI_COIN_TYPE = "0x0000000000000000000000000000000000000000000000000000000000000002::coin::Coin<0x0000000000000000000000000000000000000000000000000000000000000002::sui::SUI>"
 _SEND_FUNDS_GAS_OVERHEAD = 3_000_000
+# Budget headroom kept in a coin that pays for its own split or merge
+_SPLAY_GAS_OVERHEAD = 10_000_000
 
 
 @instrumented("pysui.sui.sui_common.executors.gas_utils.acquire_coins")
@@ -135,6 +138,125 @@ async def send_funds_to_account(
     return result.result_data
 
 
+@sync_instrumented("pysui.sui.sui_common.executors.gas_utils._net_gas")
+def _net_gas(effects) -> int:
+    """Net gas charged by a transaction."""
+    gas = effects.gas_used
+    if gas is None:
+        return 0
+    return (gas.computation_cost or 0) + (gas.storage_cost or 0) - (gas.storage_rebate or 0)
+
+
+@sync_instrumented("pysui.sui.sui_common.executors.gas_utils._paying_coin")
+def _paying_coin(effects, coin: GasCoin, balance: int) -> GasCoin:
+    """Return coin at the version and digest the effects wrote for the gas object."""
+    version, digest = coin.version, coin.digest
+    go = effects.gas_object
+    if go is not None:
+        if go.output_version is not None:
+            version = str(go.output_version)
+        if go.output_digest is not None:
+            digest = go.output_digest
+    return GasCoin(object_id=coin.object_id, version=version, digest=digest, balance=balance)
+
+
+@instrumented("pysui.sui.sui_common.executors.gas_utils.splay_gas_coin")
+async def splay_gas_coin(
+    client,
+    sender: str,
+    source: GasCoin,
+    count: int,
+    amount: int,
+    new_transaction_fn,
+) -> tuple[list[GasCoin], "sui_prot.TransactionEffects | None"]:
+    """COINS mode: split up to count coins of amount MIST off source, which pays the gas.
+
+    The count is reduced to what source can fund while keeping at least amount
+    plus gas headroom for itself.
+
+    :returns: (source at its new version followed by the new coins, effects or None
+        when nothing was split)
+    :raises ValueError: on execution failure.
+    """
+    count = min(count, (source.balance - _SPLAY_GAS_OVERHEAD) // amount - 1)
+    if count <= 0:
+        return [source], None
+    splay_tx = await new_transaction_fn()
+    coins = await splay_tx.split_coin(coin=splay_tx.gas, amounts=[amount] * count)
+    await splay_tx.transfer_objects(transfers=coins if isinstance(coins, list) else [coins], recipient=sender)
+    build_dict = await _build_and_sign_with_gas(splay_tx, source)
+    result = await client.execute(command=cmd.ExecuteTransaction(**build_dict))
+    if not result.is_ok():
+        raise ValueError(f"splay: transaction failed: {result.result_string}")
+    effects = result.result_data.effects
+    created = [
+        GasCoin(
+            object_id=changed.object_id,
+            version=str(changed.output_version or effects.lamport_version),
+            digest=changed.output_digest or "",
+            balance=amount,
+        )
+        for changed in effects.changed_objects
+        if changed.input_state == sui_prot.ChangedObjectInputObjectState.DOES_NOT_EXIST
+        and changed.output_state == sui_prot.ChangedObjectOutputObjectState.OBJECT_WRITE
+    ]
+    remaining = source.balance - amount * len(created) - _net_gas(effects)
+    logger.debug("splay: split %d coins of %d from %s", len(created), amount, source.object_id)
+    return [_paying_coin(effects, source, remaining)] + created, effects
+
+
+@instrumented("pysui.sui.sui_common.executors.gas_utils.merge_gas_coins")
+async def merge_gas_coins(
+    client,
+    sender: str,
+    coin_ids: list[str],
+    new_transaction_fn,
+) -> tuple["GasCoin | None", "sui_prot.TransactionEffects | None"]:
+    """COINS mode: merge the sender's coins among coin_ids into the richest of them.
+
+    Versions are re-read first since a retired coin may have changed after it
+    was dropped; ids that are gone or no longer the sender's are skipped.
+
+    :returns: (merged coin or None if no coin remains, effects or None when
+        there was nothing to merge)
+    :raises ValueError: on fetch or execution failure.
+    """
+    result = await client.execute(command=cmd.GetMultipleObjects(object_ids=list(coin_ids)))
+    if not result.is_ok():
+        raise ValueError(f"merge: failed to fetch coins: {result.result_string}")
+    live = sorted(
+        (
+            o
+            for o in result.result_data
+            if o is not None
+            and o.object_type == _SUI_COIN_TYPE
+            and getattr(o.owner, "address", None) == sender
+        ),
+        key=lambda o: o.balance or 0,
+        reverse=True,
+    )
+    if not live:
+        return None, None
+    primary = GasCoin(
+        object_id=live[0].object_id,
+        version=str(live[0].version),
+        digest=live[0].digest,
+        balance=live[0].balance or 0,
+    )
+    if len(live) == 1:
+        return primary, None
+    merge_tx = await new_transaction_fn()
+    await merge_tx.merge_coins(merge_to=merge_tx.gas, merge_from=[o.object_id for o in live[1:]])
+    build_dict = await _build_and_sign_with_gas(merge_tx, primary)
+    exec_result = await client.execute(command=cmd.ExecuteTransaction(**build_dict))
+    if not exec_result.is_ok():
+        raise ValueError(f"merge: transaction failed: {exec_result.result_string}")
+    effects = exec_result.result_data.effects
+    total = sum(o.balance or 0 for o in live) - _net_gas(effects)
+    logger.debug("merge: merged %d coins into %s", len(live) - 1, primary.object_id)
+    return _paying_coin(effects, primary, total), effects
+
+
 @sync_instrumented("pysui.sui.sui_common.executors.gas_utils.update_tracked_balance")
 def update_tracked_balance(effects, tracked_balance: int) -> int:
     """Deduct net gas cost from tracked_balance. Returns updated balance."""
@@ -5,12 +5,11 @@
 
 """Process-wide singleton object version registry for parallel executor coordination."""
 
-import asyncio
 import threading
 import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 import logging
@@ -19,17 +18,23 @@ from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectVersionEntry:
-    """Cached version/digest for a single Sui object."""
+    """Cached version/digest for a single Sui object.
+
+    ``version`` is normalized to int; decimal strings are accepted.
+    """
 
     object_id: str
-    version: str
+    version: int
     digest: str
-    last_used_ns: int = field(default_factory=time.monotonic_ns)
     is_tombstone: bool = False
     tombstone_expires_ns: int = 0
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.version, int):
+            self.version = int(self.version) if self.version else 0
+
 
 class AbstractObjectRegistry(ABC):
     """Interface for a process-wide object version cache."""
@@ -89,6 +94,12 @@ class InMemoryObjectRegistry(AbstractObjectRegistry):
     A single instance is shared across all parallel executors in the process.
     Use get_object_registry() to obtain the singleton; use
     _set_object_registry_for_tests() only in pytest fixtures.
+
+    Entries are stored as given (``__slots__`` dataclasses with int versions)
+    and never mutated, so reads return them without copying or locking; a
+    read only refreshes LRU order, or drops a tombstone it finds expired.
+    Writes, which may come from executors on different event loops, are
+    serialized by a ``threading.Lock`` that is never held across an await.
     """
 
     DEFAULT_MAX_ENTRIES: int = 50_000
@@ -99,62 +110,104 @@ class InMemoryObjectRegistry(AbstractObjectRegistry):
         """Initialize the in-memory registry with an LRU bound."""
         self._entries: OrderedDict[str, ObjectVersionEntry] = OrderedDict()
         self._max = max_entries
-        self._lock = asyncio.Lock()
+        self._write_lock = threading.Lock()
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.get")
     async def get(self, object_id: str) -> Optional[ObjectVersionEntry]:
         """Return the cached entry for an object id or None if missing."""
-        async with self._lock:
-            return self._get_unlocked(object_id)
+        return self.get_nowait(object_id)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.get_nowait")
+    def get_nowait(self, object_id: str) -> Optional[ObjectVersionEntry]:
+        """Return the cached entry for an object id or None, without awaiting."""
+        entry = self._entries.get(object_id)
+        if entry is None:
+            return None
+        if entry.is_tombstone and time.monotonic_ns() > entry.tombstone_expires_ns:
+            self._drop_expired(object_id, entry)
+            return None
+        try:
+            self._entries.move_to_end(object_id)
+        except KeyError:
+            pass  # Evicted by a concurrent writer
+        return entry
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.get_many")
     async def get_many(self, object_ids: list[str]) -> dict[str, ObjectVersionEntry]:
-        """Return cached entries for the given object ids keyed by id."""
-        async with self._lock:
-            result: dict[str, ObjectVersionEntry] = {}
-            for oid in object_ids:
-                entry = self._get_unlocked(oid)
-                if entry is not None:
-                    result[oid] = entry
-            return result
+        """Return cached entries for the given object ids keyed by id.
+
+        Tombstone expiry is checked against one clock reading for the batch.
+        """
+        entries = self._entries
+        move_to_end = entries.move_to_end
+        now_ns = time.monotonic_ns()
+        result: dict[str, ObjectVersionEntry] = {}
+        for oid in object_ids:
+            entry = entries.get(oid)
+            if entry is None:
+                continue
+            if entry.is_tombstone and now_ns > entry.tombstone_expires_ns:
+                self._drop_expired(oid, entry)
+                continue
+            try:
+                move_to_end(oid)
+            except KeyError:
+                pass
+            result[oid] = entry
+        return result
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.upsert")
     async def upsert(self, entry: ObjectVersionEntry) -> None:
         """Insert or update a single object version entry."""
-        async with self._lock:
+        with self._write_lock:
             self._upsert_unlocked(entry)
+            self._trim_unlocked()
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.upsert_many")
     async def upsert_many(self, entries: list[ObjectVersionEntry]) -> None:
-        """Insert or update multiple object version entries."""
-        async with self._lock:
+        """Insert or update multiple object version entries under one lock acquisition."""
+        store = self._entries
+        move_to_end = store.move_to_end
+        with self._write_lock:
             for entry in entries:
-                self._upsert_unlocked(entry)
+                oid = entry.object_id
+                if not entry.is_tombstone:
+                    existing = store.get(oid)
+                    if (
+                        existing is not None
+                        and not existing.is_tombstone
+                        and existing.version >= entry.version
+                    ):
+                        continue
+                store[oid] = entry
+                move_to_end(oid)
+            self._trim_unlocked()
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.tombstone")
     async def tombstone(self, object_id: str, ttl_seconds: float = DEFAULT_TOMBSTONE_TTL_SECONDS) -> None:
         """Mark an object id as deleted for the given TTL window."""
-        async with self._lock:
-            expires_ns = time.monotonic_ns() + int(ttl_seconds * 1_000_000_000)
-            entry = ObjectVersionEntry(
-                object_id=object_id,
-                version="",
-                digest="",
-                is_tombstone=True,
-                tombstone_expires_ns=expires_ns,
-            )
+        expires_ns = time.monotonic_ns() + int(ttl_seconds * 1_000_000_000)
+        entry = ObjectVersionEntry(
+            object_id=object_id,
+            version=0,
+            digest="",
+            is_tombstone=True,
+            tombstone_expires_ns=expires_ns,
+        )
+        with self._write_lock:
             self._upsert_unlocked(entry)
+            self._trim_unlocked()
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.evict")
     async def evict(self, object_id: str) -> None:
         """Remove an object id from the registry without tombstoning."""
-        async with self._lock:
+        with self._write_lock:
             self._entries.pop(object_id, None)
 
     @instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.reset")
     async def reset(self) -> None:
         """Clear all entries from the registry."""
-        async with self._lock:
+        with self._write_lock:
             self._entries.clear()
 
     @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry.size")
@@ -162,22 +215,9 @@ class InMemoryObjectRegistry(AbstractObjectRegistry):
         """Return the current number of cached entries."""
         return len(self._entries)
 
-    @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry._get_unlocked")
-    def _get_unlocked(self, object_id: str) -> Optional[ObjectVersionEntry]:
-        """Return entry without locking; expires tombstones and updates LRU order."""
-        entry = self._entries.get(object_id)
-        if entry is None:
-            return None
-        if entry.is_tombstone and time.monotonic_ns() > entry.tombstone_expires_ns:
-            del self._entries[object_id]
-            return None
-        self._entries.move_to_end(object_id)
-        entry.last_used_ns = time.monotonic_ns()
-        return entry
-
     @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry._upsert_unlocked")
     def _upsert_unlocked(self, entry: ObjectVersionEntry) -> None:
-        """Insert or update entry without locking; enforces version monotonicity and LRU bound."""
+        """Insert or update entry under the write lock; enforces version monotonicity."""
         existing = self._entries.get(entry.object_id)
         if existing and not entry.is_tombstone and not existing.is_tombstone:
             # Higher version wins — skip stale writes
@@ -185,8 +225,20 @@ class InMemoryObjectRegistry(AbstractObjectRegistry):
                 return
         self._entries[entry.object_id] = entry
         self._entries.move_to_end(entry.object_id)
-        while len(self._entries) > self._max:
-            self._entries.popitem(last=False)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry._drop_expired")
+    def _drop_expired(self, object_id: str, entry: ObjectVersionEntry) -> None:
+        """Remove an expired tombstone a read found, unless a writer replaced it since."""
+        with self._write_lock:
+            if self._entries.get(object_id) is entry:
+                del self._entries[object_id]
+
+    @sync_instrumented("pysui.sui.sui_common.executors.object_registry.InMemoryObjectRegistry._trim_unlocked")
+    def _trim_unlocked(self) -> None:
+        """Evict least recently used entries beyond the bound."""
+        entries = self._entries
+        while len(entries) > self._max:
+            entries.popitem(last=False)
 
 
 # --- Singleton machinery ---
@@ -206,6 +258,18 @@ def get_object_registry() -> AbstractObjectRegistry:
     return _REGISTRY
 
 
+@sync_instrumented("pysui.sui.sui_common.executors.object_registry.set_object_registry")
+def set_object_registry(registry: AbstractObjectRegistry) -> None:
+    """Install registry as the process-wide singleton.
+
+    Call before any executor starts, e.g. to use a ``SharedMemoryObjectRegistry``
+    so that several processes share one version cache.
+    """
+    global _REGISTRY
+    with _REGISTRY_INIT_LOCK:
+        _REGISTRY = registry
+
+
 @sync_instrumented("pysui.sui.sui_common.executors.object_registry._set_object_registry_for_tests")
 def _set_object_registry_for_tests(registry: Optional[AbstractObjectRegistry]) -> None:
     """Replace or clear the singleton. Call in pytest teardown to restore isolation."""
@@ -26,15 +26,23 @@ class ParallelExecutor(_BaseParallelExecutor):
     """
 
     @sync_instrumented("pysui.sui.sui_common.executors.parallel_executor.ParallelExecutor.submit")
-    def submit(self, txn: AsyncSuiTransaction | list[AsyncSuiTransaction]) -> asyncio.Future | list[asyncio.Future]:
+    def submit(
+        self,
+        txn: AsyncSuiTransaction | list[AsyncSuiTransaction],
+        *,
+        min_gas_balance: int = 0,
+    ) -> asyncio.Future | list[asyncio.Future]:
         """Submit one or more transactions for parallel execution.
 
         :param txn: A single AsyncSuiTransaction or a list of them.
+        :param min_gas_balance: In coins mode, the expected gas budget; each
+            transaction is paid with the smallest pooled coin holding at least
+            this many MIST, defaults to 0
         :return: Single Future or list of Futures.
         """
         if isinstance(txn, list):
-            return [self._submit_one(t) for t in txn]
-        return self._submit_one(txn)
+            return [self._submit_one(t, min_gas_balance) for t in txn]
+        return self._submit_one(txn, min_gas_balance)
 
     @instrumented("pysui.sui.sui_common.executors.parallel_executor.ParallelExecutor.close")
     async def close(self) -> None:
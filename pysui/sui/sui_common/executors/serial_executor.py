@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from pysui.sui.sui_common.async_txn import AsyncSuiTransaction
 
-from pysui.sui.sui_common.txn_signing import SignerBlock, SigningMultiSig
+from pysui.sui.sui_common.txn_signing import SignerBlock, SigningMultiSig, SigningPool
 from pysui.sui.sui_common.executors.exec_types import (
     ExecutionSkipped,
     ExecutorError,
@@ -58,6 +58,7 @@ class SerialQueueProcessor:
         signer_block: SignerBlock,
         gas_mode: GasMode,
         min_threshold_balance: int,
+        signing_pool: SigningPool | None = None,
     ) -> None:
         self._client = client
         self._signing_block = signer_block
@@ -69,6 +70,7 @@ class SerialQueueProcessor:
             client=client,
             gas_owner=signer_block.sender_str,
             use_account_gas=(gas_mode == GasMode.ADDRESS_BALANCE),
+            signing_pool=signing_pool,
         )
 
     @sync_instrumented("pysui.sui.sui_common.executors.serial_executor.SerialQueueProcessor.seed_funds")
@@ -203,6 +205,7 @@ class SerialQueueProcessor:
             logger.warning("SerialQueueProcessor: execute failed: %s", exc)
             error_str = str(exc).lower()
             if "insufficient gas" in error_str or "insufficient_gas" in error_str:
+                self._cache.note_insufficient_gas(signed_tx)
                 return GasStatus.NEED_FUNDS_AND_RETRY, (ExecutorError.EXECUTING_ERROR, exc)
             return GasStatus.TXN_ERROR, (ExecutorError.EXECUTING_ERROR, exc)
 
@@ -298,6 +301,7 @@ class SerialExecutor:
             signer_block=signer_block,
             gas_mode=options.gas_mode,
             min_threshold_balance=options.min_threshold_balance,
+            signing_pool=options.signing_pool,
         )
 
     @instrumented("pysui.sui.sui_common.executors.serial_executor.SerialExecutor._initialize")
@@ -0,0 +1,374 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Object version registry shared by every process on a host through an mmap'd file."""
+
+import hashlib
+import mmap
+import os
+import stat
+import struct
+import threading
+import time
+import zlib
+from typing import Optional
+
+import logging
+from pysui.sui.sui_common.executors.object_registry import (
+    AbstractObjectRegistry,
+    ObjectVersionEntry,
+)
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+_FCNTL_AVAILABLE: bool = False
+try:
+    import fcntl
+
+    _FCNTL_AVAILABLE = True
+except ImportError:
+    pass
+
+# File header: magic, layout version, bucket count, ways per bucket
+_HEADER = struct.Struct("<8sIII")
+_HEADER_SIZE = 64
+_MAGIC = b"PYSUIREG"
+_LAYOUT_VERSION = 1
+
+# Slot: seq, version, stamp, tombstone expiry, state, digest length, key, digest
+_SLOT = struct.Struct("<QQQqBB6x32s48s")
+_SEQ = struct.Struct("<Q")
+# Reads of a slot held by a writer before it is treated as a miss; a slot left
+# odd by a writer that died mid-update stays unreadable until rewritten
+_READ_RETRIES = 1_000
+
+_EMPTY = 0
+_LIVE = 1
+_TOMBSTONE = 2
+
+
+@sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry._slot_key")
+def _slot_key(object_id: str) -> bytes:
+    """32 byte table key: the address bytes, or a hash for non-address ids."""
+    hexpart = object_id[2:] if object_id[:2] in ("0x", "0X") else object_id
+    if len(hexpart) <= 64:
+        try:
+            return bytes.fromhex(hexpart.rjust(64, "0"))
+        except ValueError:
+            pass
+    return hashlib.blake2b(object_id.encode(), digest_size=32).digest()
+
+
+class SharedMemoryObjectRegistry(AbstractObjectRegistry):
+    """Fixed size, set associative object registry in a file mapped by every process.
+
+    Any process that opens the same ``path`` shares the same table, so worker
+    processes executing for one sender see each other's object versions. Use
+    a path private to the user and specific to the sender and network, e.g.
+    under ``$XDG_RUNTIME_DIR``. The first process creates and sizes the file;
+    later ones attach to it and must agree on its geometry. The file must be
+    a regular file (not a symlink) owned by the current user and not
+    accessible to anyone else.
+
+    Each object hashes to one bucket of ``ways`` slots. Writers lock the
+    bucket (a POSIX byte range lock, plus a thread lock within the process)
+    and apply the same rule as ``InMemoryObjectRegistry``: a live entry is
+    replaced only by a higher version, and tombstones always win. When a
+    bucket is full the least recently written slot is reused. Readers never
+    lock: every slot carries a sequence number that writers make odd while
+    they update it, and a read that overlaps a write is retried. A slot that
+    stays odd (its writer died mid-update) reads as a miss until the next
+    write to it, which starts again from an even sequence number.
+
+    Requires a POSIX platform (``fcntl``).
+    """
+
+    DEFAULT_CAPACITY: int = 65_536
+    DEFAULT_WAYS: int = 8
+    DEFAULT_TOMBSTONE_TTL_SECONDS: float = 30.0
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.__init__")
+    def __init__(
+        self,
+        *,
+        path: str,
+        capacity: int = DEFAULT_CAPACITY,
+        ways: int = DEFAULT_WAYS,
+    ) -> None:
+        """Create or attach to the shared registry file.
+
+        :param path: Registry file, created with mode 0600 if missing
+        :type path: str
+        :param capacity: Total slots, rounded up to a multiple of ways, defaults to 65536
+        :type capacity: int, optional
+        :param ways: Slots per bucket, defaults to 8
+        :type ways: int, optional
+        :raises NotImplementedError: If the platform has no fcntl
+        :raises ValueError: If an existing file has a different geometry
+        :raises PermissionError: If the file is not a regular file owned by the
+            current user, or is accessible to group or others
+        :raises OSError: If path is a symlink
+        """
+        if not _FCNTL_AVAILABLE:
+            raise NotImplementedError("SharedMemoryObjectRegistry requires a POSIX platform")
+        if ways < 1 or capacity < ways:
+            raise ValueError("capacity must be at least ways and ways at least 1")
+        self._path = path
+        self._ways = ways
+        self._buckets = -(-capacity // ways)
+        self._size = _HEADER_SIZE + self._buckets * ways * _SLOT.size
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            self._check_owner()
+            self._init_file()
+            self._mm = mmap.mmap(self._fd, self._size)
+        except Exception:
+            os.close(self._fd)
+            raise
+        self._thread_lock = threading.Lock()
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._check_owner")
+    def _check_owner(self) -> None:
+        """Refuse a file that is not ours alone to map and write."""
+        st = os.fstat(self._fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise PermissionError(f"{self._path} is not a regular file")
+        if st.st_uid != os.getuid():
+            raise PermissionError(f"{self._path} is owned by uid {st.st_uid}, not {os.getuid()}")
+        if st.st_mode & 0o077:
+            raise PermissionError(
+                f"{self._path} has mode {stat.S_IMODE(st.st_mode):o}, expected no group or other access"
+            )
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._init_file")
+    def _init_file(self) -> None:
+        """Size and stamp a new file, or validate the header of an existing one."""
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER_SIZE, 0)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, self._size)
+                header = _HEADER.pack(_MAGIC, _LAYOUT_VERSION, self._buckets, self._ways)
+                os.pwrite(self._fd, header, 0)
+                return
+            magic, layout, buckets, ways = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+            if (magic, layout, buckets, ways) != (_MAGIC, _LAYOUT_VERSION, self._buckets, self._ways):
+                raise ValueError(
+                    f"{self._path} holds a registry of {buckets} buckets x {ways} ways, "
+                    f"expected {self._buckets} x {self._ways}"
+                )
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER_SIZE, 0)
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.path")
+    def path(self) -> str:
+        """The registry file path."""
+        return self._path
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.close")
+    def close(self) -> None:
+        """Unmap and close the file; the shared table is left in place."""
+        self._mm.close()
+        os.close(self._fd)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.unlink")
+    def unlink(self) -> None:
+        """Remove the registry file; processes still attached keep their mapping."""
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._bucket_offset")
+    def _bucket_offset(self, key: bytes) -> int:
+        """Byte offset of the bucket that key hashes to."""
+        # Stable across processes, unlike hash()
+        bucket = zlib.crc32(key) % self._buckets
+        return _HEADER_SIZE + bucket * self._ways * _SLOT.size
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._read_slot")
+    def _read_slot(self, offset: int) -> Optional[tuple]:
+        """Consistent snapshot of one slot, retried while a writer holds it.
+
+        Returns None if no consistent snapshot is seen within ``_READ_RETRIES``
+        attempts, e.g. because a writer crashed and left the slot odd.
+        """
+        mm = self._mm
+        for _ in range(_READ_RETRIES):
+            fields = _SLOT.unpack_from(mm, offset)
+            if fields[0] & 1 == 0 and _SEQ.unpack_from(mm, offset)[0] == fields[0]:
+                return fields
+            time.sleep(0)
+        logger.debug("SharedMemoryObjectRegistry: slot at %d held by a writer, treated as a miss", offset)
+        return None
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._lookup")
+    def _lookup(self, object_id: str, now_ns: int) -> Optional[ObjectVersionEntry]:
+        """Lock free read of one object."""
+        key = _slot_key(object_id)
+        offset = self._bucket_offset(key)
+        found = None
+        for way in range(self._ways):
+            fields = self._read_slot(offset)
+            offset += _SLOT.size
+            if fields is None:
+                continue
+            _, version, _, expires, state, dlen, skey, digest = fields
+            if state == _EMPTY or skey != key:
+                continue
+            if state == _TOMBSTONE:
+                if now_ns > expires:
+                    return None
+                return ObjectVersionEntry(object_id, 0, "", True, expires)
+            if found is None or version > found.version:
+                found = ObjectVersionEntry(object_id, version, digest[:dlen].decode())
+        return found
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.get")
+    async def get(self, object_id: str) -> Optional[ObjectVersionEntry]:
+        """Return the cached entry for an object id or None if missing."""
+        return self._lookup(object_id, time.monotonic_ns())
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.get_many")
+    async def get_many(self, object_ids: list[str]) -> dict[str, ObjectVersionEntry]:
+        """Return cached entries for the given object ids keyed by id."""
+        now_ns = time.monotonic_ns()
+        result: dict[str, ObjectVersionEntry] = {}
+        for oid in object_ids:
+            entry = self._lookup(oid, now_ns)
+            if entry is not None:
+                result[oid] = entry
+        return result
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry._write")
+    def _write(self, entry: ObjectVersionEntry, now_ns: int) -> bool:
+        """Apply entry to its bucket under the bucket lock; False if it was stale."""
+        key = _slot_key(entry.object_id)
+        base = self._bucket_offset(key)
+        span = self._ways * _SLOT.size
+        digest = entry.digest.encode()
+        if len(digest) > 48:
+            raise ValueError(f"Digest too long for registry slot: {entry.digest}")
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, span, base)
+            try:
+                target = None
+                victim, victim_stamp = base, None
+                for way in range(self._ways):
+                    offset = base + way * _SLOT.size
+                    seq, version, stamp, expires, state, _, skey, _ = _SLOT.unpack_from(self._mm, offset)
+                    if state != _EMPTY and skey == key:
+                        # A slot left odd by a crashed writer is overwritten
+                        if (
+                            state == _LIVE
+                            and not entry.is_tombstone
+                            and version >= entry.version
+                            and seq & 1 == 0
+                        ):
+                            return False
+                        target = offset
+                        break
+                    # Free, expired tombstone, or least recently written
+                    reusable = state == _EMPTY or (state == _TOMBSTONE and now_ns > expires)
+                    rank = -1 if reusable else stamp
+                    if victim_stamp is None or rank < victim_stamp:
+                        victim, victim_stamp = offset, rank
+                if target is None:
+                    target = victim
+                seq = _SEQ.unpack_from(self._mm, target)[0]
+                # An odd seq was left by a writer that died mid-update
+                seq += seq & 1
+                _SEQ.pack_into(self._mm, target, seq + 1)
+                _SLOT.pack_into(
+                    self._mm,
+                    target,
+                    seq + 1,
+                    0 if entry.is_tombstone else entry.version,
+                    now_ns,
+                    entry.tombstone_expires_ns if entry.is_tombstone else 0,
+                    _TOMBSTONE if entry.is_tombstone else _LIVE,
+                    len(digest),
+                    key,
+                    digest,
+                )
+                _SEQ.pack_into(self._mm, target, seq + 2)
+                return True
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, span, base)
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.upsert")
+    async def upsert(self, entry: ObjectVersionEntry) -> None:
+        """Insert or update a single object version entry."""
+        self._write(entry, time.monotonic_ns())
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.upsert_many")
+    async def upsert_many(self, entries: list[ObjectVersionEntry]) -> None:
+        """Insert or update multiple object version entries."""
+        now_ns = time.monotonic_ns()
+        for entry in entries:
+            self._write(entry, now_ns)
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.tombstone")
+    async def tombstone(self, object_id: str, ttl_seconds: float = DEFAULT_TOMBSTONE_TTL_SECONDS) -> None:
+        """Mark an object id as deleted for the given TTL window."""
+        now_ns = time.monotonic_ns()
+        self._write(
+            ObjectVersionEntry(
+                object_id=object_id,
+                version=0,
+                digest="",
+                is_tombstone=True,
+                tombstone_expires_ns=now_ns + int(ttl_seconds * 1_000_000_000),
+            ),
+            now_ns,
+        )
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.evict")
+    async def evict(self, object_id: str) -> None:
+        """Remove an object id from the registry without tombstoning."""
+        key = _slot_key(object_id)
+        base = self._bucket_offset(key)
+        span = self._ways * _SLOT.size
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, span, base)
+            try:
+                for way in range(self._ways):
+                    offset = base + way * _SLOT.size
+                    seq, *_, state, _, skey, _ = _SLOT.unpack_from(self._mm, offset)
+                    if state != _EMPTY and skey == key:
+                        seq += seq & 1
+                        _SEQ.pack_into(self._mm, offset, seq + 1)
+                        self._mm[offset + 8 : offset + _SLOT.size] = bytes(_SLOT.size - 8)
+                        _SEQ.pack_into(self._mm, offset, seq + 2)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, span, base)
+
+    @instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.reset")
+    async def reset(self) -> None:
+        """Clear all entries from the registry, for every attached process."""
+        span = self._size - _HEADER_SIZE
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, span, _HEADER_SIZE)
+            try:
+                for offset in range(_HEADER_SIZE, self._size, _SLOT.size):
+                    seq = _SEQ.unpack_from(self._mm, offset)[0]
+                    seq += seq & 1
+                    _SEQ.pack_into(self._mm, offset, seq + 1)
+                    self._mm[offset + 8 : offset + _SLOT.size] = bytes(_SLOT.size - 8)
+                    _SEQ.pack_into(self._mm, offset, seq + 2)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, span, _HEADER_SIZE)
+
+    @sync_instrumented("pysui.sui.sui_common.executors.shared_object_registry.SharedMemoryObjectRegistry.size")
+    def size(self) -> int:
+        """Return the current number of occupied slots, including tombstones."""
+        state_at = 32  # seq, version, stamp, expiry precede the state byte
+        mm = self._mm
+        return sum(
+            1
+            for offset in range(_HEADER_SIZE + state_at, self._size, _SLOT.size)
+            if mm[offset] != _EMPTY
+        )
@@ -0,0 +1,275 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Client scoped Move function signature cache."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+FunctionKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class FunctionCacheStats:
+    """Point in time counters for a MoveFunctionCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@sync_instrumented("pysui.sui.sui_common.function_cache.normalize_target")
+def normalize_target(target: str) -> FunctionKey:
+    """Split and normalize a ``package::module::function`` target.
+
+    The package address is expanded to its full 32 byte lower case form so
+    ``0x2::coin::split`` and ``0x000...02::coin::split`` share one entry.
+
+    :param target: The triplet target string
+    :type target: str
+    :raises ValueError: If the target is not a well formed triplet
+    :return: Normalized (package, module, function)
+    :rtype: tuple[str, str, str]
+    """
+    from pysui.sui.sui_pgql.pgql_validators import TypeValidator
+    from pysui.sui.sui_utils import hexstring_to_sui_id
+
+    package, module, function = TypeValidator.check_target_triplet(target)
+    return hexstring_to_sui_id(package).lower(), module, function
+
+
+@instrumented("pysui.sui.sui_common.function_cache.fetch_function_signature")
+async def fetch_function_signature(client: Any, key: FunctionKey) -> tuple:
+    """Fetch a Move function signature through ``GetFunction``.
+
+    :param client: The protocol client (GQL or gRPC)
+    :param key: Normalized (package, module, function)
+    :type key: tuple[str, str, str]
+    :raises ValueError: If the function can not be resolved
+    :return: package address, module, function, return count, parameter types
+    :rtype: tuple
+    """
+    import pysui.sui.sui_common.sui_commands as cmd
+    from pysui.sui.sui_bcs import bcs
+    from pysui.sui.sui_common.txn_arg_encoder import grpc_to_raw_parameters
+
+    package, module, function = key
+    target = "::".join(key)
+    try:
+        result = await client.execute(
+            command=cmd.GetFunction(
+                package=package,
+                module_name=module,
+                function_name=function,
+            )
+        )
+        if result.is_ok():
+            mfunc = result.result_data
+            return (
+                bcs.Address.from_str(package),
+                module,
+                function,
+                len(mfunc.function.returns),
+                grpc_to_raw_parameters(mfunc),
+            )
+    except ValueError as ve:
+        raise ValueError(f"{target} {ve.args}")
+    raise ValueError(f"Unresolvable target {target}")
+
+
+class MoveFunctionCache:
+    """LRU cache of Move function signatures keyed by normalized target triplet.
+
+    User packages are immutable and every upgrade is assigned a new package
+    address, so the normalized address already identifies one exact package
+    version. System packages (0x1, 0x2, 0x3...) are upgraded in place, but
+    compatible upgrades can not change a public function's signature. Entries
+    are therefore only dropped explicitly, with ``invalidate`` or
+    ``invalidate_package``, or after ``ttl_seconds`` when one is set.
+
+    Concurrent misses on the same target share a single fetch.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1024
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.__init__")
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        :param maxsize: Maximum entries before least recently used eviction,
+            None for unbounded, defaults to DEFAULT_MAX_ENTRIES
+        :type maxsize: Optional[int], optional
+        :param ttl_seconds: Optional entry lifetime in seconds, defaults to None
+        :type ttl_seconds: Optional[float], optional
+        """
+        self._entries: OrderedDict[FunctionKey, tuple[int, Any]] = OrderedDict()
+        self._pending: dict[FunctionKey, asyncio.Future] = {}
+        self._maxsize = maxsize
+        self._ttl_ns = int(ttl_seconds * 1_000_000_000) if ttl_seconds else 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.hits")
+    def hits(self) -> int:
+        """Lookups served from the cache."""
+        return self._hits
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.misses")
+    def misses(self) -> int:
+        """Lookups that required a fetch."""
+        return self._misses
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.stats")
+    def stats(self) -> FunctionCacheStats:
+        """Return the current counters."""
+        return FunctionCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.size")
+    def size(self) -> int:
+        """Return the current number of cached signatures."""
+        return len(self._entries)
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.peek")
+    def peek(self, target: str) -> Optional[Any]:
+        """Return the cached signature for target without fetching or counting."""
+        entry = self._entries.get(normalize_target(target))
+        if entry is None or self._expired(entry[0]):
+            return None
+        return entry[1]
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache._expired")
+    def _expired(self, stored_ns: int) -> bool:
+        """True when a TTL is configured and the entry has outlived it."""
+        return bool(self._ttl_ns) and time.monotonic_ns() - stored_ns > self._ttl_ns
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache._store")
+    def _store(self, key: FunctionKey, value: Any) -> None:
+        """Insert value and enforce the LRU bound."""
+        self._entries[key] = (time.monotonic_ns(), value)
+        self._entries.move_to_end(key)
+        while self._maxsize and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    @instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.get_or_fetch")
+    async def get_or_fetch(
+        self,
+        target: str,
+        fetch: Callable[[FunctionKey], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached signature for target, fetching it on a miss.
+
+        :param target: The triplet target string (package::module::function)
+        :type target: str
+        :param fetch: Coroutine function called with the normalized key on a miss
+        :type fetch: Callable[[tuple[str, str, str]], Awaitable[Any]]
+        :return: The cached or freshly fetched signature
+        """
+        key = normalize_target(target)
+        entry = self._entries.get(key)
+        if entry is not None and not self._expired(entry[0]):
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._hits += 1
+            return await asyncio.shield(pending)
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await fetch(key)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure does not log noise
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+        self._store(key, value)
+        future.set_result(value)
+        return value
+
+    @instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.get")
+    async def get(self, client: Any, target: str) -> tuple:
+        """Return the signature for target, fetching through client on a miss.
+
+        :param client: The protocol client (GQL or gRPC)
+        :param target: The triplet target string (package::module::function)
+        :type target: str
+        :return: package address, module, function, return count, parameter types
+        :rtype: tuple
+        """
+        return await self.get_or_fetch(
+            target, lambda key: fetch_function_signature(client, key)
+        )
+
+    @instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.prewarm")
+    async def prewarm(self, client: Any, targets: list[str]) -> FunctionCacheStats:
+        """Fetch and cache signatures for targets concurrently.
+
+        :param client: The protocol client (GQL or gRPC)
+        :param targets: Triplet target strings to load
+        :type targets: list[str]
+        :raises ValueError: If any target can not be resolved
+        :return: The counters after prewarming
+        :rtype: FunctionCacheStats
+        """
+        await asyncio.gather(*[self.get(client, t) for t in targets])
+        return self.stats()
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.invalidate")
+    def invalidate(self, target: str) -> None:
+        """Drop a single target from the cache."""
+        self._entries.pop(normalize_target(target), None)
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.invalidate_package")
+    def invalidate_package(self, package: str) -> int:
+        """Drop every cached function of a package address; returns the count dropped."""
+        from pysui.sui.sui_utils import hexstring_to_sui_id
+
+        norm = hexstring_to_sui_id(package).lower()
+        stale = [k for k in self._entries if k[0] == norm]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    @sync_instrumented("pysui.sui.sui_common.function_cache.MoveFunctionCache.clear")
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
@@ -0,0 +1,221 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Client side inventory of SUI gas coins owned by an address."""
+
+import asyncio
+import base64
+import logging
+import re
+from typing import Any, Optional
+
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+_SUI_COIN_TYPE: str = "0x2::coin::Coin<0x2::sui::SUI>"
+_FRAMEWORK_RE = re.compile(r"0x0*2::")
+# Execution failures meaning an input object reference was out of date
+_STALE_OBJECT_RE = re.compile(
+    r"not available for consumption|versionunavailable|objectnotfound|notexists"
+    r"|not found|could not find|does not exist|deleted",
+    re.IGNORECASE,
+)
+
+
+@sync_instrumented("pysui.sui.sui_common.gas_inventory.is_sui_coin_type")
+def is_sui_coin_type(object_type: Optional[str]) -> bool:
+    """True if object_type is ``Coin<SUI>`` in short or long address form."""
+    return bool(object_type) and _FRAMEWORK_RE.sub("0x2::", object_type) == _SUI_COIN_TYPE
+
+
+@sync_instrumented("pysui.sui.sui_common.gas_inventory.is_stale_object_error")
+def is_stale_object_error(message: Optional[str]) -> bool:
+    """True if an execution failure message reports an input object version or
+    existence error, i.e. the sender's view of its objects is out of date."""
+    return bool(message) and _STALE_OBJECT_RE.search(message) is not None
+
+
+@sync_instrumented("pysui.sui.sui_common.gas_inventory.gas_payer")
+def gas_payer(tx_bytestr: str) -> Optional[str]:
+    """Return the gas owner of base64 transaction bytes, None if they do not decode."""
+    from pysui.sui.sui_bcs import bcs
+
+    try:
+        tx_data = bcs.TransactionData.deserialize(base64.b64decode(tx_bytestr))
+        return tx_data.value.GasData.Owner.to_address_str()
+    except Exception:
+        return None
+
+
+@instrumented("pysui.sui.sui_common.gas_inventory.fetch_objects_by_id")
+async def fetch_objects_by_id(client: Any, object_ids: list[str]) -> list[sui_prot.Object]:
+    """Fetch the current state of object_ids with GetMultipleObjects.
+
+    Objects that do not exist are omitted; the remainder keep input order.
+
+    :param client: The protocol client (GQL or gRPC)
+    :param object_ids: Object ids to fetch
+    :type object_ids: list[str]
+    :raises ValueError: If the request fails
+    :return: The objects found
+    :rtype: list[sui_prot.Object]
+    """
+    import pysui.sui.sui_common.sui_commands as cmd
+
+    if not object_ids:
+        return []
+    result = await client.execute(command=cmd.GetMultipleObjects(object_ids=object_ids))
+    if not result.is_ok():
+        raise ValueError(f"Failed to fetch objects: {result.result_string}")
+    found: dict[str, sui_prot.Object] = {}
+    for entry in result.result_data.objects:
+        if entry.object is not None and entry.object.object_id:
+            found[entry.object.object_id] = entry.object
+    return [found[oid] for oid in object_ids if oid in found]
+
+
+class GasCoinInventory:
+    """SUI coins owned by one address, seeded once and kept current from effects.
+
+    The first ``coins`` call lists every gas coin page for the owner. After
+    that, ``apply_executed`` folds transaction effects into the inventory:
+    deleted or transferred coins are dropped, mutated coins take their new
+    version and digest, and coins whose balance is not carried in the result
+    (or that were newly received) are refetched by id on the next ``coins``
+    call. ``invalidate`` forces a full reseed; the client calls it for the
+    payer when an execution fails because an input object version is stale or
+    the object no longer exists, as happens when the owner's coins are spent
+    outside this client.
+    """
+
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.__init__")
+    def __init__(self, owner: str) -> None:
+        """Initialize an empty inventory.
+
+        :param owner: The coin owner address
+        :type owner: str
+        """
+        self._owner = owner.lower()
+        self._coins: dict[str, sui_prot.Object] = {}
+        self._pending: set[str] = set()
+        self._seeded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.owner")
+    def owner(self) -> str:
+        """The coin owner address."""
+        return self._owner
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.seeded")
+    def seeded(self) -> bool:
+        """True once the owner's coins have been listed."""
+        return self._seeded
+
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory._owned_by_owner")
+    def _owned_by_owner(self, owner: Optional[sui_prot.Owner]) -> bool:
+        """True if owner is the inventory address."""
+        return (
+            owner is not None
+            and owner.kind == sui_prot.OwnerOwnerKind.ADDRESS
+            and (owner.address or "").lower() == self._owner
+        )
+
+    @instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.coins")
+    async def coins(self, client: Any) -> list[sui_prot.Object]:
+        """Return the owner's gas coins, seeding or catching up as required.
+
+        :param client: The protocol client (GQL or gRPC)
+        :raises ValueError: If coins can not be fetched
+        :return: The known gas coins
+        :rtype: list[sui_prot.Object]
+        """
+        async with self._lock:
+            if not self._seeded:
+                await self._seed(client)
+            elif self._pending:
+                await self._catch_up(client)
+            return list(self._coins.values())
+
+    @instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory._seed")
+    async def _seed(self, client: Any) -> None:
+        """List every gas coin page for the owner."""
+        import pysui.sui.sui_common.sui_commands as cmd
+
+        result = await client.execute_for_all(command=cmd.GetGas(owner=self._owner))
+        if not result.is_ok():
+            raise ValueError(f"Failed to fetch gas coins: {result.result_string}")
+        self._coins = {c.object_id: c for c in result.result_data.objects}
+        self._pending.clear()
+        self._seeded = True
+        logger.debug("gas inventory: seeded %d coins for %s", len(self._coins), self._owner)
+
+    @instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory._catch_up")
+    async def _catch_up(self, client: Any) -> None:
+        """Refetch coins whose state is not known after applied effects."""
+        pending = list(self._pending)
+        self._pending.clear()
+        fetched = {o.object_id: o for o in await fetch_objects_by_id(client, pending)}
+        for oid in pending:
+            obj = fetched.get(oid)
+            if obj is not None and self._owned_by_owner(obj.owner) and is_sui_coin_type(
+                obj.object_type
+            ):
+                self._coins[oid] = obj
+            else:
+                self._coins.pop(oid, None)
+
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.apply_executed")
+    def apply_executed(self, executed_tx: sui_prot.ExecutedTransaction) -> None:
+        """Fold the effects of an executed transaction into the inventory.
+
+        :param executed_tx: The executed transaction result
+        :type executed_tx: sui_prot.ExecutedTransaction
+        """
+        effects = executed_tx.effects if executed_tx else None
+        if not self._seeded or effects is None:
+            return
+        outputs: dict[str, sui_prot.Object] = {}
+        if executed_tx.objects:
+            outputs = {o.object_id: o for o in executed_tx.objects.objects}
+        for changed in effects.changed_objects:
+            oid = changed.object_id
+            if (
+                changed.output_state != sui_prot.ChangedObjectOutputObjectState.OBJECT_WRITE
+                or not self._owned_by_owner(changed.output_owner)
+            ):
+                self._coins.pop(oid, None)
+                self._pending.discard(oid)
+                continue
+            if oid not in self._coins and not is_sui_coin_type(changed.object_type):
+                continue
+            output = outputs.get(oid)
+            if (
+                output is not None
+                and output.version == changed.output_version
+                and output.balance is not None
+            ):
+                self._coins[oid] = sui_prot.Object(
+                    object_id=oid,
+                    version=changed.output_version,
+                    digest=changed.output_digest,
+                    balance=output.balance,
+                    owner=changed.output_owner,
+                    object_type=_SUI_COIN_TYPE,
+                )
+                self._pending.discard(oid)
+            else:
+                self._coins.pop(oid, None)
+                self._pending.add(oid)
+
+    @sync_instrumented("pysui.sui.sui_common.gas_inventory.GasCoinInventory.invalidate")
+    def invalidate(self) -> None:
+        """Drop all knowledge of the owner's coins; the next lookup reseeds."""
+        self._coins.clear()
+        self._pending.clear()
+        self._seeded = False
@@ -18,7 +18,8 @@ class InstrumentationCollector:
     """Base collector — override measure() to record timings.
 
     Default implementation is a no-op; subclass and override measure()
-    to capture elapsed time for each labeled code block.
+    to capture elapsed time for each labeled code block, and record()
+    to capture counter and gauge samples (cache hits, queue depths).
     """
 
     @asynccontextmanager
@@ -31,6 +32,9 @@ class InstrumentationCollector:
         """No-op by default. Override to time the wrapped sync block."""
         yield
 
+    def record(self, label: str, value: float) -> None:
+        """No-op by default. Override to receive a counter or gauge sample."""
+
 
 @asynccontextmanager
 async def active_collector(
@@ -78,6 +82,13 @@ def sync_measure(label: str) -> Iterator[None]:
         yield
 
 
+def record(label: str, value: float = 1) -> None:
+    """Hook point: report a counter or gauge sample if a collector is active; no-op otherwise."""
+    col: Optional[InstrumentationCollector] = _collector_var.get()
+    if col is not None:
+        col.record(label, value)
+
+
 def instrumented(label: str) -> Callable:
     """Decorator: wrap an async method with a measure(label) hook."""
 
@@ -0,0 +1,172 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Client scoped cache of Move package and module reads."""
+
+import asyncio
+import dataclasses
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+# Framework packages are upgraded in place at these addresses
+_SYSTEM_PACKAGES = frozenset(
+    "0x" + format(address, "064x") for address in (0x1, 0x2, 0x3, 0xB, 0xDEE9)
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class PackageCacheStats:
+    """Point in time counters for a PackageCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PackageCache:
+    """LRU cache of results of package reads (``GetPackage``, ``GetModule``...).
+
+    Commands opt in with the ``immutable_package_read`` class flag. A user
+    package never changes at its address (an upgrade publishes a new address),
+    so a successful result for one can be reused for as long as it is held.
+    Framework packages (0x1, 0x2, 0x3, 0xb, 0xdee9) are upgraded in place and
+    are never cached. Failed results are not cached.
+
+    Cached results are shared between callers and must be treated as read only.
+    Concurrent misses on the same key share a single fetch, which completes
+    (and is cached) even if the caller that started it is cancelled.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 256
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache.__init__")
+    def __init__(self, *, maxsize: Optional[int] = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the cache.
+
+        :param maxsize: Maximum entries before least recently used eviction,
+            None for unbounded, defaults to DEFAULT_MAX_ENTRIES
+        :type maxsize: Optional[int], optional
+        """
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Task] = {}
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache.stats")
+    def stats(self) -> PackageCacheStats:
+        """Return the current counters."""
+        return PackageCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    @staticmethod
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache.key_for")
+    def key_for(protocol: str, command: Any) -> Optional[Hashable]:
+        """Return the cache key of command, None if its result is not cacheable.
+
+        :param protocol: The client protocol, results are kept apart per protocol
+        :type protocol: str
+        :param command: The command about to be executed
+        :type command: SuiCommand
+        :return: The key, or None for commands that are not immutable package reads
+        """
+        if not getattr(command, "immutable_package_read", False):
+            return None
+        from pysui.sui.sui_utils import hexstring_to_sui_id
+
+        try:
+            package = hexstring_to_sui_id(command.package).lower()
+        except (AttributeError, ValueError):
+            return None
+        if package in _SYSTEM_PACKAGES:
+            return None
+        values = tuple(
+            getattr(command, field.name)
+            for field in dataclasses.fields(command)
+            if field.name not in ("package", "next_page_token")
+        )
+        return protocol, type(command).__name__, package, values
+
+    @instrumented("pysui.sui.sui_common.package_cache.PackageCache.get_or_fetch")
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for key, fetching it on a miss.
+
+        :param key: A key from key_for
+        :param fetch: Coroutine function returning a SuiRpcResult; only ok results are stored
+        :return: The cached or freshly fetched SuiRpcResult
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._hits += 1
+            return await asyncio.shield(pending)
+
+        self._misses += 1
+        # The fetch runs as its own task so cancelling the caller that started
+        # it does not cancel the callers sharing it
+        task = asyncio.get_running_loop().create_task(fetch())
+        self._pending[key] = task
+        task.add_done_callback(lambda done: self._fetched(key, done))
+        return await asyncio.shield(task)
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache._fetched")
+    def _fetched(self, key: Hashable, task: asyncio.Task) -> None:
+        """Retire a finished fetch, storing its result if ok."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        # Retrieving the exception also keeps an unawaited failure from logging noise
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result.is_ok():
+            self._store(key, result)
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache._store")
+    def _store(self, key: Hashable, result: Any) -> None:
+        """Insert result and enforce the LRU bound."""
+        self._entries[key] = result
+        while self._maxsize and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache.invalidate_package")
+    def invalidate_package(self, package: str) -> int:
+        """Drop every cached read of a package address; returns the count dropped."""
+        from pysui.sui.sui_utils import hexstring_to_sui_id
+
+        norm = hexstring_to_sui_id(package).lower()
+        stale = [key for key in self._entries if key[2] == norm]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    @sync_instrumented("pysui.sui.sui_common.package_cache.PackageCache.clear")
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
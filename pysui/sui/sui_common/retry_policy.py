@@ -0,0 +1,237 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Retry, hedging and deadline policy for SuiCommand execution."""
+
+import asyncio
+import enum
+import logging
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
+
+if TYPE_CHECKING:
+    from pysui import SuiRpcResult
+
+logger = logging.getLogger(__name__)
+
+Attempt = Callable[[Optional[float]], Awaitable["SuiRpcResult"]]
+
+
+class FailureKind(enum.IntEnum):
+    """How a failed result may be retried, as classified by the client protocol."""
+
+    # Succeeded, or failed in a way another attempt will not fix
+    PERMANENT = 0
+    # The request never reached a node (connection refused, no free session):
+    # safe to send again for any command
+    UNSENT = 1
+    # The request may have reached a node (timeout, reset, UNAVAILABLE):
+    # only idempotent commands are sent again
+    TRANSIENT = 2
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Point in time counters for a RetryPolicy."""
+
+    retries: int
+    hedges: int
+    hedge_wins: int
+    exhausted: int
+
+
+class RetryPolicy:
+    """Retry, hedging and deadline policy applied by ``AsyncClientBase.execute``.
+
+    Set one on a client with ``client.retry_policy = RetryPolicy(...)``; a
+    policy holds no per-request state and may be shared by several clients.
+
+    A failed attempt is classified by the client (see ``FailureKind``). Failures
+    before the request was sent are retried for every command. Transient
+    failures are retried only for commands whose ``idempotent`` class flag is
+    True, so ``ExecuteTransaction`` is never sent twice. Delays grow
+    exponentially from ``base_delay`` up to ``max_delay`` with full jitter.
+
+    ``deadline`` (or the ``timeout`` passed to ``execute``, which takes
+    precedence) is the budget for all attempts together. Each attempt is given
+    what remains of it as its transport timeout, and no retry is started that
+    could not begin before the budget runs out.
+
+    With ``hedge_after`` set, an idempotent command still unanswered after that
+    many seconds is sent again, up to ``max_hedges`` extra copies; the first
+    usable answer wins and the others are cancelled.
+
+    Samples reported through ``instrumentation.record``:
+
+    - ``client.retry``: an attempt is being retried
+    - ``client.hedge``: a hedged copy of a request was sent
+    - ``client.hedge_won``: a hedged copy answered first
+    - ``client.retry_exhausted``: retries or the deadline ran out
+    """
+
+    DEFAULT_MAX_ATTEMPTS: int = 3
+    DEFAULT_BASE_DELAY: float = 0.1
+    DEFAULT_MAX_DELAY: float = 2.0
+
+    @sync_instrumented("pysui.sui.sui_common.retry_policy.RetryPolicy.__init__")
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        hedge_after: Optional[float] = None,
+        max_hedges: int = 1,
+    ):
+        """Initialize the policy.
+
+        :param max_attempts: Attempts per command including the first, defaults to 3
+        :type max_attempts: int, optional
+        :param base_delay: Seconds before the first retry, doubled for each further retry, defaults to 0.1
+        :type base_delay: float, optional
+        :param max_delay: Upper bound on the delay between attempts, defaults to 2.0
+        :type max_delay: float, optional
+        :param jitter: Draw each delay uniformly from zero to its bound, defaults to True
+        :type jitter: bool, optional
+        :param deadline: Seconds allowed for all attempts of a command, defaults to None (no limit)
+        :type deadline: Optional[float], optional
+        :param hedge_after: Seconds before a hedged copy of an idempotent command is sent,
+            defaults to None (no hedging)
+        :type hedge_after: Optional[float], optional
+        :param max_hedges: Most hedged copies per attempt, defaults to 1
+        :type max_hedges: int, optional
+        :raises ValueError: If an argument is out of range
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, found {max_attempts}")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError(f"Require 0 <= base_delay <= max_delay, found {base_delay} and {max_delay}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"deadline must be > 0, found {deadline}")
+        if hedge_after is not None and hedge_after <= 0:
+            raise ValueError(f"hedge_after must be > 0, found {hedge_after}")
+        if max_hedges < 1:
+            raise ValueError(f"max_hedges must be >= 1, found {max_hedges}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.hedge_after = hedge_after
+        self.max_hedges = max_hedges
+        self._retries = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._exhausted = 0
+
+    @sync_instrumented("pysui.sui.sui_common.retry_policy.RetryPolicy.stats")
+    def stats(self) -> RetryStats:
+        """Return the current counters."""
+        return RetryStats(self._retries, self._hedges, self._hedge_wins, self._exhausted)
+
+    @sync_instrumented("pysui.sui.sui_common.retry_policy.RetryPolicy.backoff")
+    def backoff(self, retry: int) -> float:
+        """Return the delay in seconds before retry number retry (0 based)."""
+        bound = min(self.max_delay, self.base_delay * (2**retry))
+        return random.uniform(0, bound) if self.jitter else bound
+
+    @instrumented("pysui.sui.sui_common.retry_policy.RetryPolicy.run")
+    async def run(
+        self,
+        attempt: Attempt,
+        *,
+        idempotent: bool,
+        classify: Callable[["SuiRpcResult"], FailureKind],
+        timeout: Optional[float] = None,
+    ) -> "SuiRpcResult":
+        """Run attempt under this policy and return the final result.
+
+        :param attempt: Async callable(timeout) sending the request once with the
+            given transport timeout in seconds (None for no timeout)
+        :type attempt: Callable[[Optional[float]], Awaitable[SuiRpcResult]]
+        :param idempotent: Whether the request may be sent more than once
+        :type idempotent: bool
+        :param classify: Callable mapping a failed result to its FailureKind
+        :type classify: Callable[[SuiRpcResult], FailureKind]
+        :param timeout: Budget for all attempts overriding the policy deadline, defaults to None
+        :type timeout: Optional[float], optional
+        """
+        loop = asyncio.get_running_loop()
+        budget = timeout if timeout is not None else self.deadline
+        end = None if budget is None else loop.time() + budget
+        hedge = idempotent and self.hedge_after is not None
+        retry = 0
+        while True:
+            remaining = None if end is None else max(end - loop.time(), 0.0)
+            if hedge:
+                result = await self._hedged(attempt, remaining, classify)
+            else:
+                result = await attempt(remaining)
+            if result.is_ok():
+                return result
+            kind = classify(result)
+            if kind is FailureKind.PERMANENT or (kind is FailureKind.TRANSIENT and not idempotent):
+                return result
+            retry += 1
+            delay = self.backoff(retry - 1)
+            if retry >= self.max_attempts or (end is not None and loop.time() + delay >= end):
+                self._exhausted += 1
+                record("client.retry_exhausted")
+                return result
+            self._retries += 1
+            record("client.retry")
+            logger.debug("Retry %d in %.3fs after %s failure: %s", retry, delay, kind.name, result.result_string)
+            await asyncio.sleep(delay)
+
+    @instrumented("pysui.sui.sui_common.retry_policy.RetryPolicy._hedged")
+    async def _hedged(
+        self,
+        attempt: Attempt,
+        remaining: Optional[float],
+        classify: Callable[["SuiRpcResult"], FailureKind],
+    ) -> "SuiRpcResult":
+        """Send attempt, adding a copy each hedge_after seconds until one gives a usable answer."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tasks = [asyncio.ensure_future(attempt(remaining))]
+        pending = set(tasks)
+        last: Optional["SuiRpcResult"] = None
+        try:
+            while pending:
+                wait = None
+                if len(tasks) <= self.max_hedges:
+                    wait = self.hedge_after
+                    if remaining is not None and remaining - (loop.time() - start) <= wait:
+                        wait = None
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    left = None if remaining is None else max(remaining - (loop.time() - start), 0.0)
+                    task = asyncio.ensure_future(attempt(left))
+                    tasks.append(task)
+                    pending.add(task)
+                    self._hedges += 1
+                    record("client.hedge")
+                    continue
+                for task in done:
+                    result = task.result()
+                    if result.is_ok() or classify(result) is FailureKind.PERMANENT:
+                        if task is not tasks[0]:
+                            self._hedge_wins += 1
+                            record("client.hedge_won")
+                        return result
+                    last = result
+            return last
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
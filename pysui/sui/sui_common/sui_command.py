@@ -37,6 +37,26 @@ class SuiCommand(ABC):
     paginated_field_path_gql: ClassVar[tuple[str, ...] | None] = None
     paginated_field_path_grpc: ClassVar[tuple[str, ...] | None] = None
 
+    # Chunking contract
+    # When chunked_field names a list longer than chunk_size, the client splits
+    # the command into chunk_size commands, runs them concurrently and
+    # concatenates the list at chunked_result_path in input order.
+    chunked_field: ClassVar[str | None] = None
+    chunk_size: ClassVar[int] = 50
+    chunked_result_path: ClassVar[tuple[str, ...] | None] = None
+
+    # Retry contract
+    # False for commands that change chain state: a client RetryPolicy then
+    # only resends them when the request provably never reached a node, and
+    # never hedges them.
+    idempotent: ClassVar[bool] = True
+
+    # Caching contract
+    # True for reads of a Move package by address. A user package never changes
+    # at its address, so execute_for_all serves repeats from the client's
+    # PackageCache.
+    immutable_package_read: ClassVar[bool] = False
+
     @abstractmethod
     def gql_node(self) -> "PGQL_QueryNode":
         """Return a ready-to-execute GQL query node for this command."""
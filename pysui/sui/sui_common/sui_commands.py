@@ -28,6 +28,7 @@ class ExecuteTransaction(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.ExecuteTransactionSC
     grpc_class: ClassVar[type] = rn.ExecuteTransaction
+    idempotent: ClassVar[bool] = False
 
     tx_bytestr: str | bytes
     sig_array: list[str | bytes]
@@ -385,10 +386,16 @@ class GetPastObject(SuiCommand):
 
 @dataclass(kw_only=True)
 class GetMultipleObjects(SuiCommand):
-    """Fetch the current state of multiple objects by ID list."""
+    """Fetch the current state of multiple objects by ID list.
+
+    Lists longer than the protocol limit are fetched in concurrent chunks and
+    merged in input order.
+    """
 
     gql_class: ClassVar[type] = pgql_query.GetMultipleObjectsSC
     grpc_class: ClassVar[type] = rn.GetMultipleObjectsSC
+    chunked_field: ClassVar[str] = "object_ids"
+    chunked_result_path: ClassVar[tuple[str, ...]] = ("objects",)
 
     object_ids: list[str]
 
@@ -425,10 +432,16 @@ class GetObjectSummary(SuiCommand):
 
 @dataclass(kw_only=True)
 class GetMultipleObjectSummary(SuiCommand):
-    """Fetch thin summaries (id, version, digest, owner) for a list of objects."""
+    """Fetch thin summaries (id, version, digest, owner) for a list of objects.
+
+    Lists longer than the protocol limit are fetched in concurrent chunks and
+    merged in input order.
+    """
 
     gql_class: ClassVar[type] = pgql_query.GetMultipleObjectsSummarySC
     grpc_class: ClassVar[type] = rn.GetMultipleObjectsSummarySC
+    chunked_field: ClassVar[str] = "object_ids"
+    chunked_result_path: ClassVar[tuple[str, ...]] = ("objects",)
 
     object_ids: list[str]
 
@@ -605,6 +618,8 @@ class GetCheckpointBySequence(SuiCommand):
     grpc_class: ClassVar[type] = rn.GetCheckpointBySequence
 
     sequence_number: int
+    # gRPC read mask, None for every field; GraphQL returns its fixed selection
+    field_mask: Optional[list[str]] = None
 
     @sync_instrumented("pysui.sui.sui_common.sui_commands.GetCheckpointBySequence.gql_node")
     def gql_node(self) -> pgql_query.GetCheckpointBySequenceSC:
@@ -614,7 +629,9 @@ class GetCheckpointBySequence(SuiCommand):
     @sync_instrumented("pysui.sui.sui_common.sui_commands.GetCheckpointBySequence.grpc_request")
     def grpc_request(self) -> rn.GetCheckpointBySequence:
         """Return gRPC get-checkpoint-by-sequence request."""
-        return rn.GetCheckpointBySequence(sequence_number=self.sequence_number)
+        return rn.GetCheckpointBySequence(
+            sequence_number=self.sequence_number, field_mask=self.field_mask
+        )
 
 
 @dataclass(kw_only=True)
@@ -767,6 +784,7 @@ class GetPackage(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetPackageSC
     grpc_class: ClassVar[type] = rn.GetPackage
+    immutable_package_read: ClassVar[bool] = True
     is_pageable_gql: ClassVar[bool] = True
     paginated_field_path_gql: ClassVar[tuple[str, ...]] = ("package", "modules")
     compound_items_gql: ClassVar[list[tuple]] = []
@@ -822,6 +840,7 @@ class GetModule(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetModuleSC
     grpc_class: ClassVar[type] = rn.GetModule
+    immutable_package_read: ClassVar[bool] = True
     compound_sub_collections_gql: ClassVar[list[tuple]] = []
 
     package: str
@@ -844,6 +863,7 @@ class GetMoveDataType(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetMoveDataTypeSC
     grpc_class: ClassVar[type] = rn.GetMoveDataType
+    immutable_package_read: ClassVar[bool] = True
 
     package: str
     module_name: str
@@ -874,6 +894,7 @@ class GetStructure(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetStructureSC
     grpc_class: ClassVar[type] = rn.GetStructure
+    immutable_package_read: ClassVar[bool] = True
 
     package: str
     module_name: str
@@ -904,6 +925,7 @@ class GetStructures(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetStructuresSC
     grpc_class: ClassVar[type] = rn.GetStructures
+    immutable_package_read: ClassVar[bool] = True
     is_pageable_gql: ClassVar[bool] = True
     paginated_field_path_gql: ClassVar[tuple[str, ...]] = ("structures",)
 
@@ -932,6 +954,7 @@ class GetFunction(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetFunctionSC
     grpc_class: ClassVar[type] = rn.GetFunction
+    immutable_package_read: ClassVar[bool] = True
 
     package: str
     module_name: str
@@ -962,6 +985,7 @@ class GetFunctions(SuiCommand):
 
     gql_class: ClassVar[type] = pgql_query.GetFunctionsSC
     grpc_class: ClassVar[type] = rn.GetFunctions
+    immutable_package_read: ClassVar[bool] = True
     is_pageable_gql: ClassVar[bool] = True
     paginated_field_path_gql: ClassVar[tuple[str, ...]] = ("functions",)
 
@@ -6,10 +6,14 @@
 """Protocol-agnostic gas selection and budget utilities shared across GQL and gRPC paths."""
 
 import asyncio
-from typing import Callable, Optional, TypeVar, Union
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, TypeVar, Union
 
 from pysui.sui.sui_bcs import bcs
-from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+from pysui.sui.sui_common.gas_inventory import GasCoinInventory, fetch_objects_by_id
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
 
 # Per Mysten TS SDK: GAS_SAFE_OVERHEAD applied to every budget estimate.
 _GAS_SAFE_OVERHEAD: int = 1000  # gas units (not MIST)
@@ -97,6 +101,151 @@ def coins_for_budget(
     return [ref_fn(c) for c in selected]
 
 
+class GasBudgetEstimator:
+    """Reuse simulated gas budgets across structurally identical transactions.
+
+    A ``ProgrammableTransaction`` is fingerprinted by its input kinds (pure,
+    owned, shared mutability, receiving, withdrawal type) and its commands
+    (kind, Move targets, type arguments and argument wiring); pure values and
+    object ids do not contribute. The first transaction of a shape is
+    simulated, later ones reuse that budget raised by ``safety_margin``.
+    Entries are scoped to the reference gas price they were simulated at.
+
+    Hits and misses are reported to the active instrumentation collector as
+    ``gas.budget_estimator.hit`` and ``gas.budget_estimator.miss``.
+    """
+
+    DEFAULT_SAFETY_MARGIN: float = 0.10
+    DEFAULT_MAX_ENTRIES: int = 1024
+
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.__init__")
+    def __init__(
+        self,
+        *,
+        safety_margin: float = DEFAULT_SAFETY_MARGIN,
+        maxsize: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the estimator.
+
+        :param safety_margin: Fraction added to a reused budget, defaults to 0.10
+        :type safety_margin: float, optional
+        :param maxsize: Maximum shapes retained (least recently used evicted), defaults to 1024
+        :type maxsize: int, optional
+        :param ttl_seconds: Optional lifetime of a simulated budget, defaults to None
+        :type ttl_seconds: Optional[float], optional
+        :raises ValueError: If safety_margin is negative
+        """
+        if safety_margin < 0:
+            raise ValueError(f"safety_margin must be >= 0, found {safety_margin}")
+        self._margin = safety_margin
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[tuple[bytes, int], tuple[float, int]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.hits")
+    def hits(self) -> int:
+        """Budgets served without simulation."""
+        return self._hits
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.misses")
+    def misses(self) -> int:
+        """Budgets that required simulation."""
+        return self._misses
+
+    @property
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.hit_rate")
+    def hit_rate(self) -> float:
+        """Fraction of estimates served without simulation."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    @staticmethod
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.fingerprint")
+    def fingerprint(tx_kind: bcs.TransactionKind) -> Optional[bytes]:
+        """Return the shape digest of a programmable transaction, None for other kinds."""
+        if tx_kind.enum_name != "ProgrammableTransaction":
+            return None
+        ptb: bcs.ProgrammableTransaction = tx_kind.value
+        shape = hashlib.blake2b(digest_size=16)
+        for arg in ptb.Inputs:
+            shape.update(arg.enum_name.encode())
+            if arg.enum_name == "Object":
+                shape.update(arg.value.enum_name.encode())
+                if arg.value.enum_name == "SharedObject":
+                    shape.update(b"m" if arg.value.value.Mutable else b"i")
+            elif arg.enum_name == "FundsWithdrawal":
+                shape.update(arg.value.Type_.serialize())
+            shape.update(b"|")
+        shape.update(b"#")
+        # Commands reference inputs by index only, so their BCS is pure shape
+        for command in ptb.Command:
+            shape.update(command.serialize())
+        return shape.digest()
+
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.lookup")
+    def lookup(self, tx_kind: bcs.TransactionKind, gas_price: int) -> Optional[int]:
+        """Return a margin adjusted budget for the shape, or None on a miss."""
+        fprint = self.fingerprint(tx_kind)
+        entry = self._entries.get((fprint, gas_price)) if fprint else None
+        if entry is not None and (
+            self._ttl is None or time.monotonic() - entry[0] <= self._ttl
+        ):
+            self._entries.move_to_end((fprint, gas_price))
+            self._hits += 1
+            record("gas.budget_estimator.hit")
+            return int(entry[1] * (1 + self._margin))
+        self._misses += 1
+        record("gas.budget_estimator.miss")
+        return None
+
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.update")
+    def update(self, tx_kind: bcs.TransactionKind, gas_price: int, budget: int) -> None:
+        """Store a simulated budget for the transaction shape."""
+        fprint = self.fingerprint(tx_kind)
+        if fprint is None:
+            return
+        self._entries[(fprint, gas_price)] = (time.monotonic(), budget)
+        self._entries.move_to_end((fprint, gas_price))
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    @sync_instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.note_insufficient_gas")
+    def note_insufficient_gas(self, tx_kind: bcs.TransactionKind) -> None:
+        """Forget the shape so the next transaction like it is simulated again."""
+        fprint = self.fingerprint(tx_kind)
+        for key in [k for k in self._entries if k[0] == fprint]:
+            del self._entries[key]
+
+    @instrumented("pysui.sui.sui_common.txn_gas.GasBudgetEstimator.estimate")
+    async def estimate(
+        self,
+        tx_kind: bcs.TransactionKind,
+        gas_price: int,
+        simulate: Callable[[], Awaitable[int]],
+    ) -> int:
+        """Return a reused budget for the shape, simulating on a miss.
+
+        :param tx_kind: The TransactionKind BCS
+        :type tx_kind: bcs.TransactionKind
+        :param gas_price: Reference gas price the budget applies to
+        :type gas_price: int
+        :param simulate: Coroutine function returning a simulated budget
+        :type simulate: Callable[[], Awaitable[int]]
+        :return: Gas budget in MIST
+        :rtype: int
+        """
+        budget = self.lookup(tx_kind, gas_price)
+        if budget is None:
+            budget = await simulate()
+            self.update(tx_kind, gas_price, budget)
+        return budget
+
+
 
 @instrumented("gas.async_get_gas_data")
 async def async_get_gas_data(
@@ -106,14 +255,17 @@ async def async_get_gas_data(
     budget: Optional[int] = None,
     use_coins: Optional[list] = None,
     objects_in_use: set,
-    active_gas_price: int,
+    active_gas_price: Optional[int] = None,
     tx_kind: bcs.TransactionKind,
     gas_source_draw: int = 0,
 ) -> bcs.GasData:
     """Protocol-agnostic gas selection and budget computation.
 
     When both use_coins and budget are None, coin fetch and simulation run in parallel.
-    Dispatches via SuiCommand so the same code path runs for both GQL and gRPC clients.
+    Coins given by id are fetched directly; otherwise coins come from the client's
+    gas coin inventory for the payer, which is reseeded once if it can not fund
+    the transaction. Dispatches via SuiCommand so the same code path runs for both
+    GQL and gRPC clients.
 
     :param signing: The SignerBlock carrying sender/payer/sponsor addresses
     :param client: The protocol client (GQL or gRPC)
@@ -123,8 +275,9 @@ async def async_get_gas_data(
     :type use_coins: Optional[list], optional
     :param objects_in_use: Coin IDs already referenced in the transaction
     :type objects_in_use: set
-    :param active_gas_price: Current reference gas price
-    :type active_gas_price: int
+    :param active_gas_price: Current reference gas price, taken from the client's
+        chain context if None, defaults to None
+    :type active_gas_price: Optional[int], optional
     :param tx_kind: The TransactionKind BCS
     :type tx_kind: bcs.TransactionKind
     :param gas_source_draw: Extra MIST drawn from gas source by PTB commands, defaults to 0
@@ -136,6 +289,9 @@ async def async_get_gas_data(
     """
     from pysui.sui.sui_common import sui_commands as cmd
 
+    if active_gas_price is None:
+        active_gas_price = (await client.chain_context.get(client)).reference_gas_price
+
     @instrumented("pysui.sui.sui_common.txn_gas._fetch_gas")
     async def _fetch_gas() -> list:
         """Fetch all gas coins across all pages for both GQL and gRPC."""
@@ -145,8 +301,8 @@ async def async_get_gas_data(
         response = result.result_data
         return list(response.objects)
 
-    @instrumented("pysui.sui.sui_common.txn_gas._simulate_budget")
-    async def _simulate_budget() -> int:
+    @instrumented("pysui.sui.sui_common.txn_gas._simulate")
+    async def _simulate() -> int:
         """Simulate the transaction to determine gas budget."""
         tx_meta: dict = {"sender": signing.sender_str, "gasPrice": active_gas_price}
         if signing.sponsor_str:
@@ -166,32 +322,63 @@ async def async_get_gas_data(
             active_gas_price,
         )
 
+    @instrumented("pysui.sui.sui_common.txn_gas._simulate_budget")
+    async def _simulate_budget() -> int:
+        """Determine the gas budget, from the client's estimator when one is set."""
+        estimator = getattr(client, "budget_estimator", None)
+        if isinstance(estimator, GasBudgetEstimator):
+            return await estimator.estimate(tx_kind, active_gas_price, _simulate)
+        return await _simulate()
+
+    getter = getattr(client, "gas_inventory", None)
+    inventory = getter(signing.payer_address) if callable(getter) else None
+    if not isinstance(inventory, GasCoinInventory):
+        inventory = None
+
+    @instrumented("pysui.sui.sui_common.txn_gas._select_gas")
+    async def _select_gas() -> list:
+        """Return the payer's gas coins from the client inventory, or by listing them."""
+        if inventory is not None:
+            return await inventory.coins(client)
+        return await _fetch_gas()
+
+    @sync_instrumented("pysui.sui.sui_common.txn_gas._payment")
+    def _payment(coins: list) -> list[bcs.ObjectReference]:
+        """Select payment coins not already used as transaction inputs."""
+        coins = [x for x in coins if x.object_id not in objects_in_use]
+        if not coins:
+            raise ValueError("No coin objects found to fund transaction.")
+        return coins_for_budget(
+            coins,
+            budget + gas_source_draw,
+            balance_fn=lambda x: int(x.balance or 0),
+            ref_fn=bcs.ObjectReference.from_grpc_ref,
+        )
+
     # Resolve coin list and budget — parallel when both are unspecified.
+    auto_selected = use_coins is None
     if use_coins is None and budget is None:
-        use_coins, budget = await asyncio.gather(_fetch_gas(), _simulate_budget())
+        use_coins, budget = await asyncio.gather(_select_gas(), _simulate_budget())
     else:
         if use_coins is None:
-            use_coins = await _fetch_gas()
+            use_coins = await _select_gas()
         elif use_coins and all(isinstance(x, str) for x in use_coins):
-            # String IDs: fetch all gas coins then filter to the requested subset.
-            all_gas = await _fetch_gas()
-            use_coins = [x for x in all_gas if x.object_id in set(use_coins)]
+            # String IDs: fetch exactly the requested coins.
+            use_coins = await fetch_objects_by_id(client, list(use_coins))
         if budget is None:
             budget = await _simulate_budget()
 
-    _reserved = budget + gas_source_draw
-
-    use_coins = [x for x in use_coins if x.object_id not in objects_in_use]
-    if not use_coins:
-        raise ValueError("No coin objects found to fund transaction.")
+    try:
+        payment = _payment(use_coins)
+    except ValueError:
+        if not (auto_selected and inventory is not None):
+            raise
+        # The inventory may have missed coins received since it was seeded
+        inventory.invalidate()
+        payment = _payment(await inventory.coins(client))
 
     return bcs.GasData(
-        coins_for_budget(
-            use_coins,
-            _reserved,
-            balance_fn=lambda x: int(x.balance or 0),
-            ref_fn=bcs.ObjectReference.from_grpc_ref,
-        ),
+        payment,
         bcs.Address.from_str(signing.payer_address),
         active_gas_price,
         budget,
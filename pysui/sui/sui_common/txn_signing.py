@@ -5,12 +5,16 @@
 
 """Pysui Signing Block builder that works with GraphQL connection."""
 
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Optional, Union
+from deprecated.sphinx import versionadded
 from pysui import PysuiConfiguration
-from pysui.sui.sui_crypto import MultiSig, BaseMultiSig, SuiPublicKey
+from pysui.sui.sui_crypto import MultiSig, BaseMultiSig, SuiKeyPair, SuiPublicKey
 
 import pysui.sui.sui_pgql.pgql_types as pgql_type
-from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
 
 
 class SigningMultiSig:
@@ -136,10 +140,12 @@ class SignerBlock:
             result_list.append(self._sponsor)
         return result_list
 
-    @sync_instrumented("pysui.sui.sui_common.txn_signing.SignerBlock.get_signatures")
-    def get_signatures(self, *, config: PysuiConfiguration, tx_bytes: str) -> list[str]:
-        """Get all the signatures needed for the transaction."""
-        sig_list: list[str] = []
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SignerBlock._signing_keys")
+    def _signing_keys(
+        self, config: PysuiConfiguration
+    ) -> list[Union[SuiKeyPair, SigningMultiSig]]:
+        """Resolve each signer to the keypair or multisig that signs for it."""
+        keys: list[Union[SuiKeyPair, SigningMultiSig]] = []
         for signer in self._get_potential_signatures():
             if isinstance(signer, str):
                 keypair = config.active_group.get_transient_keypair(
@@ -148,10 +154,197 @@ class SignerBlock:
                 )
                 if keypair is None:
                     keypair = config.active_group.keypair_for_address(address=signer)
-                sig_list.append(keypair.new_sign_secure(tx_bytes))
+                keys.append(keypair)
+            elif signer._can_sign_msg:
+                keys.append(signer)
             else:
-                if signer._can_sign_msg:
-                    sig_list.append(signer.multi_sig.sign(tx_bytes, signer.pub_keys))
-                else:
-                    raise ValueError("BaseMultiSig can not sign for execution")
-        return sig_list
+                raise ValueError("BaseMultiSig can not sign for execution")
+        return keys
+
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SignerBlock.get_signatures")
+    def get_signatures(self, *, config: PysuiConfiguration, tx_bytes: str) -> list[str]:
+        """Get all the signatures needed for the transaction."""
+        return _sign_batch([(key, tx_bytes) for key in self._signing_keys(config)])
+
+    @versionadded(version="1.2.0", reason="Sign off the event loop.")
+    @instrumented("pysui.sui.sui_common.txn_signing.SignerBlock.get_signatures_async")
+    async def get_signatures_async(
+        self,
+        *,
+        config: PysuiConfiguration,
+        tx_bytes: str,
+        pool: Optional["SigningPool"] = None,
+    ) -> list[str]:
+        """Get all the signatures needed for the transaction from a signing pool.
+
+        Keys are resolved on the calling thread; the signing itself runs in the
+        pool's executor, batched with signatures requested by other concurrent
+        callers.
+
+        :param config: The configuration holding the signer keys
+        :type config: PysuiConfiguration
+        :param tx_bytes: Base64 transaction bytes to sign
+        :type tx_bytes: str
+        :param pool: Signing pool to use, defaults to ``default_signing_pool()``
+        :type pool: Optional[SigningPool], optional
+        :return: Base64 signatures in sender, sponsor order
+        :rtype: list[str]
+        """
+        pool = pool or default_signing_pool()
+        return await pool.sign(
+            [(key, tx_bytes) for key in self._signing_keys(config)]
+        )
+
+
+@sync_instrumented("pysui.sui.sui_common.txn_signing._sign_batch")
+def _sign_batch(jobs: list[tuple[Union[SuiKeyPair, SigningMultiSig], str]]) -> list[str]:
+    """Sign each (key, tx_bytes) job. Module level so process pools can pickle it."""
+    sigs: list[str] = []
+    for key, tx_bytes in jobs:
+        if isinstance(key, SigningMultiSig):
+            sigs.append(key.multi_sig.sign(tx_bytes, key.pub_keys))
+        else:
+            sigs.append(key.new_sign_secure(tx_bytes))
+    return sigs
+
+
+@sync_instrumented("pysui.sui.sui_common.txn_signing._resolve")
+def _resolve(future: asyncio.Future, sigs: Optional[list[str]], exc: Optional[BaseException]) -> None:
+    """Complete a sign request's future on its own loop, unless it is already done."""
+    if future.done():
+        return
+    if sigs is not None:
+        future.set_result(sigs)
+    elif exc is not None:
+        future.set_exception(exc)
+    else:
+        future.cancel()
+
+
+@versionadded(version="1.2.0", reason="Sign off the event loop.")
+class SigningPool:
+    """Runs transaction signing in a thread or process pool.
+
+    Signature requests made during one event loop turn are collected and
+    submitted to the executor together, in batches of at most ``max_batch``
+    signatures, so a burst of concurrent builds costs a few executor round
+    trips rather than one per transaction.
+
+    A ``ThreadPoolExecutor`` keeps the loop responsive while signing; a
+    ``ProcessPoolExecutor`` also spreads the signing work over CPU cores, at the
+    cost of pickling each key and transaction to the worker.
+
+    Samples reported through ``instrumentation.record``:
+
+    - ``signing.batch_size``: signatures submitted in one executor call
+    """
+
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SigningPool.__init__")
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        *,
+        max_workers: Optional[int] = None,
+        max_batch: int = 32,
+    ) -> None:
+        """Create a signing pool.
+
+        :param executor: Executor to sign in, defaults to a ThreadPoolExecutor owned by this pool
+        :type executor: Optional[Executor], optional
+        :param max_workers: Workers for the owned ThreadPoolExecutor, defaults to None
+        :type max_workers: Optional[int], optional
+        :param max_batch: Most signatures submitted in one executor call, defaults to 32
+        :type max_batch: int, optional
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pysui-sign"
+        )
+        self._max_batch = max(1, max_batch)
+        # Requests waiting for their loop's next flush, keyed by event loop so
+        # a pool shared by several loops (one per thread) never flushes one
+        # loop's requests from another.
+        self._pending: dict[asyncio.AbstractEventLoop, list[tuple[list, asyncio.Future]]] = {}
+        self._lock = threading.Lock()
+
+    @instrumented("pysui.sui.sui_common.txn_signing.SigningPool.sign")
+    async def sign(self, jobs: list[tuple[Union[SuiKeyPair, SigningMultiSig], str]]) -> list[str]:
+        """Sign (key, tx_bytes) jobs in the executor, returning signatures in job order."""
+        if not jobs:
+            return []
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            pending = self._pending.get(loop)
+            if pending is None:
+                pending = self._pending[loop] = []
+                loop.call_soon(self._flush, loop)
+            pending.append((jobs, future))
+        return await future
+
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SigningPool._flush")
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Submit everything requested on loop since its last flush, in max_batch sized groups."""
+        with self._lock:
+            pending = self._pending.pop(loop, [])
+        group: list[tuple[list, asyncio.Future]] = []
+        count = 0
+        for request in pending:
+            if group and count + len(request[0]) > self._max_batch:
+                self._submit(group)
+                group, count = [], 0
+            group.append(request)
+            count += len(request[0])
+        if group:
+            self._submit(group)
+
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SigningPool._submit")
+    def _submit(self, group: list[tuple[list, asyncio.Future]]) -> None:
+        """Sign one group in the executor and hand each request its signatures.
+
+        The executor's done callback runs on a worker thread, so each caller's
+        future is resolved on its own loop with ``call_soon_threadsafe``.
+        """
+        jobs = [job for request, _ in group for job in request]
+        record("signing.batch_size", len(jobs))
+
+        def _done(batch) -> None:
+            exc = None if batch.cancelled() else batch.exception()
+            sigs = batch.result() if exc is None and not batch.cancelled() else None
+            start = 0
+            for request, future in group:
+                value = sigs[start : start + len(request)] if sigs is not None else None
+                try:
+                    future.get_loop().call_soon_threadsafe(_resolve, future, value, exc)
+                except RuntimeError:
+                    # The caller's loop has closed; nobody is left to wake.
+                    pass
+                start += len(request)
+
+        try:
+            self._executor.submit(_sign_batch, jobs).add_done_callback(_done)
+        except Exception as exc:
+            for _, future in group:
+                _resolve(future, None, exc)
+
+    @sync_instrumented("pysui.sui.sui_common.txn_signing.SigningPool.shutdown")
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor if this pool created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+
+_DEFAULT_POOL: Optional[SigningPool] = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+@versionadded(version="1.2.0", reason="Sign off the event loop.")
+@sync_instrumented("pysui.sui.sui_common.txn_signing.default_signing_pool")
+def default_signing_pool() -> SigningPool:
+    """Return the process-wide thread backed signing pool, creating it on first call."""
+    global _DEFAULT_POOL
+    if _DEFAULT_POOL is None:
+        with _DEFAULT_POOL_LOCK:
+            if _DEFAULT_POOL is None:
+                _DEFAULT_POOL = SigningPool()
+    return _DEFAULT_POOL
@@ -19,6 +19,7 @@ import base64
 import binascii
 import hashlib
 import json
+from concurrent.futures import Executor
 from enum import IntEnum
 from typing import Optional, Union
 from deprecated.sphinx import versionadded, versionchanged, deprecated
@@ -104,6 +105,18 @@ class SuiPublicKey(PublicKey):
 
 
 
+@sync_instrumented("pysui.sui.sui_crypto._bcs_byte_vector")
+def _bcs_byte_vector(data: bytes) -> bytes:
+    """BCS vector<u8>: uleb128 length then the bytes, as personal messages are signed."""
+    length, prefix = len(data), bytearray()
+    while True:
+        byte = length & 0x7F
+        length >>= 7
+        prefix.append(byte | 0x80 if length else byte)
+        if not length:
+            return bytes(prefix) + data
+
+
 @versionchanged(version="0.33.0", reason="Converted to use pysui-fastcrypto")
 class SuiPrivateKey(PrivateKey):
     """SuiPrivateKey Sui Basic private/signing key."""
@@ -127,6 +140,7 @@ class SuiPrivateKey(PrivateKey):
         )
 
     @versionadded(version="0.71.0", reason="Signing personal messages")
+    @versionchanged(version="1.2.0", reason="Zero bytes in message were dropped")
     @sync_instrumented("pysui.sui.sui_crypto.SuiPrivateKey.sign_secure_personal_message")
     def sign_secure_personal_message(self, message: str) -> list:
         """sign_secure_personal_message for exchange.
@@ -138,10 +152,8 @@ class SuiPrivateKey(PrivateKey):
         :return: Signed message as list of u8 bytes
         :rtype: list
         """
-        from pysui.sui.sui_common.txn_pure import PureInput
-
         tx_data = base64.b64encode(
-            bytes(PureInput.pure(list(base64.b64decode(message))))
+            _bcs_byte_vector(base64.b64decode(message))
         ).decode("utf-8")
         return pfc.sign_digest(
             self.scheme,
@@ -697,9 +709,259 @@ def keypair_from_keystring(keystring: str) -> SuiKeyPair:
         )
     return SuiKeyPair.from_b64(keystring)
 
+# Local signature verification
+
+_VERIFY_INTENTS = (IntentScope.TransactionData, IntentScope.PersonalMessage)
+_MS_SCHEMES = {"Ed25519": 0, "Secp256k1": 1, "Secp256r1": 2}
+
+
+@sync_instrumented("pysui.sui.sui_crypto._signed_digest")
+def _signed_digest(message: bytes, intent: IntentScope) -> str:
+    """Base64 blake2b digest of the intent message that user signatures cover."""
+    if intent == IntentScope.PersonalMessage:
+        message = _bcs_byte_vector(message)
+    digest = hashlib.blake2b(bytes([intent, 0, 0]) + message, digest_size=32).digest()
+    return base64.b64encode(digest).decode()
+
 
+@sync_instrumented("pysui.sui.sui_crypto._ms_locally_verifiable")
+def _ms_locally_verifiable(sig_bytes: bytes) -> bool:
+    """Whether every signature and committee key of a multisig uses a scheme in _MS_SCHEMES.
 
+    Walks the BCS layout rather than deserializing it, as zkLogin and passkey
+    members use a variable length encoding.
+    """
+    known = _MS_SCHEMES.values()
+
+    def _uleb128(pos: int) -> tuple[int, int]:
+        value = shift = 0
+        while True:
+            byte = sig_bytes[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, pos
+            shift += 7
+
+    count, pos = _uleb128(1)
+    for _ in range(count):
+        if sig_bytes[pos] not in known:
+            return False
+        pos += 65
+    # Skip the u16 bitmap
+    count, pos = _uleb128(pos + 2)
+    for _ in range(count):
+        flag = sig_bytes[pos]
+        if flag not in known:
+            return False
+        # Flag, public key and weight
+        pos += 1 + (32 if flag == SignatureScheme.ED25519 else 33) + 1
+    return True
+
+
+@sync_instrumented("pysui.sui.sui_crypto._verify_multisig")
+def _verify_multisig(sig_bytes: bytes, digest: str) -> tuple[Optional[bool], str]:
+    """Verify a multisig signature; return validity and the multisig address.
+
+    Validity is None when a member uses a scheme that only a node can verify.
+    """
+    from pysui.sui.sui_bcs.bcs import SuiSignature
+
+    if not _ms_locally_verifiable(sig_bytes):
+        return None, ""
+    payload = SuiSignature.deserialize(sig_bytes).value
+    bitmap: int = payload.BitMap.Bitmap
+    members = [i for i in range(len(payload.PkMap)) if bitmap >> i & 1]
+    if bitmap >> len(payload.PkMap) or len(members) != len(payload.Sigs):
+        return False, ""
+    weight = 0
+    for index, compressed in zip(members, payload.Sigs):
+        member = payload.PkMap[index]
+        flag, raw = compressed.Sig[0], bytes(compressed.Sig[1:])
+        if flag != _MS_SCHEMES[member.enum_name] or not pfc.verify_pubk(
+            flag,
+            bytes(member.value.PublicKey),
+            digest,
+            base64.b64encode(raw).decode(),
+        ):
+            return False, ""
+        weight += member.value.Weight
+    address = bytes([SignatureScheme.MULTISIG]) + payload.Threshold.to_bytes(2, "little")
+    for member in payload.PkMap:
+        address += bytes([_MS_SCHEMES[member.enum_name]])
+        address += bytes(member.value.PublicKey) + bytes([member.value.Weight])
+    return (
+        weight >= payload.Threshold,
+        "0x" + hashlib.blake2b(address, digest_size=32).hexdigest(),
+    )
+
+
+@versionadded(version="1.2.0", reason="Local signature verification.")
+@sync_instrumented("pysui.sui.sui_crypto.verify_signature")
+def verify_signature(
+    message: str,
+    signature: str,
+    *,
+    author: Optional[str] = None,
+    intent: IntentScope = IntentScope.TransactionData,
+) -> Optional[bool]:
+    """verify_signature Verify a Sui user signature without a node.
+
+    Handles ED25519, SECP256K1, SECP256R1 and MultiSig (of those schemes)
+    signatures. zkLogin and passkey signatures, and multisigs with such a
+    member, need on chain state and are not verified here.
+
+    :param message: Base64 transaction bytes, or personal message bytes, that were signed
+    :type message: str
+    :param signature: Base64 Sui signature, scheme flag first
+    :type signature: str
+    :param author: Also require the signature to be from this address, defaults to None
+    :type author: Optional[str], optional
+    :param intent: TransactionData or PersonalMessage, defaults to IntentScope.TransactionData
+    :type intent: IntentScope, optional
+    :raises ValueError: If intent is not TransactionData or PersonalMessage
+    :return: True or False, or None if the scheme can only be verified by a node
+    :rtype: Optional[bool]
+    """
+    if intent not in _VERIFY_INTENTS:
+        raise ValueError(f"Can not verify user signatures for intent {intent!r}")
+    try:
+        sig_bytes = base64.b64decode(signature)
+        digest = _signed_digest(base64.b64decode(message), intent)
+    except (binascii.Error, ValueError):
+        return False
+    if not sig_bytes:
+        return False
+    flag = sig_bytes[0]
+    try:
+        if flag == SignatureScheme.MULTISIG:
+            valid, address = _verify_multisig(sig_bytes, digest)
+            if valid is None:
+                return None
+        elif flag <= SignatureScheme.SECP256R1:
+            if len(sig_bytes) != 65 + (32 if flag == SignatureScheme.ED25519 else 33):
+                return False
+            pub_key = sig_bytes[65:]
+            valid = pfc.verify_pubk(
+                flag, pub_key, digest, base64.b64encode(sig_bytes[1:65]).decode()
+            )
+            address = "0x" + hashlib.blake2b(bytes([flag]) + pub_key, digest_size=32).hexdigest()
+        elif flag in (SignatureScheme.ZKLOGINAUTHENTICATOR, SignatureScheme.PASSKEY):
+            return None
+        else:
+            return False
+    except (ValueError, TypeError, IndexError, KeyError):
+        return False
+    if valid and author is not None:
+        return address == author.lower()
+    return bool(valid)
+
+
+@sync_instrumented("pysui.sui.sui_crypto._verify_chunk")
+def _verify_chunk(items: list[tuple], intent: IntentScope) -> list[Optional[bool]]:
+    """Verify (message, signature[, author]) items. Module level so process pools can pickle it."""
+    return [
+        verify_signature(
+            item[0],
+            item[1],
+            author=item[2] if len(item) > 2 else None,
+            intent=intent,
+        )
+        for item in items
+    ]
+
+
+@versionadded(version="1.2.0", reason="Local signature verification.")
+@sync_instrumented("pysui.sui.sui_crypto.verify_many")
+def verify_many(
+    items: list[tuple],
+    *,
+    intent: IntentScope = IntentScope.TransactionData,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+) -> list[Optional[bool]]:
+    """verify_many Verify many signatures, optionally spread over a worker pool.
+
+    :param items: (message, signature) or (message, signature, author) tuples, see verify_signature
+    :type items: list[tuple]
+    :param intent: TransactionData or PersonalMessage, defaults to IntentScope.TransactionData
+    :type intent: IntentScope, optional
+    :param executor: Thread or process pool to verify chunks in, defaults to verifying in the caller
+    :type executor: Optional[Executor], optional
+    :param chunk_size: Items per executor task, defaults to 256
+    :type chunk_size: int, optional
+    :return: One result per item, in order; None where only a node can verify
+    :rtype: list[Optional[bool]]
+    """
+    if executor is None or len(items) <= chunk_size:
+        return _verify_chunk(items, intent)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    results: list[Optional[bool]] = []
+    for chunk_result in executor.map(_verify_chunk, chunks, [intent] * len(chunks)):
+        results.extend(chunk_result)
+    return results
+
+
+@versionadded(version="1.2.0", reason="Local signature verification.")
+@instrumented("pysui.sui.sui_crypto.async_verify_many")
+async def async_verify_many(
+    client,
+    items: list[tuple],
+    *,
+    intent: IntentScope = IntentScope.TransactionData,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+) -> list[bool]:
+    """async_verify_many Verify many signatures locally, asking the node only for zkLogin and passkey.
+
+    Local verification runs in executor (the loop's default executor if None).
+    Signatures it can not decide are verified with ``VerifyTransactionSignature``
+    or ``VerifyPersonalMessageSignature`` through client.
+
+    :param client: Async client used for the zkLogin and passkey fallback
+    :type client: AsyncClientBase
+    :param items: (message, signature) or (message, signature, author) tuples
+    :type items: list[tuple]
+    :param intent: TransactionData or PersonalMessage, defaults to IntentScope.TransactionData
+    :type intent: IntentScope, optional
+    :param executor: Thread or process pool for local verification, defaults to None
+    :type executor: Optional[Executor], optional
+    :param chunk_size: Items per executor task, defaults to 256
+    :type chunk_size: int, optional
+    :return: One result per item, in order
+    :rtype: list[bool]
+    """
+    import asyncio
+    import pysui.sui.sui_common.sui_commands as cmd
+
+    loop = asyncio.get_running_loop()
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    results: list[Optional[bool]] = []
+    for chunk_result in await asyncio.gather(
+        *[loop.run_in_executor(executor, _verify_chunk, chunk, intent) for chunk in chunks]
+    ):
+        results.extend(chunk_result)
+
+    command_class = (
+        cmd.VerifyPersonalMessageSignature
+        if intent == IntentScope.PersonalMessage
+        else cmd.VerifyTransactionSignature
+    )
+
+    async def _remote(item: tuple) -> bool:
+        result = await client.execute(
+            command=command_class(
+                message=item[0],
+                signature=item[1],
+                author=item[2] if len(item) > 2 else None,
+            )
+        )
+        return result.is_ok() and bool(getattr(result.result_data, "is_valid", False))
 
+    remote = [i for i, valid in enumerate(results) if valid is None]
+    for index, valid in zip(remote, await asyncio.gather(*[_remote(items[i]) for i in remote])):
+        results[index] = valid
+    return results  # type: ignore[return-value]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,285 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Multi-endpoint gRPC channel pool with health probing and failover."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from grpclib.client import Channel
+
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+
+@instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool._probe_service_info")
+async def _probe_service_info(channel: Channel, timeout: float) -> None:
+    """Default health probe: LedgerService.GetServiceInfo must answer within timeout."""
+    await sui_prot.LedgerServiceStub(channel).get_service_info(
+        sui_prot.GetServiceInfoRequest(), timeout=timeout
+    )
+
+
+class _Endpoint:
+    """One node address and its health state."""
+
+    __slots__ = ("host", "port", "healthy", "failures", "retry_at", "members")
+
+    def __init__(self, host: str, port: Optional[int]) -> None:
+        self.host = host
+        self.port = port
+        self.healthy = True
+        self.failures = 0
+        self.retry_at = 0.0
+        self.members: list["ChannelMember"] = []
+
+    @property
+    def name(self) -> str:
+        return f"{self.host}:{self.port}"
+
+
+class ChannelMember:
+    """One connection in the pool, handed out by ``GrpcChannelPool.lease``."""
+
+    __slots__ = ("endpoint", "channel", "outstanding", "stubs")
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.ChannelMember.__init__")
+    def __init__(self, endpoint: _Endpoint, channel: Channel) -> None:
+        self.endpoint = endpoint
+        self.channel = channel
+        self.outstanding = 0
+        # Service stubs bound to channel, created once by the client
+        self.stubs: dict = {}
+
+
+class GrpcChannelPool:
+    """Pool of gRPC channels over one or more endpoints of the same network.
+
+    Each endpoint gets ``channels_per_endpoint`` channels (separate HTTP/2
+    connections). ``lease`` hands out the channel with the fewest outstanding
+    requests among healthy endpoints, so load spreads across connections and
+    one large response does not hold up every other stream.
+
+    An endpoint is marked unhealthy when a request on it fails at the
+    transport level (connection refused or reset, stream terminated, status
+    UNAVAILABLE). Unhealthy endpoints get no new requests while a healthy one
+    exists. They come back when a background probe (``GetServiceInfo`` every
+    ``health_interval`` seconds) succeeds, or, with probing disabled, after
+    ``retry_after`` seconds. A pool with a single endpoint never probes.
+
+    Samples reported through ``instrumentation.record``:
+
+    - ``grpc.pool.endpoint_down``: an endpoint was marked unhealthy
+    - ``grpc.pool.endpoint_up``: an unhealthy endpoint recovered
+    """
+
+    DEFAULT_CHANNELS_PER_ENDPOINT: int = 1
+    DEFAULT_HEALTH_INTERVAL: float = 10.0
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.__init__")
+    def __init__(
+        self,
+        *,
+        endpoints: list[tuple[str, Optional[int]]],
+        channels_per_endpoint: int = DEFAULT_CHANNELS_PER_ENDPOINT,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        probe_timeout: float = 5.0,
+        retry_after: float = 5.0,
+        channel_factory: Optional[Callable[[str, Optional[int]], Channel]] = None,
+        probe: Optional[Callable[[Channel, float], Awaitable]] = None,
+    ):
+        """Initialize the pool; channels connect lazily on first request.
+
+        :param endpoints: (host, port) of each node, the first is preferred on ties
+        :type endpoints: list[tuple[str, Optional[int]]]
+        :param channels_per_endpoint: Connections per endpoint, defaults to 1
+        :type channels_per_endpoint: int, optional
+        :param health_interval: Seconds between health probes, 0 disables probing, ignored
+            with a single endpoint, defaults to 10.0
+        :type health_interval: float, optional
+        :param probe_timeout: Seconds a probe may take, defaults to 5.0
+        :type probe_timeout: float, optional
+        :param retry_after: With probing disabled, seconds before an unhealthy
+            endpoint is tried again, defaults to 5.0
+        :type retry_after: float, optional
+        :param channel_factory: Callable(host, port) returning a Channel, defaults to a TLS Channel
+        :type channel_factory: Optional[Callable[[str, Optional[int]], Channel]], optional
+        :param probe: Async callable(channel, timeout) that raises when the node is unhealthy,
+            defaults to a GetServiceInfo call
+        :type probe: Optional[Callable[[Channel, float], Awaitable]], optional
+        :raises ValueError: If there are no endpoints or channels_per_endpoint is less than 1
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if channels_per_endpoint < 1:
+            raise ValueError(f"channels_per_endpoint must be >= 1, found {channels_per_endpoint}")
+        factory = channel_factory or (lambda host, port: Channel(host=host, port=port, ssl=True))
+        self._endpoints: list[_Endpoint] = []
+        self._members: list[ChannelMember] = []
+        for host, port in endpoints:
+            endpoint = _Endpoint(host, port)
+            for _ in range(channels_per_endpoint):
+                member = ChannelMember(endpoint, factory(host, port))
+                endpoint.members.append(member)
+                self._members.append(member)
+            self._endpoints.append(endpoint)
+        # With a single endpoint there is nothing to fail over to, so it is
+        # retried after retry_after instead of being probed
+        self._health_interval = health_interval if len(self._endpoints) > 1 else 0.0
+        self._probe_timeout = probe_timeout
+        self._retry_after = retry_after
+        self._probe = probe or _probe_service_info
+        self._probe_task: Optional[asyncio.Task] = None
+        self._next = 0
+        # Fast path for lease while no endpoint is marked down
+        self._all_healthy = True
+
+    @property
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.endpoint_count")
+    def endpoint_count(self) -> int:
+        """Number of endpoints in the pool."""
+        return len(self._endpoints)
+
+    @property
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.in_flight")
+    def in_flight(self) -> int:
+        """Number of requests currently holding a lease."""
+        return sum(m.outstanding for m in self._members)
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.health")
+    def health(self) -> dict[str, bool]:
+        """Return whether each endpoint, by ``host:port``, is considered healthy."""
+        return {e.name: e.healthy for e in self._endpoints}
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool._usable")
+    def _usable(self, endpoint: _Endpoint, now: float) -> bool:
+        """Healthy, or due a retry because nothing is probing it."""
+        return endpoint.healthy or (self._health_interval <= 0 and now >= endpoint.retry_at)
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.has_usable")
+    def has_usable(self, exclude: frozenset[int] | set[int] = frozenset()) -> bool:
+        """Return True if an endpoint not in exclude (by index) can take requests."""
+        now = time.monotonic()
+        return any(
+            self._usable(e, now) for i, e in enumerate(self._endpoints) if i not in exclude
+        )
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.endpoint_index")
+    def endpoint_index(self, member: ChannelMember) -> int:
+        """Index of the endpoint a leased member belongs to."""
+        return self._endpoints.index(member.endpoint)
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.lease")
+    def lease(self, exclude: frozenset[int] | set[int] = frozenset()) -> ChannelMember:
+        """Take the least loaded channel of a usable endpoint; pair with ``release``.
+
+        Falls back to every endpoint not in exclude (then to all) when none is usable.
+
+        :param exclude: Endpoint indexes to avoid, e.g. ones that just refused a connection
+        :type exclude: frozenset[int] | set[int], optional
+        """
+        if self._probe_task is None and self._health_interval > 0:
+            self._start_probing()
+        if self._all_healthy and not exclude:
+            candidates = self._members
+        else:
+            now = time.monotonic()
+            candidates = [
+                m
+                for i, e in enumerate(self._endpoints)
+                if i not in exclude and self._usable(e, now)
+                for m in e.members
+            ]
+            if not candidates:
+                candidates = [
+                    m for i, e in enumerate(self._endpoints) if i not in exclude for m in e.members
+                ] or self._members
+        size = len(candidates)
+        start = self._next % size
+        self._next += 1
+        best = candidates[start]
+        if best.outstanding:
+            for offset in range(1, size):
+                member = candidates[(start + offset) % size]
+                if member.outstanding < best.outstanding:
+                    best = member
+                    if not best.outstanding:
+                        break
+        best.outstanding += 1
+        return best
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.release")
+    def release(self, member: ChannelMember) -> None:
+        """Return a leased channel."""
+        member.outstanding -= 1
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.report_failure")
+    def report_failure(self, member: ChannelMember, exc: BaseException) -> None:
+        """Mark the endpoint of member unhealthy after a transport level failure."""
+        endpoint = member.endpoint
+        endpoint.failures += 1
+        endpoint.retry_at = time.monotonic() + self._retry_after
+        if endpoint.healthy:
+            endpoint.healthy = False
+            self._all_healthy = False
+            record("grpc.pool.endpoint_down")
+            logger.warning("grpc pool: endpoint %s marked unhealthy: %r", endpoint.name, exc)
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool._mark_healthy")
+    def _mark_healthy(self, endpoint: _Endpoint) -> None:
+        endpoint.failures = 0
+        if not endpoint.healthy:
+            endpoint.healthy = True
+            self._all_healthy = all(e.healthy for e in self._endpoints)
+            record("grpc.pool.endpoint_up")
+            logger.info("grpc pool: endpoint %s healthy again", endpoint.name)
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool._start_probing")
+    def _start_probing(self) -> None:
+        """Start the probe task on first use, once a loop is running."""
+        if self._probe_task is not None or self._health_interval <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._probe_task = loop.create_task(self._probe_loop())
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.probe_once")
+    async def probe_once(self) -> None:
+        """Probe every endpoint once on its first channel and update its health."""
+
+        async def _probe(endpoint: _Endpoint) -> None:
+            try:
+                await self._probe(endpoint.members[0].channel, self._probe_timeout)
+            except Exception as exc:  # any probe failure means not healthy
+                self.report_failure(endpoint.members[0], exc)
+            else:
+                self._mark_healthy(endpoint)
+
+        await asyncio.gather(*[_probe(e) for e in self._endpoints])
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool._probe_loop")
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            await self.probe_once()
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_channel_pool.GrpcChannelPool.close")
+    async def close(self) -> None:
+        """Stop probing and close every channel."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+        for member in self._members:
+            member.channel.close()
@@ -0,0 +1,370 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Ordered, gap free checkpoint feed over the gRPC checkpoint subscription."""
+
+import asyncio
+import collections
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from grpclib.exceptions import GRPCError, ProtocolError, StreamTerminatedError
+
+import pysui.sui.sui_bcs.sui_checkpoint_bcs as sui_checkpoint_bcs
+import pysui.sui.sui_grpc.pgrpc_requests as rn
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.chain_context import ChainContextCache
+from pysui.sui.sui_common.instrumentation import instrumented, record, sync_instrumented
+
+if TYPE_CHECKING:
+    from pysui.sui.sui_grpc.pgrpc_clients import GrpcProtocolClient
+
+logger = logging.getLogger(__name__)
+
+# Failures of an established subscription that call for a reconnect
+_STREAM_ERRORS = (GRPCError, StreamTerminatedError, ProtocolError, OSError)
+
+# Field mask when decoding without a caller mask: the subscription default plus contents
+_DECODE_MASK = ["sequence_number", "digest", "contents.bcs"]
+
+
+@dataclass(frozen=True)
+class CheckpointItem:
+    """One checkpoint delivered by a CheckpointStream."""
+
+    sequence_number: int
+    checkpoint: sui_prot.Checkpoint
+    # True when fetched with GetCheckpoint to fill a gap in the subscription
+    backfilled: bool = False
+    # Decoded contents BCS when the stream decodes: a CheckpointContentsBCS for
+    # V1 contents, the decode_checkpoint_contents_v2 list for V2
+    contents: Any = None
+
+
+@dataclass(frozen=True)
+class CheckpointStreamStats:
+    """Point in time counters for a CheckpointStream."""
+
+    received: int
+    backfilled: int
+    duplicates: int
+    reconnects: int
+    delivered: int
+    queue_depth: int
+    last_sequence: Optional[int]
+    checkpoints_per_sec: float
+
+
+class _Failed:
+    """Queue marker carrying the error that ended the stream."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+# Queue marker put by close() to wake a consumer waiting for the next item
+_CLOSED = object()
+
+
+@sync_instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.decode_contents")
+def decode_contents(checkpoint: sui_prot.Checkpoint) -> Any:
+    """Decode the contents BCS of checkpoint, None when it was not requested.
+
+    :param checkpoint: A checkpoint fetched with ``contents.bcs`` in its field mask
+    :type checkpoint: sui_prot.Checkpoint
+    :return: CheckpointContentsBCS for V1 contents, list of
+        (tx_digest, effects_digest, signatures, alias_versions) for V2
+    """
+    contents = checkpoint.contents
+    if contents is None or contents.bcs is None or not contents.bcs.value:
+        return None
+    raw = bytes(contents.bcs.value)
+    if raw[0] == 0:
+        return sui_checkpoint_bcs.CheckpointContentsBCS.deserialize(raw)
+    return sui_checkpoint_bcs.decode_checkpoint_contents_v2(raw[1:])
+
+
+class CheckpointStream:
+    """Async iterator of every checkpoint, in sequence order, without gaps.
+
+    The subscription only delivers checkpoints from the moment it is opened.
+    When it drops, the stream reconnects (with exponential backoff) and fetches
+    every checkpoint it missed with ``GetCheckpoint``, up to
+    ``backfill_concurrency`` at a time, before resuming live delivery. With
+    ``start`` set, checkpoints from ``start`` up to the first live one are
+    fetched the same way, so a consumer can resume from a stored cursor.
+
+    Live checkpoints fetched with ``summary`` in the field mask are noted in
+    the client's chain context, so an epoch change seen here refreshes the
+    epoch and gas price used by transaction builds.
+
+    Items pass through a queue of at most ``queue_size`` checkpoints. A slow
+    consumer stops the stream reading from the subscription, which lets
+    HTTP/2 flow control push back on the node rather than buffering without
+    bound.
+
+    .. code-block:: python
+
+        async with CheckpointStream(client, start=cursor) as stream:
+            async for item in stream:
+                index(item.checkpoint)
+                cursor = item.sequence_number + 1
+
+    Samples reported through ``instrumentation.record``:
+
+    - ``checkpoint.stream.reconnect``: the subscription was reopened
+    - ``checkpoint.stream.backfill``: checkpoints fetched to fill one gap
+    - ``checkpoint.stream.queue_depth``: queued items after each delivery
+    """
+
+    DEFAULT_QUEUE_SIZE: int = 256
+    DEFAULT_BACKFILL_CONCURRENCY: int = 8
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.__init__")
+    def __init__(
+        self,
+        client: "GrpcProtocolClient",
+        *,
+        start: Optional[int] = None,
+        field_mask: Optional[list[str]] = None,
+        decode: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        backfill_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 10.0,
+        max_reconnects: Optional[int] = None,
+        fetch_attempts: int = 5,
+    ):
+        """Initialize the stream; the subscription opens on first iteration.
+
+        :param client: The gRPC client to subscribe and fetch with
+        :type client: GrpcProtocolClient
+        :param start: First sequence number to deliver, defaults to None (the first live checkpoint)
+        :type start: Optional[int], optional
+        :param field_mask: Checkpoint fields for subscription and backfill, defaults to None
+            (the subscription's default and every field for backfill)
+        :type field_mask: Optional[list[str]], optional
+        :param decode: Decode contents BCS into ``CheckpointItem.contents``, adding
+            ``contents.bcs`` to the field mask (sequence_number, digest and
+            contents.bcs without one), defaults to False
+        :type decode: bool, optional
+        :param queue_size: Most checkpoints buffered ahead of the consumer, defaults to 256
+        :type queue_size: int, optional
+        :param backfill_concurrency: Most GetCheckpoint calls in flight when filling a gap, defaults to 8
+        :type backfill_concurrency: int, optional
+        :param reconnect_delay: Seconds before the first reconnect, doubled per failed attempt, defaults to 0.5
+        :type reconnect_delay: float, optional
+        :param max_reconnect_delay: Upper bound on the reconnect delay, defaults to 10.0
+        :type max_reconnect_delay: float, optional
+        :param max_reconnects: Consecutive failed reconnects before the stream fails, defaults to None (no limit)
+        :type max_reconnects: Optional[int], optional
+        :param fetch_attempts: Attempts per backfilled checkpoint before the stream fails, defaults to 5
+        :type fetch_attempts: int, optional
+        :raises ValueError: If a size, concurrency or attempt count is less than 1
+        """
+        if queue_size < 1 or backfill_concurrency < 1 or fetch_attempts < 1:
+            raise ValueError("queue_size, backfill_concurrency and fetch_attempts must be >= 1")
+        if decode:
+            if not field_mask:
+                field_mask = list(_DECODE_MASK)
+            elif "contents.bcs" not in field_mask:
+                field_mask = [*field_mask, "contents.bcs"]
+        self._client = client
+        # Live checkpoints carrying a summary keep the client's chain context current
+        ctx_cache = getattr(client, "chain_context", None)
+        self._chain_context: Optional[ChainContextCache] = (
+            ctx_cache if isinstance(ctx_cache, ChainContextCache) else None
+        )
+        self._next = start
+        self._field_mask = field_mask
+        self._decode = decode
+        self._queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self._backfill_concurrency = backfill_concurrency
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._max_reconnects = max_reconnects
+        self._fetch_attempts = fetch_attempts
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._started_at = 0.0
+        self._received = 0
+        self._backfilled = 0
+        self._duplicates = 0
+        self._reconnects = 0
+        self._delivered = 0
+        self._last: Optional[int] = None
+
+    @property
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.last_sequence")
+    def last_sequence(self) -> Optional[int]:
+        """Sequence number of the last checkpoint handed to the consumer."""
+        return self._last
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.stats")
+    def stats(self) -> CheckpointStreamStats:
+        """Return the current counters and delivery rate."""
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return CheckpointStreamStats(
+            received=self._received,
+            backfilled=self._backfilled,
+            duplicates=self._duplicates,
+            reconnects=self._reconnects,
+            delivered=self._delivered,
+            queue_depth=self._queue.qsize(),
+            last_sequence=self._last,
+            checkpoints_per_sec=self._delivered / elapsed if elapsed else 0.0,
+        )
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.__aenter__")
+    async def __aenter__(self) -> "CheckpointStream":
+        self._start()
+        return self
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.__aexit__")
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "CheckpointStream":
+        return self
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.__anext__")
+    async def __anext__(self) -> CheckpointItem:
+        if self._closed:
+            raise StopAsyncIteration
+        self._start()
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        if isinstance(item, _Failed):
+            self._closed = True
+            raise item.error
+        self._delivered += 1
+        self._last = item.sequence_number
+        record("checkpoint.stream.queue_depth", self._queue.qsize())
+        return item
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream.close")
+    async def close(self) -> None:
+        """Stop the subscription and any backfill in progress, ending iteration."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # A consumer can only be waiting on an empty queue, so a full one needs no marker
+        try:
+            self._queue.put_nowait(_CLOSED)
+        except asyncio.QueueFull:
+            pass
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._start")
+    def _start(self) -> None:
+        if self._task is None and not self._closed:
+            self._started_at = time.monotonic()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._run")
+    async def _run(self) -> None:
+        """Producer: subscribe, fill gaps and queue checkpoints in order until closed."""
+        try:
+            failures = 0
+            while True:
+                if failures:
+                    if self._max_reconnects is not None and failures > self._max_reconnects:
+                        raise ValueError(f"Checkpoint subscription failed {failures} times in a row")
+                    delay = min(self._max_reconnect_delay, self._reconnect_delay * 2 ** (failures - 1))
+                    await asyncio.sleep(delay)
+                    self._reconnects += 1
+                    record("checkpoint.stream.reconnect")
+                if await self._consume_subscription():
+                    failures = 0
+                failures += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await self._queue.put(_Failed(exc))
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._consume_subscription")
+    async def _consume_subscription(self) -> bool:
+        """Read one subscription until it ends; return True if it delivered anything."""
+        result = await self._client._dispatch_grpc_request(
+            rn.SubscribeCheckpoint(field_mask=self._field_mask)
+        )
+        if not result.is_ok():
+            logger.warning("Checkpoint subscription failed to open: %s", result.result_string)
+            return False
+        stream = result.result_data
+        progressed = False
+        try:
+            async for response in stream:
+                self._received += 1
+                checkpoint = response.checkpoint
+                sequence = response.cursor
+                if sequence is None:
+                    sequence = checkpoint.sequence_number
+                if self._next is None:
+                    self._next = sequence
+                if sequence < self._next:
+                    self._duplicates += 1
+                    continue
+                if sequence > self._next:
+                    await self._backfill(self._next, sequence)
+                await self._emit(sequence, checkpoint, False)
+                progressed = True
+        except _STREAM_ERRORS as exc:
+            logger.warning("Checkpoint subscription dropped after %s: %r", self._next, exc)
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return progressed
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._emit")
+    async def _emit(self, sequence: int, checkpoint: sui_prot.Checkpoint, backfilled: bool) -> None:
+        if not backfilled and self._chain_context is not None:
+            self._chain_context.note_checkpoint(checkpoint)
+        contents = decode_contents(checkpoint) if self._decode else None
+        await self._queue.put(CheckpointItem(sequence, checkpoint, backfilled, contents))
+        self._next = sequence + 1
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._backfill")
+    async def _backfill(self, first: int, end: int) -> None:
+        """Fetch and queue checkpoints first..end-1 in order, a bounded window at a time."""
+        logger.info("Backfilling checkpoints %d..%d", first, end - 1)
+        record("checkpoint.stream.backfill", end - first)
+        window: collections.deque[asyncio.Task] = collections.deque()
+        following = first
+        try:
+            while following < end or window:
+                while following < end and len(window) < self._backfill_concurrency:
+                    window.append(asyncio.ensure_future(self._fetch(following)))
+                    following += 1
+                checkpoint = await window[0]
+                window.popleft()
+                await self._emit(first, checkpoint, True)
+                self._backfilled += 1
+                first += 1
+        finally:
+            for task in window:
+                task.cancel()
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_checkpoint_stream.CheckpointStream._fetch")
+    async def _fetch(self, sequence: int) -> sui_prot.Checkpoint:
+        """Fetch one checkpoint, retrying with backoff."""
+        request = rn.GetCheckpointBySequence(sequence_number=sequence, field_mask=self._field_mask)
+        for attempt in range(self._fetch_attempts):
+            if attempt:
+                await asyncio.sleep(min(self._max_reconnect_delay, self._reconnect_delay * 2 ** (attempt - 1)))
+            result = await self._client._dispatch_grpc_request(request)
+            if result.is_ok() and result.result_data.checkpoint is not None:
+                return result.result_data.checkpoint
+        raise ValueError(f"Unable to fetch checkpoint {sequence}: {result.result_string}")
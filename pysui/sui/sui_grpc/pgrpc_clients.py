@@ -9,6 +9,7 @@ import asyncio
 from collections.abc import Callable
 import dataclasses
 import logging
+import socket
 from typing import Any, Awaitable, ClassVar, Optional, TypeAlias, Union, Literal, TYPE_CHECKING
 import traceback
 import urllib.parse as urlparse
@@ -20,19 +21,23 @@ if TYPE_CHECKING:
     from pysui.sui.sui_common.executors.parallel_executor import ParallelExecutor
 
 import betterproto2
+from betterproto2 import grpclib as betterproto2_grpclib
 import dataclasses_json
-from deprecated.sphinx import deprecated
+from deprecated.sphinx import deprecated, versionchanged
 from grpclib.const import Status as GRPCStatus
-from grpclib.exceptions import GRPCError
+from grpclib.exceptions import GRPCError, StreamTerminatedError
 
 from pysui import SDK_CURRENT_VERSION
 from pysui.sui.sui_common.client import PysuiClient
+from pysui.sui.sui_common.function_cache import MoveFunctionCache
 from pysui.abstracts.async_client import AsyncClientBase
 from pysui.sui.sui_common.sui_command import SuiCommand
 
 import pysui.sui.sui_grpc.pgrpc_absreq as absreq
+from pysui.sui.sui_grpc.pgrpc_channel_pool import ChannelMember, GrpcChannelPool
 from pysui.sui.sui_grpc.pgrpc_requests import GetEpoch
 from pysui.sui.sui_common.instrumentation import instrumented, measure, sync_instrumented
+from pysui.sui.sui_common.retry_policy import FailureKind
 
 
 import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
@@ -73,32 +78,167 @@ def _map_pconstraints(in_bound: sui_prot.ProtocolConfig):
     return ProtocolConfig(TransactionConstraints(*ordered_list))
 
 
+# Statuses worth another attempt for idempotent commands
+_TRANSIENT_STATUS: frozenset[GRPCStatus] = frozenset(
+    {
+        GRPCStatus.UNAVAILABLE,
+        GRPCStatus.DEADLINE_EXCEEDED,
+        GRPCStatus.RESOURCE_EXHAUSTED,
+        GRPCStatus.ABORTED,
+    }
+)
+
+# Service stub class per request service, instantiated once per pooled channel
+_SERVICE_STUBS: dict[absreq.Service, type[betterproto2_grpclib.ServiceStub]] = {
+    absreq.Service.STATE: sui_prot.StateServiceStub,
+    absreq.Service.LEDGER: sui_prot.LedgerServiceStub,
+    absreq.Service.TRANSACTION: sui_prot.TransactionExecutionServiceStub,
+    absreq.Service.MOVEPACKAGE: sui_prot.MovePackageServiceStub,
+    absreq.Service.SUBSCRIPTION: sui_prot.SubscriptionServiceStub,
+    absreq.Service.SIGNATURE: sui_prot.SignatureVerificationServiceStub,
+    absreq.Service.NAMESERVICE: sui_prot.NameServiceStub,
+}
+
+
+@sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients._service_stub")
+def _service_stub(
+    member: ChannelMember, service: absreq.Service
+) -> betterproto2_grpclib.ServiceStub:
+    """Create and cache the stub for service on member's channel."""
+    try:
+        stub_class = _SERVICE_STUBS[service]
+    except KeyError:
+        raise NotImplementedError(f"{service} not implemented.") from None
+    stub = member.stubs[service] = stub_class(member.channel)
+    return stub
+
+
+class _LeasedStream:
+    """Subscription stream that holds its channel lease until the stream ends.
+
+    The lease is released once, when the stream is exhausted, fails or is
+    closed. A transport failure while reading marks the endpoint unhealthy.
+    """
+
+    __slots__ = ("_pool", "_member", "_stream")
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients._LeasedStream.__init__")
+    def __init__(self, pool: GrpcChannelPool, member: ChannelMember, stream: Any) -> None:
+        self._pool = pool
+        self._member: Optional[ChannelMember] = member
+        self._stream = stream
+
+    def __aiter__(self) -> "_LeasedStream":
+        return self
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_clients._LeasedStream.__anext__")
+    async def __anext__(self) -> Any:
+        try:
+            return await self._stream.__anext__()
+        except StopAsyncIteration:
+            self._release()
+            raise
+        except (OSError, StreamTerminatedError) as e:
+            self._fail(e)
+            raise
+        except GRPCError as e:
+            if e.status == GRPCStatus.UNAVAILABLE:
+                self._fail(e)
+            self._release()
+            raise
+        except BaseException:
+            self._release()
+            raise
+
+    @instrumented("pysui.sui.sui_grpc.pgrpc_clients._LeasedStream.aclose")
+    async def aclose(self) -> None:
+        """Close the underlying stream and release the lease."""
+        try:
+            if (aclose := getattr(self._stream, "aclose", None)) is not None:
+                await aclose()
+        finally:
+            self._release()
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients._LeasedStream._fail")
+    def _fail(self, exc: BaseException) -> None:
+        if self._member is not None:
+            self._pool.report_failure(self._member, exc)
+        self._release()
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients._LeasedStream._release")
+    def _release(self) -> None:
+        if self._member is not None:
+            self._pool.release(self._member)
+            self._member = None
+
+    def __del__(self) -> None:
+        # A stream dropped without being read to the end or closed
+        self._release()
+
+
+
 class GrpcProtocolClient(AsyncClientBase, PysuiClient):
     """Asynchronous gRPC client."""
 
     _protocol: ClassVar[str] = "grpc"
 
+    @versionchanged(
+        version="1.2.0",
+        reason="Added function_cache, health_interval and channel_factory arguments, "
+        "requests go through a GrpcChannelPool over the profile url and failover_urls",
+    )
     @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients.GrpcProtocolClient.__init__")
     def __init__(
-        self, *, pysui_config: PysuiConfiguration, default_header: dict | None = None
+        self,
+        *,
+        pysui_config: PysuiConfiguration,
+        default_header: dict | None = None,
+        function_cache: MoveFunctionCache | None = None,
+        health_interval: float = GrpcChannelPool.DEFAULT_HEALTH_INTERVAL,
+        channel_factory: Optional[Callable[[str, Optional[int]], Channel]] = None,
     ):
         """Initializes client.
 
         :param pysui_config: Configuration for interfaces
         :type pysui_config: PysuiConfiguration
-        :parm grpc_node_url: gRPC URL
+        :param function_cache: Move function signature cache to share with other
+            clients of the same network, defaults to a new cache for this client
+        :type function_cache: MoveFunctionCache | None
+        :param health_interval: Seconds between endpoint health probes when the profile
+            has failover_urls, 0 disables, defaults to 10.0
+        :type health_interval: float, optional
+        :param channel_factory: Callable(host, port) returning a Channel, defaults to a TLS Channel
+        :type channel_factory: Optional[Callable[[str, Optional[int]], Channel]], optional
         """
-        super().__init__(pysui_config=pysui_config, default_header=default_header)
-
-        if url := _clean_url(self._pysui_config.active_group.active_profile.url):
-            self._channel: Channel = Channel(host=url[0], port=url[1], ssl=True)
-        else:
-            raise ValueError(
-                f"{pysui_config.active_group.active_profile.url} in {self._pysui_config.active_profile} is not valid URL"
-            )
-        self._channels: list[Channel] = []
+        super().__init__(
+            pysui_config=pysui_config,
+            default_header=default_header,
+            function_cache=function_cache,
+        )
+        profile = self._pysui_config.active_group.active_profile
+        endpoints: list[tuple[str, Optional[int]]] = []
+        for purl in [profile.url] + list(profile.failover_urls or []):
+            if url := _clean_url(purl):
+                endpoints.append(url)
+            else:
+                raise ValueError(
+                    f"{purl} in {self._pysui_config.active_profile} is not valid URL"
+                )
+        self._pool = GrpcChannelPool(
+            endpoints=endpoints,
+            channels_per_endpoint=profile.channels_per_endpoint
+            or GrpcChannelPool.DEFAULT_CHANNELS_PER_ENDPOINT,
+            health_interval=health_interval,
+            channel_factory=channel_factory,
+        )
         self._protocol_config: ProtocolConfig = None
 
+    @property
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients.GrpcProtocolClient.channel_pool")
+    def channel_pool(self) -> GrpcChannelPool:
+        """Return the pool of channels requests are dispatched on."""
+        return self._pool
+
     @property
     @instrumented("pysui.sui.sui_grpc.pgrpc_clients.GrpcProtocolClient.current_gas_price")
     async def current_gas_price(self) -> int:
@@ -131,10 +271,8 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
 
     @instrumented("grpc.close")
     async def close(self):
-        """Close the base gRPC channel"""
-        for channel in self._channels:
-            channel.close()
-        self._channel.close()
+        """Close every pooled gRPC channel"""
+        await self._pool.close()
 
     @instrumented("grpc.__aenter__")
     async def __aenter__(self) -> "GrpcProtocolClient":
@@ -213,52 +351,59 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
         :return: Results of execution
         :rtype: SuiRpcResult
         """
-        kwargs["metadata"] = self._default_header | kwargs.get("metadata", {})
+        # Only build a merged header dict when the caller adds to the defaults
+        if metadata := kwargs.get("metadata"):
+            if self._default_header:
+                kwargs["metadata"] = self._default_header | metadata
+        else:
+            kwargs["metadata"] = self._default_header
+        tried: set[int] = set()
+        while True:
+            member = self._pool.lease(tried)
+            held = False
+            try:
+                result = await self._dispatch_on(member, request, **kwargs)
+                # A subscription stream now owns the lease
+                held = isinstance(result.result_data, _LeasedStream)
+                return result
+            except (ConnectionRefusedError, socket.gaierror) as e:
+                # Nothing reached the node, so any request (even a transaction
+                # execution) can safely go to the next endpoint
+                self._pool.report_failure(member, e)
+                tried.add(self._pool.endpoint_index(member))
+                if len(tried) >= self._pool.endpoint_count:
+                    logger.error("No gRPC endpoint reachable: %r", e)
+                    return SuiRpcResult(False, e.args, e)
+            finally:
+                if not held:
+                    self._pool.release(member)
+
+    @instrumented("grpc._dispatch_on")
+    async def _dispatch_on(
+        self, member: ChannelMember, request: absreq.PGRPC_Request, **kwargs
+    ) -> SuiRpcResult:
+        """Execute request on a leased channel.
+
+        Connection failures before the request is sent are raised for the
+        caller to fail over, other transport failures mark the endpoint unhealthy.
+        """
         srv_fn: Callable[[betterproto2.Message], betterproto2.Message]
         srv_req: betterproto2.Message
-        match request.service:
-            case absreq.Service.STATE:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.StateServiceStub(self._channel)
-                )
-            case absreq.Service.LEDGER:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.LedgerServiceStub(self._channel)
-                )
-            case absreq.Service.TRANSACTION:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.TransactionExecutionServiceStub(self._channel)
-                )
-            case absreq.Service.MOVEPACKAGE:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.MovePackageServiceStub(self._channel)
-                )
-            # Subscriptions are called synchronously on first fetch
-            case absreq.Service.SUBSCRIPTION:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.SubscriptionServiceStub(self._channel)
-                )
-                try:
-                    logger.info("Dispatching %s", type(request).__name__)
-                    logger.debug("Request detail: %s", request)
-                    result = srv_fn(srv_req, **kwargs)
-                    logger.info("Success")
-                    return SuiRpcResult(True, None, result)
-                except (GRPCError, ValueError, asyncio.exceptions.CancelledError) as e:
-                    traceback_str = traceback.format_exc()
-                    logger.error(traceback_str)
-                    return SuiRpcResult(False, e.args)
-
-            case absreq.Service.SIGNATURE:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.SignatureVerificationServiceStub(self._channel)
-                )
-            case absreq.Service.NAMESERVICE:
-                srv_fn, srv_req = request.to_request(
-                    stub=sui_prot.NameServiceStub(self._channel)
-                )
-            case _:
-                raise NotImplementedError(f"{request.service} not implemented.")
+        stub = member.stubs.get(request.service) or _service_stub(member, request.service)
+        srv_fn, srv_req = request.to_request(stub=stub)
+        # Subscriptions are called synchronously on first fetch and keep the
+        # channel leased until the stream ends
+        if request.service is absreq.Service.SUBSCRIPTION:
+            try:
+                logger.info("Dispatching %s", type(request).__name__)
+                logger.debug("Request detail: %s", request)
+                result = srv_fn(srv_req, **kwargs)
+                logger.info("Success")
+                return SuiRpcResult(True, None, _LeasedStream(self._pool, member, result))
+            except (GRPCError, ValueError, asyncio.exceptions.CancelledError) as e:
+                traceback_str = traceback.format_exc()
+                logger.error(traceback_str)
+                return SuiRpcResult(False, e.args)
 
         try:
             logger.info("Dispatching %s", type(request).__name__)
@@ -269,9 +414,22 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
                 async with measure(f"grpc.{type(request).__name__}.render"):
                     result = request.render(result)
             return SuiRpcResult(True, None, result)
+        except (ConnectionRefusedError, socket.gaierror):
+            raise
+        except asyncio.TimeoutError:
+            logger.error("%s exceeded its deadline", type(request).__name__)
+            return SuiRpcResult(False, (GRPCStatus.DEADLINE_EXCEEDED, "Deadline exceeded"))
+        except (OSError, StreamTerminatedError) as e:
+            # The failure is kept as result_data for the retry policy
+            self._pool.report_failure(member, e)
+            traceback_str = traceback.format_exc()
+            logger.error(traceback_str)
+            return SuiRpcResult(False, e.args, e)
         except GRPCError as e:
             if e.status == GRPCStatus.NOT_FOUND and getattr(request, "not_found_as_none", False):
                 return SuiRpcResult(True, None, None)
+            if e.status == GRPCStatus.UNAVAILABLE:
+                self._pool.report_failure(member, e)
             traceback_str = traceback.format_exc()
             logger.error(traceback_str)
             return SuiRpcResult(False, e.args)
@@ -306,6 +464,7 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
         return await self._dispatch_grpc_request(request, **kwargs)
 
     @instrumented("grpc.execute")
+    @versionchanged(version="1.2.0", reason="Applies the client retry_policy")
     async def execute(
         self,
         *,
@@ -315,8 +474,12 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
     ) -> SuiRpcResult:
         """Execute a SuiCommand against the gRPC protocol.
 
+        When ``retry_policy`` is set, failed attempts are retried (and read
+        commands optionally hedged) as the policy allows.
+
         :param command: A SuiCommand instance describing the operation
-        :param timeout: Optional timeout in seconds
+        :param timeout: Optional timeout in seconds, with a retry_policy the
+            budget for all attempts
         :param headers: Optional headers/metadata passed to the transport
         :return: SuiRpcResult wrapping the response or error
         :rtype: SuiRpcResult
@@ -325,19 +488,40 @@ class GrpcProtocolClient(AsyncClientBase, PysuiClient):
             return SuiRpcResult(
                 False, f"Expected SuiCommand, got {type(command).__name__}", None
             )
+        chunked = await self._execute_chunked(command, timeout=timeout, headers=headers)
+        if chunked is not None:
+            return chunked
         try:
             request = command.grpc_request()
         except NotImplementedError:
             return SuiRpcResult(False, "Command not supported by gRPC", None)
         except (ValueError, TypeError) as exc:
             return SuiRpcResult(False, str(exc), None)
-        kwargs: dict = {}
-        if timeout is not None:
-            kwargs["timeout"] = timeout
-        if headers is not None:
-            kwargs["metadata"] = headers
 
-        return await self._dispatch_grpc_request(request, **kwargs)
+        async def _attempt(attempt_timeout: float | None) -> SuiRpcResult:
+            kwargs: dict = {}
+            if attempt_timeout is not None:
+                kwargs["timeout"] = attempt_timeout
+            if headers is not None:
+                kwargs["metadata"] = headers
+            return await self._dispatch_grpc_request(request, **kwargs)
+
+        result = await self._run_with_policy(command, _attempt, timeout)
+        self._observe_result(command, result)
+        return result
+
+    @sync_instrumented("pysui.sui.sui_grpc.pgrpc_clients.GrpcProtocolClient._classify_failure")
+    def _classify_failure(self, result: SuiRpcResult) -> FailureKind:
+        """Classify a failed dispatch result for the retry policy."""
+        failure = result.result_data
+        if isinstance(failure, (ConnectionRefusedError, socket.gaierror)):
+            return FailureKind.UNSENT
+        if isinstance(failure, (OSError, StreamTerminatedError)):
+            return FailureKind.TRANSIENT
+        args = result.result_string
+        if isinstance(args, tuple) and args and args[0] in _TRANSIENT_STATUS:
+            return FailureKind.TRANSIENT
+        return FailureKind.PERMANENT
 
 
 
@@ -34,19 +34,31 @@ import httpx
 
 from pysui import SuiRpcResult, PysuiConfiguration
 from pysui.sui.sui_common.client import PysuiClient
+from pysui.sui.sui_common.function_cache import MoveFunctionCache
 from pysui.abstracts.async_client import AsyncClientBase
 from pysui.sui.sui_common.sui_command import SuiCommand
 from pysui.sui.sui_pgql.pgql_validators import TypeValidator
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 from pysui.sui.sui_pgql.pgql_configs import SuiConfigGQL
+from pysui.sui.sui_pgql.pgql_session_pool import GqlSessionPool, SessionUnavailableError
 import pysui.sui.sui_pgql.pgql_schema as scm
 import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
 from pysui.sui.sui_common.instrumentation import instrumented, measure, sync_instrumented, sync_measure
+from pysui.sui.sui_common.retry_policy import FailureKind
 
 # Standard library logging setup
 logger = logging.getLogger("pgql_client")
 
 
+_NO_SESSION = "TimeoutError: no GraphQL session available"
+# The request was sent but no response arrived in time (e.g. gql's execute_timeout)
+_TIMED_OUT = "TimeoutError: request timed out"
+# httpx failures raised before the request was written
+_UNSENT_HTTPX: frozenset[str] = frozenset({"ConnectError", "ConnectTimeout", "PoolTimeout"})
+# HTTP statuses worth another attempt for idempotent commands
+_TRANSIENT_HTTP_STATUS: frozenset[str] = frozenset({"429", "502", "503", "504"})
+
+
 class PGQL_QueryNode(ABC):
     """Base query class."""
 
@@ -105,10 +117,15 @@ class BaseSuiGQLClient(PysuiClient):
         schema: scm.Schema,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        function_cache: Optional[MoveFunctionCache] = None,
     ):
         """."""
 
-        super().__init__(pysui_config=pysui_config, default_header=default_header)
+        super().__init__(
+            pysui_config=pysui_config,
+            default_header=default_header,
+            function_cache=function_cache,
+        )
         self._schema: scm.Schema = schema
 
         # Schema persist
@@ -230,6 +247,10 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
         reason="Proxy support https://github.com/FrankC01/pysui/issues/311",
     )
     @versionchanged(version="0.89.0", reason="Added timeout argument")
+    @versionchanged(
+        version="1.2.0",
+        reason="Added pool_size, max_in_flight and function_cache arguments",
+    )
     @sync_instrumented("pysui.sui.sui_pgql.pgql_clients.GqlProtocolClient.__init__")
     def __init__(
         self,
@@ -239,23 +260,38 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
         default_header: Optional[dict] = None,
         proxies: Optional[dict] = None,
         timeout: float | None = None,
+        pool_size: int = GqlSessionPool.DEFAULT_POOL_SIZE,
+        max_in_flight: Optional[int] = None,
+        function_cache: Optional[MoveFunctionCache] = None,
     ):
-        """Async Sui GraphQL Client initializer."""
+        """Async Sui GraphQL Client initializer.
+
+        :param pool_size: Number of concurrent HTTP/2 transports, defaults to 1
+        :type pool_size: int, optional
+        :param max_in_flight: Maximum concurrent requests across all transports,
+            defaults to GqlSessionPool.DEFAULT_MAX_IN_FLIGHT
+        :type max_in_flight: Optional[int], optional
+        :param function_cache: Move function signature cache to share with other
+            clients of the same network, defaults to a new cache for this client
+        :type function_cache: Optional[MoveFunctionCache], optional
+        """
         scm_mgr: scm.Schema = scm.Schema(
             gql_url=pysui_config.url,
             gql_env=pysui_config.active_profile,
             proxies=proxies,
             timeout=timeout,
         )
-        scm_mgr.set_async_client(proxies)
+        scm_mgr.set_async_client(
+            proxies, pool_size=pool_size, max_in_flight=max_in_flight
+        )
 
         super().__init__(
             pysui_config=pysui_config,
             schema=scm_mgr,
             write_schema=write_schema,
             default_header=default_header,
+            function_cache=function_cache,
         )
-        self._slock = asyncio.Semaphore()
 
     @instrumented("gql.transaction")
     @versionadded(version="0.87.0", reason="Parity with JSON RPC and gRPC client.")
@@ -313,11 +349,8 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
     @instrumented("gql.close")
     async def close(self) -> None:
         """Close the connection."""
-        if self._schema._async_client:
-            try:
-                await self._schema._async_client.close_async()
-            except AttributeError:
-                pass
+        if self._schema.async_pool:
+            await self._schema.async_pool.close()
 
     @instrumented("gql.__aenter__")
     async def __aenter__(self) -> "GqlProtocolClient":
@@ -359,11 +392,11 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
-            async with self._slock:
-                _session = await self.async_client()
-                extra_args = dict(with_headers) if with_headers is not None else dict(self._default_header or {})
-                extra_args["timeout"] = timeout or self._schema.timeout
-                sres = await _session.execute(node, extra_args=extra_args)
+            extra_args = dict(with_headers) if with_headers is not None else dict(self._default_header or {})
+            # One deadline for the session slot wait and the request
+            sres = await self._schema.async_pool.execute(
+                node, extra_args=extra_args, timeout=timeout or self._schema.timeout
+            )
             if encode_fn:
                 async with measure(f"gql.{encode_fn.__qualname__}"):
                     result_data = encode_fn(sres)
@@ -396,6 +429,20 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
             return SuiRpcResult(
                 False, f"HTTPX error: {hexc.__class__.__name__}", vars(hexc)
             )
+        except texc.TransportServerError as tse:
+            return SuiRpcResult(
+                False, f"TransportServerError: {tse.code}", pgql_type.ErrorGQL.from_query([str(tse)])
+            )
+        except texc.TransportConnectionFailed as tcf:
+            return SuiRpcResult(
+                False,
+                f"TransportConnectionFailed: {type(tcf.__cause__ or tcf).__name__}",
+                pgql_type.ErrorGQL.from_query([str(tcf)]),
+            )
+        except SessionUnavailableError:
+            return SuiRpcResult(False, _NO_SESSION, None)
+        except asyncio.TimeoutError:
+            return SuiRpcResult(False, _TIMED_OUT, None)
         except GraphQLSyntaxError as gqe:
             return SuiRpcResult(
                 False,
@@ -522,6 +569,7 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
             )
 
     @instrumented("gql.execute")
+    @versionchanged(version="1.2.0", reason="Applies the client retry_policy")
     async def execute(
         self,
         *,
@@ -531,8 +579,12 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
     ) -> SuiRpcResult:
         """Execute a SuiCommand against the GraphQL protocol.
 
+        When ``retry_policy`` is set, failed attempts are retried (and read
+        commands optionally hedged) as the policy allows.
+
         :param command: A SuiCommand instance describing the operation
-        :param timeout: Optional timeout in seconds
+        :param timeout: Optional timeout in seconds, with a retry_policy the
+            budget for all attempts
         :param headers: Optional HTTP headers passed to the transport
         :return: SuiRpcResult wrapping the response or error
         :rtype: SuiRpcResult
@@ -541,6 +593,9 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
             return SuiRpcResult(
                 False, f"Expected SuiCommand, got {type(command).__name__}", None
             )
+        chunked = await self._execute_chunked(command, timeout=timeout, headers=headers)
+        if chunked is not None:
+            return chunked
         try:
             node = command.gql_node()
         except NotImplementedError:
@@ -548,10 +603,31 @@ class GqlProtocolClient(AsyncClientBase, BaseSuiGQLClient):
         except (ValueError, TypeError) as exc:
             return SuiRpcResult(False, str(exc), None)
 
-        return await self._execute_gql_node(
-            node, with_headers=headers, timeout=timeout,
-            capture_errors=command.capture_errors,
-        )
+
+        async def _attempt(attempt_timeout: float | None) -> SuiRpcResult:
+            return await self._execute_gql_node(
+                node, with_headers=headers, timeout=attempt_timeout,
+                capture_errors=command.capture_errors,
+            )
+
+        result = await self._run_with_policy(command, _attempt, timeout)
+        self._observe_result(command, result)
+        return result
+
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_clients.GqlProtocolClient._classify_failure")
+    def _classify_failure(self, result: SuiRpcResult) -> FailureKind:
+        """Classify a failed execution result for the retry policy."""
+        reason = result.result_string or ""
+        kind, _, detail = reason.partition(": ")
+        if reason == _NO_SESSION:
+            return FailureKind.UNSENT
+        if reason == _TIMED_OUT:
+            return FailureKind.TRANSIENT
+        if kind in ("TransportConnectionFailed", "HTTPX error"):
+            return FailureKind.UNSENT if detail in _UNSENT_HTTPX else FailureKind.TRANSIENT
+        if kind == "TransportServerError" and detail in _TRANSIENT_HTTP_STATUS:
+            return FailureKind.TRANSIENT
+        return FailureKind.PERMANENT
 
     @instrumented("gql._execute_gql_node")
     async def _execute_gql_node(
@@ -23,6 +23,7 @@ from gql.dsl import (
 
 import betterproto2
 from pysui.sui.sui_pgql.pgql_clients import PGQL_QueryNode, PGQL_NoOp
+from pysui.abstracts.client_keypair import SignatureScheme
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_fragments as frag
 from pysui.sui.sui_pgql.pgql_validators import TypeValidator
@@ -4730,7 +4731,7 @@ def _parse_user_signature(sig_b64: str) -> "sui_prot.UserSignature":
         )
 
     # --- Passkey (6) ---
-    if flag == 6:
+    if flag == SignatureScheme.PASSKEY:
         return sui_prot.UserSignature(
             bcs=sig_bcs,
             scheme=scheme,
@@ -12,12 +12,12 @@ from gql.client import ReconnectingAsyncClientSession
 import httpx
 
 from gql.transport.httpx import HTTPXTransport
-from gql.transport.httpx import HTTPXAsyncTransport
 
 from gql.dsl import (
     DSLSchema,
 )
 from pysui.sui.sui_pgql.pgql_configs import SuiConfigGQL, pgql_config, SuiConfigGQL
+from pysui.sui.sui_pgql.pgql_session_pool import GqlSessionPool
 from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
 
 
@@ -70,7 +70,7 @@ class Schema:
             self._graph_url: str = gql_url
             self._sync_client: Client = _init_client
             self._async_client: Client = None
-            self._async_session: ReconnectingAsyncClientSession = None
+            self._async_pool: GqlSessionPool = None
 
     @property
     @sync_instrumented("pysui.sui.sui_pgql.pgql_schema.Schema.base_version")
@@ -106,25 +106,38 @@ class Schema:
     @instrumented("pysui.sui.sui_pgql.pgql_schema.Schema.async_session")
     async def async_session(self) -> ReconnectingAsyncClientSession:
         """."""
-        if not self._async_session and self._async_client:
-            self._async_session = await self._async_client.connect_async(
-                reconnecting=False
-            )
-        return self._async_session
+        if self._async_pool:
+            return await self._async_pool.session_at(0)
+        return None
+
+    @property
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_schema.Schema.async_pool")
+    def async_pool(self) -> GqlSessionPool:
+        """."""
+        return self._async_pool
 
     @versionchanged(
         version="0.85.0",
         reason="Proxy support https://github.com/FrankC01/pysui/issues/311",
     )
+    @versionchanged(
+        version="1.2.0",
+        reason="Async requests run over a concurrent session pool",
+    )
     @sync_instrumented("pysui.sui.sui_pgql.pgql_schema.Schema.set_async_client")
-    def set_async_client(self, proxies: Optional[dict] = None):
+    def set_async_client(
+        self,
+        proxies: Optional[dict] = None,
+        *,
+        pool_size: int = GqlSessionPool.DEFAULT_POOL_SIZE,
+        max_in_flight: Optional[int] = None,
+    ):
         """."""
-        self._async_client = Client(
-            transport=HTTPXAsyncTransport(
-                url=self._graph_url,
-                verify=True,
-                http2=True,
-                timeout=self.timeout,
-                proxy=proxies,
-            ),
+        self._async_pool = GqlSessionPool(
+            url=self._graph_url,
+            pool_size=pool_size,
+            max_in_flight=max_in_flight,
+            timeout=self.timeout,
+            proxies=proxies,
         )
+        self._async_client = self._async_pool.clients[0]
@@ -0,0 +1,225 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Concurrent GraphQL session pool."""
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, AsyncIterator, Callable, Optional
+
+import httpx
+from gql import Client, GraphQLRequest
+from gql.client import AsyncClientSession
+from gql.transport.httpx import HTTPXAsyncTransport
+
+from pysui.sui.sui_common.instrumentation import instrumented, sync_instrumented
+
+logger = logging.getLogger(__name__)
+
+
+class SessionUnavailableError(asyncio.TimeoutError):
+    """No in-flight slot freed up in time; the request was never sent."""
+
+
+class GqlSessionPool:
+    """Pool of async GraphQL sessions sharing a bounded in-flight window.
+
+    Each pool member owns its own ``HTTPXAsyncTransport`` (and therefore its own
+    HTTP/2 connection). Requests are multiplexed as HTTP/2 streams over the
+    member with the fewest outstanding requests.
+
+    ``max_in_flight`` bounds the total number of concurrent requests across the
+    pool. Callers beyond that bound wait in arrival order (asyncio semaphores
+    wake waiters FIFO) so no caller is starved under sustained load.
+
+    Sessions are connected lazily on first use.
+    """
+
+    DEFAULT_POOL_SIZE: int = 1
+    DEFAULT_MAX_IN_FLIGHT: int = 16
+
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.__init__")
+    def __init__(
+        self,
+        *,
+        url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_in_flight: Optional[int] = None,
+        timeout: float = 120.0,
+        proxies: Optional[dict] = None,
+        transport_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """Initialize the pool.
+
+        :param url: GraphQL endpoint URL
+        :type url: str
+        :param pool_size: Number of independent transports (connections), defaults to 1
+        :type pool_size: int, optional
+        :param max_in_flight: Maximum concurrent requests across the pool,
+            defaults to DEFAULT_MAX_IN_FLIGHT
+        :type max_in_flight: Optional[int], optional
+        :param timeout: Default transport timeout in seconds, defaults to 120.0
+        :type timeout: float, optional
+        :param proxies: Optional proxy configuration passed to httpx, defaults to None
+        :type proxies: Optional[dict], optional
+        :param transport_factory: Zero-arg callable returning a gql async transport,
+            defaults to an HTTP/2 ``HTTPXAsyncTransport`` bound to ``url``
+        :type transport_factory: Optional[Callable[[], Any]], optional
+        :raises ValueError: If pool_size or max_in_flight is less than 1
+        """
+        max_in_flight = max_in_flight or self.DEFAULT_MAX_IN_FLIGHT
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, found {pool_size}")
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, found {max_in_flight}")
+        self._url = url
+        self._timeout = timeout
+        self._proxies = proxies
+        self._max_in_flight = max_in_flight
+        factory = transport_factory or self._default_transport
+        self._clients: list[Client] = [Client(transport=factory()) for _ in range(pool_size)]
+        self._sessions: list[Optional[AsyncClientSession]] = [None] * pool_size
+        self._outstanding: list[int] = [0] * pool_size
+        self._next: int = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._connect_lock = asyncio.Lock()
+
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool._default_transport")
+    def _default_transport(self) -> HTTPXAsyncTransport:
+        """Return an HTTP/2 transport sized to carry the full in-flight window."""
+        return HTTPXAsyncTransport(
+            url=self._url,
+            verify=True,
+            http2=True,
+            timeout=self._timeout,
+            proxy=self._proxies,
+            limits=httpx.Limits(
+                max_connections=self._max_in_flight,
+                max_keepalive_connections=self._max_in_flight,
+            ),
+        )
+
+    @property
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.pool_size")
+    def pool_size(self) -> int:
+        """Number of transports in the pool."""
+        return len(self._clients)
+
+    @property
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.max_in_flight")
+    def max_in_flight(self) -> int:
+        """Maximum concurrent requests across the pool."""
+        return self._max_in_flight
+
+    @property
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.in_flight")
+    def in_flight(self) -> int:
+        """Number of requests currently executing."""
+        return sum(self._outstanding)
+
+    @property
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.clients")
+    def clients(self) -> list[Client]:
+        """The gql clients backing each pool member."""
+        return list(self._clients)
+
+    @instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.session_at")
+    async def session_at(self, index: int) -> AsyncClientSession:
+        """Return the connected session for a pool member, connecting on first use."""
+        session = self._sessions[index]
+        if session is None:
+            async with self._connect_lock:
+                session = self._sessions[index]
+                if session is None:
+                    session = await self._clients[index].connect_async(reconnecting=False)
+                    self._sessions[index] = session
+                    logger.debug("session pool: connected member %d", index)
+        return session
+
+    @sync_instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool._pick")
+    def _pick(self) -> int:
+        """Return the member with the fewest outstanding requests, rotating on ties."""
+        size = len(self._clients)
+        start = self._next
+        self._next = (start + 1) % size
+        best = start
+        for offset in range(1, size):
+            idx = (start + offset) % size
+            if self._outstanding[idx] < self._outstanding[best]:
+                best = idx
+        return best
+
+    @contextlib.asynccontextmanager
+    async def session(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncClientSession]:
+        """Reserve an in-flight slot and yield the least loaded session.
+
+        :param timeout: Maximum seconds to wait for a free slot, defaults to no limit
+        :type timeout: Optional[float], optional
+        :raises SessionUnavailableError: If no slot frees up within timeout
+        """
+        if timeout is None:
+            await self._slots.acquire()
+        else:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout)
+            except asyncio.TimeoutError as exc:
+                raise SessionUnavailableError(
+                    f"no GraphQL session available within {timeout}s"
+                ) from exc
+        index = self._pick()
+        self._outstanding[index] += 1
+        try:
+            yield await self.session_at(index)
+        finally:
+            self._outstanding[index] -= 1
+            self._slots.release()
+
+    @instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.execute")
+    async def execute(
+        self,
+        request: GraphQLRequest,
+        *,
+        extra_args: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Execute a request on the least loaded pool member.
+
+        The timeout is one deadline for the slot wait and the request together:
+        the transport gets whatever the slot wait left of it.
+
+        :param request: The gql request to execute
+        :type request: GraphQLRequest
+        :param extra_args: Extra arguments passed to the transport (headers)
+        :type extra_args: Optional[dict], optional
+        :param timeout: Maximum seconds for the slot wait and request, defaults to no limit
+        :type timeout: Optional[float], optional
+        :raises SessionUnavailableError: If no slot frees up within timeout
+        :raises asyncio.TimeoutError: If the request does not complete within timeout
+        :return: The query result
+        """
+        if timeout is None:
+            async with self.session() as session:
+                return await session.execute(request, extra_args=extra_args or {})
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with self.session(timeout) as session:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise SessionUnavailableError(f"no GraphQL session available within {timeout}s")
+            args = dict(extra_args or {})
+            args["timeout"] = remaining
+            return await asyncio.wait_for(session.execute(request, extra_args=args), remaining)
+
+    @instrumented("pysui.sui.sui_pgql.pgql_session_pool.GqlSessionPool.close")
+    async def close(self) -> None:
+        """Close every connected pool member."""
+        for index, client in enumerate(self._clients):
+            if self._sessions[index] is not None:
+                self._sessions[index] = None
+                try:
+                    await client.close_async()
+                except AttributeError:
+                    pass
@@ -3,7 +3,7 @@
 
 # -*- coding: utf-8 -*-
 
-"""Unit tests for AsyncClientBase.execute_for_all() — all offline, no live node.
+"""Unit tests for AsyncClientBase.execute_for_all() and iterate_all() — all offline, no live node.
 
 Covers:
   - _protocol ClassVar defaults on AsyncClientBase and concrete subclasses
@@ -12,8 +12,11 @@ Covers:
   - Multi-page accumulation: items list extended; next_page_token cleared
   - Transport error on first page propagates immediately
   - Transport error on subsequent page propagates immediately
+  - iterate_all streams items, requests the next page before yielding, honours
+    max_items and cancels the outstanding page request when stopped early
 """
 
+import asyncio
 import dataclasses
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -248,3 +251,70 @@ class TestExecuteForAllErrors:
         assert not result.is_ok()
         assert result.result_string == "timeout"
         assert client.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestIterateAll:
+    def _paged(self, client, *pages, delay: float = 0):
+        calls = []
+
+        async def _execute(*, command, timeout=None, headers=None):
+            calls.append(command.next_page_token)
+            await asyncio.sleep(delay)
+            index = len(calls) - 1
+            token = f"t{index + 1}".encode() if index + 1 < len(pages) else None
+            return SuiRpcResult(True, "", _CoinPage(coins=list(pages[index]), next_page_token=token))
+
+        client.execute = _execute
+        return calls
+
+    async def test_streams_all_items(self):
+        client = _MockClient()
+        calls = self._paged(client, ["a", "b"], ["c"], ["d"])
+        items = [item async for item in client.iterate_all(command=_PageableCmd(owner="0x1"))]
+        assert items == ["a", "b", "c", "d"]
+        assert calls == [None, b"t1", b"t2"]
+
+    async def test_next_page_requested_before_items_yielded(self):
+        client = _MockClient()
+        calls = self._paged(client, ["a", "b"], ["c"])
+        gen = client.iterate_all(command=_PageableCmd(owner="0x1"))
+        assert await gen.__anext__() == "a"
+        await asyncio.sleep(0)
+        assert calls == [None, b"t1"]
+        assert [item async for item in gen] == ["b", "c"]
+
+    async def test_max_items_cancels_lookahead(self):
+        client = _MockClient()
+        calls = self._paged(client, ["a", "b"], ["c"], ["d"], delay=0.01)
+        items = [
+            item async for item in client.iterate_all(command=_PageableCmd(owner="0x1"), max_items=2)
+        ]
+        assert items == ["a", "b"]
+        # The second page request was cancelled before it could lead to the third
+        assert b"t2" not in calls
+
+    async def test_error_raises(self):
+        client = _MockClient()
+        client.execute = AsyncMock(side_effect=[
+            SuiRpcResult(True, "", _CoinPage(coins=["c1"], next_page_token=b"tok")),
+            SuiRpcResult(False, "timeout", None),
+        ])
+        items = []
+        with pytest.raises(ValueError, match="timeout"):
+            async for item in client.iterate_all(command=_PageableCmd(owner="0x1")):
+                items.append(item)
+        assert items == ["c1"]
+
+    async def test_non_pageable_raises(self):
+        client = _MockClient()
+        with pytest.raises(ValueError):
+            async for _ in client.iterate_all(command=_NonPageableCmd(owner="0x1")):
+                pass
+
+    async def test_execute_for_all_overlaps_pages(self):
+        client = _MockClient()
+        self._paged(client, ["a"], ["b"], ["c"], delay=0.01)
+        result = await client.execute_for_all(command=_PageableCmd(owner="0x1"))
+        assert result.result_data.coins == ["a", "b", "c"]
+        assert result.result_data.next_page_token is None
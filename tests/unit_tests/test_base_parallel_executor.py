@@ -20,6 +20,7 @@ from pysui.sui.sui_common.executors.exec_types import (
     ExecutorError,
 )
 from pysui.sui.sui_common.executors.gas_pool import GasCoin
+from pysui.sui.sui_common.executors.gas_utils import _SUI_COIN_TYPE
 
 
 _CE_PATH = "pysui.sui.sui_common.executors.base_parallel_executor._BaseCachingExecutor"
@@ -714,3 +715,191 @@ class TestConflictTracking:
             result = await fut
             await ex.close()
         assert result is executed_tx
+
+
+# ---------------------------------------------------------------------------
+# Look-ahead scheduling
+# ---------------------------------------------------------------------------
+
+def _tagged_txn(tag, unresolved_ids=None, sender="0xsender"):
+    txn = _txn_mock(unresolved_ids)
+    txn.tag = tag
+    txn.signer_block.sender_str = sender
+    return txn
+
+
+def _ordering_ce(built: list):
+    ce = _ce_mock()
+
+    async def _build(txn, signing_block, gas_override):
+        built.append(txn.tag)
+        return {"tx_bytestr": txn.tag, "sig_array": ["sig"]}
+
+    ce.build_transaction = AsyncMock(side_effect=_build)
+    return ce
+
+
+async def _run_with_hot_object(ex, txns):
+    """Submit txns while 0xhot is held; release it once the others settle."""
+    built: list = []
+    ex._tracked_balance = 20_000_000
+    executed_tx = _mock_executed_tx()
+    ex._client.execute = AsyncMock(return_value=_ok_result(executed_tx))
+    held = await ex._conflict_tracker.acquire({"0xhot"})
+    with patch(_CE_PATH, return_value=_ordering_ce(built)):
+        ex._build_task = asyncio.create_task(ex._build_worker())
+        futs = ex.submit(txns)
+        await asyncio.sleep(0.01)
+        before_release = list(built)
+        await held.release()
+        ex._wakeup.set()  # stands in for the holder's execute task finishing
+        await asyncio.gather(*futs)
+        await ex.close()
+    return before_release, built
+
+
+class TestScheduler:
+
+    @pytest.mark.asyncio
+    async def test_blocked_head_does_not_stall_unrelated(self):
+        ex = _make_executor(gas_mode=GasMode.ADDRESS_BALANCE)
+        before, built = await _run_with_hot_object(
+            ex, [_tagged_txn("A", ["0xhot"]), _tagged_txn("B", ["0xcold"]), _tagged_txn("C")]
+        )
+        assert before == ["B", "C"]
+        assert built == ["B", "C", "A"]
+
+    @pytest.mark.asyncio
+    async def test_same_object_keeps_submit_order(self):
+        ex = _make_executor(gas_mode=GasMode.ADDRESS_BALANCE)
+        before, built = await _run_with_hot_object(
+            ex,
+            [
+                _tagged_txn("A", ["0xhot"]),
+                _tagged_txn("B", ["0xhot", "0xcold"]),
+                _tagged_txn("C", ["0xcold"]),
+            ],
+        )
+        # C shares 0xcold with blocked B, so it may not overtake it either
+        assert before == []
+        assert built == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_preserve_sender_order(self):
+        ex = _make_executor(gas_mode=GasMode.ADDRESS_BALANCE, preserve_sender_order=True)
+        before, built = await _run_with_hot_object(
+            ex,
+            [
+                _tagged_txn("A", ["0xhot"]),
+                _tagged_txn("B", ["0xcold"]),
+                _tagged_txn("C", sender="0xother"),
+            ],
+        )
+        assert before == ["C"]
+        assert built == ["C", "A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_window_of_one_is_fifo(self):
+        ex = _make_executor(gas_mode=GasMode.ADDRESS_BALANCE, reorder_window=1)
+        before, built = await _run_with_hot_object(
+            ex, [_tagged_txn("A", ["0xhot"]), _tagged_txn("B", ["0xcold"])]
+        )
+        assert before == []
+        assert built == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_coins_mode_waits_for_gas_then_dispatches(self):
+        ex = _make_executor(gas_mode=GasMode.COINS, max_concurrent=4)
+        ex._tracked_balance = 20_000_000
+        built: list = []
+        ex._client.execute = AsyncMock(return_value=_ok_result(_mock_executed_tx()))
+        with patch(_CE_PATH, return_value=_ordering_ce(built)):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            futs = ex.submit([_tagged_txn("A"), _tagged_txn("B")])
+            await asyncio.sleep(0.01)
+            assert built == []
+            await ex._add_funds(
+                [MagicMock(object_type=_SUI_COIN_TYPE, object_id="0xc1",
+                           version=1, digest="d", balance=20_000_000)]
+            )
+            await asyncio.gather(*futs)
+            await ex.close()
+        assert sorted(built) == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_hard_stop_skips_window(self):
+        ex = _make_executor(gas_mode=GasMode.ADDRESS_BALANCE)
+        held = await ex._conflict_tracker.acquire({"0xhot"})
+        with patch(_CE_PATH, return_value=_ce_mock()):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            fut = ex.submit(_tagged_txn("A", ["0xhot"]))
+            await asyncio.sleep(0.01)
+            assert ex._window
+            await ex._hard_stop("stopping")
+        assert fut.result().reason == "stopping"
+        await held.release()
+
+
+# ---------------------------------------------------------------------------
+# Balance aware gas coin selection
+# ---------------------------------------------------------------------------
+
+class TestGasCoinSelection:
+
+    @pytest.mark.asyncio
+    async def test_dispatch_uses_smallest_adequate_coin(self):
+        ex = _make_executor(gas_mode=GasMode.COINS)
+        await ex._gas_pool.replenish(
+            [_gas_coin("01", 50_000_000), _gas_coin("02", 5_000_000), _gas_coin("03", 20_000_000)]
+        )
+        ex._tracked_balance = 100_000_000
+        ex._client.execute = AsyncMock(return_value=_ok_result(_mock_executed_tx()))
+        ce = _ce_mock()
+        with patch(_CE_PATH, return_value=ce):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            await ex.submit(_txn_mock(), min_gas_balance=10_000_000)
+            await ex.close()
+        gas = ce.build_transaction.await_args.args[2]
+        assert gas[0].object_id == _gas_coin("03").object_id
+
+    @pytest.mark.asyncio
+    async def test_unaffordable_minimum_falls_back_to_richest_coin(self):
+        ex = _make_executor(gas_mode=GasMode.COINS)
+        await ex._gas_pool.replenish([_gas_coin("01", 5_000_000), _gas_coin("02", 8_000_000)])
+        ex._tracked_balance = 100_000_000
+        ex._client.execute = AsyncMock(return_value=_ok_result(_mock_executed_tx()))
+        ce = _ce_mock()
+        with patch(_CE_PATH, return_value=ce):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            await ex.submit(_txn_mock(), min_gas_balance=10_000_000)
+            await ex.close()
+        assert ce.build_transaction.await_args.args[2][0].object_id == _gas_coin("02").object_id
+
+    def test_waits_for_richer_coin_in_flight(self):
+        ex = _make_executor(gas_mode=GasMode.COINS)
+        ex._gas_pool._checked_out = 1
+        assert ex._gas_available(0)
+        assert not ex._gas_available(10_000_000)
+        ex._gas_pool._checked_out = 0
+        assert ex._gas_available(10_000_000)
+
+    @pytest.mark.asyncio
+    async def test_gas_error_retries_on_richer_pooled_coin(self):
+        ex = _make_executor(gas_mode=GasMode.COINS, max_retries=1)
+        ex._options.on_balance_low = AsyncMock()
+        await ex._gas_pool.replenish([_gas_coin("01", 5_000_000), _gas_coin("02", 50_000_000)])
+        ex._tracked_balance = 100_000_000
+        bad_result = MagicMock()
+        bad_result.is_ok.return_value = False
+        bad_result.result_string = "insufficient gas"
+        ex._client.execute = AsyncMock(side_effect=[bad_result, _ok_result(_mock_executed_tx())])
+        ce = _ce_mock()
+        ce.note_insufficient_gas = MagicMock()
+        with patch(_CE_PATH, return_value=ce):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            result = await ex.submit(_txn_mock())
+            await ex.close()
+        assert not isinstance(result, tuple)
+        used = [c.args[2][0].object_id for c in ce.build_transaction.await_args_list]
+        assert used == [_gas_coin("01").object_id, _gas_coin("02").object_id]
+        ex._options.on_balance_low.assert_not_called()
@@ -299,3 +299,76 @@ class TestApplyEffects:
         assert (await cache.get_object("0xnew")).owner == "0xowner2"
         assert (await cache.get_object("0xshared")).owner is None
         assert await cache.get_object("0xdel") is None
+
+    @pytest.mark.asyncio
+    async def test_take_dirty_returns_changes_once(self):
+        cache = AsyncObjectCache()
+        effects = self._make_effects([
+            self._owned_change("0xnew", "0xowner"),
+            self._deleted_change("0xdel"),
+        ])
+        await cache.applyEffects(effects)
+        dirty = cache.take_dirty()
+        assert dirty["0xnew"].version == "5"
+        assert dirty["0xdel"] is None
+        assert cache.take_dirty() == {}
+
+    @pytest.mark.asyncio
+    async def test_objects_added_outside_effects_are_not_dirty(self):
+        cache = AsyncObjectCache()
+        await cache.add_object(ObjectSummary(objectId="0xa", version="1", digest="d", owner="0xo"))
+        assert cache.take_dirty() == {}
+
+
+class TestSyncToRegistry:
+    """_BaseCachingExecutor.sync_to_registry pushes only effects deltas."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_objects_are_pushed_in_one_batch(self):
+        from unittest.mock import AsyncMock
+        from pysui.sui.sui_common.executors import _BaseCachingExecutor
+
+        ce = _BaseCachingExecutor()
+        for i in range(10):
+            await ce.cache.add_object(ObjectSummary(objectId=f"0x{i}", version="1", digest="d", owner="0xo"))
+        helper = TestApplyEffects()
+        await ce.cache.applyEffects(helper._make_effects([
+            helper._owned_change("0x1", "0xo"),
+            helper._shared_change("0xshared"),
+            helper._deleted_change("0x2"),
+        ]))
+        registry = AsyncMock()
+        await ce.sync_to_registry(registry)
+        registry.upsert_many.assert_awaited_once()
+        entries = {e.object_id: e for e in registry.upsert_many.await_args.args[0]}
+        assert set(entries) == {"0x1", "0x2"}
+        assert entries["0x1"].version == 5 and not entries["0x1"].is_tombstone
+        assert entries["0x2"].is_tombstone
+        registry.tombstone.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_changes_makes_no_registry_call(self):
+        from unittest.mock import AsyncMock
+        from pysui.sui.sui_common.executors import _BaseCachingExecutor
+
+        ce = _BaseCachingExecutor()
+        await ce.cache.add_object(ObjectSummary(objectId="0xa", version="1", digest="d", owner="0xo"))
+        registry = AsyncMock()
+        await ce.sync_to_registry(registry)
+        registry.upsert_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deletion_tombstones_registry_entry(self):
+        from pysui.sui.sui_common.executors import (
+            InMemoryObjectRegistry,
+            ObjectVersionEntry,
+            _BaseCachingExecutor,
+        )
+
+        registry = InMemoryObjectRegistry()
+        await registry.upsert(ObjectVersionEntry(object_id="0xdel", version=3, digest="d"))
+        ce = _BaseCachingExecutor()
+        helper = TestApplyEffects()
+        await ce.cache.applyEffects(helper._make_effects([helper._deleted_change("0xdel")]))
+        await ce.sync_to_registry(registry)
+        assert (await registry.get("0xdel")).is_tombstone
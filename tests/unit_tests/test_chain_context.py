@@ -0,0 +1,241 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for ChainContextCache — all offline, no live node.
+
+Covers:
+  - First lookup fetches epoch info and chain id, later lookups are free
+  - Chain id is fetched only once across refreshes
+  - Known epoch end keeps the context current; unknown end honours max_age
+  - note_epoch / note_checkpoint / invalidate force a refresh
+  - Epoch duration is learned from a rollover and used to estimate the end
+  - Rollover re-initializes protocol constraints when the client supports it
+  - Executor apply_effects notes the effects epoch
+  - Client execution results note the effects epoch, epoch related failures invalidate
+  - CheckpointStream notes live checkpoints
+"""
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.chain_context import ChainContextCache
+
+_UTC = datetime.timezone.utc
+
+
+def _result(data):
+    res = MagicMock()
+    res.is_ok.return_value = True
+    res.result_data = data
+    return res
+
+
+def _make_client(epochs: list[sui_prot.Epoch], chain_id: str = "4c78adac"):
+    """Client whose GetBasicCurrentEpochInfo answers successive epochs."""
+    client = MagicMock()
+    client.protocol.return_value = "constraints"
+    calls = {"epoch": 0, "chain": 0}
+
+    async def _execute(*, command, timeout=None):
+        if isinstance(command, cmd.GetChainIdentifier):
+            calls["chain"] += 1
+            return _result(chain_id)
+        idx = min(calls["epoch"], len(epochs) - 1)
+        calls["epoch"] += 1
+        return _result(epochs[idx])
+
+    client.execute = AsyncMock(side_effect=_execute)
+    del client._init_protocol
+    return client, calls
+
+
+def _epoch(num: int, start: datetime.datetime, end=None, rgp: int = 1000):
+    return sui_prot.Epoch(epoch=num, reference_gas_price=rgp, start=start, end=end)
+
+
+_NOW = datetime.datetime.now(_UTC)
+
+
+@pytest.mark.asyncio
+class TestLookup:
+    async def test_first_get_fetches_then_caches(self):
+        client, calls = _make_client([_epoch(5, _NOW)])
+        cache = ChainContextCache()
+        ctx = await cache.get(client)
+        assert (ctx.epoch, ctx.reference_gas_price, ctx.chain_id) == (5, 1000, "4c78adac")
+        assert ctx.protocol == "constraints"
+        for _ in range(5):
+            await cache.get(client)
+        assert calls == {"epoch": 1, "chain": 1}
+        assert cache.hits == 5
+        assert cache.refreshes == 1
+
+    async def test_concurrent_first_gets_share_one_fetch(self):
+        client, calls = _make_client([_epoch(5, _NOW)])
+        cache = ChainContextCache()
+        await asyncio.gather(*[cache.get(client) for _ in range(8)])
+        assert calls == {"epoch": 1, "chain": 1}
+
+    async def test_fetch_error_raises(self):
+        client = MagicMock()
+        bad = MagicMock()
+        bad.is_ok.return_value = False
+        bad.result_string = "boom"
+        client.execute = AsyncMock(return_value=bad)
+        with pytest.raises(ValueError):
+            await ChainContextCache().get(client)
+
+
+@pytest.mark.asyncio
+class TestFreshness:
+    async def test_known_end_ignores_max_age(self):
+        end = _NOW + datetime.timedelta(hours=1)
+        client, calls = _make_client([_epoch(5, _NOW, end)])
+        cache = ChainContextCache(max_age_seconds=0)
+        await cache.get(client)
+        await cache.get(client)
+        assert calls["epoch"] == 1
+
+    async def test_unknown_end_uses_max_age(self):
+        client, calls = _make_client([_epoch(5, _NOW)])
+        cache = ChainContextCache(max_age_seconds=0)
+        await cache.get(client)
+        await asyncio.sleep(0.001)
+        await cache.get(client)
+        assert calls == {"epoch": 2, "chain": 1}
+
+    async def test_note_epoch_forces_refresh(self):
+        client, calls = _make_client([_epoch(5, _NOW), _epoch(6, _NOW, rgp=2000)])
+        cache = ChainContextCache(max_age_seconds=None)
+        await cache.get(client)
+        assert not cache.note_epoch(5)
+        assert cache.note_epoch(6)
+        ctx = await cache.get(client)
+        assert (ctx.epoch, ctx.reference_gas_price) == (6, 2000)
+        assert calls == {"epoch": 2, "chain": 1}
+
+    async def test_note_checkpoint_end_of_epoch(self):
+        client, _ = _make_client([_epoch(5, _NOW)])
+        cache = ChainContextCache(max_age_seconds=None)
+        await cache.get(client)
+        plain = sui_prot.Checkpoint(summary=sui_prot.CheckpointSummary(epoch=5))
+        closing = sui_prot.Checkpoint(
+            summary=sui_prot.CheckpointSummary(
+                epoch=5, end_of_epoch_data=sui_prot.EndOfEpochData()
+            )
+        )
+        assert not cache.note_checkpoint(plain)
+        assert cache.note_checkpoint(closing)
+
+    async def test_invalidate(self):
+        client, calls = _make_client([_epoch(5, _NOW)])
+        cache = ChainContextCache(max_age_seconds=None)
+        await cache.get(client)
+        cache.invalidate()
+        await cache.get(client)
+        assert calls == {"epoch": 2, "chain": 1}
+
+
+@pytest.mark.asyncio
+class TestRollover:
+    async def test_duration_learned_and_end_estimated(self):
+        day = datetime.timedelta(days=1)
+        client, _ = _make_client([_epoch(5, _NOW - day), _epoch(6, _NOW)])
+        cache = ChainContextCache(max_age_seconds=None)
+        await cache.get(client)
+        cache.note_epoch(6)
+        ctx = await cache.get(client)
+        assert ctx.epoch_end == _NOW + day
+
+    async def test_rollover_reinitializes_protocol(self):
+        client, _ = _make_client([_epoch(5, _NOW), _epoch(6, _NOW)])
+        client._init_protocol = AsyncMock()
+        cache = ChainContextCache(max_age_seconds=None)
+        await cache.get(client)
+        client._init_protocol.assert_not_awaited()
+        cache.note_epoch(6)
+        await cache.get(client)
+        client._init_protocol.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestExecutorIntegration:
+    async def test_apply_effects_notes_epoch(self):
+        from pysui.sui.sui_common.executors.base_caching_executor import (
+            _BaseCachingExecutor,
+        )
+
+        client, _ = _make_client([_epoch(5, _NOW)])
+        client.chain_context = ChainContextCache(max_age_seconds=None)
+        await client.chain_context.get(client)
+        caching = _BaseCachingExecutor(client=client)
+        caching.cache.applyEffects = AsyncMock()
+        await caching.apply_effects(sui_prot.TransactionEffects(epoch=6))
+        assert client.chain_context._stale
+
+    async def test_client_execute_notes_epoch(self):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client, _ = _make_client([_epoch(5, _NOW)])
+        client._chain_context = ChainContextCache(max_age_seconds=None)
+        client._gas_inventories = {}
+        await client._chain_context.get(client)
+        command = cmd.ExecuteTransaction(tx_bytestr="", sig_array=[])
+        executed = sui_prot.ExecutedTransaction(effects=sui_prot.TransactionEffects(epoch=5))
+        PysuiClient._observe_result(client, command, _result(executed))
+        assert not client._chain_context._stale
+        executed = sui_prot.ExecutedTransaction(effects=sui_prot.TransactionEffects(epoch=6))
+        PysuiClient._observe_result(client, command, _result(executed))
+        assert client._chain_context._stale
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Gas price 750 under reference gas price (RGP) 1000",
+            "GasPriceUnderRGP { gas_price: 750, reference_gas_price: 1000 }",
+            "Transaction Expired",
+            "Epoch 6 is not within the transaction's valid epochs",
+        ],
+    )
+    async def test_client_epoch_failure_invalidates(self, message):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client, calls = _make_client([_epoch(5, _NOW)])
+        client._chain_context = ChainContextCache(max_age_seconds=None)
+        client._gas_inventories = {}
+        await client._chain_context.get(client)
+        failed = MagicMock()
+        failed.is_ok.return_value = False
+        failed.result_string = message
+        command = cmd.ExecuteTransaction(tx_bytestr="", sig_array=[])
+        PysuiClient._observe_result(client, command, failed)
+        await client._chain_context.get(client)
+        assert calls["epoch"] == 2
+
+    async def test_checkpoint_stream_notes_epoch(self):
+        from pysui import SuiRpcResult
+        from pysui.sui.sui_grpc.pgrpc_checkpoint_stream import CheckpointStream
+
+        client, _ = _make_client([_epoch(5, _NOW)])
+        client.chain_context = ChainContextCache(max_age_seconds=None)
+        await client.chain_context.get(client)
+
+        async def _stream():
+            summary = sui_prot.CheckpointSummary(epoch=5, end_of_epoch_data=sui_prot.EndOfEpochData())
+            yield sui_prot.SubscribeCheckpointsResponse(
+                cursor=9, checkpoint=sui_prot.Checkpoint(sequence_number=9, summary=summary)
+            )
+
+        client._dispatch_grpc_request = AsyncMock(return_value=SuiRpcResult(True, None, _stream()))
+        async with CheckpointStream(client) as stream:
+            async for item in stream:
+                break
+        assert item.sequence_number == 9
+        assert client.chain_context._stale
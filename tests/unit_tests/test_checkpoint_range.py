@@ -0,0 +1,112 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for fetch_checkpoint_range — all offline.
+
+Covers:
+  - Ordered delivery with bounded concurrency and reorder window
+  - Field mask carried to the gRPC request
+  - Cursor file saved while consuming, on close, and resumed from
+  - Fetch failures raise and leave a resumable cursor
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.pgrpc_clients as pgrpc_clients
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui import SuiRpcResult
+from pysui.sui.sui_common.checkpoint_range import CheckpointCursor, fetch_checkpoint_range
+
+
+class _Client:
+    """Answers GetCheckpointBySequence, later sequence numbers sooner."""
+
+    def __init__(self, fail: set | None = None) -> None:
+        self.fail = fail or set()
+        self.commands: list = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute(self, *, command, timeout=None, headers=None):
+        self.commands.append(command)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (3 - command.sequence_number % 4))
+        finally:
+            self.in_flight -= 1
+        if command.sequence_number in self.fail:
+            return SuiRpcResult(False, "not found")
+        checkpoint = sui_prot.Checkpoint(sequence_number=command.sequence_number)
+        return SuiRpcResult(True, None, sui_prot.GetCheckpointResponse(checkpoint=checkpoint))
+
+
+def test_field_mask_request():
+    request = cmd.GetCheckpointBySequence(sequence_number=7, field_mask=["digest"]).grpc_request()
+    assert request.sequence == 7
+    assert request.field_mask.paths == ["digest"]
+
+
+@pytest.mark.asyncio
+class TestFetchRange:
+    async def test_ordered_and_bounded(self):
+        client = _Client()
+        seen = [
+            (seq, cp.sequence_number)
+            async for seq, cp in fetch_checkpoint_range(client, 10, 50, concurrency=3, reorder_window=6)
+        ]
+        assert seen == [(n, n) for n in range(10, 50)]
+        assert client.peak <= 3
+        assert len(client.commands) == 40
+
+    async def test_client_method(self, monkeypatch):
+        client = pgrpc_clients.GrpcProtocolClient.__new__(pgrpc_clients.GrpcProtocolClient)
+        fake = _Client()
+        monkeypatch.setattr(client, "execute", fake.execute)
+        seqs = [seq async for seq, _ in client.fetch_checkpoint_range(0, 5, field_mask=["digest"])]
+        assert seqs == [0, 1, 2, 3, 4]
+        assert {tuple(c.field_mask) for c in fake.commands} == {("digest",)}
+
+    async def test_validation(self):
+        with pytest.raises(ValueError):
+            async for _ in fetch_checkpoint_range(_Client(), 0, 5, concurrency=4, reorder_window=2):
+                pass
+
+    async def test_cursor_saved_and_resumed(self, tmp_path):
+        path = str(tmp_path / "cursor.json")
+        client = _Client()
+        gen = fetch_checkpoint_range(client, 0, 20, cursor_file=path, save_every=5)
+        async for seq, _ in gen:
+            if seq == 7:
+                break
+        await gen.aclose()
+        # 0..6 were consumed; 7 was handed out but not yet released
+        assert json.load(open(path)) == {"next": 7, "end": 20}
+        resumed = [seq async for seq, _ in fetch_checkpoint_range(_Client(), 0, 20, cursor_file=path)]
+        assert resumed == list(range(7, 20))
+        assert CheckpointCursor(path).load() == 20
+
+    async def test_periodic_save(self, tmp_path):
+        path = str(tmp_path / "cursor.json")
+        gen = fetch_checkpoint_range(_Client(), 0, 20, cursor_file=path, save_every=5)
+        async for seq, _ in gen:
+            if seq == 12:
+                assert CheckpointCursor(path).load() == 10
+                break
+        await gen.aclose()
+
+    async def test_failure_leaves_cursor(self, tmp_path):
+        path = str(tmp_path / "cursor.json")
+        client = _Client(fail={6})
+        seqs = []
+        with pytest.raises(ValueError, match="checkpoint 6"):
+            async for seq, _ in fetch_checkpoint_range(client, 0, 20, cursor_file=path):
+                seqs.append(seq)
+        assert seqs == [0, 1, 2, 3, 4, 5]
+        assert CheckpointCursor(path).load() == 6
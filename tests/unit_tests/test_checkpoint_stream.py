@@ -0,0 +1,186 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for CheckpointStream — all offline against a scripted client.
+
+Covers:
+  - In order delivery from a live subscription
+  - Start cursor and gap backfill with GetCheckpoint, bounded concurrency
+  - Reconnect after a dropped subscription resumes without loss or duplicates
+  - Bounded queue holds the producer back from a slow consumer
+  - Contents decoding and field mask handling, with and without a caller mask
+  - close() ends iteration for a consumer waiting on an empty queue
+  - Failed backfill and reconnect limits end iteration with an error
+"""
+
+import asyncio
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+import pysui.sui.sui_grpc.pgrpc_requests as rn
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui import SuiRpcResult
+from pysui.sui.sui_grpc.pgrpc_checkpoint_stream import CheckpointStream
+
+
+def _response(seq: int) -> sui_prot.SubscribeCheckpointsResponse:
+    return sui_prot.SubscribeCheckpointsResponse(
+        cursor=seq, checkpoint=sui_prot.Checkpoint(sequence_number=seq)
+    )
+
+
+class _Client:
+    """Replays scripted subscriptions and answers GetCheckpoint from a ledger."""
+
+    def __init__(self, *subscriptions, fail_fetch: set | None = None) -> None:
+        # Each subscription is a list of sequence numbers, optionally ending in an exception
+        self.subscriptions = list(subscriptions)
+        self.fail_fetch = fail_fetch or set()
+        self.fetched: list[int] = []
+        self.masks: list = []
+        self.in_flight = 0
+        self.peak = 0
+        self.read = 0
+
+    async def _stream(self, script):
+        for step in script:
+            if isinstance(step, BaseException):
+                raise step
+            self.read += 1
+            yield _response(step)
+
+    async def _dispatch_grpc_request(self, request, **kwargs):
+        if isinstance(request, rn.SubscribeCheckpoint):
+            if not self.subscriptions:
+                await asyncio.Event().wait()
+            script = self.subscriptions.pop(0)
+            if script is None:
+                return SuiRpcResult(False, "refused", ConnectionRefusedError())
+            self.masks.append(request.field_mask.paths if request.field_mask else None)
+            return SuiRpcResult(True, None, self._stream(script))
+        seq = request.sequence
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later checkpoints answer first to exercise reordering
+            await asyncio.sleep(0.001 * (seq % 3))
+        finally:
+            self.in_flight -= 1
+        if seq in self.fail_fetch:
+            return SuiRpcResult(False, "not found")
+        self.fetched.append(seq)
+        return SuiRpcResult(
+            True, None, sui_prot.GetCheckpointResponse(checkpoint=sui_prot.Checkpoint(sequence_number=seq))
+        )
+
+
+async def _take(stream: CheckpointStream, count: int) -> list:
+    items = []
+    async for item in stream:
+        items.append(item)
+        if len(items) == count:
+            break
+    return items
+
+
+def _fast(client, **kwargs) -> CheckpointStream:
+    kwargs.setdefault("reconnect_delay", 0)
+    kwargs.setdefault("max_reconnect_delay", 0)
+    return CheckpointStream(client, **kwargs)
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        CheckpointStream(None, queue_size=0)
+    with pytest.raises(ValueError):
+        CheckpointStream(None, backfill_concurrency=0)
+
+
+@pytest.mark.asyncio
+class TestCheckpointStream:
+    async def test_live_in_order(self):
+        async with _fast(_Client([10, 11, 12])) as stream:
+            items = await _take(stream, 3)
+        assert [i.sequence_number for i in items] == [10, 11, 12]
+        assert not any(i.backfilled for i in items)
+        assert stream.last_sequence == 12
+
+    async def test_start_backfills_to_live(self):
+        client = _Client([30, 31])
+        async with _fast(client, start=5, backfill_concurrency=4) as stream:
+            items = await _take(stream, 27)
+        assert [i.sequence_number for i in items] == list(range(5, 32))
+        assert all(i.backfilled for i in items[:25])
+        assert sorted(client.fetched) == list(range(5, 30))
+        assert client.peak <= 4
+        stats = stream.stats()
+        assert (stats.backfilled, stats.delivered) == (25, 27)
+
+    async def test_reconnect_resumes(self):
+        drop = GRPCError(Status.UNAVAILABLE, "drop")
+        client = _Client([1, 2, 3, drop], None, [2, 3, 7, 8])
+        async with _fast(client) as stream:
+            items = await _take(stream, 8)
+        assert [i.sequence_number for i in items] == list(range(1, 9))
+        assert sorted(client.fetched) == [4, 5, 6]
+        stats = stream.stats()
+        assert stats.reconnects == 2
+        assert stats.duplicates == 2
+
+    async def test_stream_end_reconnects(self):
+        client = _Client([1, 2], [3])
+        async with _fast(client) as stream:
+            items = await _take(stream, 3)
+        assert [i.sequence_number for i in items] == [1, 2, 3]
+        assert stream.stats().reconnects == 1
+
+    async def test_bounded_queue(self):
+        client = _Client(list(range(100)))
+        async with _fast(client, queue_size=4) as stream:
+            await _take(stream, 1)
+            await asyncio.sleep(0.01)
+            # One delivered, four queued and one held by the blocked producer
+            assert client.read <= 6
+            assert stream.stats().queue_depth == 4
+
+    async def test_decode_adds_mask(self, monkeypatch):
+        import pysui.sui.sui_grpc.pgrpc_checkpoint_stream as module
+
+        monkeypatch.setattr(module, "decode_contents", lambda cp: ("decoded", cp.sequence_number))
+        client = _Client([4])
+        async with _fast(client, field_mask=["sequence_number"], decode=True) as stream:
+            (item,) = await _take(stream, 1)
+        assert item.contents == ("decoded", 4)
+        assert client.masks == [["sequence_number", "contents.bcs"]]
+
+    async def test_decode_without_contents(self):
+        client = _Client([4])
+        async with _fast(client, decode=True) as stream:
+            (item,) = await _take(stream, 1)
+        assert item.contents is None
+        assert client.masks == [["sequence_number", "digest", "contents.bcs"]]
+
+    async def test_close_wakes_consumer(self):
+        stream = _fast(_Client([1]))
+        async with stream:
+            consumer = asyncio.ensure_future(_take(stream, 2))
+            await asyncio.sleep(0.01)
+            assert not consumer.done()
+        items = await asyncio.wait_for(consumer, 1)
+        assert [i.sequence_number for i in items] == [1]
+
+    async def test_backfill_failure_raises(self):
+        client = _Client([1, 5], fail_fetch={3})
+        async with _fast(client, fetch_attempts=2) as stream:
+            with pytest.raises(ValueError, match="checkpoint 3"):
+                await _take(stream, 5)
+            assert [i async for i in stream] == []
+
+    async def test_reconnect_limit(self):
+        async with _fast(_Client(None, None, None), max_reconnects=2) as stream:
+            with pytest.raises(ValueError):
+                await _take(stream, 1)
@@ -0,0 +1,154 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for automatic chunking of multi-object commands — all offline.
+
+Covers:
+  - Chunking contract ClassVars on GetMultipleObjects / GetMultipleObjectSummary
+  - Lists at or under chunk_size are executed unchanged
+  - Oversized lists are split, executed concurrently up to chunk_concurrency
+    and merged in input order
+  - First failing chunk result is returned
+  - gRPC and GraphQL clients route execute() through chunking
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui import SuiRpcResult
+from pysui.abstracts.async_client import AsyncClientBase
+
+
+def _oid(n: int) -> str:
+    return "0x" + f"{n:064x}"
+
+
+def _batch(ids):
+    return sui_prot.BatchGetObjectsResponse(
+        objects=[sui_prot.GetObjectResult(object=sui_prot.Object(object_id=i)) for i in ids]
+    )
+
+
+class _ChunkingClient(AsyncClientBase):
+    """Concrete client whose backend answers each request with its ids."""
+
+    _protocol: str = "grpc"
+
+    def __init__(self, fail_on: int | None = None):
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._fail_on = fail_on
+
+    async def transaction(self, **kwargs):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def execute(self, *, command, timeout=None, headers=None):
+        chunked = await self._execute_chunked(command, timeout=timeout, headers=headers)
+        if chunked is not None:
+            return chunked
+        self.calls.append(list(command.object_ids))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        # Later chunks finish first to prove merge order is input order
+        await asyncio.sleep(0.001 * (10 - len(self.calls)))
+        self.in_flight -= 1
+        if self._fail_on is not None and _oid(self._fail_on) in command.object_ids:
+            return SuiRpcResult(False, "boom", None)
+        return SuiRpcResult(True, "", _batch(command.object_ids))
+
+
+class TestContract:
+    def test_multi_object_commands_are_chunked(self):
+        for klass in (cmd.GetMultipleObjects, cmd.GetMultipleObjectSummary):
+            assert klass.chunked_field == "object_ids"
+            assert klass.chunk_size == 50
+            assert klass.chunked_result_path == ("objects",)
+
+    def test_other_commands_are_not(self):
+        assert cmd.GetObject.chunked_field is None
+
+
+@pytest.mark.asyncio
+class TestExecuteChunked:
+    async def test_small_list_not_split(self):
+        client = _ChunkingClient()
+        ids = [_oid(n) for n in range(50)]
+        result = await client.execute(command=cmd.GetMultipleObjects(object_ids=ids))
+        assert result.is_ok()
+        assert client.calls == [ids]
+
+    async def test_split_and_merged_in_input_order(self):
+        client = _ChunkingClient()
+        ids = [_oid(n) for n in reversed(range(175))]
+        command = cmd.GetMultipleObjects(object_ids=ids)
+        result = await client.execute(command=command)
+        assert result.is_ok()
+        assert sorted(len(c) for c in client.calls) == [25, 50, 50, 50]
+        assert [e.object.object_id for e in result.result_data.objects] == ids
+        assert command.object_ids == ids
+
+    async def test_concurrency_bounded(self):
+        client = _ChunkingClient()
+        client.chunk_concurrency = 2
+        ids = [_oid(n) for n in range(400)]
+        result = await client.execute(command=cmd.GetMultipleObjectSummary(object_ids=ids))
+        assert result.is_ok()
+        assert len(client.calls) == 8
+        assert client.peak == 2
+
+    async def test_failure_returned(self):
+        client = _ChunkingClient(fail_on=120)
+        ids = [_oid(n) for n in range(200)]
+        result = await client.execute(command=cmd.GetMultipleObjects(object_ids=ids))
+        assert not result.is_ok()
+        assert result.result_string == "boom"
+
+
+@pytest.mark.asyncio
+class TestProtocolClients:
+    async def test_grpc_execute_chunks(self):
+        from pysui.sui.sui_grpc.pgrpc_clients import GrpcProtocolClient
+
+        client = GrpcProtocolClient.__new__(GrpcProtocolClient)
+        client._gas_inventories = {}
+
+        async def _dispatch(request, **kwargs):
+            return SuiRpcResult(
+                True, "", _batch([r.object_id for r in request.objects])
+            )
+
+        client._dispatch_grpc_request = AsyncMock(side_effect=_dispatch)
+        ids = [_oid(n) for n in range(120)]
+        result = await client.execute(command=cmd.GetMultipleObjects(object_ids=ids))
+        assert [e.object.object_id for e in result.result_data.objects] == ids
+        assert client._dispatch_grpc_request.await_count == 3
+
+    async def test_gql_execute_chunks(self):
+        from pysui.sui.sui_pgql.pgql_clients import GqlProtocolClient
+
+        client = GqlProtocolClient.__new__(GqlProtocolClient)
+        client._gas_inventories = {}
+        seen = []
+
+        async def _run(node, **kwargs):
+            seen.append(node)
+            return SuiRpcResult(True, "", _batch(node.object_ids))
+
+        client._execute_gql_node = AsyncMock(side_effect=_run)
+        ids = [_oid(n) for n in range(60)]
+        result = await client.execute(command=cmd.GetMultipleObjects(object_ids=ids))
+        assert [e.object.object_id for e in result.result_data.objects] == ids
+        assert [len(n.object_ids) for n in seen] == [50, 10]
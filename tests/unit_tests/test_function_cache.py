@@ -0,0 +1,168 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for MoveFunctionCache — all offline, no live node.
+
+Covers:
+  - Target normalization (short and long package addresses share a key)
+  - Hit/miss counters and stats
+  - Concurrent misses on one target coalesce into a single fetch
+  - Failed fetches are not cached
+  - LRU bound and TTL expiry
+  - Target and package invalidation
+  - prewarm and client-scoped sharing through AsyncSuiTransaction
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysui.sui.sui_common.function_cache import (
+    MoveFunctionCache,
+    fetch_function_signature,
+    normalize_target,
+)
+
+_SHORT = "0x2::coin::split"
+_LONG = "0x" + "0" * 63 + "2::coin::split"
+_PKG = "0x" + "0" * 63 + "2"
+
+
+def _counting_fetch(delay: float = 0.0):
+    calls: list[tuple] = []
+
+    async def _fetch(key):
+        calls.append(key)
+        if delay:
+            await asyncio.sleep(delay)
+        return ("sig",) + key
+
+    return _fetch, calls
+
+
+class TestNormalize:
+    def test_short_and_long_addresses_match(self):
+        assert normalize_target(_SHORT) == normalize_target(_LONG)
+        assert normalize_target(_SHORT) == (_PKG, "coin", "split")
+
+    def test_bad_triplet_raises(self):
+        with pytest.raises(ValueError):
+            normalize_target("0x2::coin")
+
+
+@pytest.mark.asyncio
+class TestLookup:
+    async def test_hit_and_miss_counters(self):
+        cache = MoveFunctionCache()
+        fetch, calls = _counting_fetch()
+        first = await cache.get_or_fetch(_SHORT, fetch)
+        second = await cache.get_or_fetch(_LONG, fetch)
+        assert first == second
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    async def test_concurrent_misses_coalesce(self):
+        cache = MoveFunctionCache()
+        fetch, calls = _counting_fetch(delay=0.01)
+        results = await asyncio.gather(
+            *[cache.get_or_fetch(_SHORT, fetch) for _ in range(10)]
+        )
+        assert len(calls) == 1
+        assert len(set(results)) == 1
+        assert cache.misses == 1
+
+    async def test_failed_fetch_not_cached(self):
+        cache = MoveFunctionCache()
+
+        async def _boom(key):
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_fetch(_SHORT, _boom)
+        assert cache.size() == 0
+        fetch, calls = _counting_fetch()
+        await cache.get_or_fetch(_SHORT, fetch)
+        assert len(calls) == 1
+
+    async def test_lru_eviction(self):
+        cache = MoveFunctionCache(maxsize=2)
+        fetch, _ = _counting_fetch()
+        await cache.get_or_fetch("0x2::coin::split", fetch)
+        await cache.get_or_fetch("0x2::coin::join", fetch)
+        await cache.get_or_fetch("0x2::coin::split", fetch)
+        await cache.get_or_fetch("0x2::coin::zero", fetch)
+        assert cache.peek("0x2::coin::join") is None
+        assert cache.peek("0x2::coin::split") is not None
+        assert cache.stats().evictions == 1
+
+    async def test_ttl_expiry(self):
+        cache = MoveFunctionCache(ttl_seconds=0.01)
+        fetch, calls = _counting_fetch()
+        await cache.get_or_fetch(_SHORT, fetch)
+        await asyncio.sleep(0.02)
+        await cache.get_or_fetch(_SHORT, fetch)
+        assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+class TestInvalidation:
+    async def test_invalidate_package(self):
+        cache = MoveFunctionCache()
+        fetch, _ = _counting_fetch()
+        await cache.get_or_fetch("0x2::coin::split", fetch)
+        await cache.get_or_fetch("0x2::coin::join", fetch)
+        await cache.get_or_fetch("0x3::sui_system::request_add_stake", fetch)
+        assert cache.invalidate_package("0x2") == 2
+        assert cache.size() == 1
+
+    async def test_invalidate_target_refetches(self):
+        cache = MoveFunctionCache()
+        fetch, calls = _counting_fetch()
+        await cache.get_or_fetch(_SHORT, fetch)
+        cache.invalidate(_SHORT)
+        await cache.get_or_fetch(_SHORT, fetch)
+        assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+class TestClientIntegration:
+    async def test_fetch_unresolvable_raises(self):
+        client = MagicMock()
+        result = MagicMock()
+        result.is_ok.return_value = False
+        client.execute = AsyncMock(return_value=result)
+        with pytest.raises(ValueError, match="Unresolvable"):
+            await fetch_function_signature(client, normalize_target(_SHORT))
+
+    async def test_prewarm_fetches_concurrently(self, monkeypatch):
+        import pysui.sui.sui_common.function_cache as fc
+
+        fetch, calls = _counting_fetch(delay=0.01)
+        monkeypatch.setattr(
+            fc, "fetch_function_signature", lambda client, key: fetch(key)
+        )
+        cache = MoveFunctionCache()
+        stats = await cache.prewarm(
+            MagicMock(), ["0x2::coin::split", "0x2::coin::join", _LONG]
+        )
+        assert len(calls) == 2
+        assert stats.size == 2
+
+    async def test_transactions_share_client_cache(self):
+        from pysui.sui.sui_common.async_txn import AsyncSuiTransaction
+
+        client = MagicMock()
+        client.function_cache = MoveFunctionCache()
+        fetch, calls = _counting_fetch()
+        await client.function_cache.get_or_fetch(_SHORT, fetch)
+
+        txn = AsyncSuiTransaction.__new__(AsyncSuiTransaction)
+        txn.client = client
+        assert await txn._function_meta_args(_LONG) == ("sig", _PKG, "coin", "split")
+        assert client.function_cache.hits == 1
+        assert len(calls) == 1
@@ -0,0 +1,209 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for GasBudgetEstimator — all offline, no network required.
+
+Covers:
+    - PTB shape fingerprint ignores pure values and object ids
+    - Fingerprint distinguishes command wiring, shared mutability and Move targets
+    - Miss simulates, hit reuses with safety margin, gas price scopes entries
+    - note_insufficient_gas forces re-simulation
+    - Hits and misses reported via InstrumentationCollector.record
+    - async_get_gas_data routes simulation through the client's estimator
+    - _BaseCachingExecutor.note_insufficient_gas decodes signed transactions
+"""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_bcs import bcs
+from pysui.sui.sui_common.instrumentation import InstrumentationCollector, active_collector
+from pysui.sui.sui_common.txn_gas import GasBudgetEstimator, async_get_gas_data
+
+_ADDR = "0x" + "a1" * 32
+_OBJ1 = "0x" + "01" * 32
+_OBJ2 = "0x" + "02" * 32
+
+
+def _pure(value: int) -> bcs.CallArg:
+    return bcs.CallArg("Pure", list(value.to_bytes(8, "little")))
+
+
+def _shared(oid: str, mutable: bool) -> bcs.CallArg:
+    return bcs.CallArg(
+        "Object",
+        bcs.ObjectArg(
+            "SharedObject",
+            bcs.SharedObjectReference(bcs.Address.from_str(oid), 1, mutable),
+        ),
+    )
+
+
+def _split_transfer(amount: int, recipient_input: int = 1) -> bcs.TransactionKind:
+    """split(gas, [amount]) then transfer result to recipient."""
+    commands = [
+        bcs.Command(
+            "SplitCoin",
+            bcs.SplitCoin(bcs.Argument("GasCoin"), [bcs.Argument("Input", 0)]),
+        ),
+        bcs.Command(
+            "TransferObjects",
+            bcs.TransferObjects(
+                [bcs.Argument("Result", 0)], bcs.Argument("Input", recipient_input)
+            ),
+        ),
+    ]
+    inputs = [_pure(amount), bcs.CallArg("Pure", list(bcs.Address.from_str(_ADDR).serialize()))]
+    return bcs.TransactionKind(
+        "ProgrammableTransaction", bcs.ProgrammableTransaction(inputs, commands)
+    )
+
+
+def _move_call(function: str, shared: bcs.CallArg) -> bcs.TransactionKind:
+    call = bcs.ProgrammableMoveCall(
+        bcs.Address.from_str("0x2"), "counter", function, [], [bcs.Argument("Input", 0)]
+    )
+    return bcs.TransactionKind(
+        "ProgrammableTransaction",
+        bcs.ProgrammableTransaction([shared], [bcs.Command("MoveCall", call)]),
+    )
+
+
+class _RecordingCollector(InstrumentationCollector):
+    def __init__(self):
+        self.samples: list[tuple[str, float]] = []
+
+    def record(self, label, value):
+        self.samples.append((label, value))
+
+
+class TestFingerprint:
+    def test_pure_values_do_not_change_shape(self):
+        assert GasBudgetEstimator.fingerprint(
+            _split_transfer(10)
+        ) == GasBudgetEstimator.fingerprint(_split_transfer(99_999))
+
+    def test_argument_wiring_changes_shape(self):
+        assert GasBudgetEstimator.fingerprint(
+            _split_transfer(10, 1)
+        ) != GasBudgetEstimator.fingerprint(_split_transfer(10, 0))
+
+    def test_object_ids_ignored_mutability_kept(self):
+        fp = GasBudgetEstimator.fingerprint
+        assert fp(_move_call("inc", _shared(_OBJ1, True))) == fp(
+            _move_call("inc", _shared(_OBJ2, True))
+        )
+        assert fp(_move_call("inc", _shared(_OBJ1, True))) != fp(
+            _move_call("inc", _shared(_OBJ1, False))
+        )
+
+    def test_move_target_changes_shape(self):
+        fp = GasBudgetEstimator.fingerprint
+        assert fp(_move_call("inc", _shared(_OBJ1, True))) != fp(
+            _move_call("dec", _shared(_OBJ1, True))
+        )
+
+    def test_non_programmable_has_no_shape(self):
+        assert GasBudgetEstimator.fingerprint(bcs.TransactionKind("Genesis", None)) is None
+
+    def test_negative_margin_rejected(self):
+        with pytest.raises(ValueError):
+            GasBudgetEstimator(safety_margin=-0.1)
+
+
+@pytest.mark.asyncio
+class TestEstimate:
+    async def test_miss_then_hit_with_margin(self):
+        est = GasBudgetEstimator(safety_margin=0.2)
+        simulate = AsyncMock(return_value=1_000_000)
+        assert await est.estimate(_split_transfer(1), 1000, simulate) == 1_000_000
+        assert await est.estimate(_split_transfer(2), 1000, simulate) == 1_200_000
+        simulate.assert_awaited_once()
+        assert (est.hits, est.misses, est.hit_rate) == (1, 1, 0.5)
+
+    async def test_gas_price_scopes_entries(self):
+        est = GasBudgetEstimator()
+        simulate = AsyncMock(return_value=500)
+        await est.estimate(_split_transfer(1), 1000, simulate)
+        await est.estimate(_split_transfer(1), 750, simulate)
+        assert simulate.await_count == 2
+
+    async def test_insufficient_gas_forces_simulation(self):
+        est = GasBudgetEstimator()
+        simulate = AsyncMock(return_value=500)
+        await est.estimate(_split_transfer(1), 1000, simulate)
+        est.note_insufficient_gas(_split_transfer(7))
+        await est.estimate(_split_transfer(1), 1000, simulate)
+        assert simulate.await_count == 2
+
+    async def test_lru_bound(self):
+        est = GasBudgetEstimator(maxsize=1)
+        simulate = AsyncMock(return_value=500)
+        await est.estimate(_split_transfer(1, 1), 1000, simulate)
+        await est.estimate(_split_transfer(1, 0), 1000, simulate)
+        await est.estimate(_split_transfer(1, 1), 1000, simulate)
+        assert simulate.await_count == 3
+
+    async def test_hits_reported_to_collector(self):
+        est = GasBudgetEstimator()
+        simulate = AsyncMock(return_value=500)
+        collector = _RecordingCollector()
+        async with active_collector(collector):
+            await est.estimate(_split_transfer(1), 1000, simulate)
+            await est.estimate(_split_transfer(1), 1000, simulate)
+        assert collector.samples == [
+            ("gas.budget_estimator.miss", 1),
+            ("gas.budget_estimator.hit", 1),
+        ]
+
+
+@pytest.mark.asyncio
+class TestIntegration:
+    async def test_async_get_gas_data_uses_estimator(self):
+        client = MagicMock()
+        client.budget_estimator = GasBudgetEstimator(safety_margin=0)
+        client.budget_estimator.update(_split_transfer(1), 1000, 4_000)
+        signing = MagicMock()
+        signing.payer_address = _ADDR
+        coin = sui_prot.Object(
+            object_id=_OBJ1, version=3, digest="1" * 32, balance=10_000
+        )
+        gas = await async_get_gas_data(
+            signing=signing,
+            client=client,
+            use_coins=[coin],
+            objects_in_use=set(),
+            active_gas_price=1000,
+            tx_kind=_split_transfer(5),
+        )
+        assert gas.Budget == 4_000
+        client.execute.assert_not_called()
+
+
+class TestExecutorIntegration:
+    def test_executor_note_insufficient_gas(self):
+        from pysui.sui.sui_common.executors.base_caching_executor import (
+            _BaseCachingExecutor,
+        )
+
+        client = MagicMock()
+        client.budget_estimator = GasBudgetEstimator()
+        kind = _split_transfer(1)
+        client.budget_estimator.update(kind, 1000, 4_000)
+        tx_data = bcs.TransactionData(
+            "V1",
+            bcs.TransactionDataV1(
+                kind,
+                bcs.Address.from_str(_ADDR),
+                bcs.GasData([], bcs.Address.from_str(_ADDR), 1000, 4_000),
+                bcs.TransactionExpiration("None"),
+            ),
+        )
+        signed = {"tx_bytestr": base64.b64encode(tx_data.serialize()).decode()}
+        _BaseCachingExecutor(client=client).note_insufficient_gas(signed)
+        assert client.budget_estimator.lookup(kind, 1000) is None
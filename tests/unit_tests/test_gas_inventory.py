@@ -0,0 +1,320 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for GasCoinInventory and targeted gas coin lookup — all offline.
+
+Covers:
+  - is_sui_coin_type accepts short and long framework addresses
+  - fetch_objects_by_id keeps input order and omits missing ids
+  - Inventory seeds once, then serves from memory
+  - apply_executed updates mutated coins, drops deleted/transferred coins and
+    refetches coins whose balance is unknown
+  - async_get_gas_data: string ids use GetMultipleObjects, auto-select uses the
+    inventory and reseeds once when it can not fund the budget
+  - Client records executed transactions into its inventories and invalidates
+    the payer's inventory after a stale or missing object failure
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import base64
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_bcs import bcs
+from pysui.sui.sui_common.gas_inventory import (
+    GasCoinInventory,
+    fetch_objects_by_id,
+    gas_payer,
+    is_stale_object_error,
+    is_sui_coin_type,
+)
+from pysui.sui.sui_common.txn_gas import async_get_gas_data
+
+_OWNER = "0x" + "ab" * 32
+_OTHER = "0x" + "cd" * 32
+_DIGEST = "1" * 32
+_COIN_T = "0x2::coin::Coin<0x2::sui::SUI>"
+
+
+def _oid(n: int) -> str:
+    return "0x" + f"{n:064x}"
+
+
+def _owner(addr: str = _OWNER) -> sui_prot.Owner:
+    return sui_prot.Owner(kind=sui_prot.OwnerOwnerKind.ADDRESS, address=addr)
+
+
+def _coin(n: int, balance: int = 1_000, version: int = 1) -> sui_prot.Object:
+    return sui_prot.Object(
+        object_id=_oid(n),
+        version=version,
+        digest=_DIGEST,
+        balance=balance,
+        owner=_owner(),
+        object_type=_COIN_T,
+    )
+
+
+def _ok(data):
+    res = MagicMock()
+    res.is_ok.return_value = True
+    res.result_data = data
+    return res
+
+
+def _batch(objs):
+    return sui_prot.BatchGetObjectsResponse(
+        objects=[sui_prot.GetObjectResult(object=o) for o in objs]
+    )
+
+
+def _make_client(listed: list, by_id: dict | None = None):
+    """Client listing `listed` for GetGas and answering GetMultipleObjects from by_id."""
+    by_id = by_id or {}
+    client = MagicMock()
+    client.execute_for_all = AsyncMock(
+        return_value=_ok(sui_prot.ListOwnedObjectsResponse(objects=listed))
+    )
+
+    async def _execute(*, command, timeout=None):
+        assert isinstance(command, cmd.GetMultipleObjects)
+        return _ok(_batch([by_id[i] for i in command.object_ids if i in by_id]))
+
+    client.execute = AsyncMock(side_effect=_execute)
+    return client
+
+
+def _changed(n, *, state=sui_prot.ChangedObjectOutputObjectState.OBJECT_WRITE,
+             owner=_OWNER, version=2, object_type=_COIN_T):
+    return sui_prot.ChangedObject(
+        object_id=_oid(n),
+        output_state=state,
+        output_version=version,
+        output_digest=_DIGEST,
+        output_owner=_owner(owner),
+        object_type=object_type,
+    )
+
+
+def _executed(changed, outputs=()):
+    return sui_prot.ExecutedTransaction(
+        effects=sui_prot.TransactionEffects(changed_objects=list(changed)),
+        objects=sui_prot.ObjectSet(objects=list(outputs)) if outputs else None,
+    )
+
+
+class TestCoinType:
+    def test_short_and_long_forms(self):
+        long_t = "0x" + "0" * 63 + "2::coin::Coin<0x" + "0" * 63 + "2::sui::SUI>"
+        assert is_sui_coin_type(_COIN_T)
+        assert is_sui_coin_type(long_t)
+        assert not is_sui_coin_type("0x2::coin::Coin<0x5::usdc::USDC>")
+        assert not is_sui_coin_type(None)
+
+
+@pytest.mark.asyncio
+class TestFetchById:
+    async def test_keeps_input_order(self):
+        objs = {_oid(n): _coin(n) for n in range(120)}
+        client = _make_client([], objs)
+        wanted = [_oid(n) for n in reversed(range(120))] + [_oid(999)]
+        found = await fetch_objects_by_id(client, wanted)
+        assert [o.object_id for o in found] == wanted[:-1]
+        client.execute.assert_awaited_once()
+
+    async def test_empty(self):
+        client = _make_client([])
+        assert await fetch_objects_by_id(client, []) == []
+        client.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestInventory:
+    async def test_seeds_once(self):
+        client = _make_client([_coin(1), _coin(2)])
+        inv = GasCoinInventory(_OWNER)
+        assert len(await inv.coins(client)) == 2
+        assert len(await inv.coins(client)) == 2
+        client.execute_for_all.assert_awaited_once()
+
+    async def test_apply_executed_with_output_balance(self):
+        client = _make_client([_coin(1, 1_000), _coin(2)])
+        inv = GasCoinInventory(_OWNER)
+        await inv.coins(client)
+        out = sui_prot.Object(object_id=_oid(1), version=2, balance=900)
+        inv.apply_executed(_executed([_changed(1)], [out]))
+        coins = {c.object_id: c for c in await inv.coins(client)}
+        assert (coins[_oid(1)].version, coins[_oid(1)].balance) == (2, 900)
+        client.execute.assert_not_called()
+
+    async def test_deleted_and_transferred_dropped(self):
+        client = _make_client([_coin(1), _coin(2), _coin(3)])
+        inv = GasCoinInventory(_OWNER)
+        await inv.coins(client)
+        inv.apply_executed(
+            _executed(
+                [
+                    _changed(1, state=sui_prot.ChangedObjectOutputObjectState.DOES_NOT_EXIST),
+                    _changed(2, owner=_OTHER),
+                ]
+            )
+        )
+        assert [c.object_id for c in await inv.coins(client)] == [_oid(3)]
+
+    async def test_unknown_balance_and_new_coins_refetched(self):
+        client = _make_client(
+            [_coin(1)], {_oid(1): _coin(1, 700, 2), _oid(5): _coin(5, 50, 2)}
+        )
+        inv = GasCoinInventory(_OWNER)
+        await inv.coins(client)
+        inv.apply_executed(
+            _executed(
+                [
+                    _changed(1),
+                    _changed(5),
+                    _changed(6, object_type="0x2::example::Thing"),
+                ]
+            )
+        )
+        coins = {c.object_id: c.balance for c in await inv.coins(client)}
+        assert coins == {_oid(1): 700, _oid(5): 50}
+        client.execute.assert_awaited_once()
+
+    async def test_unseeded_ignores_effects(self):
+        inv = GasCoinInventory(_OWNER)
+        inv.apply_executed(_executed([_changed(1)]))
+        assert not inv.seeded
+
+
+def _signing():
+    signing = MagicMock()
+    signing.payer_address = _OWNER
+    return signing
+
+
+@pytest.mark.asyncio
+class TestGasData:
+    async def test_string_ids_fetch_only_requested(self):
+        client = _make_client([], {_oid(1): _coin(1), _oid(2): _coin(2)})
+        client.gas_inventory = None
+        gas = await async_get_gas_data(
+            signing=_signing(),
+            client=client,
+            budget=500,
+            use_coins=[_oid(2)],
+            objects_in_use=set(),
+            active_gas_price=1000,
+            tx_kind=MagicMock(),
+        )
+        assert [p.ObjectID.to_address_str() for p in gas.Payment] == [_oid(2)]
+        client.execute_for_all.assert_not_called()
+
+    async def test_auto_select_uses_inventory(self):
+        client = _make_client([_coin(1, 5_000)])
+        inv = GasCoinInventory(_OWNER)
+        client.gas_inventory = MagicMock(return_value=inv)
+        for _ in range(3):
+            await async_get_gas_data(
+                signing=_signing(),
+                client=client,
+                budget=500,
+                objects_in_use=set(),
+                active_gas_price=1000,
+                tx_kind=MagicMock(),
+            )
+        client.execute_for_all.assert_awaited_once()
+
+    async def test_insufficient_inventory_reseeds_once(self):
+        client = _make_client([_coin(1, 100)])
+        inv = GasCoinInventory(_OWNER)
+        client.gas_inventory = MagicMock(return_value=inv)
+        await inv.coins(client)
+        client.execute_for_all.return_value = _ok(
+            sui_prot.ListOwnedObjectsResponse(objects=[_coin(1, 100), _coin(2, 9_000)])
+        )
+        gas = await async_get_gas_data(
+            signing=_signing(),
+            client=client,
+            budget=500,
+            objects_in_use=set(),
+            active_gas_price=1000,
+            tx_kind=MagicMock(),
+        )
+        assert [p.ObjectID.to_address_str() for p in gas.Payment] == [_oid(2)]
+        assert client.execute_for_all.await_count == 2
+
+
+class TestClientObserve:
+    def test_execute_result_applied_to_inventories(self):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client = MagicMock()
+        client._gas_inventories = {_OWNER: MagicMock()}
+        executed = _executed([_changed(1)])
+        PysuiClient._observe_result(
+            client, cmd.ExecuteTransaction(tx_bytestr="", sig_array=[]), _ok(executed)
+        )
+        client._gas_inventories[_OWNER].apply_executed.assert_called_once_with(executed)
+
+    def _failed(self, message: str):
+        res = MagicMock()
+        res.is_ok.return_value = False
+        res.result_string = message
+        return res
+
+    def _tx_bytes(self, payer: str) -> str:
+        tx_data = bcs.TransactionData(
+            "V1",
+            bcs.TransactionDataV1(
+                bcs.TransactionKind("ProgrammableTransaction", bcs.ProgrammableTransaction([], [])),
+                bcs.Address.from_str(payer),
+                bcs.GasData([], bcs.Address.from_str(payer), 1_000, 10),
+                bcs.TransactionExpiration("None", None),
+            ),
+        )
+        return base64.b64encode(tx_data.serialize()).decode()
+
+    def test_stale_object_failure_invalidates_payer(self):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client = MagicMock()
+        client._gas_inventories = {_OWNER: MagicMock(), _OTHER: MagicMock()}
+        command = cmd.ExecuteTransaction(tx_bytestr=self._tx_bytes(_OWNER), sig_array=[])
+        assert gas_payer(command.tx_bytestr) == _OWNER
+        PysuiClient._observe_result(
+            client,
+            command,
+            self._failed(f"Object {_oid(1)} is not available for consumption, current version: 9"),
+        )
+        client._gas_inventories[_OWNER].invalidate.assert_called_once()
+        client._gas_inventories[_OTHER].invalidate.assert_not_called()
+
+    def test_other_failures_keep_inventory(self):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client = MagicMock()
+        client._gas_inventories = {_OWNER: MagicMock()}
+        command = cmd.ExecuteTransaction(tx_bytestr=self._tx_bytes(_OWNER), sig_array=[])
+        PysuiClient._observe_result(client, command, self._failed("MoveAbort in 0x2::coin"))
+        client._gas_inventories[_OWNER].invalidate.assert_not_called()
+
+    def test_undecodable_payer_invalidates_all(self):
+        from pysui.sui.sui_common.client import PysuiClient
+
+        client = MagicMock()
+        client._gas_inventories = {_OWNER: MagicMock(), _OTHER: MagicMock()}
+        PysuiClient._observe_result(
+            client, cmd.ExecuteTransaction(tx_bytestr="", sig_array=[]), self._failed("ObjectNotFound")
+        )
+        assert all(i.invalidate.called for i in client._gas_inventories.values())
+
+    def test_stale_object_messages(self):
+        assert is_stale_object_error("Could not find the referenced object 0x1 at version 3")
+        assert is_stale_object_error("ObjectVersionUnavailableForConsumption")
+        assert not is_stale_object_error("InsufficientGas")
+        assert not is_stale_object_error(None)
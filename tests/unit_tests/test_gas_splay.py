@@ -0,0 +1,282 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Tests for parallel executor gas coin splay and merge.
+
+Covers:
+- GasCoinPool circulation count, is_low and retired coins
+- splay_gas_coin count capping and coin extraction from effects
+- merge_gas_coins version re-read, owner filtering and merge
+- executor startup splay and background re-splay/merge
+- a failed merge or splay keeps the retired (or merged) coins for the next cycle
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.executors import ExecutorOptions, GasCoin, GasCoinPool, GasMode, ParallelExecutor
+from pysui.sui.sui_common.executors.gas_utils import (
+    _SPLAY_GAS_OVERHEAD,
+    _SUI_COIN_TYPE,
+    merge_gas_coins,
+    splay_gas_coin,
+)
+
+_SENDER = "0x" + "5e" * 32
+_BASE = "pysui.sui.sui_common.executors.base_parallel_executor"
+
+
+def _coin(n: int, balance: int = 1_000_000_000) -> GasCoin:
+    return GasCoin(object_id=f"0x{n:064x}", version="1", digest=f"d{n}", balance=balance)
+
+
+def _ok(data):
+    result = MagicMock()
+    result.is_ok.return_value = True
+    result.result_data = data
+    return result
+
+
+def _effects(created: list[str], gas_cost: int = 1_000):
+    effects = MagicMock()
+    effects.lamport_version = 9
+    effects.gas_used = MagicMock(computation_cost=gas_cost, storage_cost=0, storage_rebate=0)
+    effects.gas_object = MagicMock(output_version=9, output_digest="gas-after")
+    changed = []
+    for oid in created:
+        ch = MagicMock()
+        ch.object_id = oid
+        ch.input_state = sui_prot.ChangedObjectInputObjectState.DOES_NOT_EXIST
+        ch.output_state = sui_prot.ChangedObjectOutputObjectState.OBJECT_WRITE
+        ch.output_version = 9
+        ch.output_digest = f"new-{oid}"
+        changed.append(ch)
+    effects.changed_objects = changed
+    return effects
+
+
+def _new_tx_fn():
+    tx = MagicMock()
+    tx.split_coin = AsyncMock(side_effect=lambda coin, amounts: [MagicMock() for _ in amounts])
+    tx.transfer_objects = AsyncMock()
+    tx.merge_coins = AsyncMock()
+    tx.build_and_sign = AsyncMock(return_value={"tx_bytestr": "abc", "sig_array": ["sig"]})
+    return tx, AsyncMock(return_value=tx)
+
+
+@pytest.mark.asyncio
+class TestGasCoinPoolCirculation:
+    """Checked out and retired coin accounting."""
+
+    async def test_managed_counts_checked_out(self):
+        pool = GasCoinPool(low_water_mark=1)
+        await pool.replenish([_coin(1), _coin(2)])
+        pool.try_checkout()
+        assert pool.size() == 1 and pool.managed() == 2
+        assert not pool.is_low()
+
+    async def test_retired_coins_are_kept_and_taken_once(self):
+        pool = GasCoinPool(min_balance_per_coin=100, low_water_mark=1)
+        await pool.replenish([_coin(1), _coin(2, balance=10)])
+        first, second = pool.try_checkout(min_balance=100), pool.try_checkout()
+        await pool.checkin(first, retire=True)
+        await pool.checkin(second)
+        assert pool.managed() == 0 and pool.is_low()
+        assert [c.object_id for c in pool.take_retired()] == [first.object_id, second.object_id]
+        assert pool.take_retired() == []
+
+
+@pytest.mark.asyncio
+class TestSplayGasCoin:
+    """splay_gas_coin transaction and result."""
+
+    async def test_splits_and_returns_new_coins(self):
+        tx, new_tx = _new_tx_fn()
+        client = MagicMock()
+        created = ["0xa1", "0xa2", "0xa3"]
+        client.execute = AsyncMock(return_value=_ok(MagicMock(effects=_effects(created))))
+        coins, effects = await splay_gas_coin(client, _SENDER, _coin(1), 3, 100_000_000, new_tx)
+        assert tx.split_coin.await_args.kwargs["amounts"] == [100_000_000] * 3
+        assert tx.transfer_objects.await_args.kwargs["recipient"] == _SENDER
+        source = coins[0]
+        assert (source.version, source.digest) == ("9", "gas-after")
+        assert source.balance == 1_000_000_000 - 300_000_000 - 1_000
+        assert [c.object_id for c in coins[1:]] == created
+        assert all(c.balance == 100_000_000 and c.version == "9" for c in coins[1:])
+
+    async def test_count_capped_by_source_balance(self):
+        tx, new_tx = _new_tx_fn()
+        client = MagicMock()
+        client.execute = AsyncMock(return_value=_ok(MagicMock(effects=_effects(["0xa1"]))))
+        balance = 3 * 100_000_000 + _SPLAY_GAS_OVERHEAD
+        await splay_gas_coin(client, _SENDER, _coin(1, balance), 10, 100_000_000, new_tx)
+        assert len(tx.split_coin.await_args.kwargs["amounts"]) == 2
+
+    async def test_source_too_small_is_returned_untouched(self):
+        _, new_tx = _new_tx_fn()
+        client = MagicMock()
+        client.execute = AsyncMock()
+        source = _coin(1, 150_000_000)
+        coins, effects = await splay_gas_coin(client, _SENDER, source, 4, 100_000_000, new_tx)
+        assert coins == [source] and effects is None
+        client.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestMergeGasCoins:
+    """merge_gas_coins re-read and merge."""
+
+    def _obj(self, n: int, balance: int, owner: str = _SENDER):
+        return MagicMock(
+            object_id=f"0x{n:064x}",
+            version=4,
+            digest=f"d{n}",
+            balance=balance,
+            object_type=_SUI_COIN_TYPE,
+            owner=MagicMock(address=owner),
+        )
+
+    async def test_single_live_coin_needs_no_transaction(self):
+        _, new_tx = _new_tx_fn()
+        client = MagicMock()
+        client.execute = AsyncMock(
+            return_value=_ok([self._obj(1, 50), self._obj(2, 90, owner="0xother")])
+        )
+        coin, effects = await merge_gas_coins(client, _SENDER, ["0x1", "0x2"], new_tx)
+        assert coin.object_id == f"0x{1:064x}" and coin.version == "4"
+        assert effects is None
+        new_tx.assert_not_called()
+
+    async def test_merges_into_richest(self):
+        tx, new_tx = _new_tx_fn()
+        client = MagicMock()
+        client.execute = AsyncMock(
+            side_effect=[
+                _ok([self._obj(1, 50_000), self._obj(2, 90_000), self._obj(3, 10_000)]),
+                _ok(MagicMock(effects=_effects([]))),
+            ]
+        )
+        coin, effects = await merge_gas_coins(client, _SENDER, ["0x1", "0x2", "0x3"], new_tx)
+        assert coin.object_id == f"0x{2:064x}"
+        assert coin.balance == 150_000 - 1_000
+        assert tx.merge_coins.await_args.kwargs["merge_from"] == [f"0x{1:064x}", f"0x{3:064x}"]
+
+    async def test_nothing_left(self):
+        _, new_tx = _new_tx_fn()
+        client = MagicMock()
+        client.execute = AsyncMock(return_value=_ok([]))
+        assert await merge_gas_coins(client, _SENDER, ["0x1"], new_tx) == (None, None)
+
+
+@pytest.mark.asyncio
+class TestExecutorSplay:
+    """Parallel executor startup splay and background maintenance."""
+
+    def _executor(self, **kwargs) -> ParallelExecutor:
+        options = ExecutorOptions(
+            sender=_SENDER,
+            gas_mode=GasMode.COINS,
+            initial_coins=[],
+            min_threshold_balance=0,
+            max_concurrent=4,
+            **kwargs,
+        )
+        return ParallelExecutor(client=MagicMock(), options=options)
+
+    async def test_startup_splays_to_max_concurrent(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        fat = MagicMock(object_id="0xfat", version=1, digest="d", balance=5_000_000_000)
+        splayed = [_coin(0), _coin(1), _coin(2), _coin(3)]
+        with patch(f"{_BASE}.acquire_coins", AsyncMock(return_value=[fat])), patch(
+            f"{_BASE}.splay_gas_coin", AsyncMock(return_value=(splayed, _effects([])))
+        ) as splay:
+            await ex._initialize()
+            await ex.close()
+        assert splay.await_args.kwargs["count"] == 3
+        assert splay.await_args.kwargs["amount"] == 100_000_000
+        assert ex._gas_pool.size() == 4
+
+    async def test_no_splay_by_default(self):
+        ex = self._executor()
+        fat = MagicMock(object_id="0xfat", version=1, digest="d", balance=5_000_000_000)
+        with patch(f"{_BASE}.acquire_coins", AsyncMock(return_value=[fat])), patch(
+            f"{_BASE}.splay_gas_coin", AsyncMock()
+        ) as splay:
+            await ex._initialize()
+            await ex.close()
+        splay.assert_not_called()
+        assert ex._gas_pool.size() == 1
+
+    async def test_low_pool_merges_retired_and_resplays(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(1), _coin(2)])
+        retired = [ex._gas_pool.try_checkout(), ex._gas_pool.try_checkout()]
+        for coin in retired:
+            await ex._gas_pool.checkin(coin, retire=True)
+        merged = _coin(7)
+        with patch(f"{_BASE}.merge_gas_coins", AsyncMock(return_value=(merged, _effects([])))) as merge, patch(
+            f"{_BASE}.splay_gas_coin",
+            AsyncMock(return_value=([merged, _coin(8), _coin(9), _coin(10)], _effects([]))),
+        ) as splay:
+            ex._maybe_maintain_gas()
+            await ex._gas_maintenance
+        assert merge.await_args.kwargs["coin_ids"] == [c.object_id for c in retired]
+        assert splay.await_args.kwargs["count"] == 3
+        assert ex._gas_pool.size() == 4
+
+    async def test_resplay_from_pool_coin_when_nothing_retired(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(1)])
+        with patch(f"{_BASE}.merge_gas_coins", AsyncMock()) as merge, patch(
+            f"{_BASE}.splay_gas_coin",
+            AsyncMock(side_effect=lambda **kw: ([kw["source"], _coin(8), _coin(9), _coin(10)], _effects([]))),
+        ) as splay:
+            ex._maybe_maintain_gas()
+            await ex._gas_maintenance
+        merge.assert_not_called()
+        assert splay.await_args.kwargs["count"] == 3
+        assert ex._gas_pool.size() == 4 and ex._gas_pool.managed() == 4
+
+    async def test_failed_split_retires_pool_coin(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(1)])
+        with patch(f"{_BASE}.splay_gas_coin", AsyncMock(side_effect=ValueError("boom"))):
+            ex._maybe_maintain_gas()
+            await ex._gas_maintenance
+        assert ex._gas_pool.managed() == 0
+        assert [c.object_id for c in ex._gas_pool.take_retired()] == [_coin(1).object_id]
+
+    async def test_failed_merge_keeps_retired_coins(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(1), _coin(2)])
+        retired = [ex._gas_pool.try_checkout(), ex._gas_pool.try_checkout()]
+        for coin in retired:
+            await ex._gas_pool.checkin(coin, retire=True)
+        with patch(f"{_BASE}.merge_gas_coins", AsyncMock(side_effect=ConnectionError("down"))):
+            ex._maybe_maintain_gas()
+            await ex._gas_maintenance
+        assert [c.object_id for c in ex._gas_pool.take_retired()] == [c.object_id for c in retired]
+
+    async def test_failed_splay_keeps_merged_coin(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(1), _coin(2)])
+        for coin in [ex._gas_pool.try_checkout(), ex._gas_pool.try_checkout()]:
+            await ex._gas_pool.checkin(coin, retire=True)
+        merged = _coin(7)
+        with patch(f"{_BASE}.merge_gas_coins", AsyncMock(return_value=(merged, _effects([])))), patch(
+            f"{_BASE}.splay_gas_coin", AsyncMock(side_effect=ValueError("boom"))
+        ):
+            ex._maybe_maintain_gas()
+            await ex._gas_maintenance
+        assert ex._gas_pool.take_retired() == [merged]
+
+    async def test_pool_above_low_water_mark_is_left_alone(self):
+        ex = self._executor(splay_coin_balance=100_000_000)
+        await ex._gas_pool.replenish([_coin(n) for n in range(4)])
+        ex._maybe_maintain_gas()
+        assert ex._gas_maintenance is None
@@ -0,0 +1,157 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for GqlSessionPool — all offline, no live node.
+
+Covers:
+  - Argument validation
+  - Requests run concurrently up to max_in_flight and never beyond
+  - Waiters are admitted in arrival order
+  - Least-outstanding member selection spreads load across transports
+  - Slot wait timeout surfaces SessionUnavailableError
+  - One timeout covers the slot wait and the request
+  - close() closes every connected member
+"""
+
+import asyncio
+import pytest
+
+from gql import gql
+from gql.transport.async_transport import AsyncTransport
+from graphql import ExecutionResult
+
+from pysui.sui.sui_pgql.pgql_session_pool import GqlSessionPool, SessionUnavailableError
+
+
+class _FakeTransport(AsyncTransport):
+    """Async transport that records concurrency and answers after a delay."""
+
+    def __init__(self, tracker: dict, delay: float = 0.01):
+        self.tracker = tracker
+        self.delay = delay
+        self.connected = False
+        self.closed = False
+        self.executed = 0
+
+    async def connect(self):
+        self.connected = True
+
+    async def close(self):
+        self.closed = True
+
+    async def execute(self, request, *args, **kwargs):
+        self.tracker["active"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        self.tracker["order"].append(request.variable_values or {})
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker["active"] -= 1
+        self.executed += 1
+        return ExecutionResult(data={"ok": True})
+
+    def subscribe(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+
+def _make_pool(pool_size=1, max_in_flight=4, delay=0.01):
+    tracker = {"active": 0, "peak": 0, "order": []}
+    transports: list[_FakeTransport] = []
+
+    def _factory():
+        t = _FakeTransport(tracker, delay)
+        transports.append(t)
+        return t
+
+    pool = GqlSessionPool(
+        url="http://localhost",
+        pool_size=pool_size,
+        max_in_flight=max_in_flight,
+        transport_factory=_factory,
+    )
+    return pool, tracker, transports
+
+
+_QUERY = gql("query { ok }")
+
+
+class TestValidation:
+    def test_rejects_zero_pool_size(self):
+        with pytest.raises(ValueError):
+            GqlSessionPool(url="http://localhost", pool_size=0)
+
+    def test_rejects_negative_in_flight(self):
+        with pytest.raises(ValueError):
+            GqlSessionPool(url="http://localhost", max_in_flight=-1)
+
+    def test_default_in_flight(self):
+        pool, _, _ = _make_pool(max_in_flight=None)
+        assert pool.max_in_flight == GqlSessionPool.DEFAULT_MAX_IN_FLIGHT
+
+
+@pytest.mark.asyncio
+class TestConcurrency:
+    async def test_requests_overlap_up_to_limit(self):
+        pool, tracker, _ = _make_pool(max_in_flight=4)
+        results = await asyncio.gather(*[pool.execute(_QUERY) for _ in range(12)])
+        assert all(r == {"ok": True} for r in results)
+        assert tracker["peak"] == 4
+        assert pool.in_flight == 0
+
+    async def test_single_slot_serializes(self):
+        pool, tracker, _ = _make_pool(max_in_flight=1)
+        await asyncio.gather(*[pool.execute(_QUERY) for _ in range(5)])
+        assert tracker["peak"] == 1
+
+    async def test_waiters_admitted_in_arrival_order(self):
+        pool, tracker, _ = _make_pool(max_in_flight=1)
+        requests = [gql("query { ok }") for _ in range(6)]
+        for idx, req in enumerate(requests):
+            req.variable_values = {"idx": idx}
+        await asyncio.gather(*[pool.execute(r) for r in requests])
+        assert [o["idx"] for o in tracker["order"]] == list(range(6))
+
+    async def test_load_spread_across_members(self):
+        pool, _, transports = _make_pool(pool_size=3, max_in_flight=6)
+        await asyncio.gather(*[pool.execute(_QUERY) for _ in range(6)])
+        assert [t.executed for t in transports] == [2, 2, 2]
+
+    async def test_slot_wait_timeout(self):
+        pool, _, _ = _make_pool(max_in_flight=1, delay=0.2)
+        blocker = asyncio.create_task(pool.execute(_QUERY))
+        await asyncio.sleep(0)
+        with pytest.raises(SessionUnavailableError):
+            await pool.execute(_QUERY, timeout=0.01)
+        await blocker
+        assert pool.in_flight == 0
+
+    async def test_timeout_covers_slot_wait_and_request(self):
+        pool, _, transports = _make_pool(max_in_flight=1, delay=0.1)
+        blocker = asyncio.create_task(pool.execute(_QUERY))
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # Waits about 0.1s for the slot, leaving too little for a 0.1s request
+        with pytest.raises(asyncio.TimeoutError) as info:
+            await pool.execute(_QUERY, timeout=0.15)
+        assert not isinstance(info.value, SessionUnavailableError)
+        assert loop.time() - started < 0.2
+        await blocker
+        assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+class TestLifecycle:
+    async def test_members_connect_lazily(self):
+        pool, _, transports = _make_pool(pool_size=2, max_in_flight=1)
+        assert not any(t.connected for t in transports)
+        await pool.execute(_QUERY)
+        assert sum(t.connected for t in transports) == 1
+
+    async def test_close_closes_connected_members(self):
+        pool, _, transports = _make_pool(pool_size=2, max_in_flight=2)
+        await asyncio.gather(pool.execute(_QUERY), pool.execute(_QUERY))
+        await pool.close()
+        assert all(t.closed for t in transports)
@@ -0,0 +1,239 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for GrpcChannelPool and its use by GrpcProtocolClient — all offline.
+
+Covers:
+  - Constructor validation
+  - Least-outstanding routing across channels and endpoints
+  - Failover on connection refused, no retry once a request may have been sent
+  - Health probing marks endpoints down and back up, background probe task
+  - A single endpoint pool never probes and retries after retry_after
+  - close() stops probing and closes every channel
+  - Profile failover_urls / channels_per_endpoint JSON round trip and client wiring
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+import pysui.sui.sui_grpc.pgrpc_absreq as absreq
+import pysui.sui.sui_grpc.pgrpc_clients as pgrpc_clients
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_common.config.confgroup import Profile
+from pysui.sui.sui_grpc.pgrpc_channel_pool import GrpcChannelPool
+from pysui.sui.sui_grpc.pgrpc_clients import GrpcProtocolClient
+from pysui.sui.sui_grpc.pgrpc_requests import GetEpoch
+
+
+class _FakeChannel:
+    def __init__(self, host, port) -> None:
+        self.host = host
+        self.port = port
+        self.fail: BaseException | None = None
+        self.calls = 0
+        self.closed = False
+
+    async def call(self):
+        self.calls += 1
+        if self.fail is not None:
+            raise self.fail
+        return sui_prot.GetEpochResponse(epoch=sui_prot.Epoch(epoch=7))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeLedgerStub:
+    def __init__(self, channel) -> None:
+        self._channel = channel
+
+    async def get_epoch(self, request, **kwargs):
+        return await self._channel.call()
+
+    async def get_service_info(self, request, **kwargs):
+        return await self._channel.call()
+
+
+@pytest.fixture(autouse=True)
+def fake_stub(monkeypatch):
+    monkeypatch.setattr(sui_prot, "LedgerServiceStub", _FakeLedgerStub)
+    monkeypatch.setitem(pgrpc_clients._SERVICE_STUBS, absreq.Service.LEDGER, _FakeLedgerStub)
+
+
+def _pool(endpoints=(("a", 443), ("b", 443)), **kwargs) -> GrpcChannelPool:
+    kwargs.setdefault("health_interval", 0)
+    return GrpcChannelPool(endpoints=list(endpoints), channel_factory=_FakeChannel, **kwargs)
+
+
+def _client(pool: GrpcChannelPool) -> GrpcProtocolClient:
+    client = GrpcProtocolClient.__new__(GrpcProtocolClient)
+    client._default_header = {}
+    client._pool = pool
+    return client
+
+
+def _channels(pool: GrpcChannelPool) -> dict[str, list[_FakeChannel]]:
+    out: dict[str, list[_FakeChannel]] = {}
+    for member in pool._members:
+        out.setdefault(member.channel.host, []).append(member.channel)
+    return out
+
+
+class TestPool:
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            _pool(endpoints=())
+        with pytest.raises(ValueError):
+            _pool(channels_per_endpoint=0)
+
+    def test_least_outstanding(self):
+        pool = _pool(endpoints=[("a", 443)], channels_per_endpoint=3)
+        leased = [pool.lease() for _ in range(3)]
+        assert len({id(m) for m in leased}) == 3
+        assert pool.in_flight == 3
+        pool.release(leased[1])
+        assert pool.lease() is leased[1]
+        for member in leased:
+            pool.release(member)
+        assert pool.in_flight == 0
+
+    def test_unhealthy_endpoint_skipped(self):
+        pool = _pool(retry_after=60)
+        pool.report_failure(pool.lease(), ConnectionRefusedError())
+        down = [name for name, ok in pool.health().items() if not ok]
+        assert len(down) == 1
+        for _ in range(4):
+            member = pool.lease()
+            assert member.endpoint.name != down[0]
+            pool.release(member)
+        # Nothing usable outside exclude: fall back rather than fail
+        healthy = pool.endpoint_index(member)
+        assert not pool.has_usable({healthy})
+        assert pool.endpoint_index(pool.lease({healthy})) != healthy
+
+    def test_retry_after_without_probing(self):
+        pool = _pool(retry_after=0)
+        member = pool.lease()
+        pool.report_failure(member, ConnectionRefusedError())
+        assert pool.has_usable({1 - pool.endpoint_index(member)})
+
+
+@pytest.mark.asyncio
+class TestProbing:
+    async def test_probe_once_recovers(self):
+        pool = _pool(retry_after=60)
+        a = _channels(pool)["a"][0]
+        a.fail = GRPCError(Status.UNAVAILABLE)
+        await pool.probe_once()
+        assert pool.health() == {"a:443": False, "b:443": True}
+        a.fail = None
+        await pool.probe_once()
+        assert pool.health() == {"a:443": True, "b:443": True}
+
+    async def test_background_probe_and_close(self):
+        pool = _pool(health_interval=0.01)
+        _channels(pool)["b"][0].fail = OSError("reset")
+        pool.release(pool.lease())
+        for _ in range(50):
+            if not pool.health()["b:443"]:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.health()["b:443"] is False
+        task = pool._probe_task
+        await pool.close()
+        assert task.cancelled()
+        assert all(m.channel.closed for m in pool._members)
+
+    async def test_single_endpoint_not_probed(self):
+        pool = _pool(endpoints=[("a", 443)], health_interval=0.01, retry_after=0)
+        pool.release(pool.lease())
+        assert pool._probe_task is None
+        member = pool.lease()
+        pool.report_failure(member, OSError("reset"))
+        pool.release(member)
+        assert pool.has_usable()
+
+
+@pytest.mark.asyncio
+class TestClientDispatch:
+    async def test_failover_on_connection_refused(self):
+        pool = _pool()
+        channels = _channels(pool)
+        channels["a"][0].fail = ConnectionRefusedError(111, "refused")
+        client = _client(pool)
+        for _ in range(3):
+            result = await client._dispatch_grpc_request(GetEpoch())
+            assert result.is_ok()
+            assert result.result_data.epoch.epoch == 7
+        assert pool.health()["a:443"] is False
+        assert channels["a"][0].calls == 1
+        assert channels["b"][0].calls == 3
+        assert pool.in_flight == 0
+
+    async def test_all_endpoints_refused(self):
+        pool = _pool()
+        for chans in _channels(pool).values():
+            chans[0].fail = ConnectionRefusedError(111, "refused")
+        result = await _client(pool)._dispatch_grpc_request(GetEpoch())
+        assert not result.is_ok()
+        assert set(pool.health().values()) == {False}
+        assert pool.in_flight == 0
+
+    async def test_unavailable_not_retried(self):
+        pool = _pool(endpoints=[("a", 443)])
+        channels = _channels(pool)
+        channels["a"][0].fail = GRPCError(Status.UNAVAILABLE, "draining")
+        result = await _client(pool)._dispatch_grpc_request(GetEpoch())
+        assert not result.is_ok()
+        assert channels["a"][0].calls == 1
+        assert pool.health()["a:443"] is False
+
+    async def test_other_grpc_errors_keep_endpoint_healthy(self):
+        pool = _pool(endpoints=[("a", 443)])
+        _channels(pool)["a"][0].fail = GRPCError(Status.INVALID_ARGUMENT, "bad")
+        result = await _client(pool)._dispatch_grpc_request(GetEpoch())
+        assert not result.is_ok()
+        assert pool.health()["a:443"] is True
+
+
+class TestProfileConfig:
+    def test_json_round_trip(self):
+        plain = Profile("devnet", "https://fullnode.devnet.sui.io:443")
+        assert "failover_urls" not in plain.to_json()
+        assert Profile.from_json(plain.to_json()) == plain
+        pooled = Profile(
+            "mainnet",
+            "https://a.example:443",
+            failover_urls=["https://b.example:443"],
+            channels_per_endpoint=2,
+        )
+        assert Profile.from_json(pooled.to_json()) == pooled
+
+    def test_client_builds_pool_from_profile(self):
+        config = MagicMock()
+        config.active_group.active_profile = Profile(
+            "mainnet",
+            "https://a.example:443",
+            failover_urls=["https://b.example:8443"],
+            channels_per_endpoint=2,
+        )
+        client = GrpcProtocolClient(pysui_config=config, health_interval=0, channel_factory=_FakeChannel)
+        assert client.channel_pool.endpoint_count == 2
+        assert {h: [(c.host, c.port) for c in cs] for h, cs in _channels(client.channel_pool).items()} == {
+            "a.example": [("a.example", 443)] * 2,
+            "b.example": [("b.example", 8443)] * 2,
+        }
+
+    def test_invalid_failover_url(self):
+        config = MagicMock()
+        config.active_group.active_profile = Profile(
+            "mainnet", "https://a.example:443", failover_urls=["https://b.example:port"]
+        )
+        with pytest.raises(ValueError):
+            GrpcProtocolClient(pysui_config=config, channel_factory=_FakeChannel)
@@ -0,0 +1,148 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for GrpcProtocolClient request dispatch — all offline.
+
+Covers:
+  - Service stubs are created once per pooled channel and reused
+  - Every absreq.Service has a stub class; unknown services raise NotImplementedError
+  - Default header handling: passed through, merged only when the caller adds metadata
+  - Subscriptions are dispatched on a cached stub without being awaited
+  - A subscription stream holds its channel lease until it ends, fails or is closed
+"""
+
+import pytest
+from grpclib.exceptions import StreamTerminatedError
+
+import pysui.sui.sui_grpc.pgrpc_absreq as absreq
+import pysui.sui.sui_grpc.pgrpc_clients as pgrpc_clients
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui.sui.sui_grpc.pgrpc_channel_pool import GrpcChannelPool
+from pysui.sui.sui_grpc.pgrpc_requests import GetEpoch
+
+
+class _Channel:
+    def __init__(self, host, port) -> None:
+        self.host = host
+
+    def close(self) -> None:
+        pass
+
+
+class _LedgerStub:
+    created: list["_LedgerStub"] = []
+
+    def __init__(self, channel) -> None:
+        self.channel = channel
+        self.metadata: list = []
+        _LedgerStub.created.append(self)
+
+    async def get_epoch(self, request, *, metadata=None, **kwargs):
+        self.metadata.append(metadata)
+        return sui_prot.GetEpochResponse(epoch=sui_prot.Epoch(epoch=1))
+
+
+class _SubscriptionStub:
+    def __init__(self, channel) -> None:
+        self.channel = channel
+
+    fail: BaseException | None = None
+
+    def subscribe_checkpoints(self, request, **kwargs):
+        return self._stream()
+
+    async def _stream(self):
+        yield self.channel.host
+        yield self.channel.host
+        if _SubscriptionStub.fail is not None:
+            raise _SubscriptionStub.fail
+
+
+class _Subscribe(absreq.PGRPC_Request):
+    def __init__(self) -> None:
+        super().__init__(absreq.Service.SUBSCRIPTION)
+
+    def to_request(self, *, stub):
+        return stub.subscribe_checkpoints, sui_prot.SubscribeCheckpointsRequest()
+
+
+@pytest.fixture(autouse=True)
+def fake_stubs(monkeypatch):
+    _LedgerStub.created = []
+    _SubscriptionStub.fail = None
+    monkeypatch.setitem(pgrpc_clients._SERVICE_STUBS, absreq.Service.LEDGER, _LedgerStub)
+    monkeypatch.setitem(pgrpc_clients._SERVICE_STUBS, absreq.Service.SUBSCRIPTION, _SubscriptionStub)
+
+
+def _client(header: dict | None = None, endpoints=(("a", 443),), channels: int = 1):
+    client = pgrpc_clients.GrpcProtocolClient.__new__(pgrpc_clients.GrpcProtocolClient)
+    client._default_header = header or {}
+    client._pool = GrpcChannelPool(
+        endpoints=list(endpoints),
+        channels_per_endpoint=channels,
+        health_interval=0,
+        channel_factory=_Channel,
+    )
+    return client
+
+
+def test_every_service_has_a_stub():
+    assert set(pgrpc_clients._SERVICE_STUBS) == set(absreq.Service)
+
+
+@pytest.mark.asyncio
+class TestDispatch:
+    async def test_stub_reused_per_channel(self):
+        client = _client(endpoints=[("a", 443), ("b", 443)], channels=2)
+        for _ in range(12):
+            assert (await client._dispatch_grpc_request(GetEpoch())).is_ok()
+        assert len(_LedgerStub.created) == 4
+        assert len({id(stub.channel) for stub in _LedgerStub.created}) == 4
+        assert sum(len(stub.metadata) for stub in _LedgerStub.created) == 12
+
+    async def test_unknown_service(self, monkeypatch):
+        monkeypatch.delitem(pgrpc_clients._SERVICE_STUBS, absreq.Service.LEDGER)
+        client = _client()
+        with pytest.raises(NotImplementedError):
+            await client._dispatch_grpc_request(GetEpoch())
+        assert client.channel_pool.in_flight == 0
+
+    async def test_default_header(self):
+        header = {"x-client": "pysui"}
+        client = _client(header)
+        await client._dispatch_grpc_request(GetEpoch())
+        await client._dispatch_grpc_request(GetEpoch(), metadata={"x-trace": "1"})
+        await _client()._dispatch_grpc_request(GetEpoch(), metadata={"x-trace": "2"})
+        first, merged, caller_only = [m for stub in _LedgerStub.created for m in stub.metadata]
+        assert first is header
+        assert merged == {"x-client": "pysui", "x-trace": "1"}
+        assert caller_only == {"x-trace": "2"}
+        assert header == {"x-client": "pysui"}
+
+    async def test_subscription(self):
+        client = _client()
+        first = await client._dispatch_grpc_request(_Subscribe())
+        second = await client._dispatch_grpc_request(_Subscribe())
+        assert [item async for item in first.result_data] == ["a", "a"]
+        member = client.channel_pool._members[0]
+        assert isinstance(member.stubs[absreq.Service.SUBSCRIPTION], _SubscriptionStub)
+        assert client.channel_pool.in_flight == 1
+        await second.result_data.aclose()
+        assert client.channel_pool.in_flight == 0
+
+    async def test_subscription_holds_lease(self):
+        client = _client(endpoints=[("a", 443), ("b", 443)])
+        stream = (await client._dispatch_grpc_request(_Subscribe())).result_data
+        assert client.channel_pool.in_flight == 1
+        # The streaming channel is loaded, so the next request goes elsewhere
+        other = client.channel_pool.lease()
+        assert other.endpoint.name == "b:443"
+        client.channel_pool.release(other)
+        _SubscriptionStub.fail = StreamTerminatedError("reset")
+        with pytest.raises(StreamTerminatedError):
+            async for _ in stream:
+                pass
+        assert client.channel_pool.in_flight == 0
+        assert client.channel_pool.health() == {"a:443": False, "b:443": True}
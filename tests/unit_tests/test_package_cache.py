@@ -0,0 +1,167 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for PackageCache and concurrent compound resolution — all offline.
+
+Covers:
+  - Cache keys: opt-in flag, address normalization, framework packages excluded
+  - execute_for_all serves repeated package reads from the cache, per protocol
+  - Failures are not cached; concurrent misses share one fetch; LRU bound
+  - Cancelling the caller that started a shared fetch does not cancel the others
+  - Truncated package modules fetched concurrently, bounded, stitched by index
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+from pysui import SuiRpcResult
+from pysui.abstracts.async_client import AsyncClientBase
+from pysui.sui.sui_common.package_cache import PackageCache
+
+_PKG = "0x" + "ab" * 32
+
+
+class _Client(AsyncClientBase):
+    """Answers GetPackage with a single page and GetModule per module name."""
+
+    _protocol = "gql"
+
+    def __init__(self, modules: list | None = None, fail: set | None = None) -> None:
+        self.modules = modules or []
+        self.fail = fail or set()
+        self.calls: list = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def transaction(self, **kwargs):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def execute(self, *, command, timeout=None, headers=None):
+        self.calls.append(command)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+        if isinstance(command, cmd.GetPackage):
+            modules = [
+                SimpleNamespace(name=name, functions_has_next=truncated, datatypes_has_next=False)
+                for name, truncated in self.modules
+            ]
+            page = SimpleNamespace(modules=modules, next_page_token=None)
+            return SuiRpcResult(True, "", SimpleNamespace(package=page))
+        if command.module_name in self.fail:
+            return SuiRpcResult(False, "unavailable", None)
+        return SuiRpcResult(True, "", SimpleNamespace(name=command.module_name, complete=True))
+
+
+def test_keys():
+    short = cmd.GetModule(package="0xAB", module_name="m")
+    full = cmd.GetModule(package="0x" + "0" * 62 + "ab", module_name="m")
+    assert PackageCache.key_for("gql", short) == PackageCache.key_for("gql", full)
+    assert PackageCache.key_for("gql", short) != PackageCache.key_for("grpc", short)
+    assert PackageCache.key_for("gql", cmd.GetModule(package=_PKG, module_name="n")) != PackageCache.key_for(
+        "gql", cmd.GetModule(package=_PKG, module_name="m")
+    )
+    assert PackageCache.key_for("gql", cmd.GetPackage(package="0x2")) is None
+    assert PackageCache.key_for("gql", cmd.GetEpoch()) is None
+
+
+@pytest.mark.asyncio
+class TestPackageCache:
+    async def test_repeat_served_from_cache(self):
+        client = _Client()
+        command = cmd.GetModule(package=_PKG, module_name="pool")
+        first = await client.execute_for_all(command=command)
+        second = await client.execute_for_all(command=command)
+        assert second is first
+        assert len(client.calls) == 1
+        assert client.package_cache.stats().hits == 1
+
+    async def test_shared_between_clients(self):
+        one, two = _Client(), _Client()
+        two.package_cache = one.package_cache
+        command = cmd.GetModule(package=_PKG, module_name="pool")
+        await one.execute_for_all(command=command)
+        await two.execute_for_all(command=command)
+        assert two.calls == []
+
+    async def test_failures_not_cached(self):
+        client = _Client(fail={"pool"})
+        command = cmd.GetModule(package=_PKG, module_name="pool")
+        assert not (await client.execute_for_all(command=command)).is_ok()
+        client.fail.clear()
+        assert (await client.execute_for_all(command=command)).is_ok()
+        assert len(client.calls) == 2
+
+    async def test_concurrent_misses_share_fetch(self):
+        client = _Client()
+        command = cmd.GetModule(package=_PKG, module_name="pool")
+        results = await asyncio.gather(*[client.execute_for_all(command=command) for _ in range(5)])
+        assert len(client.calls) == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_owner_cancel_does_not_reach_waiters(self):
+        client = _Client()
+        command = cmd.GetModule(package=_PKG, module_name="pool")
+        owner = asyncio.create_task(client.execute_for_all(command=command))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(client.execute_for_all(command=command)) for _ in range(3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        results = await asyncio.gather(*waiters)
+        assert owner.cancelled()
+        assert len(client.calls) == 1
+        assert all(r.is_ok() and r is results[0] for r in results)
+        assert client.package_cache.stats().size == 1
+
+    async def test_lru_bound_and_invalidate(self):
+        client = _Client()
+        client.package_cache = PackageCache(maxsize=2)
+        for name in ("a", "b", "c"):
+            await client.execute_for_all(command=cmd.GetModule(package=_PKG, module_name=name))
+        stats = client.package_cache.stats()
+        assert (stats.size, stats.evictions) == (2, 1)
+        assert client.package_cache.invalidate_package(_PKG) == 2
+
+    async def test_framework_package_not_cached(self):
+        client = _Client()
+        command = cmd.GetModule(package="0x2", module_name="coin")
+        await client.execute_for_all(command=command)
+        await client.execute_for_all(command=command)
+        assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+class TestCompound:
+    async def test_truncated_modules_fetched_concurrently(self):
+        modules = [(f"m{i}", i % 2 == 0) for i in range(20)]
+        client = _Client(modules)
+        client.compound_concurrency = 4
+        result = await client.execute_for_all(command=cmd.GetPackage(package=_PKG))
+        resolved = result.result_data.package.modules
+        assert [m.name for m in resolved] == [name for name, _ in modules]
+        assert all(getattr(m, "complete", False) == truncated for m, (_, truncated) in zip(resolved, modules))
+        assert client.peak == 4
+        # Package and its modules are cached: a second load is free
+        await client.execute_for_all(command=cmd.GetPackage(package=_PKG))
+        assert len(client.calls) == 11
+
+    async def test_failed_module_keeps_partial(self):
+        client = _Client([("a", True), ("b", True)], fail={"a"})
+        result = await client.execute_for_all(command=cmd.GetPackage(package=_PKG))
+        first, second = result.result_data.package.modules
+        assert first.functions_has_next is True
+        assert second.complete is True
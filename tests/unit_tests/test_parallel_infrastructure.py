@@ -52,7 +52,7 @@ class TestObjectVersionEntry:
     def test_fields(self):
         entry = _entry("0x01", "5", "xyz")
         assert entry.object_id == "0x01"
-        assert entry.version == "5"
+        assert entry.version == 5
         assert entry.digest == "xyz"
         assert not entry.is_tombstone
 
@@ -81,7 +81,7 @@ class TestInMemoryObjectRegistry:
         await reg.upsert(_entry(_oid(), "3", "d3"))
         result = await reg.get(_oid())
         assert result is not None
-        assert result.version == "3"
+        assert result.version == 3
 
     @pytest.mark.asyncio
     async def test_get_missing(self, reg):
@@ -92,7 +92,7 @@ class TestInMemoryObjectRegistry:
         await reg.upsert(_entry(_oid(), "5", "d5"))
         await reg.upsert(_entry(_oid(), "3", "d3"))  # stale — should be dropped
         result = await reg.get(_oid())
-        assert result.version == "5"
+        assert result.version == 5
 
     @pytest.mark.asyncio
     async def test_lower_version_is_dropped(self, reg):
@@ -101,6 +101,47 @@ class TestInMemoryObjectRegistry:
         result = await reg.get(_oid())
         assert result.digest == "d10"
 
+    @pytest.mark.asyncio
+    async def test_versions_compare_numerically(self, reg):
+        await reg.upsert(_entry(_oid(), "9", "d9"))
+        await reg.upsert(_entry(_oid(), "10", "d10"))
+        assert (await reg.get(_oid())).digest == "d10"
+        await reg.upsert(_entry(_oid(), 100, "d100"))
+        await reg.upsert(_entry(_oid(), "99", "d99"))
+        assert (await reg.get(_oid())).version == 100
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_keeps_highest_within_batch(self, reg):
+        await reg.upsert_many([_entry(_oid(), "7", "d7"), _entry(_oid(), "2", "d2")])
+        assert (await reg.get(_oid())).digest == "d7"
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_missing_and_expired(self, reg):
+        await reg.upsert(_entry(_oid("01"), "1"))
+        await reg.tombstone(_oid("02"), ttl_seconds=0.0)
+        await asyncio.sleep(0)
+        found = await reg.get_many([_oid("01"), _oid("02"), _oid("03")])
+        assert list(found) == [_oid("01")]
+        # The expired tombstone is dropped by the read
+        assert reg.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_read_refreshes_lru_order(self):
+        reg = InMemoryObjectRegistry(max_entries=2)
+        await reg.upsert(_entry(_oid("00"), "1"))
+        await reg.upsert(_entry(_oid("01"), "1"))
+        assert reg.get_nowait(_oid("00")) is not None
+        await reg.upsert(_entry(_oid("02"), "1"))
+        assert reg.get_nowait(_oid("00")) is not None
+        assert reg.get_nowait(_oid("01")) is None
+
+    @pytest.mark.asyncio
+    async def test_write_after_tombstone_revives(self, reg):
+        await reg.tombstone(_oid(), ttl_seconds=60.0)
+        await reg.upsert(_entry(_oid(), "4", "d4"))
+        result = await reg.get(_oid())
+        assert not result.is_tombstone and result.version == 4
+
     @pytest.mark.asyncio
     async def test_upsert_many(self, reg):
         entries = [_entry(_oid(f"{i:02x}"), str(i)) for i in range(5)]
@@ -153,6 +194,17 @@ class TestInMemoryObjectRegistry:
         await asyncio.sleep(0)  # yield to let time pass
         result = await reg.get(_oid())
         assert result is None
+        assert reg.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_tombstone_drop_keeps_newer_write(self, reg):
+        await reg.tombstone(_oid(), ttl_seconds=0.0)
+        await asyncio.sleep(0)
+        stale = reg._entries[_oid()]
+        await reg.upsert(_entry(_oid(), "3"))
+        # A reader that saw the old tombstone must not remove the new entry
+        reg._drop_expired(_oid(), stale)
+        assert (await reg.get(_oid())).version == 3
 
     @pytest.mark.asyncio
     async def test_tombstone_overwrites_normal(self, reg):
@@ -311,6 +363,113 @@ class TestConflictTracker:
         await res.release()
         assert tracker.in_flight_ids() == set()
 
+    @pytest.mark.asyncio
+    async def test_try_acquire_all_or_nothing(self):
+        tracker = ConflictTracker()
+        held = await tracker.acquire({"0xa"})
+        assert tracker.try_acquire({"0xa", "0xb"}) is None
+        assert tracker.in_flight_ids() == {"0xa"}
+        res = tracker.try_acquire({"0xb", "0xc"})
+        assert res is not None
+        assert tracker.in_flight_ids() == {"0xa", "0xb", "0xc"}
+        await res.release()
+        await held.release()
+        assert tracker.in_flight_ids() == set()
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_wakes_blocked_acquire_on_release(self):
+        tracker = ConflictTracker()
+        res = tracker.try_acquire({"0xa"})
+        waiter = asyncio.create_task(tracker.acquire({"0xa"}))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await res.release()
+        await (await waiter).release()
+
+
+    @pytest.mark.asyncio
+    async def test_grants_in_call_order(self):
+        tracker = ConflictTracker()
+        held = await tracker.acquire({"0xobj"})
+        order: list[int] = []
+
+        async def tx(i: int):
+            async with await tracker.acquire({"0xobj"}):
+                order.append(i)
+
+        tasks = [asyncio.create_task(tx(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert tracker.queue_depths() == {"0xobj": 5}
+        await held.release()
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_multi_object_waiter_granted_on_last_release(self):
+        tracker = ConflictTracker()
+        res_a = await tracker.acquire({"0xa"})
+        res_b = await tracker.acquire({"0xb"})
+        both = asyncio.create_task(tracker.acquire({"0xa", "0xb"}))
+        await asyncio.sleep(0)
+        await res_a.release()
+        await asyncio.sleep(0)
+        assert not both.done()
+        await res_b.release()
+        await (await both).release()
+        assert tracker.in_flight_ids() == set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_withdrawn(self):
+        tracker = ConflictTracker()
+        held = await tracker.acquire({"0xa", "0xb"})
+        cancelled = asyncio.create_task(tracker.acquire({"0xa", "0xb"}))
+        later = asyncio.create_task(tracker.acquire({"0xb"}))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await held.release()
+        await (await later).release()
+        assert tracker.in_flight_ids() == set()
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self):
+        tracker = ConflictTracker()
+        res = await tracker.acquire({"0xa"})
+        nxt = asyncio.create_task(tracker.acquire({"0xa"}))
+        await asyncio.sleep(0)
+        await res.release()
+        await res.release()
+        assert tracker.in_flight_ids() == {"0xa"}
+        await (await nxt).release()
+
+    @pytest.mark.asyncio
+    async def test_depth_and_wait_recorded(self):
+        from pysui.sui.sui_common.instrumentation import (
+            InstrumentationCollector,
+            active_collector,
+        )
+
+        class _Recorder(InstrumentationCollector):
+            def __init__(self):
+                self.samples: dict[str, list[float]] = {}
+
+            def record(self, label, value):
+                self.samples.setdefault(label, []).append(value)
+
+        tracker = ConflictTracker()
+        col = _Recorder()
+        async with active_collector(col):
+            held = await tracker.acquire({"0xa"})
+            waiters = [asyncio.create_task(tracker.acquire({"0xa"})) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            await held.release()
+            for w in waiters:
+                await (await w).release()
+        assert col.samples["executor.conflict.queue_depth"] == [1, 2]
+        waits = col.samples["executor.conflict.wait_seconds"]
+        assert len(waits) == 2 and all(w >= 0.01 for w in waits)
+
 
 # ===========================================================================
 # GasCoinPool
@@ -379,6 +538,29 @@ class TestGasCoinPool:
         await pool.reset()
         assert pool.size() == 0
 
+    @pytest.mark.asyncio
+    async def test_reset_forgets_checked_out_and_fails_waiters(self):
+        pool = GasCoinPool(low_water_mark=1)
+        await pool.replenish([_coin("01"), _coin("02")])
+        pool.try_checkout()
+        pool.try_checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0)
+        await pool.reset()
+        assert pool.managed() == 0 and pool.is_low()
+        with pytest.raises(RuntimeError):
+            await waiter
+        await pool.replenish([_coin("03"), _coin("04")])
+        assert pool.managed() == 2 and not pool.is_low()
+
+    @pytest.mark.asyncio
+    async def test_try_checkout(self):
+        pool = GasCoinPool()
+        assert pool.try_checkout() is None
+        await pool.replenish([_coin()])
+        assert pool.try_checkout().object_id == _coin().object_id
+        assert pool.size() == 0
+
     @pytest.mark.asyncio
     async def test_checkout_blocks_until_checkin(self):
         pool = GasCoinPool()
@@ -391,3 +573,75 @@ class TestGasCoinPool:
         await producer()
         coin = await checkout_task
         assert coin is not None
+
+    @pytest.mark.asyncio
+    async def test_checkout_returns_smallest_adequate_coin(self):
+        pool = GasCoinPool()
+        await pool.replenish([_coin("01", 900), _coin("02", 100), _coin("03", 400)])
+        assert (await pool.checkout(min_balance=300)).balance == 400
+        assert pool.try_checkout(min_balance=1000) is None
+        assert pool.try_checkout().balance == 100
+        assert pool.max_balance() == 900
+
+    @pytest.mark.asyncio
+    async def test_equal_balances_checkout_oldest_first(self):
+        pool = GasCoinPool()
+        await pool.replenish([_coin("01", 500), _coin("02", 500)])
+        first = pool.try_checkout()
+        await pool.checkin(first)
+        assert pool.try_checkout().object_id == _oid("02")
+
+    @pytest.mark.asyncio
+    async def test_waiter_woken_only_by_adequate_coin(self):
+        pool = GasCoinPool()
+        task = asyncio.create_task(pool.checkout(min_balance=500))
+        await asyncio.sleep(0)
+        await pool.replenish([_coin("01", 100)])
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert pool.size() == 1
+        await pool.replenish([_coin("02", 800)])
+        coin = await task
+        assert coin.object_id == _oid("02")
+        assert pool.size() == 1 and pool.managed() == 2
+
+    @pytest.mark.asyncio
+    async def test_or_richest_waiter_settles_when_nothing_is_out(self):
+        pool = GasCoinPool()
+        await pool.replenish([_coin("01", 100), _coin("02", 300)])
+        # Nothing checked out and nothing adequate: the richest is returned at once
+        richest = await pool.checkout(min_balance=500, or_richest=True)
+        assert richest.object_id == _oid("02")
+        task = asyncio.create_task(pool.checkout(min_balance=500, or_richest=True))
+        await asyncio.sleep(0)
+        assert not task.done()
+        await pool.checkin(richest)
+        assert (await task).object_id == _oid("02")
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self):
+        pool = GasCoinPool()
+        first = asyncio.create_task(pool.checkout(min_balance=100))
+        second = asyncio.create_task(pool.checkout(min_balance=100))
+        await asyncio.sleep(0)
+        await pool.replenish([_coin("01", 200)])
+        assert (await first).object_id == _oid("01")
+        assert not second.done()
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await pool.replenish([_coin("02", 200)])
+        assert pool.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_count_waits_and_retirements(self):
+        pool = GasCoinPool(min_balance_per_coin=50)
+        task = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0)
+        await pool.replenish([_coin("01", 40), _coin("02", 60)])
+        coin = await task
+        await pool.checkin(coin)
+        await pool.checkin(pool.try_checkout(), retire=True)
+        stats = pool.stats()
+        assert (stats.checkouts, stats.waits, stats.retired) == (2, 1, 2)
+        assert stats.available == 0 and stats.wait_seconds >= 0
@@ -369,6 +369,65 @@ class TestProfileGroupKeypairs:
             g.add_keys(keys=[{"key_string": _gen_key_string(), "alias": alias}])
 
 
+
+# ---------------------------------------------------------------------------
+# ProfileGroup — lookup indexes and keypair cache
+# ---------------------------------------------------------------------------
+
+
+class TestProfileGroupIndexes:
+    @pytest.fixture
+    def group(self):
+        g, address, alias = _make_minimal_group("test_group")
+        addies = g.add_keys(keys=[{"key_string": _gen_key_string()} for _ in range(5)])
+        return g, [address] + addies
+
+    def test_keypair_decoded_once(self, group, monkeypatch):
+        g, addies = group
+        calls = []
+        decode = crypto.keypair_from_keystring
+        monkeypatch.setattr(crypto, "keypair_from_keystring", lambda k: calls.append(k) or decode(k))
+        first = g.keypair_for_address(address=addies[3])
+        assert g.keypair_for_address(address=addies[3]) is first
+        assert len(calls) == 1
+
+    def test_keypair_cache_bounded(self, group, monkeypatch):
+        g, addies = group
+        monkeypatch.setattr(ProfileGroup, "KEYPAIR_CACHE_SIZE", 2)
+        for address in addies:
+            g.keypair_for_address(address=address)
+        assert list(g._keypairs) == addies[-2:]
+
+    def test_remove_alias_invalidates(self, group):
+        g, addies = group
+        g.keypair_for_address(address=addies[2])
+        g.remove_alias(alias_name=g.alias_name_for_address(address=addies[2]))
+        with pytest.raises(ValueError):
+            g.keypair_for_address(address=addies[2])
+        assert g.alias_for_address(address=addies[3]) is g.alias_list[2]
+        assert g.keypair_for_address(address=addies[3]).serialize() == g.key_list[2].private_key_base64
+
+    def test_replaced_key_not_served_from_cache(self, group):
+        g, addies = group
+        g.keypair_for_address(address=addies[1])
+        new_key = _gen_key_string()
+        g.key_list[1] = ProfileKey(new_key)
+        assert g.keypair_for_address(address=addies[1]).serialize() == new_key
+
+    def test_lookups_follow_list_changes(self, group):
+        g, addies = group
+        assert g._address_exists(address=addies[4]) == addies[4]
+        g.address_list = list(reversed(g.address_list))
+        assert g._address_position(addies[4]) == 1
+        renamed = g.alias_list[0].alias
+        g.replace_alias_name(from_alias=renamed, to_alias="re-named")
+        assert g._alias_exists(alias_name=renamed) is None
+        assert g._alias_exists(alias_name="re-named") is g.alias_list[0]
+        g.add_profile(new_prf=Profile("devnet", "https://example.org"))
+        assert g._profile_exists(profile_name="devnet").url == "https://example.org"
+        assert g._key_exists(key_string=g.key_list[5].private_key_base64) is g.key_list[5]
+
+
 # ---------------------------------------------------------------------------
 # PysuiConfiguration — initialization
 # ---------------------------------------------------------------------------
@@ -0,0 +1,270 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for RetryPolicy and its use by the async clients — all offline.
+
+Covers:
+  - Constructor validation and backoff bounds
+  - Idempotency: transient failures retried only for idempotent commands,
+    failures before sending retried for every command
+  - Deadline budget shrinks the per-attempt timeout and stops retries
+  - Hedged requests: first usable answer wins, losers cancelled, counters
+  - gRPC and GraphQL failure classification, gRPC deadline results
+  - GraphQL slot wait timeouts are unsent, response timeouts are transient
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from gql import gql
+from gql.transport import exceptions as texc
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.pgrpc_clients as pgrpc_clients
+import pysui.sui.sui_grpc.pgrpc_absreq as absreq
+from pysui import SuiRpcResult
+from pysui.sui.sui_common.retry_policy import FailureKind, RetryPolicy
+from pysui.sui.sui_grpc.pgrpc_channel_pool import GrpcChannelPool
+from pysui.sui.sui_pgql.pgql_clients import GqlProtocolClient
+from pysui.sui.sui_pgql.pgql_session_pool import SessionUnavailableError
+
+_OK = SuiRpcResult(True, None, "ok")
+_UNAVAILABLE = SuiRpcResult(False, (Status.UNAVAILABLE, "draining"))
+_REFUSED = SuiRpcResult(False, (111, "refused"), ConnectionRefusedError(111, "refused"))
+_BAD = SuiRpcResult(False, (Status.INVALID_ARGUMENT, "bad"))
+
+
+def _classify(result: SuiRpcResult) -> FailureKind:
+    return pgrpc_clients.GrpcProtocolClient._classify_failure(None, result)
+
+
+class _Script:
+    """Attempt callable returning scripted results, optionally after a delay."""
+
+    def __init__(self, *steps) -> None:
+        self.steps = list(steps)
+        self.timeouts: list = []
+        self.cancelled = 0
+
+    async def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        delay, result = self.steps.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return result
+
+
+def _quick(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("base_delay", 0)
+    kwargs.setdefault("max_delay", 0)
+    return RetryPolicy(**kwargs)
+
+
+class TestPolicy:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_attempts": 0},
+            {"base_delay": -1},
+            {"base_delay": 2, "max_delay": 1},
+            {"deadline": 0},
+            {"hedge_after": 0},
+            {"max_hedges": 0},
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+    def test_backoff(self):
+        fixed = RetryPolicy(base_delay=0.1, max_delay=0.5, jitter=False)
+        assert [fixed.backoff(n) for n in range(4)] == [0.1, 0.2, 0.4, 0.5]
+        jittered = RetryPolicy(base_delay=0.1, max_delay=0.5)
+        assert all(0 <= jittered.backoff(3) <= 0.5 for _ in range(50))
+
+
+@pytest.mark.asyncio
+class TestRun:
+    async def test_transient_retried_when_idempotent(self):
+        policy = _quick()
+        attempt = _Script((0, _UNAVAILABLE), (0, _UNAVAILABLE), (0, _OK))
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _OK
+        assert policy.stats().retries == 2
+
+    async def test_transient_not_retried_when_not_idempotent(self):
+        policy = _quick()
+        attempt = _Script((0, _UNAVAILABLE), (0, _OK))
+        assert await policy.run(attempt, idempotent=False, classify=_classify) is _UNAVAILABLE
+        assert policy.stats().retries == 0
+
+    async def test_unsent_retried_when_not_idempotent(self):
+        policy = _quick()
+        attempt = _Script((0, _REFUSED), (0, _OK))
+        assert await policy.run(attempt, idempotent=False, classify=_classify) is _OK
+
+    async def test_permanent_not_retried(self):
+        policy = _quick()
+        attempt = _Script((0, _BAD), (0, _OK))
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _BAD
+
+    async def test_exhausted(self):
+        policy = _quick(max_attempts=2)
+        attempt = _Script((0, _UNAVAILABLE), (0, _UNAVAILABLE), (0, _OK))
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _UNAVAILABLE
+        assert policy.stats().retries == 1
+        assert policy.stats().exhausted == 1
+
+    async def test_deadline_budget(self):
+        policy = RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=0.05, jitter=False, deadline=0.12)
+        attempt = _Script(*[(0, _UNAVAILABLE)] * 10)
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _UNAVAILABLE
+        # 0.12s budget fits the first attempt and two 0.05s backoffs
+        assert len(attempt.timeouts) == 3
+        assert attempt.timeouts[0] == pytest.approx(0.12, abs=0.01)
+        assert attempt.timeouts == sorted(attempt.timeouts, reverse=True)
+        assert policy.stats().exhausted == 1
+
+    async def test_timeout_overrides_deadline(self):
+        policy = _quick(deadline=100)
+        attempt = _Script((0, _OK))
+        await policy.run(attempt, idempotent=True, classify=_classify, timeout=2)
+        assert attempt.timeouts[0] == pytest.approx(2, abs=0.01)
+
+    async def test_hedge_wins(self):
+        policy = _quick(hedge_after=0.01)
+        late = SuiRpcResult(True, None, "late")
+        attempt = _Script((1, late), (0, _OK))
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _OK
+        assert attempt.cancelled == 1
+        stats = policy.stats()
+        assert (stats.hedges, stats.hedge_wins) == (1, 1)
+
+    async def test_hedge_waits_past_transient_failure(self):
+        policy = _quick(hedge_after=0.01, max_attempts=1)
+        attempt = _Script((0.03, _UNAVAILABLE), (0.05, _OK))
+        assert await policy.run(attempt, idempotent=True, classify=_classify) is _OK
+
+    async def test_no_hedge_when_not_idempotent(self):
+        policy = _quick(hedge_after=0.01)
+        attempt = _Script((0.05, _OK), (0, _OK))
+        assert await policy.run(attempt, idempotent=False, classify=_classify) is _OK
+        assert policy.stats().hedges == 0
+        assert len(attempt.timeouts) == 1
+
+
+@pytest.mark.asyncio
+class TestClients:
+    def _grpc(self, *results) -> pgrpc_clients.GrpcProtocolClient:
+        client = pgrpc_clients.GrpcProtocolClient.__new__(pgrpc_clients.GrpcProtocolClient)
+        client._gas_inventories = {}
+        client._dispatch_grpc_request = AsyncMock(side_effect=list(results))
+        client.retry_policy = _quick()
+        return client
+
+    async def test_grpc_read_retried_with_timeout(self):
+        client = self._grpc(_UNAVAILABLE, _OK)
+        assert await client.execute(command=cmd.GetEpoch(), timeout=5) is _OK
+        assert client._dispatch_grpc_request.await_count == 2
+        for call in client._dispatch_grpc_request.await_args_list:
+            assert 0 < call.kwargs["timeout"] <= 5
+
+    async def test_grpc_execute_transaction_never_blindly_retried(self):
+        command = cmd.ExecuteTransaction(tx_bytestr="AAAA", sig_array=["AAAA"])
+        client = self._grpc(_UNAVAILABLE, _OK)
+        assert await client.execute(command=command) is _UNAVAILABLE
+        client = self._grpc(_REFUSED, _OK)
+        assert await client.execute(command=command) is _OK
+
+    async def test_no_policy_sends_once(self):
+        client = self._grpc(_UNAVAILABLE, _OK)
+        client.retry_policy = None
+        assert await client.execute(command=cmd.GetEpoch()) is _UNAVAILABLE
+
+    async def test_grpc_deadline_result(self, monkeypatch):
+        class _Stub:
+            def __init__(self, channel) -> None:
+                pass
+
+            async def get_epoch(self, request, **kwargs):
+                raise asyncio.TimeoutError()
+
+        monkeypatch.setitem(pgrpc_clients._SERVICE_STUBS, absreq.Service.LEDGER, _Stub)
+        client = pgrpc_clients.GrpcProtocolClient.__new__(pgrpc_clients.GrpcProtocolClient)
+        client._default_header = {}
+        client._pool = GrpcChannelPool(
+            endpoints=[("a", 443)], health_interval=0, channel_factory=lambda h, p: object()
+        )
+        result = await client._dispatch_grpc_request(pgrpc_clients.GetEpoch())
+        assert result.result_string[0] == Status.DEADLINE_EXCEEDED
+        assert _classify(result) is FailureKind.TRANSIENT
+        # A deadline is not an endpoint failure
+        assert client.channel_pool.health() == {"a:443": True}
+
+
+def test_grpc_classification():
+    assert _classify(SuiRpcResult(False, ("reset",), ConnectionResetError())) is FailureKind.TRANSIENT
+    assert _classify(SuiRpcResult(False, GRPCError(Status.ABORTED).args)) is FailureKind.TRANSIENT
+    assert _classify(SuiRpcResult(False, GRPCError(Status.NOT_FOUND).args)) is FailureKind.PERMANENT
+    assert _classify(SuiRpcResult(False, ("bad value",))) is FailureKind.PERMANENT
+
+
+@pytest.mark.parametrize(
+    "reason, kind",
+    [
+        ("TimeoutError: no GraphQL session available", FailureKind.UNSENT),
+        ("TimeoutError: request timed out", FailureKind.TRANSIENT),
+        ("TransportConnectionFailed: ConnectError", FailureKind.UNSENT),
+        ("TransportConnectionFailed: ReadTimeout", FailureKind.TRANSIENT),
+        ("HTTPX error: RemoteProtocolError", FailureKind.TRANSIENT),
+        ("TransportServerError: 503", FailureKind.TRANSIENT),
+        ("TransportServerError: 400", FailureKind.PERMANENT),
+        ("TransportQueryError", FailureKind.PERMANENT),
+    ],
+)
+def test_gql_classification(reason, kind):
+    client = GqlProtocolClient.__new__(GqlProtocolClient)
+    assert client._classify_failure(SuiRpcResult(False, reason, None)) is kind
+
+
+@pytest.mark.asyncio
+async def test_gql_transport_errors_become_results():
+    client = GqlProtocolClient.__new__(GqlProtocolClient)
+    client._default_header = {}
+    client._schema = MagicMock(timeout=5)
+    failed = texc.TransportConnectionFailed("boom")
+    failed.__cause__ = httpx.ConnectError("refused")
+    client._schema.async_pool.execute = AsyncMock(
+        side_effect=[texc.TransportServerError("unavailable", 503), failed]
+    )
+    node = gql("{ chainIdentifier }")
+    first = await client._execute(node)
+    second = await client._execute(node)
+    assert first.result_string == "TransportServerError: 503"
+    assert client._classify_failure(first) is FailureKind.TRANSIENT
+    assert second.result_string == "TransportConnectionFailed: ConnectError"
+    assert client._classify_failure(second) is FailureKind.UNSENT
+
+
+@pytest.mark.asyncio
+async def test_gql_timeouts_before_and_after_send():
+    client = GqlProtocolClient.__new__(GqlProtocolClient)
+    client._default_header = {}
+    client._schema = MagicMock(timeout=5)
+    client._schema.async_pool.execute = AsyncMock(
+        side_effect=[SessionUnavailableError("no slot"), asyncio.TimeoutError()]
+    )
+    node = gql("{ chainIdentifier }")
+    unsent = await client._execute(node)
+    sent = await client._execute(node)
+    assert client._classify_failure(unsent) is FailureKind.UNSENT
+    # gql's execute_timeout fires after the request went out: never resend a transaction
+    assert client._classify_failure(sent) is FailureKind.TRANSIENT
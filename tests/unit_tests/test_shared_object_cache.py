@@ -0,0 +1,260 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Tests for SharedObjectCache and TransactionObjectCache.
+
+Covers:
+- registry first lookup (newer registry version, tombstone)
+- version monotonic owned object writes
+- per transaction Custom overlay isolation
+- effects and resolution through an overlay land in the shared cache
+- parallel executor hands one shared cache to every transaction
+"""
+
+import asyncio
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import pysui.sui.sui_bcs.bcs as bcs
+from pysui.sui.sui_common.executors import (
+    AsyncObjectCache,
+    ExecutorError,
+    ExecutorOptions,
+    GasMode,
+    InMemoryObjectRegistry,
+    ObjectSummary,
+    ObjectVersionEntry,
+    ParallelExecutor,
+    SharedObjectCache,
+    TransactionObjectCache,
+    _BaseCachingExecutor,
+)
+
+_OID = "0x" + "ab" * 32
+_OWNER = "0x" + "cd" * 32
+
+
+def _owned(version: int, digest: str = "d") -> ObjectSummary:
+    return ObjectSummary(objectId=_OID, version=str(version), digest=digest, owner=_OWNER)
+
+
+def _tx_bytes(version: int) -> str:
+    """A programmable transaction whose only input is _OID at version."""
+    ref = bcs.ObjectReference(bcs.Address.from_str(_OID), version, bcs.Digest.from_bytes(bytes(32)))
+    tx_data = bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            bcs.TransactionKind(
+                "ProgrammableTransaction",
+                bcs.ProgrammableTransaction([bcs.CallArg("Object", bcs.ObjectArg("ImmOrOwnedObject", ref))], []),
+            ),
+            bcs.Address.from_str(_OWNER),
+            bcs.GasData([], bcs.Address.from_str(_OWNER), 1_000, 10),
+            bcs.TransactionExpiration("None", None),
+        ),
+    )
+    return base64.b64encode(tx_data.serialize()).decode()
+
+
+@pytest.mark.asyncio
+class TestSharedObjectCache:
+    """SharedObjectCache lookup order and write rules."""
+
+    async def test_miss_then_hit(self):
+        cache = SharedObjectCache()
+        assert await cache.get_object(_OID) is None
+        await cache.add_object(_owned(3))
+        assert (await cache.get_object(_OID)).version == "3"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    async def test_owned_writes_are_version_monotonic(self):
+        cache = SharedObjectCache()
+        await cache.add_object(_owned(5, "new"))
+        kept = await cache.add_object(_owned(4, "old"))
+        assert kept.digest == "new"
+        assert (await cache.get_object(_OID)).version == "5"
+
+    async def test_newer_registry_version_wins(self):
+        registry = InMemoryObjectRegistry()
+        cache = SharedObjectCache(registry)
+        await cache.add_object(_owned(2))
+        await registry.upsert(ObjectVersionEntry(object_id=_OID, version=7, digest="reg"))
+        obj = await cache.get_object(_OID)
+        assert (obj.version, obj.digest, obj.owner) == ("7", "reg", _OWNER)
+        assert cache.stats().registry_hits == 1
+
+    async def test_registry_entry_without_local_entry(self):
+        registry = InMemoryObjectRegistry()
+        cache = SharedObjectCache(registry)
+        await registry.upsert(ObjectVersionEntry(object_id=_OID, version=9, digest="reg"))
+        obj = await cache.get_object(_OID)
+        assert obj.version == "9"
+
+    async def test_older_registry_version_loses(self):
+        registry = InMemoryObjectRegistry()
+        cache = SharedObjectCache(registry)
+        await registry.upsert(ObjectVersionEntry(object_id=_OID, version=1, digest="reg"))
+        await cache.add_object(_owned(4, "local"))
+        assert (await cache.get_object(_OID)).digest == "local"
+
+    async def test_tombstone_forces_fetch(self):
+        registry = InMemoryObjectRegistry()
+        cache = SharedObjectCache(registry)
+        await cache.add_object(_owned(2))
+        await registry.tombstone(_OID)
+        assert await cache.get_object(_OID) is None
+        assert cache.stats().misses == 1
+
+    async def test_shared_object_served_before_registry(self):
+        registry = AsyncMock()
+        cache = SharedObjectCache(registry)
+        shared = ObjectSummary(objectId=_OID, version="1", digest="d", initialSharedVersion="1")
+        await cache.add_object(shared)
+        assert await cache.get_object(_OID) is shared
+        registry.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestTransactionObjectCache:
+    """TransactionObjectCache overlay behaviour."""
+
+    async def test_objects_are_shared_between_overlays(self):
+        shared = SharedObjectCache()
+        first, second = TransactionObjectCache(shared), TransactionObjectCache(shared)
+        await first.add_object(_owned(3))
+        assert (await second.get_object(_OID)).version == "3"
+
+    async def test_custom_bucket_is_private(self):
+        shared = SharedObjectCache()
+        first, second = TransactionObjectCache(shared), TransactionObjectCache(shared)
+        await first.setCustom("gasCoins", ["0x1"])
+        assert await second.getCustom("gasCoins") is None
+        assert await shared.getCustom("gasCoins") is None
+
+    async def test_reset_keeps_shared_objects(self):
+        shared = SharedObjectCache()
+        overlay = TransactionObjectCache(shared)
+        await overlay.add_object(_owned(3))
+        await overlay.setCustom("gasCoins", ["0x1"])
+        await overlay.reset()
+        assert await overlay.getCustom("gasCoins") is None
+        assert (await shared.get_object(_OID)).version == "3"
+
+    async def test_clear_owned_objects_clears_shared_store(self):
+        shared = SharedObjectCache()
+        overlay = TransactionObjectCache(shared)
+        await overlay.add_object(_owned(3))
+        await overlay.clearOwnedObjects()
+        assert await shared.get_object(_OID) is None
+        # The overlay still reads through the same (now empty) store
+        await shared.add_object(_owned(4))
+        assert (await overlay.get_object(_OID)).version == "4"
+
+    async def test_apply_effects_reaches_shared_cache(self):
+        import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+
+        shared = SharedObjectCache()
+        overlay = TransactionObjectCache(shared)
+        await shared.add_object(_owned(3))
+        changed = MagicMock()
+        changed.object_id = _OID
+        changed.output_state = sui_prot.ChangedObjectOutputObjectState.OBJECT_WRITE
+        changed.output_digest = "after"
+        changed.output_owner = MagicMock(kind=sui_prot.OwnerOwnerKind.ADDRESS, address=_OWNER)
+        effects = MagicMock(lamport_version=8, changed_objects=[changed])
+        await overlay.applyEffects(effects)
+        obj = await TransactionObjectCache(shared).get_object(_OID)
+        assert (obj.version, obj.digest) == ("8", "after")
+
+
+class TestExecutorWiring:
+    """Caching and parallel executors use the shared tier."""
+
+    def test_caching_executor_defaults_to_private_cache(self):
+        ce = _BaseCachingExecutor()
+        assert type(ce.cache) is AsyncObjectCache
+
+    def test_caching_executor_uses_overlay(self):
+        shared = SharedObjectCache()
+        ce = _BaseCachingExecutor(shared_cache=shared)
+        assert isinstance(ce.cache, TransactionObjectCache)
+        assert ce.cache.shared is shared
+
+    @pytest.mark.asyncio
+    async def test_parallel_executor_shares_cache(self):
+        client = MagicMock()
+        client.execute = AsyncMock(return_value=MagicMock(is_ok=MagicMock(return_value=False)))
+        options = ExecutorOptions(
+            sender="0xsender",
+            gas_mode=GasMode.ADDRESS_BALANCE,
+            initial_coins=[],
+            min_threshold_balance=10_000_000,
+        )
+        ex = ParallelExecutor(client=client, options=options)
+        ce = MagicMock()
+        ce.build_transaction = AsyncMock(return_value={"tx_bytestr": "abc", "sig_array": ["sig"]})
+        txn = MagicMock()
+        txn.builder.get_unresolved_inputs.return_value = {}
+        path = "pysui.sui.sui_common.executors.base_parallel_executor._BaseCachingExecutor"
+        with patch(path, return_value=ce) as ce_cls:
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            futs = ex.submit([txn, txn])
+            await asyncio.gather(*futs)
+            await ex.close()
+        assert ce_cls.call_count == 2
+        assert all(c.kwargs["shared_cache"] is ex.object_cache for c in ce_cls.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_stale_input_fails_once_then_recovers(self):
+        registry = InMemoryObjectRegistry()
+        await registry.upsert(ObjectVersionEntry(object_id=_OID, version=2, digest="stale"))
+        executed = MagicMock()
+        executed.effects.changed_objects = []
+        executed.effects.gas_used = MagicMock(computation_cost=0, storage_cost=0, storage_rebate=0)
+        executed.objects = None
+
+        async def execute(*, command):
+            result = MagicMock()
+            result.is_ok.return_value = command.tx_bytestr == _tx_bytes(5)
+            result.result_data = executed
+            result.result_string = "Object is not available for consumption, current version: 5"
+            return result
+
+        async def build(self, txn, signer_block, gas_objects_override=None):
+            obj = await self.cache.get_object(_OID)
+            if obj is None:
+                # Fetched from the node on a miss
+                obj = await self.cache.add_object(_owned(5))
+            return {"tx_bytestr": _tx_bytes(int(obj.version)), "sig_array": ["sig"]}
+
+        client = MagicMock()
+        client.execute = AsyncMock(side_effect=execute)
+        options = ExecutorOptions(
+            sender="0xsender",
+            gas_mode=GasMode.ADDRESS_BALANCE,
+            initial_coins=[],
+            min_threshold_balance=0,
+        )
+        ex = ParallelExecutor(client=client, options=options)
+        ex._registry = registry
+        ex._object_cache = SharedObjectCache(registry)
+        await ex.object_cache.add_object(_owned(1))
+        txn = MagicMock()
+        txn.builder.get_unresolved_inputs.return_value = {}
+        with patch.object(_BaseCachingExecutor, "build_transaction", build), patch(
+            "pysui.sui.sui_common.executors.base_parallel_executor.update_tracked_balance_from_accumulator",
+            return_value=0,
+        ):
+            ex._build_task = asyncio.create_task(ex._build_worker())
+            (first,) = ex.submit([txn])
+            assert (await first)[0] is ExecutorError.EXECUTING_ERROR
+            assert await registry.get(_OID) is None
+            (second,) = ex.submit([txn])
+            assert await second is executed
+            await ex.close()
+        assert client.execute.await_count == 2
@@ -0,0 +1,228 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for SharedMemoryObjectRegistry — all offline.
+
+Covers:
+  - Basic get / upsert / version ordering / tombstone / evict / reset
+  - Bucket overflow reuses the least recently written slot
+  - A slot left odd by a crashed writer reads as a miss and is rewritten
+  - Attaching to an existing file, geometry mismatch
+  - Symlinked or group / other accessible files are refused
+  - Several processes writing the same object ids concurrently
+  - set_object_registry installs the shared registry as the singleton
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+from pysui.sui.sui_common.executors import object_registry as reg_mod
+from pysui.sui.sui_common.executors.object_registry import (
+    ObjectVersionEntry,
+    get_object_registry,
+    set_object_registry,
+)
+from pysui.sui.sui_common.executors import shared_object_registry as shm_mod
+from pysui.sui.sui_common.executors.shared_object_registry import (
+    _SEQ,
+    SharedMemoryObjectRegistry,
+    _slot_key,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX only")
+
+
+def _oid(n: int) -> str:
+    return f"0x{n:064x}"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "registry.bin")
+
+
+@pytest.fixture
+def registry(path):
+    r = SharedMemoryObjectRegistry(path=path, capacity=256, ways=4)
+    yield r
+    r.close()
+
+
+def _writer(path: str, worker: int, workers: int, ids: int, top: int) -> None:
+    """Upsert every id at this worker's share of versions 1..top, in rising order."""
+    r = SharedMemoryObjectRegistry(path=path, capacity=256, ways=4)
+
+    async def _run():
+        for v in range(1 + worker, top + 1, workers):
+            await r.upsert_many(
+                [ObjectVersionEntry(_oid(n), v, f"d{v}") for n in range(ids)]
+            )
+
+    asyncio.run(_run())
+    r.close()
+
+
+def _reader(path: str, ids: int, queue) -> None:
+    """Report every entry read while writers run whose digest does not match its version."""
+    r = SharedMemoryObjectRegistry(path=path, capacity=256, ways=4)
+    torn = []
+    for _ in range(200):
+        found = asyncio.run(r.get_many([_oid(n) for n in range(ids)]))
+        torn.extend((e.version, e.digest) for e in found.values() if e.digest != f"d{e.version}")
+    r.close()
+    queue.put(torn)
+
+
+@pytest.mark.asyncio
+class TestBasics:
+    async def test_get_missing(self, registry):
+        assert await registry.get(_oid(1)) is None
+
+    async def test_upsert_and_get(self, registry):
+        await registry.upsert(ObjectVersionEntry(_oid(1), 5, "abc"))
+        entry = await registry.get(_oid(1))
+        assert (entry.object_id, entry.version, entry.digest) == (_oid(1), 5, "abc")
+
+    async def test_lower_version_ignored(self, registry):
+        await registry.upsert(ObjectVersionEntry(_oid(1), 10, "new"))
+        await registry.upsert(ObjectVersionEntry(_oid(1), 9, "old"))
+        assert (await registry.get(_oid(1))).digest == "new"
+
+    async def test_short_and_long_ids_share_a_key(self, registry):
+        await registry.upsert(ObjectVersionEntry("0x5", 1, "a"))
+        assert (await registry.get(_oid(5))).digest == "a"
+
+    async def test_non_hex_id(self, registry):
+        assert len(_slot_key("not-an-address")) == 32
+        await registry.upsert(ObjectVersionEntry("not-an-address", 3, "x"))
+        assert (await registry.get("not-an-address")).version == 3
+
+    async def test_tombstone_blocks_and_expires(self, registry):
+        await registry.upsert(ObjectVersionEntry(_oid(1), 5, "abc"))
+        await registry.tombstone(_oid(1), ttl_seconds=60)
+        assert (await registry.get(_oid(1))).is_tombstone
+        await registry.tombstone(_oid(2), ttl_seconds=0)
+        await asyncio.sleep(0.001)
+        assert await registry.get(_oid(2)) is None
+
+    async def test_write_over_tombstone(self, registry):
+        await registry.tombstone(_oid(1), ttl_seconds=60)
+        await registry.upsert(ObjectVersionEntry(_oid(1), 2, "back"))
+        assert (await registry.get(_oid(1))).digest == "back"
+
+    async def test_evict_and_reset(self, registry):
+        await registry.upsert_many([ObjectVersionEntry(_oid(n), 1, "d") for n in range(10)])
+        assert registry.size() == 10
+        await registry.evict(_oid(3))
+        assert await registry.get(_oid(3)) is None
+        assert registry.size() == 9
+        await registry.reset()
+        assert registry.size() == 0
+
+    async def test_full_bucket_reuses_oldest(self, path):
+        r = SharedMemoryObjectRegistry(path=path, capacity=2, ways=2)
+        for n in range(3):
+            await r.upsert(ObjectVersionEntry(_oid(n), 1, f"d{n}"))
+        assert await r.get(_oid(0)) is None
+        assert (await r.get(_oid(2))).digest == "d2"
+        assert r.size() == 2
+        r.close()
+
+    async def test_crashed_writer_slot(self, registry, monkeypatch):
+        monkeypatch.setattr(shm_mod, "_READ_RETRIES", 5)
+        await registry.upsert(ObjectVersionEntry(_oid(1), 1, "old"))
+        offset = registry._bucket_offset(_slot_key(_oid(1)))
+        while registry._read_slot(offset)[6] != _slot_key(_oid(1)):
+            offset += shm_mod._SLOT.size
+        # A writer died between its two sequence bumps
+        _SEQ.pack_into(registry._mm, offset, _SEQ.unpack_from(registry._mm, offset)[0] + 1)
+        assert await registry.get(_oid(1)) is None
+        await registry.upsert(ObjectVersionEntry(_oid(1), 1, "new"))
+        assert _SEQ.unpack_from(registry._mm, offset)[0] % 2 == 0
+        assert (await registry.get(_oid(1))).digest == "new"
+
+    async def test_digest_too_long(self, registry):
+        with pytest.raises(ValueError):
+            await registry.upsert(ObjectVersionEntry(_oid(1), 1, "x" * 49))
+
+
+class TestAttach:
+    def test_second_handle_sees_writes(self, path, registry):
+        asyncio.run(registry.upsert(ObjectVersionEntry(_oid(7), 4, "seen")))
+        other = SharedMemoryObjectRegistry(path=path, capacity=256, ways=4)
+        assert asyncio.run(other.get(_oid(7))).digest == "seen"
+        other.close()
+
+    def test_geometry_mismatch(self, path, registry):
+        with pytest.raises(ValueError):
+            SharedMemoryObjectRegistry(path=path, capacity=512, ways=4)
+
+    def test_symlink_refused(self, path, tmp_path):
+        link = str(tmp_path / "link.bin")
+        os.symlink(path, link)
+        with pytest.raises(OSError):
+            SharedMemoryObjectRegistry(path=link, capacity=256, ways=4)
+        assert not os.path.exists(path)
+
+    def test_shared_mode_refused(self, path, registry):
+        os.chmod(path, 0o666)
+        with pytest.raises(PermissionError):
+            SharedMemoryObjectRegistry(path=path, capacity=256, ways=4)
+
+    def test_unlink(self, path, registry):
+        registry.unlink()
+        assert not os.path.exists(path)
+
+
+class TestMultiProcess:
+    def _ctx(self):
+        try:
+            return multiprocessing.get_context("fork")
+        except ValueError:
+            pytest.skip("fork start method unavailable")
+
+    def test_concurrent_writers_keep_highest_version(self, path, registry):
+        ctx = self._ctx()
+        workers, ids, top = 4, 20, 60
+        procs = [
+            ctx.Process(target=_writer, args=(path, w, workers, ids, top))
+            for w in range(workers)
+        ]
+        queue = ctx.Queue()
+        reader = ctx.Process(target=_reader, args=(path, ids, queue))
+        for p in procs + [reader]:
+            p.start()
+        torn = queue.get(timeout=60)
+        for p in procs + [reader]:
+            p.join(timeout=60)
+            assert p.exitcode == 0
+        assert torn == []
+        found = asyncio.run(registry.get_many([_oid(n) for n in range(ids)]))
+        assert len(found) == ids
+        assert {(e.version, e.digest) for e in found.values()} == {(top, f"d{top}")}
+
+    def test_child_reads_parent_writes(self, path, registry):
+        ctx = self._ctx()
+        asyncio.run(registry.upsert(ObjectVersionEntry(_oid(1), 8, "d8")))
+        queue = ctx.Queue()
+        reader = ctx.Process(target=_reader, args=(path, 2, queue))
+        reader.start()
+        assert queue.get(timeout=60) == []
+        reader.join(timeout=60)
+        assert reader.exitcode == 0
+
+
+class TestSingleton:
+    def test_set_object_registry(self, registry):
+        saved = reg_mod._REGISTRY
+        try:
+            set_object_registry(registry)
+            assert get_object_registry() is registry
+        finally:
+            reg_mod._set_object_registry_for_tests(saved)
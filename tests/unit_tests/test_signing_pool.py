@@ -0,0 +1,178 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for SigningPool and SignerBlock.get_signatures_async — all offline.
+
+Covers:
+  - Async signatures match the synchronous path, sender then sponsor
+  - Concurrent requests are batched into few executor calls, split at max_batch
+  - Executor failures reach every caller in the batch
+  - Process pool signing (keys are pickled to the worker)
+  - One pool shared by several event loops on separate threads
+  - _BaseCachingExecutor.build_transaction passes its pool to build_and_sign
+"""
+
+import asyncio
+import base64
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysui.sui.sui_crypto import create_new_keypair
+from pysui.sui.sui_common.txn_signing import (
+    SignerBlock,
+    SigningPool,
+    default_signing_pool,
+)
+
+_SENDER = "0x" + "11" * 32
+_SPONSOR = "0x" + "22" * 32
+
+
+class _Group:
+    using_profile = "test"
+
+    def __init__(self, keys: dict) -> None:
+        self._keys = keys
+
+    def get_transient_keypair(self, *, profile_name, address):
+        return self._keys.get(address)
+
+
+class _Config:
+    def __init__(self, keys: dict) -> None:
+        self.active_group = _Group(keys)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.batches: list[int] = []
+
+    def submit(self, fn, jobs, *args, **kwargs):
+        self.batches.append(len(jobs))
+        return super().submit(fn, jobs, *args, **kwargs)
+
+
+@pytest.fixture
+def config():
+    return _Config({_SENDER: create_new_keypair()[1], _SPONSOR: create_new_keypair()[1]})
+
+
+def _tx(n: int) -> str:
+    return base64.b64encode(n.to_bytes(4, "little") * 50).decode()
+
+
+@pytest.mark.asyncio
+class TestSignatures:
+    async def test_matches_sync_path(self, config):
+        block = SignerBlock(sender=_SENDER, sponsor=_SPONSOR)
+        pool = SigningPool()
+        try:
+            sigs = await block.get_signatures_async(config=config, tx_bytes=_tx(1), pool=pool)
+        finally:
+            pool.shutdown()
+        assert len(sigs) == 2
+        assert sigs == block.get_signatures(config=config, tx_bytes=_tx(1))
+
+    async def test_default_pool(self, config):
+        block = SignerBlock(sender=_SENDER)
+        assert default_signing_pool() is default_signing_pool()
+        sigs = await block.get_signatures_async(config=config, tx_bytes=_tx(2))
+        assert sigs == block.get_signatures(config=config, tx_bytes=_tx(2))
+
+    async def test_concurrent_requests_batched(self, config):
+        block = SignerBlock(sender=_SENDER)
+        executor = _CountingExecutor()
+        pool = SigningPool(executor, max_batch=16)
+        try:
+            results = await asyncio.gather(
+                *[block.get_signatures_async(config=config, tx_bytes=_tx(n), pool=pool) for n in range(40)]
+            )
+        finally:
+            executor.shutdown()
+        assert executor.batches == [16, 16, 8]
+        assert results == [block.get_signatures(config=config, tx_bytes=_tx(n)) for n in range(40)]
+
+    async def test_failure_reaches_every_caller(self):
+        broken = MagicMock()
+        broken.new_sign_secure.side_effect = RuntimeError("bad key")
+        block = SignerBlock(sender=_SENDER)
+        pool = SigningPool()
+        try:
+            results = await asyncio.gather(
+                *[
+                    block.get_signatures_async(config=_Config({_SENDER: broken}), tx_bytes=_tx(n), pool=pool)
+                    for n in range(3)
+                ],
+                return_exceptions=True,
+            )
+        finally:
+            pool.shutdown()
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_process_pool(self, config):
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            pytest.skip("fork start method unavailable")
+        block = SignerBlock(sender=_SENDER, sponsor=_SPONSOR)
+        executor = ProcessPoolExecutor(max_workers=1, mp_context=ctx)
+        try:
+            sigs = await block.get_signatures_async(
+                config=config, tx_bytes=_tx(3), pool=SigningPool(executor)
+            )
+        finally:
+            executor.shutdown()
+        assert sigs == block.get_signatures(config=config, tx_bytes=_tx(3))
+
+
+def test_pool_shared_across_loops(config):
+    block = SignerBlock(sender=_SENDER)
+    pool = SigningPool(max_batch=16)
+    results: dict[int, list] = {}
+
+    async def burst(worker: int) -> list:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *[
+                    block.get_signatures_async(config=config, tx_bytes=_tx(worker * 1000 + n), pool=pool)
+                    for n in range(200)
+                ]
+            ),
+            30,
+        )
+
+    def run(worker: int) -> None:
+        results[worker] = asyncio.run(burst(worker))
+
+    threads = [threading.Thread(target=run, args=(w,)) for w in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+    finally:
+        pool.shutdown()
+    assert sorted(results) == [0, 1, 2, 3]
+    for worker, sigs in results.items():
+        assert sigs[7] == block.get_signatures(config=config, tx_bytes=_tx(worker * 1000 + 7))
+        assert all(len(s) == 1 for s in sigs)
+
+
+@pytest.mark.asyncio
+async def test_build_transaction_uses_pool():
+    from pysui.sui.sui_common.executors.base_caching_executor import _BaseCachingExecutor
+
+    pool = SigningPool()
+    caching = _BaseCachingExecutor(client=MagicMock(), signing_pool=pool)
+    txn = MagicMock()
+    txn.build_and_sign = AsyncMock(return_value={})
+    await caching.build_transaction(txn, None, gas_objects_override=[])
+    assert txn.build_and_sign.await_args.kwargs["signing_pool"] is pool
+    pool.shutdown()
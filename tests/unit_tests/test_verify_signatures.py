@@ -0,0 +1,162 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Unit tests for local signature verification in sui_crypto — all offline.
+
+Covers:
+  - ED25519 / SECP256K1 / SECP256R1 transaction and personal message signatures
+  - MultiSig signatures, tampering and author checks
+  - zkLogin / passkey signatures, and multisigs with such members, are left to the node (None)
+  - verify_many ordering with thread and process pools
+  - async_verify_many falls back to the verify commands only when needed
+"""
+
+import base64
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+
+import pysui.sui.sui_common.sui_commands as cmd
+import pysui.sui.sui_grpc.suimsgs.sui.rpc.v2 as sui_prot
+from pysui import SuiRpcResult
+from pysui.abstracts.client_keypair import SignatureScheme
+from pysui.sui.sui_crypto import (
+    IntentScope,
+    MultiSig,
+    async_verify_many,
+    create_new_keypair,
+    verify_many,
+    verify_signature,
+)
+
+_SCHEMES = [SignatureScheme.ED25519, SignatureScheme.SECP256K1, SignatureScheme.SECP256R1]
+_KEYS = [create_new_keypair(scheme=s)[1] for s in _SCHEMES]
+
+
+def _msg(n: int) -> str:
+    # Includes zero bytes, which personal message encoding must keep
+    return base64.b64encode(bytes(range(n % 7, n % 7 + 40)) + n.to_bytes(4, "little")).decode()
+
+
+def _address(keypair) -> str:
+    return "0x" + hashlib.blake2b(keypair.public_key.scheme_and_key(), digest_size=32).hexdigest()
+
+
+class TestSingleScheme:
+    @pytest.mark.parametrize("keypair", _KEYS, ids=[s.name for s in _SCHEMES])
+    def test_transaction_signature(self, keypair):
+        sig = keypair.new_sign_secure(_msg(1))
+        assert verify_signature(_msg(1), sig) is True
+        assert verify_signature(_msg(2), sig) is False
+        assert verify_signature(_msg(1), sig, author=_address(keypair)) is True
+        assert verify_signature(_msg(1), sig, author="0x" + "0" * 64) is False
+
+    @pytest.mark.parametrize("keypair", _KEYS, ids=[s.name for s in _SCHEMES])
+    def test_personal_message(self, keypair):
+        sig = keypair.sign_personal_message(_msg(3))
+        assert verify_signature(_msg(3), sig, intent=IntentScope.PersonalMessage) is True
+        assert verify_signature(_msg(3), sig) is False
+
+    def test_malformed(self):
+        assert verify_signature(_msg(1), "not base64!") is False
+        assert verify_signature(_msg(1), "") is False
+        assert verify_signature(_msg(1), base64.b64encode(b"\x00" + b"\x01" * 10).decode()) is False
+
+    def test_unsupported_intent(self):
+        with pytest.raises(ValueError):
+            verify_signature(_msg(1), _KEYS[0].new_sign_secure(_msg(1)), intent=IntentScope.CheckpointSummary)
+
+    def test_zklogin_and_passkey_left_to_node(self):
+        for flag in (SignatureScheme.ZKLOGINAUTHENTICATOR, SignatureScheme.PASSKEY):
+            assert verify_signature(_msg(1), base64.b64encode(bytes([flag]) + b"\x00" * 8).decode()) is None
+
+
+class TestMultiSig:
+    @pytest.fixture
+    def msig(self):
+        return MultiSig(_KEYS, [1, 1, 1], 2)
+
+    def test_valid(self, msig):
+        sig = msig.sign(_msg(4), [_KEYS[0].public_key, _KEYS[2].public_key])
+        assert verify_signature(_msg(4), sig, author=msig.address) is True
+        assert verify_signature(_msg(4), sig, author=_address(_KEYS[0])) is False
+
+    def test_tampered(self, msig):
+        sig = bytearray(base64.b64decode(msig.sign(_msg(4), [_KEYS[1].public_key, _KEYS[2].public_key])))
+        sig[10] ^= 0xFF
+        assert verify_signature(_msg(4), base64.b64encode(sig).decode()) is False
+        assert verify_signature(_msg(5), msig.sign(_msg(4), [_KEYS[0].public_key, _KEYS[1].public_key])) is False
+
+    def test_below_threshold(self):
+        msig = MultiSig(_KEYS, [1, 1, 1], 2)
+        heavy = MultiSig(_KEYS, [2, 1, 1], 2)
+        # Sign with one key of a multisig where it alone meets the threshold, then
+        # claim the committee of one where it does not
+        sig = heavy.sign(_msg(6), [_KEYS[0].public_key])
+        raw = bytearray(base64.b64decode(sig))
+        weight_at = raw.index(bytes(_KEYS[0].public_key.key_bytes)) + 32
+        raw[weight_at] = 1
+        assert verify_signature(_msg(6), base64.b64encode(raw).decode()) is False
+        assert msig.address != heavy.address
+
+    def test_unsupported_member_left_to_node(self, msig):
+        sig = bytearray(base64.b64decode(msig.sign(_msg(4), [_KEYS[0].public_key, _KEYS[2].public_key])))
+        # Recast the committee's last key as a zkLogin (flag 3) member
+        pk_at = sig.index(bytes(_KEYS[2].public_key.key_bytes)) - 1
+        assert sig[pk_at] == SignatureScheme.SECP256R1
+        sig[pk_at] = 3
+        assert verify_signature(_msg(4), base64.b64encode(sig).decode()) is None
+        # and the first signature (after the flag and count bytes) as a passkey (flag 4) one
+        sig = bytearray(base64.b64decode(msig.sign(_msg(4), [_KEYS[0].public_key, _KEYS[2].public_key])))
+        sig[2] = 4
+        assert verify_signature(_msg(4), base64.b64encode(sig).decode()) is None
+
+
+class TestVerifyMany:
+    def _items(self, n: int) -> list[tuple]:
+        items = []
+        for i in range(n):
+            keypair = _KEYS[i % 3]
+            # Every fifth signature is over a different message
+            items.append((_msg(i), keypair.new_sign_secure(_msg(i + (i % 5 == 0)))))
+        return items
+
+    def test_inline(self):
+        items = self._items(20)
+        assert verify_many(items) == [i % 5 != 0 for i in range(20)]
+
+    def test_thread_pool(self):
+        items = self._items(50)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            assert verify_many(items, executor=pool, chunk_size=7) == [i % 5 != 0 for i in range(50)]
+
+    def test_process_pool(self):
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            pytest.skip("fork start method unavailable")
+        items = self._items(12)
+        with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as pool:
+            assert verify_many(items, executor=pool, chunk_size=4) == [i % 5 != 0 for i in range(12)]
+
+
+@pytest.mark.asyncio
+async def test_async_verify_many_falls_back_for_zklogin():
+    zk_sig = base64.b64encode(bytes([5]) + b"\x00" * 8).decode()
+    items = [
+        (_msg(1), _KEYS[0].new_sign_secure(_msg(1))),
+        (_msg(2), zk_sig, "0x" + "ab" * 32),
+        (_msg(3), _KEYS[1].new_sign_secure(_msg(4))),
+    ]
+    client = AsyncMock()
+    client.execute.return_value = SuiRpcResult(True, "", sui_prot.VerifySignatureResponse(is_valid=True))
+    assert await async_verify_many(client, items, chunk_size=2) == [True, True, False]
+    assert client.execute.await_count == 1
+    command = client.execute.await_args.kwargs["command"]
+    assert isinstance(command, cmd.VerifyTransactionSignature)
+    assert (command.signature, command.author) == (zk_sig, "0x" + "ab" * 32)